@@ -1,10 +1,12 @@
 import csv
 import re
+import time
 from datetime import datetime, timedelta
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.core.exceptions import ValidationError
-from academics.models import Course
+from academics.models import Class, Course
+from academics.services import CourseWooCommerceService
 from django.utils import timezone
 from decimal import Decimal
 
@@ -51,7 +53,12 @@ class Command(BaseCommand):
         parser.add_argument(
             '--clear-existing',
             action='store_true',
-            help='Clear existing courses with the same term name before creating new ones'
+            help='Clear existing courses generated for the same term (courses with enrollments are kept)'
+        )
+        parser.add_argument(
+            '--publish',
+            action='store_true',
+            help='Create courses as published and queue one WooCommerce sync for all of them'
         )
 
     def handle(self, *args, **options):
@@ -62,6 +69,7 @@ class Command(BaseCommand):
         early_bird_days = options['early_bird_days']
         dry_run = options['dry_run']
         clear_existing = options['clear_existing']
+        publish = options['publish']
 
         if dry_run:
             self.stdout.write(self.style.WARNING('DRY RUN MODE - No courses will be created'))
@@ -78,10 +86,12 @@ class Command(BaseCommand):
             with open(file_path, 'r', encoding='utf-8') as file:
                 self.generate_courses(
                     file, start_date, end_date, term_name,
-                    early_bird_days, dry_run, clear_existing
+                    early_bird_days, dry_run, clear_existing, publish
                 )
         except FileNotFoundError:
             raise CommandError(f'File not found: {file_path}')
+        except CommandError:
+            raise
         except Exception as e:
             raise CommandError(f'Error reading file: {str(e)}')
 
@@ -92,8 +102,19 @@ class Command(BaseCommand):
         except ValueError:
             raise CommandError(f'Invalid date format: {date_str}. Use YYYY-MM-DD format.')
 
-    def generate_courses(self, file, start_date, end_date, term_name, early_bird_days, dry_run=False, clear_existing=False):
-        """Generate courses from TSV file"""
+    def generate_courses(self, file, start_date, end_date, term_name, early_bird_days, dry_run=False,
+                         clear_existing=False, publish=False):
+        """
+        Generate courses from TSV file
+
+        The whole file is validated before anything is written. Courses and
+        their classes are then inserted with bulk_create in one transaction,
+        which skips the per-course save signals; WooCommerce is synced
+        afterwards by a single queued job.
+        """
+        timings = {}
+        started = time.perf_counter()
+
         reader = csv.reader(file, delimiter='\t')
 
         # Skip header row
@@ -103,13 +124,6 @@ class Command(BaseCommand):
 
         self.stdout.write(f'Header: {header}')
 
-        # Clear existing courses if requested
-        if clear_existing and not dry_run:
-            existing_count = Course.objects.filter(name__icontains=term_name).count()
-            if existing_count > 0:
-                self.stdout.write(f'Clearing {existing_count} existing courses containing "{term_name}"...')
-                Course.objects.filter(name__icontains=term_name).delete()
-
         stats = {
             'total': 0,
             'success': 0,
@@ -118,6 +132,8 @@ class Command(BaseCommand):
         }
 
         errors = []
+        courses = []
+        seen_names = set()
 
         for row_num, row in enumerate(reader, start=2):  # Start from 2 since we skipped header
             if not row or len(row) < 7:  # Skip empty or incomplete rows
@@ -135,109 +151,168 @@ class Command(BaseCommand):
                     original_price_str, early_bird_price_str, registration_fee_str,
                     start_date, end_date, term_name, early_bird_days
                 )
+                if publish:
+                    course_data.update({
+                        'status': 'published',
+                        'is_online_bookable': True,
+                        'bookable_state': 'bookable',
+                    })
+
+                course = Course(**course_data)
+                course.full_clean(validate_unique=False, validate_constraints=False)
+
+                if course.name in seen_names:
+                    raise ValueError(f"Duplicate course '{course.name}' in file")
+                seen_names.add(course.name)
+                courses.append((row_num, course))
+
+            except ValidationError as e:
+                errors.append(f"Row {row_num} error: {'; '.join(e.messages)}")
+            except Exception as e:
+                errors.append(f"Row {row_num} error: {str(e)}")
+
+        # Courses from an earlier run of this term; enrolled ones are never cleared
+        term_courses = Course.objects.filter(name__endswith=f' ({term_name})')
+        clear_ids = []
+        if clear_existing:
+            enrolled = set(term_courses.filter(enrollments__isnull=False).values_list('pk', flat=True))
+            clear_ids = [pk for pk in term_courses.values_list('pk', flat=True) if pk not in enrolled]
+            if enrolled:
+                self.stdout.write(self.style.WARNING(
+                    f'Keeping {len(enrolled)} existing course(s) with enrollments'
+                ))
+
+        # Check for existing courses with the same names in one query
+        existing_names = set(
+            Course.objects.filter(name__in=seen_names).exclude(pk__in=clear_ids).values_list('name', flat=True)
+        )
+        to_create = []
+        for row_num, course in courses:
+            if course.name in existing_names:
+                self.stdout.write(f"Row {row_num}: Course '{course.name}' already exists, skipping")
+                stats['skipped'] += 1
+            else:
+                to_create.append((row_num, course))
 
-                if not course_data:
-                    stats['skipped'] += 1
-                    continue
-
-                # Check for existing course with same name
-                if Course.objects.filter(name=course_data['name']).exists():
-                    self.stdout.write(
-                        f"Row {row_num}: Course '{course_data['name']}' already exists, skipping"
-                    )
-                    stats['skipped'] += 1
-                    continue
-
-                if not dry_run:
-                    # Create course
-                    with transaction.atomic():
-                        course = Course.objects.create(**course_data)
-                        self.stdout.write(
-                            self.style.SUCCESS(f"Row {row_num}: Created course '{course.name}'")
-                        )
-                else:
-                    self.stdout.write(
-                        f"Row {row_num}: Would create course '{course_data['name']}'"
-                    )
-
-                stats['success'] += 1
+        timings['validate'] = time.perf_counter() - started
 
-            except Exception as e:
-                error_msg = f"Row {row_num} error: {str(e)}"
-                errors.append(error_msg)
-                stats['errors'] += 1
-                self.stdout.write(self.style.ERROR(error_msg))
+        if errors:
+            stats['errors'] = len(errors)
+            self.print_summary(stats, errors, dry_run)
+            raise CommandError(f'{len(errors)} row(s) failed validation; no courses were created')
+
+        if dry_run:
+            for row_num, course in to_create:
+                self.stdout.write(
+                    f"Row {row_num}: Would create course '{course.name}' "
+                    f"with {len(course.build_classes())} classes"
+                )
+            if clear_ids:
+                self.stdout.write(f'Would clear {len(clear_ids)} existing courses for "{term_name}"')
+            stats['success'] = len(to_create)
+            self.print_summary(stats, errors, dry_run)
+            self.print_timings(timings)
+            return
+
+        with transaction.atomic():
+            phase = time.perf_counter()
+            if clear_ids:
+                self.stdout.write(f'Clearing {len(clear_ids)} existing courses for "{term_name}"...')
+                Class.objects.filter(course_id__in=clear_ids).delete()
+                Course.objects.filter(pk__in=clear_ids).delete()
+            timings['clear'] = time.perf_counter() - phase
+
+            phase = time.perf_counter()
+            created = Course.objects.bulk_create([course for _, course in to_create], batch_size=500)
+            timings['courses'] = time.perf_counter() - phase
+
+            phase = time.perf_counter()
+            classes = Class.objects.bulk_create(
+                [class_instance for course in created for class_instance in course.build_classes()],
+                batch_size=500
+            )
+            timings['classes'] = time.perf_counter() - phase
+
+        for row_num, course in to_create:
+            self.stdout.write(self.style.SUCCESS(f"Row {row_num}: Created course '{course.name}'"))
+        self.stdout.write(f'Created {len(created)} courses and {len(classes)} classes')
+        stats['success'] = len(created)
+
+        phase = time.perf_counter()
+        if publish and created:
+            result = CourseWooCommerceService.queue_bulk_sync([course.pk for course in created])
+            if result['queued']:
+                self.stdout.write(f"Queued WooCommerce sync for {len(created)} courses (job {result['job_id']})")
+            else:
+                self.stdout.write(
+                    f"WooCommerce sync ran inline: {result['synced']} synced, "
+                    f"{result['skipped']} skipped, {result['failed']} failed"
+                )
+        timings['publish'] = time.perf_counter() - phase
 
         # Print summary
-        self.print_summary(stats, errors, dry_run)
+        self.print_summary(stats, errors, dry_run, publish)
+        self.print_timings(timings)
 
     def parse_course_data(self, weekday_str, course_name, start_time_str, duration_str,
                          original_price_str, early_bird_price_str, registration_fee_str,
                          start_date, end_date, term_name, early_bird_days):
-        """Parse and validate course data from TSV row"""
-        try:
-            # Parse weekday
-            weekday_num = self.parse_weekday(weekday_str)
-            if weekday_num is None:
-                self.stdout.write(self.style.ERROR(f"Invalid weekday: {weekday_str}"))
-                return None
-
-            # Parse start time
-            start_time = self.parse_time(start_time_str)
-            if not start_time:
-                self.stdout.write(self.style.ERROR(f"Invalid start time: {start_time_str}"))
-                return None
-
-            # Parse duration
-            duration_minutes = self.parse_duration(duration_str)
-            if not duration_minutes:
-                self.stdout.write(self.style.ERROR(f"Invalid duration: {duration_str}"))
-                return None
-
-            # Parse prices
-            original_price = self.parse_price(original_price_str)
-            early_bird_price = self.parse_price(early_bird_price_str)
-            registration_fee = self.parse_price(registration_fee_str)
-
-            if original_price is None:
-                self.stdout.write(self.style.ERROR(f"Invalid original price: {original_price_str}"))
-                return None
-
-            # Calculate course start date (first occurrence of weekday on or after term start)
-            course_start_date = self.get_first_weekday_date(start_date, weekday_num)
-
-            # Calculate early bird deadline
-            early_bird_deadline = None
-            if early_bird_price is not None and early_bird_price > 0:
-                early_bird_deadline = course_start_date - timedelta(days=early_bird_days)
-
-            # Generate unique course name
-            full_course_name = f"{course_name} - {weekday_str} {start_time_str} ({term_name})"
-
-            return {
-                'name': full_course_name,
-                'short_description': f"{course_name} class every {weekday_str} at {start_time_str}",
-                'price': original_price,
-                'early_bird_price': early_bird_price if early_bird_price and early_bird_price > 0 else None,
-                'early_bird_deadline': early_bird_deadline,
-                'registration_fee': registration_fee if registration_fee and registration_fee > 0 else None,
-                'course_type': 'group',
-                'category': 'term_courses',
-                'status': 'draft',  # Create as draft for review
-                'start_date': course_start_date,
-                'end_date': end_date,
-                'repeat_pattern': 'weekly',
-                'repeat_weekday': weekday_num,
-                'start_time': start_time,
-                'duration_minutes': duration_minutes,
-                'vacancy': 12,  # Default class capacity
-                'is_online_bookable': False,  # Will be enabled when published
-                'bookable_state': 'closed',  # Will be opened when published
-            }
-
-        except Exception as e:
-            self.stdout.write(self.style.ERROR(f"Error parsing course data: {str(e)}"))
-            return None
+        """Parse and validate course data from TSV row, raising ValueError on bad input"""
+        # Parse weekday
+        weekday_num = self.parse_weekday(weekday_str)
+        if weekday_num is None:
+            raise ValueError(f"Invalid weekday: {weekday_str}")
+
+        # Parse start time
+        start_time = self.parse_time(start_time_str)
+        if not start_time:
+            raise ValueError(f"Invalid start time: {start_time_str}")
+
+        # Parse duration
+        duration_minutes = self.parse_duration(duration_str)
+        if not duration_minutes:
+            raise ValueError(f"Invalid duration: {duration_str}")
+
+        # Parse prices
+        original_price = self.parse_price(original_price_str)
+        early_bird_price = self.parse_price(early_bird_price_str)
+        registration_fee = self.parse_price(registration_fee_str)
+
+        if original_price is None:
+            raise ValueError(f"Invalid original price: {original_price_str}")
+
+        # Calculate course start date (first occurrence of weekday on or after term start)
+        course_start_date = self.get_first_weekday_date(start_date, weekday_num)
+
+        # Calculate early bird deadline
+        early_bird_deadline = None
+        if early_bird_price is not None and early_bird_price > 0:
+            early_bird_deadline = course_start_date - timedelta(days=early_bird_days)
+
+        # Generate unique course name
+        full_course_name = f"{course_name} - {weekday_str} {start_time_str} ({term_name})"
+
+        return {
+            'name': full_course_name,
+            'short_description': f"{course_name} class every {weekday_str} at {start_time_str}",
+            'price': original_price,
+            'early_bird_price': early_bird_price if early_bird_price and early_bird_price > 0 else None,
+            'early_bird_deadline': early_bird_deadline,
+            'registration_fee': registration_fee if registration_fee and registration_fee > 0 else None,
+            'course_type': 'group',
+            'category': 'term_courses',
+            'status': 'draft',  # Create as draft for review
+            'start_date': course_start_date,
+            'end_date': end_date,
+            'repeat_pattern': 'weekly',
+            'repeat_weekday': weekday_num,
+            'daily_weekdays': None,  # Course.save() clears this for weekly courses
+            'start_time': start_time,
+            'duration_minutes': duration_minutes,
+            'vacancy': 12,  # Default class capacity
+            'is_online_bookable': False,  # Will be enabled when published
+            'bookable_state': 'closed',  # Will be opened when published
+        }
 
     def parse_weekday(self, weekday_str):
         """Parse weekday string to weekday number (0=Monday, 6=Sunday)"""
@@ -293,7 +368,7 @@ class Command(BaseCommand):
             days_ahead += 7
         return start_date + timedelta(days=days_ahead)
 
-    def print_summary(self, stats, errors, dry_run):
+    def print_summary(self, stats, errors, dry_run, publish=False):
         """Print generation summary"""
         self.stdout.write('\n' + '=' * 60)
         if dry_run:
@@ -315,7 +390,13 @@ class Command(BaseCommand):
             self.stdout.write('\n' + self.style.WARNING(
                 'To actually create the courses, run the command without --dry-run'
             ))
-        elif not dry_run and stats['success'] > 0:
+        elif not dry_run and stats['success'] > 0 and not publish:
             self.stdout.write('\n' + self.style.SUCCESS(
                 'Courses created as DRAFT status. Review them in Django admin before publishing.'
-            ))
\ No newline at end of file
+            ))
+
+    def print_timings(self, timings):
+        """Print per-phase timings"""
+        self.stdout.write(
+            'Timings: ' + ', '.join(f'{phase} {seconds:.2f}s' for phase, seconds in timings.items())
+        )
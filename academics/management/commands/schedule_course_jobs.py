@@ -0,0 +1,15 @@
+"""
+Management command to register scheduled expiry and early bird jobs
+Saving a course keeps its jobs up to date; run this once after deploying the
+scheduler, or after the Redis data has been lost, to cover existing courses
+"""
+from django.core.management.base import BaseCommand
+from academics.services import CourseScheduleService
+
+
+class Command(BaseCommand):
+    help = 'Register exact-time expiry and early bird jobs for upcoming published courses'
+
+    def handle(self, *args, **options):
+        count = CourseScheduleService.schedule_upcoming()
+        self.stdout.write(self.style.SUCCESS(f'Scheduled date jobs for {count} course(s)'))
@@ -4,6 +4,7 @@ Django management command to update expired courses
 Usage:
     python manage.py update_expired_courses
     python manage.py update_expired_courses --dry-run
+    python manage.py update_expired_courses --window 7
     python manage.py update_expired_courses --check-consistency
 """
 
@@ -28,6 +29,12 @@ class Command(BaseCommand):
             help='Check for status inconsistencies without updating'
         )
         
+        parser.add_argument(
+            '--window',
+            type=int,
+            help='Only check courses that ended in the last N days (default: all courses)'
+        )
+        
         parser.add_argument(
             '--upcoming',
             type=int,
@@ -47,13 +54,15 @@ class Command(BaseCommand):
         elif options['upcoming'] > 0:
             self.show_upcoming_expiry(options['upcoming'])
         else:
-            self.update_expired_courses(options['dry_run'])
+            self.update_expired_courses(options['dry_run'], options['window'])
     
-    def update_expired_courses(self, dry_run=False):
+    def update_expired_courses(self, dry_run=False, window_days=None):
         """Update expired courses"""
+        if window_days is not None and window_days < 0:
+            raise CommandError('--window must be zero or more days')
         self.stdout.write("Checking for courses that need status update...")
         
-        result = CourseStatusService.update_expired_courses(dry_run=dry_run)
+        result = CourseStatusService.update_expired_courses(dry_run=dry_run, window_days=window_days)
         
         if result['found_expired'] == 0:
             self.stdout.write(
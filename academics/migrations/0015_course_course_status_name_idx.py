@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:56
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0014_coursegroup_course_group'),
+        ('facilities', '0003_alter_facility_attendance_radius'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['status', 'name'], name='course_status_name_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:55
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0015_course_course_status_name_idx'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='class',
+            name='roster_version',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Bumped when enrolments or makeups affecting this class change; keys the roster cache', verbose_name='Roster Version'),
+        ),
+    ]
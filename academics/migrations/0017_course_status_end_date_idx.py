@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-18 23:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0016_class_roster_version'),
+        ('facilities', '0003_alter_facility_attendance_radius'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(fields=['status', 'end_date'], name='course_status_end_date_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.5 on 2026-10-18 23:38
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0017_course_status_end_date_idx'),
+        ('facilities', '0003_alter_facility_attendance_radius'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='class',
+            index=models.Index(fields=['is_active', 'date', 'start_time'], name='class_active_date_time_idx'),
+        ),
+    ]
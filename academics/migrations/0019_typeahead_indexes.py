@@ -0,0 +1,25 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:49
+
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0018_class_active_date_time_idx'),
+        ('facilities', '0003_alter_facility_attendance_radius'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='course',
+            name='course_status_name_idx',
+        ),
+        migrations.AddIndex(
+            model_name='course',
+            index=models.Index(models.F('status'), django.db.models.functions.text.Lower('name'), name='course_status_name_lower_idx'),
+        ),
+    ]
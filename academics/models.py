@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils import timezone
 from django.utils.text import slugify
 from django.urls import reverse
@@ -6,6 +7,7 @@ from tinymce.models import HTMLField
 from datetime import timedelta
 from accounts.models import Staff
 from facilities.models import Facility, Classroom
+from core.utils.change_tracking import FieldTrackerMixin
 
 
 class CourseGroup(models.Model):
@@ -163,10 +165,15 @@ class CourseGroup(models.Model):
         return reverse('academics:course_group_public_detail', kwargs={'slug': self.slug})
 
 
-class Course(models.Model):
+class Course(FieldTrackerMixin, models.Model):
     """
     Course model - Enhanced with status, descriptions and period management
     """
+    tracked_fields = (
+        'status', 'repeat_pattern', 'repeat_weekday', 'start_date', 'end_date', 'start_time',
+        'early_bird_price', 'early_bird_deadline',
+    )
+
     COURSE_TYPE_CHOICES = [
         ('group', 'Group Class'),
         ('private', 'Private Lesson'),
@@ -408,6 +415,11 @@ class Course(models.Model):
     class Meta:
         verbose_name = 'Course'
         verbose_name_plural = 'Courses'
+        indexes = [
+            # Typeahead: status IN (...) plus a prefix range on the lower-cased name
+            models.Index(models.F('status'), Lower('name'), name='course_status_name_lower_idx'),
+            models.Index(fields=['status', 'end_date'], name='course_status_end_date_idx'),
+        ]
     
     def get_duration_display(self):
         """
@@ -652,9 +664,8 @@ class Course(models.Model):
         
         # Validate status change restrictions
         if self.pk:
-            old_instance = Course.objects.get(pk=self.pk)
             # Prevent Published -> Draft if enrollments exist
-            if old_instance.status == 'published' and self.status == 'draft':
+            if self.previous('status') == 'published' and self.status == 'draft':
                 if self.enrollments.exists():
                     raise ValidationError({
                         'status': 'Cannot revert to Draft status because this course has existing enrollments. Please use "Archived" instead.'
@@ -826,12 +837,23 @@ class Course(models.Model):
 
         classes_created = 0
 
-        for class_date in schedule_dates:
-            key = (class_date, self.start_time)
+        for class_instance in self.build_classes(schedule_dates):
+            key = (class_instance.date, class_instance.start_time)
             if key in existing_keys:
                 continue
 
-            Class.objects.create(
+            class_instance.save()
+            classes_created += 1
+            existing_keys.add(key)
+
+        return classes_created
+
+    def build_classes(self, schedule_dates=None):
+        """Unsaved Class instances for the course schedule, e.g. for bulk_create()"""
+        if schedule_dates is None:
+            schedule_dates = self._iter_schedule_dates() or []
+        return [
+            Class(
                 course=self,
                 date=class_date,
                 start_time=self.start_time,
@@ -840,10 +862,8 @@ class Course(models.Model):
                 facility=self.facility,
                 classroom=self.classroom
             )
-            classes_created += 1
-            existing_keys.add(key)
-
-        return classes_created
+            for class_date in schedule_dates
+        ]
     
     def get_repeat_config_display(self):
         """Get display text for repeat configuration"""
@@ -1031,10 +1051,12 @@ class Course(models.Model):
         return total_breakdown
 
 
-class Class(models.Model):
+class Class(FieldTrackerMixin, models.Model):
     """
     Class model - Specific instance of a course
     """
+    tracked_fields = ('course', 'date', 'start_time', 'teacher', 'classroom', 'is_active')
+
     course = models.ForeignKey(
         Course,
         on_delete=models.CASCADE,
@@ -1079,6 +1101,12 @@ class Class(models.Model):
         default=True,
         verbose_name='Active Status'
     )
+    roster_version = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        verbose_name='Roster Version',
+        help_text='Bumped when enrolments or makeups affecting this class change; keys the roster cache'
+    )
     
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -1093,6 +1121,20 @@ class Class(models.Model):
         verbose_name = 'Class'
         verbose_name_plural = 'Classes'
         unique_together = ['course', 'date', 'start_time']
+        indexes = [
+            models.Index(fields=['is_active', 'date', 'start_time'], name='class_active_date_time_idx'),
+        ]
+    
+    def save(self, *args, **kwargs):
+        # roster_version only moves through queryset updates
+        # (AttendanceRosterService.invalidate); a stale instance must not
+        # write its old value back and revive an outdated roster cache key
+        if not self._state.adding and kwargs.get('update_fields') is None and not kwargs.get('force_insert'):
+            kwargs['update_fields'] = [
+                field.name for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != 'roster_version'
+            ]
+        super().save(*args, **kwargs)
     
     def get_duration_display(self):
         """
@@ -5,10 +5,13 @@ Centralized service for managing course status updates and consistency checks.
 """
 
 from copy import copy
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 
 from django.utils import timezone
 from django.conf import settings
+from django.db import transaction
 from django.db.models import Q
+from django.db.models.functions import Coalesce
 from academics.models import Course, CourseGroup
 from core.woocommerce_api import WooCommerceSyncService
 import logging
@@ -70,7 +73,7 @@ class CourseGroupCreationService:
         return course
 
     @classmethod
-    def duplicate_child_course(cls, course):
+    def _prepare_duplicate(cls, course):
         duplicate = copy(course)
         duplicate.pk = None
         duplicate.id = None
@@ -80,25 +83,88 @@ class CourseGroupCreationService:
         duplicate.woocommerce_last_synced_at = None
         duplicate.enrollment_deadline = None
         duplicate.name = duplicate.build_group_child_name(base_name=course.get_group_name_snapshot())
+        return duplicate
+
+    @classmethod
+    def duplicate_child_course(cls, course):
+        duplicate = cls._prepare_duplicate(course)
         duplicate.save()
         return duplicate
 
+    @classmethod
+    def duplicate_child_courses(cls, courses):
+        """
+        Duplicate many child courses as drafts with one bulk_create
+
+        Drafts of group children need no WooCommerce sync or date jobs, so
+        skipping Course.save and its signals loses nothing; the name rebuild
+        that Course.save would apply is done here.
+        """
+        duplicates = []
+        for course in courses:
+            duplicate = cls._prepare_duplicate(course)
+            if duplicate.group_id:
+                duplicate.name = duplicate.build_group_child_name()
+            duplicates.append(duplicate)
+
+        Course.objects.bulk_create(duplicates)
+        for duplicate in duplicates:
+            # The copy shares the original's change-tracking baseline
+            duplicate._snapshot_tracked_fields()
+        return duplicates
+
     @classmethod
     def sync_group_snapshot_to_published_children(cls, group):
-        published_children = list(
-            group.courses.filter(status='published').select_related('group')
-        )
+        """
+        Copy the group's shared fields onto its published child courses
+
+        Children that differ from the group are written with one bulk_update.
+        Course.save and its signals do not run: WooCommerce skips group
+        children anyway, and early bird jobs are rescheduled after commit for
+        children whose early bird fields changed.
 
+        Returns:
+            Number of published children
+        """
+        published_children = list(group.courses.filter(status='published'))
+        snapshot = {field_name: getattr(group, field_name) for field_name in GROUP_PUBLISHED_CHILD_SYNC_FIELDS}
+        # Compare database values: an empty image is None on one side and '' on the other
+        prepared = {
+            field_name: Course._meta.get_field(field_name).get_prep_value(value)
+            for field_name, value in snapshot.items()
+        }
+        now = timezone.now()
+
+        changed = []
+        early_bird_changed = []
         for course in published_children:
-            for field_name in GROUP_PUBLISHED_CHILD_SYNC_FIELDS:
-                setattr(course, field_name, getattr(group, field_name))
+            changed_fields = {
+                field_name for field_name, value in prepared.items()
+                if Course._meta.get_field(field_name).get_prep_value(getattr(course, field_name)) != value
+            }
+            for field_name in changed_fields:
+                setattr(course, field_name, snapshot[field_name])
+
+            name = course.name
             course.name = course.build_group_child_name(base_name=group.name)
-            course._skip_auto_status_update = True
-            try:
-                course.save()
-            finally:
-                if hasattr(course, '_skip_auto_status_update'):
-                    delattr(course, '_skip_auto_status_update')
+            # Course.save rebuilds the name once more from the prefix just set
+            course.name = course.build_group_child_name()
+
+            if changed_fields or course.name != name:
+                course.updated_at = now
+                changed.append(course)
+            if changed_fields & {'early_bird_price', 'early_bird_deadline'}:
+                early_bird_changed.append(course)
+
+        if changed:
+            with transaction.atomic():
+                Course.objects.bulk_update(changed, [*GROUP_PUBLISHED_CHILD_SYNC_FIELDS, 'name', 'updated_at'])
+                if early_bird_changed:
+                    def reschedule_early_bird():
+                        for course in early_bird_changed:
+                            CourseScheduleService.schedule(course, ['early_bird'])
+
+                    transaction.on_commit(reschedule_early_bird)
 
         return len(published_children)
 
@@ -162,6 +228,22 @@ class CourseWooCommerceService:
                 'message': str(exc),
             }
 
+    @classmethod
+    def queue_bulk_sync(cls, course_ids):
+        """
+        Sync many courses to WooCommerce in one background job
+
+        Runs inline when the queue is unavailable.
+        """
+        try:
+            import django_rq
+            job = django_rq.get_queue('default').enqueue('academics.tasks.sync_courses', course_ids=list(course_ids))
+            return {'queued': True, 'job_id': job.id}
+        except Exception as exc:
+            logger.warning(f"Queueing bulk WooCommerce sync failed, running inline: {exc}")
+            from academics.tasks import sync_courses
+            return {'queued': False, **sync_courses(course_ids=list(course_ids))}
+
     @staticmethod
     def get_success_suffix(course):
         if course.status == 'published':
@@ -318,58 +400,131 @@ class CourseWooCommerceService:
 
 class CourseStatusService:
     """Service class for managing course status operations"""
-    
+
+    FOLLOWUP_JOB = 'academics.tasks.process_course_status_changes'
+
+    @classmethod
+    def transition_courses(cls, courses, new_status, reason=''):
+        """
+        Move a set of courses to a new status with a single UPDATE
+
+        Course.save() and its post_save signal are bypassed. The WooCommerce
+        resync and logging for every changed course are handed to one
+        follow-up job, queued once the transaction commits.
+
+        Args:
+            courses (QuerySet): Courses to transition; rows already in
+                new_status are left alone
+            new_status (str): Target status
+            reason (str): Short label recorded with the follow-up job
+
+        Returns:
+            dict: {'changed': [{'id', 'name', 'from', 'to'}, ...],
+                   'followup': queue result (empty until the commit)}
+        """
+        updates = {'status': new_status, 'updated_at': timezone.now()}
+        # Mirrors Course.save(): archived courses stop taking bookings
+        if new_status == 'archived':
+            updates['bookable_state'] = 'closed'
+
+        with transaction.atomic():
+            rows = list(
+                courses.exclude(status=new_status)
+                .select_for_update()
+                .order_by('pk')
+                .values('pk', 'name', 'status')
+            )
+            if rows:
+                Course.objects.filter(pk__in=[row['pk'] for row in rows]).update(**updates)
+
+        changed = [
+            {'id': row['pk'], 'name': row['name'], 'from': row['status'], 'to': new_status}
+            for row in rows
+        ]
+        followup = {}
+        if changed:
+            logger.info(f"Moved {len(changed)} course(s) to {new_status} ({reason or 'manual'})")
+            transaction.on_commit(
+                lambda: followup.update(cls._schedule_status_followup(changed, reason))
+            )
+        return {'changed': changed, 'followup': followup}
+
+    @classmethod
+    def _schedule_status_followup(cls, changes, reason):
+        """Queue the follow-up job, or run it inline when the queue is unavailable"""
+        try:
+            import django_rq
+            job = django_rq.get_queue('default').enqueue(cls.FOLLOWUP_JOB, changes=changes, reason=reason)
+            return {'queued': True, 'job_id': job.id}
+        except Exception as exc:
+            logger.warning(f"Queueing course status follow-up failed, running inline: {exc}")
+            from academics.tasks import process_course_status_changes
+            return {'queued': False, **process_course_status_changes(changes=changes, reason=reason)}
+
+    @staticmethod
+    def _past_end_date(courses, today, since=None):
+        """
+        Courses whose last day (end_date, or start_date for single sessions) is before today
+
+        With ``since``, only courses whose last day falls on or after it are
+        matched, using plain range filters on the date columns.
+        """
+        courses = courses.annotate(last_date=Coalesce('end_date', 'start_date'))
+        if since is None:
+            return courses.filter(last_date__lt=today)
+        return courses.filter(
+            Q(end_date__gte=since, end_date__lt=today)
+            | Q(end_date__isnull=True, start_date__gte=since, start_date__lt=today)
+        )
+
     @classmethod
-    def update_expired_courses(cls, dry_run=False):
+    def update_expired_courses(cls, dry_run=False, window_days=None):
         """
         Update courses that should be expired based on end dates
         
         Args:
             dry_run (bool): If True, only return what would be updated without making changes
+            window_days (int): Only look at courses that ended in the last N days
+                (expiry jobs handle each course on time; this is the safety net).
+                None scans every published course.
             
         Returns:
             dict: Summary of updates performed or would be performed
         """
         today = timezone.now().date()
+        since = today - timedelta(days=window_days) if window_days is not None else None
         
         # Find published courses that have passed their end date
-        expired_courses = Course.objects.filter(
-            status='published',
-            end_date__lt=today
-        ) | Course.objects.filter(
-            status='published',
-            end_date__isnull=True,
-            start_date__lt=today
+        expired_courses = list(
+            cls._past_end_date(Course.objects.filter(status='published'), today, since)
+            .order_by('pk')
+            .values('pk', 'name', 'last_date', 'status')
         )
         
-        expired_count = expired_courses.count()
-        
         result = {
-            'found_expired': expired_count,
+            'found_expired': len(expired_courses),
             'updated': 0,
-            'courses': []
+            'courses': [
+                {
+                    'id': course['pk'],
+                    'name': course['name'],
+                    'end_date': course['last_date'],
+                    'current_status': course['status']
+                }
+                for course in expired_courses
+            ],
+            'changed': [],
         }
         
-        if expired_count > 0:
-            for course in expired_courses:
-                end_date = course.end_date or course.start_date
-                result['courses'].append({
-                    'id': course.pk,
-                    'name': course.name,
-                    'end_date': end_date,
-                    'current_status': course.status
-                })
-                
-                if not dry_run:
-                    # Set flag to prevent automatic status update in save()
-                    course._skip_auto_status_update = False
-                    course.status = 'expired'
-                    course.save()
-                    result['updated'] += 1
-                    logger.info(f"Updated course to expired: {course.name} (ID: {course.pk})")
-            
-            if not dry_run:
-                logger.info(f"Updated {result['updated']} courses to expired status")
+        if expired_courses and not dry_run:
+            transition = cls.transition_courses(
+                Course.objects.filter(pk__in=[course['pk'] for course in expired_courses], status='published'),
+                'expired',
+                reason='end_date_passed',
+            )
+            result['changed'] = transition['changed']
+            result['updated'] = len(transition['changed'])
+            logger.info(f"Updated {result['updated']} courses to expired status")
         
         return result
     
@@ -440,37 +595,33 @@ class CourseStatusService:
             force (bool): If True, skip date validation
             
         Returns:
-            dict: Summary of updates
+            dict: Summary of updates, including exactly which courses changed
         """
         if new_status not in ['draft', 'published', 'expired']:
             raise ValueError(f"Invalid status: {new_status}")
         
         courses = Course.objects.filter(id__in=course_ids)
-        updated_count = 0
         skipped = []
         
-        for course in courses:
-            # Validate status change if not forced
-            if not force and new_status == 'published':
-                end_date = course.end_date or course.start_date
-                if end_date < timezone.now().date():
-                    skipped.append({
-                        'id': course.pk,
-                        'name': course.name,
-                        'reason': 'Cannot publish expired course'
-                    })
-                    continue
-            
-            course._skip_auto_status_update = True
-            course.status = new_status
-            course.save()
-            updated_count += 1
-            logger.info(f"Bulk updated course status: {course.name} -> {new_status}")
+        # Validate status change if not forced
+        if not force and new_status == 'published':
+            skipped = [
+                {
+                    'id': course['pk'],
+                    'name': course['name'],
+                    'reason': 'Cannot publish expired course'
+                }
+                for course in cls._past_end_date(courses, timezone.now().date()).values('pk', 'name')
+            ]
+            courses = courses.exclude(pk__in=[course['id'] for course in skipped])
+        
+        transition = cls.transition_courses(courses, new_status, reason='bulk_update')
         
         return {
-            'updated': updated_count,
+            'updated': len(transition['changed']),
             'skipped': skipped,
-            'total_requested': len(course_ids)
+            'total_requested': len(course_ids),
+            'changed': transition['changed'],
         }
     
     @classmethod
@@ -499,3 +650,99 @@ class CourseStatusService:
             start_date__gte=today,
             start_date__lte=future_date
         )
+
+
+class CourseScheduleService:
+    """
+    Exact-time jobs for course date events
+
+    A job is registered on the django-rq scheduler (workers run with
+    --with-scheduler) when a course's end date or early bird deadline is set
+    or changes. Each job id is derived from the course, so registering again
+    moves the existing job. Jobs re-check the course when they fire, which
+    keeps stale jobs harmless; the daily commands remain as a safety net.
+    """
+
+    QUEUE = 'default'
+    EVENTS = {
+        'expiry': 'academics.tasks.expire_course',
+        'early_bird': 'academics.tasks.end_course_early_bird',
+    }
+
+    @staticmethod
+    def job_id(event, course_id):
+        return f'course-{event}-{course_id}'
+
+    @staticmethod
+    def _after(day):
+        """First moment at which ``day`` is in the past for timezone.now().date()"""
+        return datetime.combine(day + timedelta(days=1), time.min, tzinfo=dt_timezone.utc)
+
+    @classmethod
+    def run_at(cls, event, course):
+        """When the event's job should fire for this course, or None if it needs none"""
+        if course.status != 'published':
+            return None
+        if event == 'expiry':
+            return cls._after(course.end_date or course.start_date)
+        if course.early_bird_price is not None and course.early_bird_deadline:
+            return cls._after(course.early_bird_deadline)
+        return None
+
+    @classmethod
+    def schedule(cls, course, events=None):
+        """
+        Register (or move, or cancel) the jobs for a course
+
+        Returns:
+            dict: {event: scheduled datetime or None}; empty if the queue is unavailable
+        """
+        scheduled = {}
+        try:
+            import django_rq
+            queue = django_rq.get_queue(cls.QUEUE)
+            for event in events or cls.EVENTS:
+                job_id = cls.job_id(event, course.pk)
+                when = cls.run_at(event, course)
+                if when is None or when <= timezone.now():
+                    # Nothing to wait for: drop any earlier job and leave past dates to the daily run
+                    cls._cancel(queue, job_id)
+                    scheduled[event] = None
+                    continue
+                queue.enqueue_at(when, cls.EVENTS[event], course_id=course.pk, job_id=job_id)
+                scheduled[event] = when
+        except Exception as exc:
+            logger.warning(f"Could not schedule date jobs for course {course.pk}: {exc}")
+            return {}
+        return scheduled
+
+    @classmethod
+    def cancel(cls, course_id):
+        """Remove every pending job for a course"""
+        try:
+            import django_rq
+            queue = django_rq.get_queue(cls.QUEUE)
+            for event in cls.EVENTS:
+                cls._cancel(queue, cls.job_id(event, course_id))
+        except Exception as exc:
+            logger.warning(f"Could not cancel date jobs for course {course_id}: {exc}")
+
+    @staticmethod
+    def _cancel(queue, job_id):
+        from rq.exceptions import NoSuchJobError
+
+        try:
+            queue.scheduled_job_registry.remove(job_id, delete_job=True)
+        except NoSuchJobError:
+            pass
+
+    @classmethod
+    def schedule_upcoming(cls):
+        """Register jobs for every published course with a future date event"""
+        today = timezone.now().date()
+        courses = Course.objects.filter(status='published').filter(
+            Q(end_date__gte=today)
+            | Q(end_date__isnull=True, start_date__gte=today)
+            | Q(early_bird_price__isnull=False, early_bird_deadline__gte=today)
+        )
+        return sum(1 for course in courses.iterator() if cls.schedule(course))
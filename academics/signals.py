@@ -1,6 +1,7 @@
 """
 Django signals for automatic WooCommerce synchronization
 """
+from django.db import transaction
 from django.db.models.signals import post_save, post_delete
 from django.dispatch import receiver
 from django.contrib.sites.models import Site
@@ -50,6 +51,33 @@ def sync_course_to_woocommerce(sender, instance, created, **kwargs):
         logger.error(f"Error in course WooCommerce sync signal: {str(e)}")
 
 
+@receiver(post_save, sender=Course)
+def schedule_course_date_jobs(sender, instance, created, raw=False, **kwargs):
+    """
+    Register exact-time expiry and early bird jobs when the relevant dates change
+    """
+    if raw:
+        return
+
+    from academics.services import CourseScheduleService
+
+    events = []
+    if created or instance.has_changed('status', 'start_date', 'end_date'):
+        events.append('expiry')
+    if created or instance.has_changed('status', 'early_bird_price', 'early_bird_deadline'):
+        events.append('early_bird')
+    if events:
+        transaction.on_commit(lambda: CourseScheduleService.schedule(instance, events))
+
+
+@receiver(post_delete, sender=Course)
+def cancel_course_date_jobs(sender, instance, **kwargs):
+    from academics.services import CourseScheduleService
+
+    course_id = instance.pk
+    transaction.on_commit(lambda: CourseScheduleService.cancel(course_id))
+
+
 @receiver(post_delete, sender=Course)
 def remove_course_from_woocommerce(sender, instance, **kwargs):
     """
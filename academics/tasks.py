@@ -0,0 +1,101 @@
+"""
+django-rq task definitions for academics.
+These tasks are queued by academics.services and are safe to run in
+background workers.
+"""
+import logging
+from django.utils import timezone
+from academics.models import Course
+
+logger = logging.getLogger(__name__)
+
+
+def process_course_status_changes(changes, reason=''):
+    """
+    Background job: side effects of a bulk course status transition.
+
+    Resyncs the changed courses to WooCommerce, logs every transition and
+    registers or cancels their date jobs to match the new status.
+    ``changes`` is the list returned by CourseStatusService.transition_courses.
+    """
+    from academics.services import CourseScheduleService, CourseWooCommerceService
+
+    courses = Course.objects.in_bulk([change['id'] for change in changes])
+    summary = {'synced': 0, 'skipped': 0, 'failed': 0, 'missing': 0}
+
+    for change in changes:
+        course = courses.get(change['id'])
+        if course is None:
+            summary['missing'] += 1
+            continue
+
+        logger.info(
+            f"Course {course.pk} '{course.name}' status {change['from']} -> {change['to']}"
+            f"{f' ({reason})' if reason else ''}"
+        )
+
+        CourseScheduleService.schedule(course)
+        result = CourseWooCommerceService.sync_saved_course(course)
+        if result.get('status') == 'success':
+            summary['synced'] += 1
+        elif result.get('status') == 'error':
+            summary['failed'] += 1
+            logger.error(f"Failed to sync course {course.pk} to WooCommerce: {result.get('message')}")
+        else:
+            summary['skipped'] += 1
+
+    return summary
+
+
+def expire_course(course_id):
+    """Scheduled job: expire one course once its end date has passed."""
+    from academics.services import CourseStatusService
+
+    courses = CourseStatusService._past_end_date(
+        Course.objects.filter(pk=course_id, status='published'), timezone.now().date()
+    )
+    transition = CourseStatusService.transition_courses(courses, 'expired', reason='scheduled_expiry')
+    return len(transition['changed'])
+
+
+def end_course_early_bird(course_id):
+    """Scheduled job: push regular pricing to WooCommerce once the early bird deadline has passed."""
+    from academics.services import CourseWooCommerceService
+
+    course = Course.objects.filter(
+        pk=course_id,
+        status='published',
+        early_bird_price__isnull=False,
+        early_bird_deadline__lt=timezone.now().date(),
+    ).first()
+    if course is None:
+        return {'status': 'skipped', 'message': 'Early bird pricing is not ending for this course.'}
+
+    result = CourseWooCommerceService.sync_saved_course(course)
+    logger.info(f"Early bird pricing ended for course {course.pk} '{course.name}': {result.get('status')}")
+    return result
+
+
+def sync_courses(course_ids):
+    """
+    Background job: sync a batch of courses to WooCommerce.
+
+    Used after bulk creation, which skips the per-course post_save sync. Date
+    jobs are registered here as well for the same reason.
+    """
+    from academics.services import CourseScheduleService, CourseWooCommerceService
+
+    summary = {'synced': 0, 'skipped': 0, 'failed': 0}
+    for course in Course.objects.filter(pk__in=course_ids).order_by('pk').iterator():
+        CourseScheduleService.schedule(course)
+        result = CourseWooCommerceService.sync_saved_course(course)
+        if result.get('status') == 'success':
+            summary['synced'] += 1
+        elif result.get('status') == 'error':
+            summary['failed'] += 1
+            logger.error(f"Failed to sync course {course.pk} to WooCommerce: {result.get('message')}")
+        else:
+            summary['skipped'] += 1
+
+    logger.info(f"Bulk WooCommerce sync of {len(course_ids)} course(s): {summary}")
+    return summary
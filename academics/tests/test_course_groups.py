@@ -463,3 +463,64 @@ class CourseGroupTests(TestCase):
         child_course.refresh_from_db()
         self.assertEqual(child_course.status, 'expired')
         self.assertEqual(result['updated'], 1)
+
+    def create_published_children(self, group, count):
+        start = timezone.now().date() + timedelta(days=7)
+        return [
+            self.create_child_course(
+                group,
+                status='published',
+                start_date=start + timedelta(days=index),
+                end_date=start + timedelta(days=index + 56),
+                repeat_weekday=(start + timedelta(days=index)).weekday(),
+            )
+            for index in range(count)
+        ]
+
+    def test_sync_published_children_writes_changed_children_in_one_update(self):
+        group = self.create_group(early_bird_deadline=timezone.now().date() + timedelta(days=3))
+        children = self.create_published_children(group, 3)
+        draft_child = self.create_child_course(group, status='draft')
+
+        group.name = 'Renamed Studio'
+        group.price = 960
+        group.early_bird_deadline = timezone.now().date() + timedelta(days=5)
+        group.save()
+
+        with patch('academics.services.CourseScheduleService.schedule') as schedule, \
+                self.captureOnCommitCallbacks(execute=True):
+            with self.assertNumQueries(4):
+                updated = CourseGroupCreationService.sync_group_snapshot_to_published_children(group)
+
+        self.assertEqual(updated, 3)
+        self.assertEqual(schedule.call_count, 3)
+        self.assertEqual(schedule.call_args.args[1], ['early_bird'])
+        for child in children:
+            child.refresh_from_db()
+            self.assertEqual(str(child.price), '960.00')
+            self.assertEqual(child.early_bird_deadline, group.early_bird_deadline)
+            self.assertEqual(child.name, child.build_group_child_name(base_name='Renamed Studio'))
+        draft_child.refresh_from_db()
+        self.assertEqual(str(draft_child.price), '899.00')
+
+        # A second pass finds nothing to write
+        with self.assertNumQueries(1):
+            CourseGroupCreationService.sync_group_snapshot_to_published_children(group)
+
+    def test_duplicate_child_courses_matches_single_duplicate(self):
+        group = self.create_group()
+        children = self.create_published_children(group, 2)
+
+        single = CourseGroupCreationService.duplicate_child_course(children[0])
+        with self.assertNumQueries(1):
+            duplicates = CourseGroupCreationService.duplicate_child_courses(children)
+
+        self.assertTrue(all(duplicate.pk for duplicate in duplicates))
+        self.assertEqual(duplicates[0].name, single.name)
+        for original, duplicate in zip(children, duplicates):
+            duplicate.refresh_from_db()
+            self.assertEqual(duplicate.status, 'draft')
+            self.assertEqual(duplicate.group_id, group.pk)
+            self.assertIsNone(duplicate.external_id)
+            self.assertEqual(duplicate.start_date, original.start_date)
+            self.assertFalse(duplicate.has_changed())
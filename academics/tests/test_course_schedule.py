@@ -0,0 +1,115 @@
+from datetime import datetime, time, timedelta, timezone as dt_timezone
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.test import TestCase
+from django.utils import timezone
+
+from academics.models import Course
+from academics.services import CourseScheduleService, CourseStatusService
+from academics.tasks import end_course_early_bird, expire_course
+
+
+class CourseScheduleTest(TestCase):
+    def setUp(self):
+        patcher = patch('academics.signals.WooCommerceSyncService')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        queue_patcher = patch('django_rq.get_queue')
+        self.queue = queue_patcher.start().return_value
+        self.addCleanup(queue_patcher.stop)
+
+        self.today = timezone.now().date()
+
+    def _course(self, **kwargs):
+        values = {
+            'name': 'Scheduled Course',
+            'start_date': self.today,
+            'end_date': self.today + timedelta(days=30),
+            'start_time': '10:00',
+            'duration_minutes': 60,
+            'price': Decimal('100.00'),
+            'status': 'published',
+        }
+        values.update(kwargs)
+        return Course.objects.create(**values)
+
+    def _midnight_after(self, day):
+        return datetime.combine(day + timedelta(days=1), time.min, tzinfo=dt_timezone.utc)
+
+    def test_saving_course_registers_exact_time_jobs(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            course = self._course(
+                early_bird_price=Decimal('80.00'),
+                early_bird_deadline=self.today + timedelta(days=7),
+            )
+
+        calls = {call.kwargs['job_id']: call for call in self.queue.enqueue_at.call_args_list}
+        expiry = calls[f'course-expiry-{course.pk}']
+        self.assertEqual(expiry.args, (self._midnight_after(course.end_date), 'academics.tasks.expire_course'))
+        self.assertEqual(expiry.kwargs['course_id'], course.pk)
+        early_bird = calls[f'course-early_bird-{course.pk}']
+        self.assertEqual(early_bird.args[0], self._midnight_after(course.early_bird_deadline))
+
+    def test_only_relevant_changes_reschedule(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            course = self._course()
+        self.queue.reset_mock()
+
+        course = Course.objects.get(pk=course.pk)
+        course.description = 'Updated description'
+        with self.captureOnCommitCallbacks(execute=True):
+            course.save()
+        self.queue.enqueue_at.assert_not_called()
+
+        course.end_date = self.today + timedelta(days=60)
+        with self.captureOnCommitCallbacks(execute=True):
+            course.save()
+        self.queue.enqueue_at.assert_called_once()
+        self.assertEqual(self.queue.enqueue_at.call_args.args[0], self._midnight_after(course.end_date))
+
+    def test_unpublishing_cancels_jobs(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            course = self._course()
+        self.queue.reset_mock()
+
+        course = Course.objects.get(pk=course.pk)
+        course.status = 'draft'
+        with self.captureOnCommitCallbacks(execute=True):
+            course.save()
+
+        self.queue.enqueue_at.assert_not_called()
+        removed = [call.args[0] for call in self.queue.scheduled_job_registry.remove.call_args_list]
+        self.assertIn(f'course-expiry-{course.pk}', removed)
+
+    def test_jobs_act_only_once_the_date_has_passed(self):
+        course = self._course(early_bird_price=Decimal('80.00'), early_bird_deadline=self.today)
+
+        self.assertEqual(expire_course(course.pk), 0)
+        self.assertEqual(end_course_early_bird(course.pk)['status'], 'skipped')
+
+        Course.objects.filter(pk=course.pk).update(
+            end_date=self.today - timedelta(days=1), early_bird_deadline=self.today - timedelta(days=1)
+        )
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertEqual(expire_course(course.pk), 1)
+        self.assertEqual(Course.objects.get(pk=course.pk).status, 'expired')
+
+    def test_expiry_window_limits_daily_scan(self):
+        recent = self._course(start_date=self.today - timedelta(days=10), end_date=self.today - timedelta(days=2))
+        old = self._course(start_date=self.today - timedelta(days=60), end_date=None)
+        Course.objects.filter(pk__in=[recent.pk, old.pk]).update(status='published')
+
+        result = CourseStatusService.update_expired_courses(dry_run=True, window_days=7)
+        self.assertEqual([course['id'] for course in result['courses']], [recent.pk])
+
+        result = CourseStatusService.update_expired_courses(dry_run=True)
+        self.assertEqual(sorted(course['id'] for course in result['courses']), sorted([recent.pk, old.pk]))
+
+    def test_queue_unavailable_does_not_block_save(self):
+        self.queue.enqueue_at.side_effect = ConnectionError('redis down')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            course = self._course()
+
+        self.assertEqual(CourseScheduleService.schedule(course), {})
@@ -3,6 +3,7 @@ from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import timedelta
 from academics.models import Course, Class
+from academics.services import CourseStatusService
 from enrollment.models import Enrollment
 from students.models import Student
 from accounts.models import Staff
@@ -97,3 +98,80 @@ class CourseStatusTests(TestCase):
         course_id = self.course.id
         self.course.delete()
         self.assertFalse(Course.objects.filter(id=course_id).exists())
+
+
+class BulkCourseStatusTransitionTests(TestCase):
+    def setUp(self):
+        patcher = patch('academics.signals.WooCommerceSyncService')
+        self.mock_signal_service = patcher.start()
+        self.addCleanup(patcher.stop)
+
+        today = timezone.now().date()
+        self.past = [
+            Course.objects.create(
+                name=f'Past Course {index}',
+                start_date=today - timedelta(days=30),
+                end_date=today - timedelta(days=1),
+                start_time='10:00',
+                duration_minutes=60,
+                price=100.00,
+                status='draft',
+            )
+            for index in range(3)
+        ]
+        Course.objects.filter(pk__in=[course.pk for course in self.past]).update(status='published')
+        self.current = Course.objects.create(
+            name='Current Course',
+            start_date=today,
+            end_date=today + timedelta(days=30),
+            start_time='10:00',
+            duration_minutes=60,
+            price=100.00,
+            status='published',
+        )
+        self.mock_signal_service.reset_mock()
+
+    @patch('django_rq.get_queue')
+    def test_update_expired_courses_uses_one_update_and_one_job(self, mock_get_queue):
+        with self.captureOnCommitCallbacks(execute=True):
+            # preview select, then savepoint, locked select, one update, release
+            with self.assertNumQueries(5):
+                result = CourseStatusService.update_expired_courses()
+
+        self.assertEqual(result['found_expired'], 3)
+        self.assertEqual(result['updated'], 3)
+        self.assertEqual(
+            [(change['id'], change['from'], change['to']) for change in result['changed']],
+            [(course.pk, 'published', 'expired') for course in self.past],
+        )
+        self.assertEqual(
+            set(Course.objects.filter(status='expired').values_list('pk', flat=True)),
+            {course.pk for course in self.past},
+        )
+        self.mock_signal_service.assert_not_called()
+
+        enqueue = mock_get_queue.return_value.enqueue
+        enqueue.assert_called_once()
+        self.assertEqual(enqueue.call_args.args[0], 'academics.tasks.process_course_status_changes')
+        self.assertEqual(enqueue.call_args.kwargs['changes'], result['changed'])
+
+    def test_bulk_update_status_reports_only_changed_rows(self):
+        with patch('django_rq.get_queue', side_effect=Exception('redis down')):
+            with self.captureOnCommitCallbacks(execute=True):
+                result = CourseStatusService.bulk_update_status(
+                    [self.past[0].pk, self.current.pk], 'published'
+                )
+                archived = CourseStatusService.transition_courses(
+                    Course.objects.filter(pk=self.current.pk), 'archived'
+                )
+
+        # Past course is skipped, current course was already published
+        self.assertEqual(result['updated'], 0)
+        self.assertEqual([course['id'] for course in result['skipped']], [self.past[0].pk])
+        self.assertEqual(result['changed'], [])
+
+        self.current.refresh_from_db()
+        self.assertEqual(self.current.status, 'archived')
+        self.assertEqual(self.current.bookable_state, 'closed')
+        # Queue unavailable: follow-up ran inline (sync disabled in tests)
+        self.assertEqual(archived['followup'], {'queued': False, 'synced': 0, 'skipped': 1, 'failed': 0, 'missing': 0})
@@ -0,0 +1,98 @@
+import os
+import tempfile
+from io import StringIO
+from unittest.mock import patch
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from academics.models import Class, Course
+from enrollment.models import Enrollment
+from students.models import Student
+
+TSV_HEADER = 'Weekday\tCourse\tStart Time\tDuration (mins)\tOriginal Price\tEarly Bird Price\tNew Student Enrolment Fee\n'
+
+
+class GenerateTermCoursesCommandTests(TestCase):
+    def setUp(self):
+        patcher = patch('academics.signals.WooCommerceSyncService')
+        self.mock_signal_service = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _tsv(self, *rows):
+        handle, path = tempfile.mkstemp(suffix='.tsv')
+        with os.fdopen(handle, 'w', encoding='utf-8') as tsv:
+            tsv.write(TSV_HEADER)
+            tsv.writelines('\t'.join(row) + '\n' for row in rows)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def _run(self, path, *args):
+        out = StringIO()
+        call_command(
+            'generate_term_courses', '--file', path, '--start-date', '2030-10-14', '--end-date', '2030-12-21',
+            '--term-name', 'Term 4 2030', *args, stdout=out
+        )
+        return out.getvalue()
+
+    def test_bulk_creates_courses_and_classes(self):
+        path = self._tsv(
+            ('Wednesday', 'Artisan Studio', '4:00PM', '120', '899', '799', '160'),
+            ('Saturday', 'Protege Studio', '10:00AM', '90', '699', '', ''),
+        )
+
+        with self.assertNumQueries(5):  # existing names, savepoint, courses, classes, release
+            output = self._run(path)
+
+        wednesday = Course.objects.get(name='Artisan Studio - Wednesday 4:00PM (Term 4 2030)')
+        self.assertEqual(wednesday.status, 'draft')
+        self.assertEqual(str(wednesday.start_date), '2030-10-16')
+        self.assertEqual(Class.objects.filter(course=wednesday).count(), 10)
+        self.assertEqual(Class.objects.count(), 20)
+        self.mock_signal_service.assert_not_called()
+        self.assertIn('Created 2 courses and 20 classes', output)
+        self.assertIn('Timings: validate', output)
+
+    def test_invalid_row_aborts_before_writing(self):
+        path = self._tsv(
+            ('Wednesday', 'Artisan Studio', '4:00PM', '120', '899', '799', '160'),
+            ('Funday', 'Broken Studio', '4:00PM', '120', '899', '799', '160'),
+        )
+
+        with self.assertRaisesMessage(CommandError, '1 row(s) failed validation'):
+            self._run(path)
+
+        self.assertFalse(Course.objects.exists())
+
+    def test_publish_queues_one_sync_job(self):
+        path = self._tsv(
+            ('Monday', 'Artisan Studio', '4:00PM', '120', '899', '799', '160'),
+            ('Tuesday', 'Protege Studio', '4:00PM', '120', '899', '799', '160'),
+        )
+
+        with patch('django_rq.get_queue') as mock_get_queue:
+            self._run(path, '--publish')
+
+        enqueue = mock_get_queue.return_value.enqueue
+        enqueue.assert_called_once()
+        self.assertEqual(enqueue.call_args.args[0], 'academics.tasks.sync_courses')
+        self.assertEqual(sorted(enqueue.call_args.kwargs['course_ids']), sorted(Course.objects.values_list('pk', flat=True)))
+        self.assertEqual(set(Course.objects.values_list('status', flat=True)), {'published'})
+
+    def test_clear_existing_keeps_enrolled_courses(self):
+        path = self._tsv(
+            ('Wednesday', 'Artisan Studio', '4:00PM', '120', '899', '799', '160'),
+            ('Saturday', 'Protege Studio', '10:00AM', '90', '699', '', ''),
+        )
+        self._run(path)
+        enrolled = Course.objects.get(name__startswith='Artisan Studio')
+        Enrollment.objects.create(student=Student.objects.create(first_name='Kept', last_name='Student'), course=enrolled)
+        cleared_pk = Course.objects.get(name__startswith='Protege Studio').pk
+
+        output = self._run(path, '--clear-existing')
+
+        self.assertIn("Course 'Artisan Studio - Wednesday 4:00PM (Term 4 2030)' already exists, skipping", output)
+        self.assertTrue(Course.objects.filter(pk=enrolled.pk).exists())
+        self.assertFalse(Course.objects.filter(pk=cleared_pk).exists())
+        self.assertEqual(Course.objects.filter(name__startswith='Protege Studio').count(), 1)
@@ -787,9 +787,8 @@ class CourseUpdateView(LoginRequiredMixin, UpdateView):
         return kwargs
     
     def form_valid(self, form):
-        # Capture original repeat configuration from the database before saving
-        original = Course.objects.get(pk=form.instance.pk)
-        original_repeat_weekday = original.repeat_weekday
+        # Capture original repeat configuration before saving
+        original_repeat_weekday = form.instance.previous('repeat_weekday')
 
         CourseWooCommerceService.mark_manual_sync(form.instance)
         try:
@@ -1309,14 +1308,9 @@ class ClassUpdateView(LoginRequiredMixin, UpdateView):
     def form_valid(self, form):
         # Check if key fields have changed and warn about impacts
         if self.object.pk:  # Only for updates, not new instances
-            original = Class.objects.get(pk=self.object.pk)
-            changed_fields = []
-            
             # Check critical fields that might affect students/attendance
             critical_fields = ['date', 'start_time', 'teacher', 'classroom']
-            for field in critical_fields:
-                if getattr(original, field) != form.cleaned_data.get(field):
-                    changed_fields.append(field)
+            changed_fields = [field for field in critical_fields if self.object.has_changed(field)]
             
             if changed_fields:
                 field_names = ', '.join(changed_fields)
@@ -1416,7 +1410,12 @@ def class_add_students(request, pk):
 @require_http_methods(["GET"])
 def class_makeup_candidates(request, pk):
     """
-    Return student metadata and candidate classes for makeup scheduling.
+    Return student metadata and one page of candidate classes for makeup scheduling.
+
+    Optional GET filters: date_from, date_to (YYYY-MM-DD), course_id,
+    facility_id, weekday (repeatable, Monday=0), limit and cursor (the
+    next_cursor of the previous page). Once the date window has no more
+    pages, next_window holds the date_from/date_to to request next.
     """
     class_instance = get_object_or_404(Class, pk=pk)
 
@@ -1435,16 +1434,48 @@ def class_makeup_candidates(request, pk):
             'message': 'student_id is required.'
         }, status=400)
 
+    from django.core.exceptions import ValidationError
+    from django.utils.dateparse import parse_date
     from students.models import Student
     from enrollment.services import MakeupSessionService
 
+    filters = {}
+    try:
+        for name in ('date_from', 'date_to'):
+            if request.GET.get(name):
+                filters[name] = parse_date(request.GET[name])
+                if filters[name] is None:
+                    raise ValueError(name)
+        for name in ('course_id', 'facility_id', 'limit'):
+            if request.GET.get(name):
+                filters[name] = int(request.GET[name])
+        if filters.get('limit', 1) < 1:
+            raise ValueError('limit')
+        weekdays = [int(day) for day in request.GET.getlist('weekday')]
+        if any(day not in range(7) for day in weekdays):
+            raise ValueError('weekday')
+    except ValueError:
+        return JsonResponse({
+            'success': False,
+            'message': 'Invalid filter value.'
+        }, status=400)
+
     student = get_object_or_404(Student, pk=student_id)
-    payload = MakeupSessionService.get_candidate_classes(
-        student=student,
-        current_class=class_instance,
-        initiated_from=initiated_from,
-        actor=request.user,
-    )
+    try:
+        payload = MakeupSessionService.get_candidate_classes(
+            student=student,
+            current_class=class_instance,
+            initiated_from=initiated_from,
+            actor=request.user,
+            weekdays=weekdays,
+            cursor=request.GET.get('cursor'),
+            **filters,
+        )
+    except ValidationError as e:
+        return JsonResponse({
+            'success': False,
+            'message': ' '.join(e.messages)
+        }, status=400)
 
     return JsonResponse({
         'success': True,
@@ -5,7 +5,7 @@ from django.utils.safestring import mark_safe
 from .models import (
     ClockInOut, EmailSettings, SMSSettings, EmailLog, SMSLog, 
     NotificationQuota, WooCommerceSyncLog, WooCommerceSyncQueue, OrganisationSettings,
-    TeacherAttendance
+    TeacherAttendance, GeocodeCache, StaffDailyHours, DeliveryDailyStats, LogArchive
 )
 import json
 
@@ -165,6 +165,45 @@ class SMSLogAdmin(admin.ModelAdmin):
     readonly_fields = ('created_at', 'updated_at')
 
 
+@admin.register(GeocodeCache)
+class GeocodeCacheAdmin(admin.ModelAdmin):
+    list_display = ('address', 'status', 'latitude', 'longitude', 'provider', 'fetched_at', 'expires_at')
+    list_filter = ('status', 'provider')
+    search_fields = ('address', 'formatted_address')
+    ordering = ('-fetched_at',)
+    
+    readonly_fields = ('address_key', 'fetched_at')
+
+
+@admin.register(StaffDailyHours)
+class StaffDailyHoursAdmin(admin.ModelAdmin):
+    list_display = ('staff', 'date', 'total_hours', 'sessions', 'completed_sessions', 'class_count', 'has_unmatched_clock_in', 'has_unmatched_clock_out')
+    list_filter = ('has_unmatched_clock_in', 'has_unmatched_clock_out', 'date')
+    search_fields = ('staff__first_name', 'staff__last_name', 'staff__username')
+    ordering = ('-date',)
+    
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(DeliveryDailyStats)
+class DeliveryDailyStatsAdmin(admin.ModelAdmin):
+    list_display = ('date', 'channel', 'message_type', 'sent_count', 'failed_count', 'updated_at')
+    list_filter = ('channel', 'message_type')
+    ordering = ('-date', 'channel', 'message_type')
+    
+    readonly_fields = ('updated_at',)
+
+
+@admin.register(LogArchive)
+class LogArchiveAdmin(admin.ModelAdmin):
+    list_display = ('dataset', 'date', 'row_count', 'size_bytes', 'archived_at', 'restored_at')
+    list_filter = ('dataset',)
+    search_fields = ('path',)
+    ordering = ('-date', 'dataset')
+    
+    readonly_fields = ('archived_at', 'restored_at')
+
+
 @admin.register(NotificationQuota)
 class NotificationQuotaAdmin(admin.ModelAdmin):
     list_display = ('notification_type', 'year', 'month', 'used_count', 'monthly_limit', 'usage_percentage_display', 'is_quota_exceeded')
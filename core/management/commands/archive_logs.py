@@ -0,0 +1,83 @@
+"""
+Management command to archive old log rows
+Moves email/SMS/WooCommerce sync logs and student activity older than their
+retention horizon into gzipped daily files, or restores an archived period
+"""
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from core.services.log_archive_service import LogArchiveService
+
+
+class Command(BaseCommand):
+    help = 'Archive old log rows to compressed daily files, or re-hydrate an archived period'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--dataset',
+            action='append',
+            choices=list(LogArchiveService.DATASETS),
+            help='Dataset to process (repeatable, default: all)'
+        )
+        parser.add_argument(
+            '--older-than',
+            type=int,
+            help='Archive rows older than this many days (default: LOG_ARCHIVE_AFTER_DAYS)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Report what would be archived without writing anything'
+        )
+        parser.add_argument(
+            '--rehydrate',
+            action='store_true',
+            help='Restore archived rows between --start and --end instead of archiving'
+        )
+        parser.add_argument(
+            '--start',
+            type=str,
+            help='First date to re-hydrate, YYYY-MM-DD'
+        )
+        parser.add_argument(
+            '--end',
+            type=str,
+            help='Last date to re-hydrate, YYYY-MM-DD (default: --start)'
+        )
+
+    def handle(self, *args, **options):
+        datasets = options['dataset'] or list(LogArchiveService.DATASETS)
+
+        if options['rehydrate']:
+            start_date = self._parse_date(options['start'], '--start')
+            if not start_date:
+                raise CommandError('--rehydrate requires --start')
+            end_date = self._parse_date(options['end'], '--end') or start_date
+            if end_date < start_date:
+                raise CommandError('--end must not be before --start')
+
+            for dataset in datasets:
+                result = LogArchiveService.rehydrate(dataset, start_date, end_date)
+                self.stdout.write(self.style.SUCCESS(
+                    f"{dataset}: restored {result['restored']} row(s), skipped {result['skipped']}"
+                ))
+            return
+
+        if options['older_than'] is not None and options['older_than'] < 1:
+            raise CommandError('--older-than must be at least 1')
+
+        for dataset in datasets:
+            result = LogArchiveService.archive(
+                dataset, older_than_days=options['older_than'], dry_run=options['dry_run']
+            )
+            verb = 'Would archive' if options['dry_run'] else 'Archived'
+            self.stdout.write(self.style.SUCCESS(
+                f"{dataset}: {verb} {result['rows']} row(s) across {result['days']} day(s)"
+            ))
+
+    def _parse_date(self, value, option):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError(f'{option} must be a date in YYYY-MM-DD format')
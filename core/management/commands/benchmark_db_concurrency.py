@@ -0,0 +1,110 @@
+"""
+Management command to benchmark SQLite write concurrency
+Runs several processes doing short read-modify-write transactions (the shape
+of a bulk send logging rows and bumping counters) against a scratch database,
+once with SQLite's defaults and once with the tuned profile from settings
+"""
+import multiprocessing
+import os
+import sqlite3
+import tempfile
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+def _connect(path, profile, pragmas):
+    if profile == 'tuned':
+        conn = sqlite3.connect(path, timeout=pragmas['busy_timeout'] / 1000, isolation_level=None)
+        for name, value in pragmas.items():
+            conn.execute(f'PRAGMA {name}={value}')
+    else:
+        # Django's previous behaviour: rollback journal, 5s timeout, deferred transactions
+        conn = sqlite3.connect(path, timeout=5, isolation_level=None)
+    return conn
+
+
+def _worker(path, profile, pragmas, transactions):
+    conn = _connect(path, profile, pragmas)
+    begin = 'BEGIN IMMEDIATE' if profile == 'tuned' else 'BEGIN'
+    committed = locked = 0
+    for index in range(transactions):
+        try:
+            conn.execute(begin)
+            sent = conn.execute('SELECT sent FROM counter WHERE id = 1').fetchone()[0]
+            conn.execute('INSERT INTO log (worker, seq, payload) VALUES (?, ?, ?)', (os.getpid(), index, 'x' * 200))
+            conn.execute('UPDATE counter SET sent = ? WHERE id = 1', (sent + 1,))
+            conn.execute('COMMIT')
+            committed += 1
+        except sqlite3.OperationalError as exc:
+            if conn.in_transaction:
+                conn.execute('ROLLBACK')
+            if 'locked' not in str(exc) and 'busy' not in str(exc):
+                raise
+            locked += 1
+    conn.close()
+    return committed, locked
+
+
+class Command(BaseCommand):
+    help = 'Compare lock contention between default and tuned SQLite settings'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Concurrent writer processes (default: 8)'
+        )
+        parser.add_argument(
+            '--transactions',
+            type=int,
+            default=200,
+            help='Transactions per worker (default: 200)'
+        )
+        parser.add_argument(
+            '--profile',
+            action='append',
+            choices=['default', 'tuned'],
+            help='Profile to run (repeatable, default: both)'
+        )
+
+    def handle(self, *args, **options):
+        if options['workers'] < 1 or options['transactions'] < 1:
+            raise CommandError('--workers and --transactions must be at least 1')
+
+        for profile in options['profile'] or ['default', 'tuned']:
+            result = self.run_profile(profile, options['workers'], options['transactions'])
+            self.stdout.write(self.style.SUCCESS(
+                f"{profile}: {result['committed']} committed, {result['locked']} locked, "
+                f"counter={result['counter']} in {result['seconds']:.2f}s "
+                f"({result['committed'] / result['seconds']:.0f} tx/s)"
+            ))
+
+    def run_profile(self, profile, workers, transactions):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'benchmark.sqlite3')
+            setup = _connect(path, profile, settings.SQLITE_PRAGMAS)
+            setup.execute('CREATE TABLE counter (id INTEGER PRIMARY KEY, sent INTEGER NOT NULL)')
+            setup.execute('CREATE TABLE log (id INTEGER PRIMARY KEY, worker INTEGER, seq INTEGER, payload TEXT)')
+            setup.execute('INSERT INTO counter (id, sent) VALUES (1, 0)')
+            setup.close()
+
+            started = time.perf_counter()
+            with multiprocessing.Pool(workers) as pool:
+                results = pool.starmap(
+                    _worker, [(path, profile, settings.SQLITE_PRAGMAS, transactions)] * workers
+                )
+            seconds = time.perf_counter() - started
+
+            check = sqlite3.connect(path)
+            counter = check.execute('SELECT sent FROM counter WHERE id = 1').fetchone()[0]
+            check.close()
+
+        return {
+            'committed': sum(committed for committed, _ in results),
+            'locked': sum(locked for _, locked in results),
+            'counter': counter,
+            'seconds': max(seconds, 1e-6),
+        }
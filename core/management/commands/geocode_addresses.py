@@ -0,0 +1,105 @@
+"""
+Management command to batch geocode facility and student addresses
+Fills missing facility coordinates and warms the geocode cache
+"""
+import time
+from decimal import Decimal
+from django.core.management.base import BaseCommand, CommandError
+from core.services.geocoding_service import GeocodingService
+from core.utils.gps_utils import invalidate_facility_index
+from facilities.models import Facility
+from students.models import Student
+
+
+class Command(BaseCommand):
+    help = 'Geocode facility (and optionally student) addresses through the geocode cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=4,
+            help='Maximum concurrent provider requests (default: 4)'
+        )
+        parser.add_argument(
+            '--provider',
+            type=str,
+            help='Geocoding provider to use (default: GEOCODING_PROVIDER setting)'
+        )
+        parser.add_argument(
+            '--students',
+            action='store_true',
+            help='Also geocode active student addresses into the cache'
+        )
+        parser.add_argument(
+            '--overwrite',
+            action='store_true',
+            help='Replace existing facility coordinates instead of only filling blanks'
+        )
+        parser.add_argument(
+            '--refresh',
+            action='store_true',
+            help='Ignore cached results and query the provider again'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Geocode and report without updating facilities'
+        )
+
+    def handle(self, *args, **options):
+        try:
+            provider = GeocodingService.get_provider(options['provider'])
+        except ValueError as e:
+            raise CommandError(str(e))
+
+        if not provider.available:
+            raise CommandError(f"Geocoding provider '{provider.name}' is not configured")
+
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('DRY RUN MODE - Facilities will not be updated'))
+
+        facilities = Facility.objects.exclude(address='')
+        if not options['overwrite']:
+            facilities = facilities.filter(latitude__isnull=True) | facilities.filter(longitude__isnull=True)
+        facilities = list(facilities)
+
+        addresses = [facility.address for facility in facilities]
+        if options['students']:
+            addresses.extend(
+                Student.objects.filter(is_active=True).exclude(address='').values_list('address', flat=True)
+            )
+
+        distinct = {GeocodingService.normalise_address(address) for address in addresses} - {''}
+        self.stdout.write(f'Geocoding {len(distinct)} distinct address(es) with {provider.name}...')
+
+        started = time.perf_counter()
+        results = GeocodingService.geocode_many(
+            addresses,
+            provider=provider,
+            max_workers=options['workers'],
+            refresh=options['refresh'],
+        )
+        elapsed = time.perf_counter() - started
+
+        updated = []
+        for facility in facilities:
+            coordinates = results.get(facility.address)
+            if not coordinates:
+                self.stdout.write(self.style.WARNING(f'  Could not geocode {facility.name}: {facility.address}'))
+                continue
+            facility.latitude = Decimal(str(round(coordinates[0], 8)))
+            facility.longitude = Decimal(str(round(coordinates[1], 8)))
+            updated.append(facility)
+            self.stdout.write(f'  {facility.name}: {coordinates[0]:.6f}, {coordinates[1]:.6f}')
+
+        if updated and not options['dry_run']:
+            Facility.objects.bulk_update(updated, ['latitude', 'longitude'])
+            invalidate_facility_index()
+
+        found = sum(1 for coordinates in results.values() if coordinates)
+        action = 'Would update' if options['dry_run'] else 'Updated'
+        self.stdout.write(self.style.SUCCESS(
+            f'{action} {len(updated)} facility(ies); '
+            f'{found}/{len(results)} address(es) resolved in {elapsed:.2f}s'
+        ))
@@ -0,0 +1,44 @@
+"""
+Management command to rebuild the daily email/SMS delivery stats
+Recounts DeliveryDailyStats from the EmailLog and SMSLog tables
+"""
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from core.services.delivery_stats_service import DeliveryStatsService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild daily sent/failed delivery stats from the email and SMS logs'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--channel',
+            choices=['email', 'sms'],
+            help='Only rebuild one channel (default: both)'
+        )
+        parser.add_argument(
+            '--start',
+            type=str,
+            help='First date to rebuild, YYYY-MM-DD (default: all history)'
+        )
+        parser.add_argument(
+            '--end',
+            type=str,
+            help='Last date to rebuild, YYYY-MM-DD (default: all history)'
+        )
+
+    def handle(self, *args, **options):
+        start_date = self._parse_date(options['start'], '--start')
+        end_date = self._parse_date(options['end'], '--end')
+
+        written = DeliveryStatsService.rebuild(options['channel'], start_date, end_date)
+
+        self.stdout.write(self.style.SUCCESS(f'Rebuilt {written} delivery stats row(s)'))
+
+    def _parse_date(self, value, option):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError(f'{option} must be a date in YYYY-MM-DD format')
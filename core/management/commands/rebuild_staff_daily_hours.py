@@ -0,0 +1,51 @@
+"""
+Management command to rebuild the StaffDailyHours rollup
+Recomputes daily staff hours from raw TeacherAttendance records
+"""
+import time
+from datetime import datetime
+from django.core.management.base import BaseCommand, CommandError
+from core.services.staff_hours_service import StaffDailyHoursService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the daily staff hours rollup from teacher attendance records'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--start',
+            type=str,
+            help='First date to rebuild, YYYY-MM-DD (default: earliest clock record)'
+        )
+        parser.add_argument(
+            '--end',
+            type=str,
+            help='Last date to rebuild, YYYY-MM-DD (default: latest clock record)'
+        )
+        parser.add_argument(
+            '--staff',
+            type=int,
+            action='append',
+            help='Only rebuild this staff id (repeatable)'
+        )
+
+    def handle(self, *args, **options):
+        start_date = self._parse_date(options['start'], '--start')
+        end_date = self._parse_date(options['end'], '--end')
+        if start_date and end_date and start_date > end_date:
+            raise CommandError('--start must be on or before --end')
+
+        started = time.perf_counter()
+        written = StaffDailyHoursService.rebuild(start_date, end_date, staff_ids=options['staff'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rebuilt {written} staff daily hours row(s) in {time.perf_counter() - started:.2f}s'
+        ))
+
+    def _parse_date(self, value, option):
+        if not value:
+            return None
+        try:
+            return datetime.strptime(value, '%Y-%m-%d').date()
+        except ValueError:
+            raise CommandError(f'{option} must be a date in YYYY-MM-DD format')
@@ -0,0 +1,75 @@
+"""
+Management command to pre-render facility QR sheets
+Intended to run overnight so admins download ready-made sheets
+"""
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from core.services.qr_render_service import QRRenderService
+from facilities.models import Facility
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Pre-render printable QR sheets for every active facility'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--weeks',
+            type=int,
+            default=1,
+            help='Number of weeks to render starting from the current week (default: 1)'
+        )
+        parser.add_argument(
+            '--format',
+            choices=['pdf', 'svg', 'both'],
+            default='pdf',
+            help='Sheet format to render (default: pdf)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            help='Worker processes for rendering QR images (default: CPU count)'
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Re-render sheets that already exist'
+        )
+
+    def handle(self, *args, **options):
+        formats = ['pdf', 'svg'] if options['format'] == 'both' else [options['format']]
+        today = timezone.localdate()
+        current_week = today - timedelta(days=today.weekday())
+        weeks = [current_week + timedelta(weeks=offset) for offset in range(max(1, options['weeks']))]
+
+        started = time.perf_counter()
+        rendered = 0
+        failed = 0
+
+        for facility in Facility.objects.filter(is_active=True).order_by('name'):
+            for week_start in weeks:
+                for sheet_format in formats:
+                    try:
+                        path = QRRenderService.render_facility_sheet(
+                            facility,
+                            week_start,
+                            fmt=sheet_format,
+                            workers=options['workers'],
+                            force=options['force'],
+                        )
+                        rendered += 1
+                        if options['verbosity'] > 1:
+                            self.stdout.write(f'  {facility.name} {week_start}: {path}')
+                    except Exception as e:
+                        failed += 1
+                        logger.error(f"Failed to render QR sheet for facility {facility.id} week {week_start}: {str(e)}")
+                        self.stdout.write(self.style.ERROR(f'  {facility.name} {week_start}: {str(e)}'))
+
+        self.stdout.write(self.style.SUCCESS(
+            f'Rendered {rendered} sheet(s) in {time.perf_counter() - started:.2f}s'
+            + (f', {failed} failed' if failed else '')
+        ))
@@ -1,8 +1,10 @@
 """
 Management command to check and update early bird pricing that has expired
-This command should be run daily to ensure WooCommerce reflects current pricing
+Deadlines are normally handled by scheduled jobs (see CourseScheduleService);
+run daily with --window as a safety net so WooCommerce reflects current pricing
 """
-from django.core.management.base import BaseCommand
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 from academics.models import Course
 from core.woocommerce_api import WooCommerceSyncService
@@ -25,6 +27,11 @@ class Command(BaseCommand):
             action='store_true',
             help='Force sync all courses with early bird pricing, regardless of expiry',
         )
+        parser.add_argument(
+            '--window',
+            type=int,
+            help='Only check deadlines that passed in the last N days (default: all courses)',
+        )
 
     def handle(self, *args, **options):
         dry_run = options['dry_run']
@@ -34,12 +41,22 @@ class Command(BaseCommand):
             self.style.SUCCESS(f'Starting early bird pricing update check (dry_run={dry_run})')
         )
 
+        today = timezone.now().date()
+
         # Get all courses with early bird pricing
         courses_with_early_bird = Course.objects.filter(
             early_bird_price__isnull=False,
             early_bird_deadline__isnull=False,
             status='published'
         )
+        if options['window'] is not None:
+            if options['window'] < 0:
+                raise CommandError('--window must be zero or more days')
+            if not force_sync:
+                courses_with_early_bird = courses_with_early_bird.filter(
+                    early_bird_deadline__gte=today - timedelta(days=options['window']),
+                    early_bird_deadline__lt=today,
+                )
 
         if not courses_with_early_bird.exists():
             self.stdout.write(
@@ -47,7 +64,6 @@ class Command(BaseCommand):
             )
             return
 
-        today = timezone.now().date()
         sync_service = WooCommerceSyncService()
 
         courses_to_sync = []
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:09
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0013_alter_teacherattendance_facility'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GeocodeCache',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('address_key', models.CharField(help_text='SHA-256 of the normalised address', max_length=64, unique=True, verbose_name='Address Key')),
+                ('address', models.TextField(verbose_name='Normalised Address')),
+                ('latitude', models.DecimalField(blank=True, decimal_places=8, max_digits=10, null=True, verbose_name='Latitude')),
+                ('longitude', models.DecimalField(blank=True, decimal_places=8, max_digits=11, null=True, verbose_name='Longitude')),
+                ('status', models.CharField(choices=[('ok', 'Found'), ('not_found', 'Not Found')], default='ok', max_length=20, verbose_name='Status')),
+                ('provider', models.CharField(max_length=20, verbose_name='Provider')),
+                ('fetched_at', models.DateTimeField(default=django.utils.timezone.now, verbose_name='Fetched At')),
+                ('expires_at', models.DateTimeField(help_text='Entries past this time are fetched again on next use', verbose_name='Expires At')),
+            ],
+            options={
+                'verbose_name': 'Geocode Cache Entry',
+                'verbose_name_plural': 'Geocode Cache',
+                'ordering': ['-fetched_at'],
+                'indexes': [models.Index(fields=['expires_at'], name='core_geocod_expires_13530a_idx')],
+            },
+        ),
+    ]
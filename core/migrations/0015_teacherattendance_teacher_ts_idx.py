@@ -0,0 +1,21 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:17
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0015_course_course_status_name_idx'),
+        ('core', '0014_geocodecache'),
+        ('facilities', '0003_alter_facility_attendance_radius'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='teacherattendance',
+            index=models.Index(fields=['teacher', 'timestamp', 'id'], name='teacher_att_teacher_ts_idx'),
+        ),
+    ]
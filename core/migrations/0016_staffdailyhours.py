@@ -0,0 +1,47 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:22
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_staff_daily_hours(apps, schema_editor):
+    # Uses the live models: pairing and rollup rules live in the service
+    from core.services.staff_hours_service import StaffDailyHoursService
+
+    StaffDailyHoursService.rebuild()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0015_teacherattendance_teacher_ts_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StaffDailyHours',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Local date the sessions started on', verbose_name='Date')),
+                ('total_hours', models.DecimalField(decimal_places=4, default=Decimal('0'), help_text='Hours from completed clock in/out pairs', max_digits=8, verbose_name='Total Hours')),
+                ('sessions', models.PositiveIntegerField(default=0, help_text='Completed sessions plus unmatched clock records', verbose_name='Sessions')),
+                ('completed_sessions', models.PositiveIntegerField(default=0, verbose_name='Completed Sessions')),
+                ('has_unmatched_clock_in', models.BooleanField(default=False, help_text='A clock in on this day has no matching clock out', verbose_name='Unmatched Clock In')),
+                ('has_unmatched_clock_out', models.BooleanField(default=False, help_text='A clock out on this day has no matching clock in', verbose_name='Unmatched Clock Out')),
+                ('class_count', models.PositiveIntegerField(default=0, help_text="Distinct classes linked to the day's clock records", verbose_name='Classes')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+                ('staff', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_hours', to=settings.AUTH_USER_MODEL, verbose_name='Staff')),
+            ],
+            options={
+                'verbose_name': 'Staff Daily Hours',
+                'verbose_name_plural': 'Staff Daily Hours',
+                'ordering': ['-date', 'staff'],
+                'indexes': [models.Index(fields=['date', 'staff'], name='staff_daily_hours_date_idx')],
+                'constraints': [models.UniqueConstraint(fields=('staff', 'date'), name='unique_staff_daily_hours')],
+            },
+        ),
+        migrations.RunPython(backfill_staff_daily_hours, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:34
+
+from django.db import migrations, models
+
+
+def backfill_delivery_stats(apps, schema_editor):
+    from core.services.delivery_stats_service import DeliveryStatsService
+
+    DeliveryDailyStats = apps.get_model('core', 'DeliveryDailyStats')
+    for channel, (model_name, type_field) in DeliveryStatsService.CHANNELS.items():
+        logs = apps.get_model('core', model_name).objects.all()
+        DeliveryDailyStats.objects.bulk_create([
+            DeliveryDailyStats(channel=channel, **values)
+            for values in DeliveryStatsService.daily_counts(logs, type_field)
+        ], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0016_staffdailyhours'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DeliveryDailyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='Date')),
+                ('channel', models.CharField(choices=[('email', 'Email'), ('sms', 'SMS')], max_length=10, verbose_name='Channel')),
+                ('message_type', models.CharField(help_text='email_type or sms_type of the counted logs', max_length=30, verbose_name='Message Type')),
+                ('sent_count', models.PositiveIntegerField(default=0, verbose_name='Sent')),
+                ('failed_count', models.PositiveIntegerField(default=0, verbose_name='Failed')),
+                ('updated_at', models.DateTimeField(auto_now=True, verbose_name='Updated At')),
+            ],
+            options={
+                'verbose_name': 'Delivery Daily Stats',
+                'verbose_name_plural': 'Delivery Daily Stats',
+                'ordering': ['-date', 'channel', 'message_type'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['-created_at', '-id'], name='email_log_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='email_log_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['email_type', 'status', '-created_at', '-id'], name='email_log_type_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='emaillog',
+            index=models.Index(fields=['recipient_type', '-created_at', '-id'], name='email_log_recipient_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['-created_at', '-id'], name='sms_log_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['status', '-created_at', '-id'], name='sms_log_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['sms_type', 'status', '-created_at', '-id'], name='sms_log_type_status_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='smslog',
+            index=models.Index(fields=['recipient_type', '-created_at', '-id'], name='sms_log_recipient_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='deliverydailystats',
+            index=models.Index(fields=['channel', 'date'], name='delivery_stats_channel_idx'),
+        ),
+        migrations.AddConstraint(
+            model_name='deliverydailystats',
+            constraint=models.UniqueConstraint(fields=('date', 'channel', 'message_type'), name='unique_delivery_daily_stats'),
+        ),
+        migrations.RunPython(backfill_delivery_stats, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0017_log_indexes_delivery_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='LogArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dataset', models.CharField(choices=[('email_log', 'Email Logs'), ('sms_log', 'SMS Logs'), ('woocommerce_sync_log', 'WooCommerce Sync Logs'), ('student_activity', 'Student Activities')], max_length=30, verbose_name='Dataset')),
+                ('date', models.DateField(help_text='Local date of the archived rows', verbose_name='Date')),
+                ('path', models.CharField(help_text='Gzipped JSONL file on the private storage backend', max_length=255, verbose_name='File Path')),
+                ('row_count', models.PositiveIntegerField(default=0, verbose_name='Rows')),
+                ('size_bytes', models.PositiveIntegerField(default=0, verbose_name='Compressed Size')),
+                ('min_id', models.BigIntegerField(blank=True, null=True, verbose_name='Lowest ID')),
+                ('max_id', models.BigIntegerField(blank=True, null=True, verbose_name='Highest ID')),
+                ('archived_at', models.DateTimeField(auto_now=True, verbose_name='Archived At')),
+                ('restored_at', models.DateTimeField(blank=True, help_text='Set while the rows are re-hydrated into the live table', null=True, verbose_name='Restored At')),
+            ],
+            options={
+                'verbose_name': 'Log Archive',
+                'verbose_name_plural': 'Log Archives',
+                'ordering': ['dataset', '-date'],
+                'constraints': [models.UniqueConstraint(fields=('dataset', 'date'), name='unique_log_archive_day')],
+            },
+        ),
+    ]
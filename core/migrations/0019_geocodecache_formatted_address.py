@@ -0,0 +1,18 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0018_logarchive'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='geocodecache',
+            name='formatted_address',
+            field=models.CharField(blank=True, help_text='Address as returned by the provider', max_length=255, verbose_name='Formatted Address'),
+        ),
+    ]
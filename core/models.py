@@ -7,6 +7,7 @@ from accounts.models import Staff
 from decimal import Decimal
 import logging
 from core.utils.url_utils import normalise_site_domain
+from core.utils.change_tracking import FieldTrackerMixin
 
 logger = logging.getLogger(__name__)
 
@@ -649,10 +650,12 @@ class ClockInOut(models.Model):
         return f"{self.staff.get_full_name()} - {self.get_status_display()} at {self.timestamp.strftime('%Y-%m-%d %H:%M')}"
 
 
-class TeacherAttendance(models.Model):
+class TeacherAttendance(FieldTrackerMixin, models.Model):
     """
     Teacher attendance model for GPS-based clock in/out system
     """
+    tracked_fields = ('teacher', 'timestamp')
+
     CLOCK_TYPE_CHOICES = [
         ('clock_in', 'Clock In'),
         ('clock_out', 'Clock Out'),
@@ -777,6 +780,9 @@ class TeacherAttendance(models.Model):
         verbose_name = 'Teacher Attendance'
         verbose_name_plural = 'Teacher Attendance Records'
         ordering = ['-timestamp']
+        indexes = [
+            models.Index(fields=['teacher', 'timestamp', 'id'], name='teacher_att_teacher_ts_idx'),
+        ]
     
     def __str__(self):
         return f"{self.teacher.get_full_name()} - {self.get_clock_type_display()} at {self.facility.name} ({self.timestamp.strftime('%Y-%m-%d %H:%M')})"
@@ -788,6 +794,78 @@ class TeacherAttendance(models.Model):
         return self.timestamp.date() == timezone.now().date()
 
 
+class StaffDailyHours(models.Model):
+    """
+    Per staff, per day rollup of paired TeacherAttendance records
+
+    Maintained by core.signals and rebuilt with the rebuild_staff_daily_hours
+    command; payroll summaries read from here instead of raw clock records.
+    """
+    staff = models.ForeignKey(
+        Staff,
+        on_delete=models.CASCADE,
+        related_name='daily_hours',
+        verbose_name='Staff'
+    )
+    date = models.DateField(
+        verbose_name='Date',
+        help_text='Local date the sessions started on'
+    )
+    total_hours = models.DecimalField(
+        max_digits=8,
+        decimal_places=4,
+        default=Decimal('0'),
+        verbose_name='Total Hours',
+        help_text='Hours from completed clock in/out pairs'
+    )
+    sessions = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Sessions',
+        help_text='Completed sessions plus unmatched clock records'
+    )
+    completed_sessions = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Completed Sessions'
+    )
+    has_unmatched_clock_in = models.BooleanField(
+        default=False,
+        verbose_name='Unmatched Clock In',
+        help_text='A clock in on this day has no matching clock out'
+    )
+    has_unmatched_clock_out = models.BooleanField(
+        default=False,
+        verbose_name='Unmatched Clock Out',
+        help_text='A clock out on this day has no matching clock in'
+    )
+    class_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Classes',
+        help_text='Distinct classes linked to the day\'s clock records'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Updated At'
+    )
+
+    class Meta:
+        verbose_name = 'Staff Daily Hours'
+        verbose_name_plural = 'Staff Daily Hours'
+        ordering = ['-date', 'staff']
+        constraints = [
+            models.UniqueConstraint(fields=['staff', 'date'], name='unique_staff_daily_hours'),
+        ]
+        indexes = [
+            models.Index(fields=['date', 'staff'], name='staff_daily_hours_date_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.staff.get_full_name()} - {self.date} ({self.total_hours}h)"
+
+    @property
+    def has_unmatched_clock(self):
+        return self.has_unmatched_clock_in or self.has_unmatched_clock_out
+
+
 class EmailLog(models.Model):
     """
     Email log model
@@ -860,6 +938,13 @@ class EmailLog(models.Model):
         verbose_name = 'Email Log'
         verbose_name_plural = 'Email Logs'
         ordering = ['-created_at']
+        # Log browser seeks on (created_at, id) under each filter combination
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='email_log_created_idx'),
+            models.Index(fields=['status', '-created_at', '-id'], name='email_log_status_idx'),
+            models.Index(fields=['email_type', 'status', '-created_at', '-id'], name='email_log_type_status_idx'),
+            models.Index(fields=['recipient_type', '-created_at', '-id'], name='email_log_recipient_idx'),
+        ]
     
     def __str__(self):
         return f"{self.recipient_email} - {self.subject} ({self.get_status_display()})"
@@ -940,11 +1025,137 @@ class SMSLog(models.Model):
         verbose_name = 'SMS Log'
         verbose_name_plural = 'SMS Logs'
         ordering = ['-created_at']
+        # Log browser seeks on (created_at, id) under each filter combination
+        indexes = [
+            models.Index(fields=['-created_at', '-id'], name='sms_log_created_idx'),
+            models.Index(fields=['status', '-created_at', '-id'], name='sms_log_status_idx'),
+            models.Index(fields=['sms_type', 'status', '-created_at', '-id'], name='sms_log_type_status_idx'),
+            models.Index(fields=['recipient_type', '-created_at', '-id'], name='sms_log_recipient_idx'),
+        ]
     
     def __str__(self):
         return f"{self.recipient_phone} - {self.get_sms_type_display()} ({self.get_status_display()})"
 
 
+class DeliveryDailyStats(models.Model):
+    """
+    Sent/failed counts per channel, message type and day
+
+    Incremented as EmailLog and SMSLog rows are written so dashboards never
+    count raw log rows; rebuild with the rebuild_delivery_stats command.
+    """
+    CHANNEL_CHOICES = [
+        ('email', 'Email'),
+        ('sms', 'SMS'),
+    ]
+
+    date = models.DateField(
+        verbose_name='Date'
+    )
+    channel = models.CharField(
+        max_length=10,
+        choices=CHANNEL_CHOICES,
+        verbose_name='Channel'
+    )
+    message_type = models.CharField(
+        max_length=30,
+        verbose_name='Message Type',
+        help_text='email_type or sms_type of the counted logs'
+    )
+    sent_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Sent'
+    )
+    failed_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Failed'
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Updated At'
+    )
+
+    class Meta:
+        verbose_name = 'Delivery Daily Stats'
+        verbose_name_plural = 'Delivery Daily Stats'
+        ordering = ['-date', 'channel', 'message_type']
+        constraints = [
+            models.UniqueConstraint(fields=['date', 'channel', 'message_type'], name='unique_delivery_daily_stats'),
+        ]
+        indexes = [
+            models.Index(fields=['channel', 'date'], name='delivery_stats_channel_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_channel_display()} {self.message_type} {self.date}: {self.sent_count} sent, {self.failed_count} failed"
+
+
+class LogArchive(models.Model):
+    """
+    Index entry for one day of log rows moved to archive storage
+    """
+    DATASET_CHOICES = [
+        ('email_log', 'Email Logs'),
+        ('sms_log', 'SMS Logs'),
+        ('woocommerce_sync_log', 'WooCommerce Sync Logs'),
+        ('student_activity', 'Student Activities'),
+    ]
+
+    dataset = models.CharField(
+        max_length=30,
+        choices=DATASET_CHOICES,
+        verbose_name='Dataset'
+    )
+    date = models.DateField(
+        verbose_name='Date',
+        help_text='Local date of the archived rows'
+    )
+    path = models.CharField(
+        max_length=255,
+        verbose_name='File Path',
+        help_text='Gzipped JSONL file on the private storage backend'
+    )
+    row_count = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Rows'
+    )
+    size_bytes = models.PositiveIntegerField(
+        default=0,
+        verbose_name='Compressed Size'
+    )
+    min_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='Lowest ID'
+    )
+    max_id = models.BigIntegerField(
+        null=True,
+        blank=True,
+        verbose_name='Highest ID'
+    )
+    archived_at = models.DateTimeField(
+        auto_now=True,
+        verbose_name='Archived At'
+    )
+    restored_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        verbose_name='Restored At',
+        help_text='Set while the rows are re-hydrated into the live table'
+    )
+
+    class Meta:
+        verbose_name = 'Log Archive'
+        verbose_name_plural = 'Log Archives'
+        ordering = ['dataset', '-date']
+        constraints = [
+            models.UniqueConstraint(fields=['dataset', 'date'], name='unique_log_archive_day'),
+        ]
+
+    def __str__(self):
+        return f"{self.get_dataset_display()} {self.date} ({self.row_count} rows)"
+
+
 class NotificationQuota(models.Model):
     """
     Monthly notification quota management for SMS and Email
@@ -1352,3 +1563,83 @@ class WooCommerceSyncQueue(models.Model):
             minutes = int(total_seconds // 60)
             seconds = int(total_seconds % 60)
             return f"{minutes}m {seconds}s"
+
+
+class GeocodeCache(models.Model):
+    """
+    Cached geocoding results keyed by normalised address
+    """
+    STATUS_CHOICES = [
+        ('ok', 'Found'),
+        ('not_found', 'Not Found'),
+    ]
+
+    address_key = models.CharField(
+        max_length=64,
+        unique=True,
+        verbose_name='Address Key',
+        help_text='SHA-256 of the normalised address'
+    )
+    address = models.TextField(
+        verbose_name='Normalised Address'
+    )
+    formatted_address = models.CharField(
+        max_length=255,
+        blank=True,
+        verbose_name='Formatted Address',
+        help_text='Address as returned by the provider'
+    )
+    latitude = models.DecimalField(
+        max_digits=10,
+        decimal_places=8,
+        null=True,
+        blank=True,
+        verbose_name='Latitude'
+    )
+    longitude = models.DecimalField(
+        max_digits=11,
+        decimal_places=8,
+        null=True,
+        blank=True,
+        verbose_name='Longitude'
+    )
+    status = models.CharField(
+        max_length=20,
+        choices=STATUS_CHOICES,
+        default='ok',
+        verbose_name='Status'
+    )
+    provider = models.CharField(
+        max_length=20,
+        verbose_name='Provider'
+    )
+    fetched_at = models.DateTimeField(
+        default=timezone.now,
+        verbose_name='Fetched At'
+    )
+    expires_at = models.DateTimeField(
+        verbose_name='Expires At',
+        help_text='Entries past this time are fetched again on next use'
+    )
+
+    class Meta:
+        verbose_name = 'Geocode Cache Entry'
+        verbose_name_plural = 'Geocode Cache'
+        ordering = ['-fetched_at']
+        indexes = [
+            models.Index(fields=['expires_at']),
+        ]
+
+    def __str__(self):
+        return f"{self.address} ({self.get_status_display()})"
+
+    @property
+    def is_expired(self):
+        return self.expires_at <= timezone.now()
+
+    @property
+    def coordinates(self):
+        """(latitude, longitude) as floats, or None for negative results"""
+        if self.status != 'ok' or self.latitude is None or self.longitude is None:
+            return None
+        return (float(self.latitude), float(self.longitude))
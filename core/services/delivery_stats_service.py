@@ -0,0 +1,162 @@
+"""
+Delivery Stats Service for EduPulse
+Keeps per-day sent/failed counters for email and SMS so log pages and
+dashboards read a handful of summary rows instead of counting raw logs
+"""
+from datetime import timedelta
+from typing import Dict, Optional
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class DeliveryStatsService:
+    """
+    Service for maintaining and reading DeliveryDailyStats
+    """
+
+    # channel -> (log model name, message type field)
+    CHANNELS = {
+        'email': ('EmailLog', 'email_type'),
+        'sms': ('SMSLog', 'sms_type'),
+    }
+    # channel -> LogArchive dataset holding its archived logs
+    ARCHIVE_DATASETS = {
+        'email': 'email_log',
+        'sms': 'sms_log',
+    }
+
+    @classmethod
+    def log_model(cls, channel):
+        from django.apps import apps
+        return apps.get_model('core', cls.CHANNELS[channel][0])
+
+    @staticmethod
+    def record(channel, message_type, status, when=None, count=1):
+        """Add one (or ``count``) delivery outcomes to the day's counters"""
+        from core.models import DeliveryDailyStats
+
+        counter = 'sent_count' if status == 'sent' else 'failed_count'
+        day = timezone.localdate(when) if when else timezone.localdate()
+        row = DeliveryDailyStats.objects.filter(date=day, channel=channel, message_type=message_type or '')
+
+        with transaction.atomic():
+            if row.update(**{counter: F(counter) + count}):
+                return
+            try:
+                with transaction.atomic():
+                    DeliveryDailyStats.objects.create(
+                        date=day, channel=channel, message_type=message_type or '', **{counter: count}
+                    )
+            except IntegrityError:
+                # Another writer created the row first
+                row.update(**{counter: F(counter) + count})
+
+    @staticmethod
+    def daily_counts(logs, type_field):
+        """
+        Per-day, per-type sent/failed counts for a log queryset in one query
+
+        Works on historical models too, so migrations can backfill with it.
+
+        Returns:
+            List of DeliveryDailyStats field dicts (without channel)
+        """
+        counts = logs.annotate(day=TruncDate('created_at')).values('day', type_field).annotate(
+            sent=Count('id', filter=Q(status='sent')),
+            failed=Count('id', filter=~Q(status='sent')),
+        ).order_by()
+
+        return [
+            {
+                'date': entry['day'],
+                'message_type': entry[type_field] or '',
+                'sent_count': entry['sent'],
+                'failed_count': entry['failed'],
+            }
+            for entry in counts
+        ]
+
+    @classmethod
+    def rebuild(cls, channel=None, start_date=None, end_date=None) -> int:
+        """
+        Recount the daily stats from the log tables
+
+        Days with a LogArchive entry are left as they are: their logs have
+        moved to archive files, so the live tables can no longer count them.
+
+        Returns:
+            Number of stats rows written
+        """
+        from core.models import DeliveryDailyStats, LogArchive
+
+        written = 0
+        for name in ([channel] if channel else cls.CHANNELS):
+            type_field = cls.CHANNELS[name][1]
+            archived_days = set(
+                LogArchive.objects.filter(dataset=cls.ARCHIVE_DATASETS[name]).values_list('date', flat=True)
+            )
+            logs = cls.log_model(name).objects.all()
+            if start_date:
+                logs = logs.filter(created_at__date__gte=start_date)
+            if end_date:
+                logs = logs.filter(created_at__date__lte=end_date)
+
+            rows = [
+                DeliveryDailyStats(channel=name, **values)
+                for values in cls.daily_counts(logs, type_field)
+                if values['date'] not in archived_days
+            ]
+
+            with transaction.atomic():
+                existing = DeliveryDailyStats.objects.filter(channel=name)
+                if start_date:
+                    existing = existing.filter(date__gte=start_date)
+                if end_date:
+                    existing = existing.filter(date__lte=end_date)
+                existing.exclude(
+                    date__in=LogArchive.objects.filter(dataset=cls.ARCHIVE_DATASETS[name]).values('date')
+                ).delete()
+                DeliveryDailyStats.objects.bulk_create(rows, batch_size=500)
+            written += len(rows)
+
+        return written
+
+    @staticmethod
+    def totals(channel, message_type: Optional[str] = None, start_date=None, end_date=None) -> Dict[str, int]:
+        """
+        Sent and failed totals for a channel, optionally by type and date range
+
+        Returns:
+            {'sent': int, 'failed': int, 'total': int}
+        """
+        from core.models import DeliveryDailyStats
+
+        stats = DeliveryDailyStats.objects.filter(channel=channel)
+        if message_type:
+            stats = stats.filter(message_type=message_type)
+        if start_date:
+            stats = stats.filter(date__gte=start_date)
+        if end_date:
+            stats = stats.filter(date__lte=end_date)
+
+        result = stats.aggregate(sent=Sum('sent_count'), failed=Sum('failed_count'))
+        sent = result['sent'] or 0
+        failed = result['failed'] or 0
+        return {'sent': sent, 'failed': failed, 'total': sent + failed}
+
+    @classmethod
+    def dashboard_stats(cls, channel, days=7) -> Dict[str, int]:
+        """Totals in the shape the settings pages use"""
+        overall = cls.totals(channel)
+        recent = cls.totals(channel, start_date=timezone.localdate() - timedelta(days=days - 1))
+        return {
+            'total_sent': overall['sent'],
+            'total_failed': overall['failed'],
+            'recent_count': recent['total'],
+        }
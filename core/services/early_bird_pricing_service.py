@@ -216,45 +216,59 @@ class EarlyBirdPricingService:
     def _create_price_adjustment_activity(enrollment, previous_price, new_price, adjustment_type, performed_by):
         """Create student activity record for price adjustment"""
         try:
-            from students.models import StudentActivity
+            EarlyBirdPricingService._build_price_adjustment_activity(
+                enrollment, previous_price, new_price, adjustment_type, performed_by
+            ).save()
 
-            # Determine description based on adjustment type
-            if adjustment_type == 'regular_price_applied':
-                description = (
-                    f'Price adjusted from early bird ${previous_price} to regular price ${new_price} '
-                    f'due to early bird deadline expiry. Staff decision: apply regular pricing.'
-                )
-            elif adjustment_type == 'early_bird_price_maintained':
-                description = (
-                    f'Early bird price ${new_price} maintained despite deadline expiry. '
-                    f'Staff decision: honor early bird pricing from enrollment date.'
-                )
-            else:
-                description = (
-                    f'Price adjusted from ${previous_price} to ${new_price}. '
-                    f'Adjustment type: {adjustment_type}'
-                )
+        except Exception as e:
+            logger.error(f"Error creating price adjustment activity: {str(e)}")
 
-            StudentActivity.create_activity(
-                student=enrollment.student,
-                activity_type='price_adjustment',
-                title=f'Course fee adjusted for {enrollment.course.name}',
-                description=description,
-                enrollment=enrollment,
-                course=enrollment.course,
-                performed_by=performed_by,
-                metadata={
-                    'adjustment_type': adjustment_type,
-                    'previous_price': str(previous_price),
-                    'new_price': str(new_price),
-                    'price_difference': str(previous_price - new_price),
-                    'early_bird_deadline': enrollment.course.early_bird_deadline.isoformat() if enrollment.course.early_bird_deadline else None,
-                    'adjustment_reason': 'early_bird_deadline_check'
-                }
+    @staticmethod
+    def _price_adjustment_description(previous_price, new_price, adjustment_type):
+        """Activity description for an individual staff pricing decision"""
+        if adjustment_type == 'regular_price_applied':
+            return (
+                f'Price adjusted from early bird ${previous_price} to regular price ${new_price} '
+                f'due to early bird deadline expiry. Staff decision: apply regular pricing.'
             )
+        if adjustment_type == 'early_bird_price_maintained':
+            return (
+                f'Early bird price ${new_price} maintained despite deadline expiry. '
+                f'Staff decision: honor early bird pricing from enrollment date.'
+            )
+        return (
+            f'Price adjusted from ${previous_price} to ${new_price}. '
+            f'Adjustment type: {adjustment_type}'
+        )
 
-        except Exception as e:
-            logger.error(f"Error creating price adjustment activity: {str(e)}")
+    @staticmethod
+    def _build_price_adjustment_activity(enrollment, previous_price, new_price, adjustment_type, performed_by,
+                                         description=None, reason='early_bird_deadline_check'):
+        """Unsaved student activity record for a price adjustment"""
+        from students.models import StudentActivity
+
+        if description is None:
+            description = EarlyBirdPricingService._price_adjustment_description(
+                previous_price, new_price, adjustment_type
+            )
+
+        return StudentActivity(
+            student_id=enrollment.student_id,
+            activity_type='price_adjustment',
+            title=f'Course fee adjusted for {enrollment.course.name}',
+            description=description,
+            enrollment=enrollment,
+            course=enrollment.course,
+            performed_by=performed_by,
+            metadata={
+                'adjustment_type': adjustment_type,
+                'previous_price': str(previous_price),
+                'new_price': str(new_price),
+                'price_difference': str(previous_price - new_price),
+                'early_bird_deadline': enrollment.course.early_bird_deadline.isoformat() if enrollment.course.early_bird_deadline else None,
+                'adjustment_reason': reason
+            }
+        )
 
     @staticmethod
     def get_price_adjustment_summary(enrollment, current_action_date=None):
@@ -308,4 +322,230 @@ class EarlyBirdPricingService:
             }
         }
 
-        return summary
\ No newline at end of file
+        return summary
+
+    @staticmethod
+    def courses_for_scope(course_id=None, term_start=None, term_end=None):
+        """
+        Courses with early bird pricing for a single course or a whole term
+
+        A term is the set of courses starting between term_start and term_end
+        (inclusive).
+        """
+        from academics.models import Course
+
+        courses = Course.objects.filter(early_bird_price__isnull=False, early_bird_deadline__isnull=False)
+        if course_id is not None:
+            return courses.filter(pk=course_id)
+        if term_start is None or term_end is None:
+            raise ValueError('Provide a course or both term start and end dates')
+        return courses.filter(start_date__gte=term_start, start_date__lte=term_end)
+
+    @staticmethod
+    def staff_decision(form_data):
+        """
+        Adjustment type recorded by an individual staff pricing decision, if any
+
+        Batch repricing records its own adjustments with batch_adjustment set;
+        those are not treated as decisions to protect.
+        """
+        form_data = form_data or {}
+        if form_data.get('batch_adjustment'):
+            return None
+        return form_data.get('price_adjustment_type')
+
+    @staticmethod
+    def _repricing_queryset(courses, action_date):
+        """
+        Pending enrolments whose fee differs from the course price on action_date
+
+        The suggested price is computed in SQL with the same rule as
+        Course.get_applicable_price().
+        """
+        from django.db.models import BooleanField, Case, DecimalField, F, Q, Value, When
+        from django.db.models.functions import Coalesce
+        from enrollment.models import Enrollment
+
+        early_bird = Q(course__early_bird_deadline__gte=action_date)
+        return (
+            Enrollment.objects.filter(status='pending', course__in=courses)
+            .annotate(
+                should_be_early_bird=Case(
+                    When(early_bird, then=Value(True)), default=Value(False), output_field=BooleanField()
+                ),
+                suggested_price=Case(
+                    When(early_bird, then=F('course__early_bird_price')),
+                    default=F('course__price'),
+                    output_field=DecimalField(max_digits=10, decimal_places=2),
+                ),
+                current_price=Coalesce(
+                    'course_fee', Value(Decimal('0')), output_field=DecimalField(max_digits=10, decimal_places=2)
+                ),
+            )
+            .exclude(current_price=F('suggested_price'))
+            .order_by('course_id', 'pk')
+        )
+
+    @staticmethod
+    def preview_batch_adjustment(courses, action_date=None):
+        """
+        Suggested prices for every pending enrolment of the given courses
+
+        Enrolments where staff already decided the price individually are
+        listed under 'staff_decisions' and left out of the count and total:
+        a batch only reprices them when they are selected explicitly.
+
+        Returns:
+            dict: {
+                'action_date': date,
+                'count': int,
+                'total_difference': Decimal,
+                'enrollments': [{'enrollment_id', 'student_id', 'student_name',
+                                 'course_id', 'course_name', 'early_bird_deadline',
+                                 'current_price', 'suggested_price',
+                                 'price_difference', 'was_early_bird',
+                                 'should_be_early_bird', 'staff_decision'}, ...],
+                'staff_decisions': [same shape as 'enrollments'],
+            }
+        """
+        action_date = action_date or timezone.now().date()
+        rows = EarlyBirdPricingService._repricing_queryset(courses, action_date).values(
+            'pk', 'student_id', 'student__first_name', 'student__last_name', 'course_id', 'course__name',
+            'course__early_bird_deadline', 'current_price', 'suggested_price', 'is_early_bird',
+            'should_be_early_bird', 'form_data',
+        )
+
+        enrollments = []
+        staff_decisions = []
+        for row in rows:
+            entry = {
+                'enrollment_id': row['pk'],
+                'student_id': row['student_id'],
+                'student_name': f"{row['student__first_name']} {row['student__last_name']}".strip(),
+                'course_id': row['course_id'],
+                'course_name': row['course__name'],
+                'early_bird_deadline': row['course__early_bird_deadline'],
+                'current_price': row['current_price'],
+                'suggested_price': row['suggested_price'],
+                'price_difference': row['current_price'] - row['suggested_price'],
+                'was_early_bird': row['is_early_bird'],
+                'should_be_early_bird': row['should_be_early_bird'],
+                'staff_decision': EarlyBirdPricingService.staff_decision(row['form_data']),
+            }
+            (staff_decisions if entry['staff_decision'] else enrollments).append(entry)
+
+        return {
+            'action_date': action_date,
+            'count': len(enrollments),
+            'total_difference': sum((row['price_difference'] for row in enrollments), Decimal('0')),
+            'enrollments': enrollments,
+            'staff_decisions': staff_decisions,
+        }
+
+    @staticmethod
+    def apply_batch_adjustment(courses, performed_by=None, enrollment_ids=None, action_date=None):
+        """
+        Apply suggested prices to pending enrolments in one pass
+
+        Enrolments are re-checked inside the transaction, so rows that were
+        repriced since the preview are left alone. Enrolments carrying an
+        individual staff pricing decision are skipped and reported unless
+        they are listed in enrollment_ids.
+
+        Args:
+            courses: Course queryset (see courses_for_scope)
+            performed_by: Staff user performing the adjustment
+            enrollment_ids: Optional subset of previewed enrolments to apply
+            action_date: Date used to pick early bird or regular pricing (defaults to today)
+
+        Returns:
+            dict: {'updated': int, 'total_difference': Decimal, 'enrollment_ids': [int, ...],
+                   'skipped_staff_decisions': [int, ...]}
+        """
+        from django.db import transaction
+        from enrollment.models import Enrollment
+        from students.models import StudentActivity
+
+        action_date = action_date or timezone.now().date()
+        now = timezone.now()
+
+        with transaction.atomic():
+            enrollments = EarlyBirdPricingService._repricing_queryset(courses, action_date).select_related('course')
+            if enrollment_ids is not None:
+                enrollments = enrollments.filter(pk__in=enrollment_ids)
+            enrollments = list(enrollments.select_for_update(of=('self',)))
+
+            skipped = []
+            if enrollment_ids is None:
+                skipped = [
+                    enrollment.pk for enrollment in enrollments
+                    if EarlyBirdPricingService.staff_decision(enrollment.form_data)
+                ]
+                enrollments = [enrollment for enrollment in enrollments if enrollment.pk not in skipped]
+
+            activities = []
+            total_difference = Decimal('0')
+            for enrollment in enrollments:
+                course = enrollment.course
+                previous_price = enrollment.current_price
+                previous_early_bird_status = enrollment.is_early_bird
+                new_price = enrollment.suggested_price
+                deadline = f'{course.early_bird_deadline:%d/%m/%Y}' if course.early_bird_deadline else 'not set'
+
+                if enrollment.should_be_early_bird:
+                    enrollment.is_early_bird = True
+                    enrollment.original_price = course.price
+                    enrollment.early_bird_savings = course.get_early_bird_savings()
+                    adjustment_type = 'early_bird_price_maintained'
+                    description = (
+                        f'Batch repricing for {action_date:%d/%m/%Y}: price adjusted from ${previous_price} '
+                        f'to early bird price ${new_price}; early bird deadline {deadline} had not passed.'
+                    )
+                else:
+                    enrollment.is_early_bird = False
+                    enrollment.original_price = None
+                    enrollment.early_bird_savings = None
+                    adjustment_type = 'regular_price_applied'
+                    description = (
+                        f'Batch repricing for {action_date:%d/%m/%Y}: price adjusted from ${previous_price} '
+                        f'to regular price ${new_price}; early bird deadline {deadline} had passed.'
+                    )
+                enrollment.course_fee = new_price
+                enrollment.updated_at = now
+
+                enrollment.form_data = dict(enrollment.form_data or {})
+                enrollment.form_data.update({
+                    'price_adjustment_performed': True,
+                    'price_adjustment_date': now.isoformat(),
+                    'price_adjustment_type': adjustment_type,
+                    'previous_price': str(previous_price),
+                    'new_price': str(new_price),
+                    'performed_by': performed_by.username if performed_by else 'system',
+                    'previous_early_bird_status': previous_early_bird_status,
+                    'batch_adjustment': True,
+                })
+
+                activities.append(EarlyBirdPricingService._build_price_adjustment_activity(
+                    enrollment, previous_price, new_price, adjustment_type, performed_by,
+                    description=description, reason='batch_repricing'
+                ))
+                total_difference += previous_price - new_price
+
+            Enrollment.objects.bulk_update(
+                enrollments,
+                ['course_fee', 'is_early_bird', 'original_price', 'early_bird_savings', 'form_data', 'updated_at'],
+                batch_size=500,
+            )
+            StudentActivity.objects.bulk_create(activities, batch_size=500)
+
+        if enrollments:
+            logger.info(
+                f"Batch price adjustment applied to {len(enrollments)} enrolment(s) "
+                f"by {performed_by.username if performed_by else 'system'}"
+            )
+        return {
+            'updated': len(enrollments),
+            'total_difference': total_difference,
+            'enrollment_ids': [enrollment.pk for enrollment in enrollments],
+            'skipped_staff_decisions': skipped,
+        }
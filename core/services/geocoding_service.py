@@ -0,0 +1,306 @@
+"""
+Geocoding Service for EduPulse
+Caches address lookups in GeocodeCache and batches provider requests
+"""
+import hashlib
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from django.conf import settings
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+Coordinates = Tuple[float, float]
+
+# Coordinates plus the provider's formatted address
+Location = Tuple[Coordinates, str]
+
+
+class GeocodingError(Exception):
+    """Transient provider failure; the address is not cached and can be retried"""
+
+
+class GoogleGeocodingProvider:
+    """
+    Google Geocoding API over a shared, pooled HTTP session
+    """
+    name = 'google'
+    url = 'https://maps.googleapis.com/maps/api/geocode/json'
+    region = 'au'
+    components = 'country:AU'
+    pool_size = 8
+
+    _session = None
+    _session_lock = threading.Lock()
+
+    def __init__(self, api_key=None):
+        self.api_key = api_key or getattr(settings, 'GOOGLE_MAPS_API_KEY', None)
+
+    @property
+    def available(self):
+        return bool(self.api_key)
+
+    @classmethod
+    def get_session(cls):
+        with cls._session_lock:
+            if cls._session is None:
+                session = requests.Session()
+                adapter = HTTPAdapter(pool_connections=1, pool_maxsize=cls.pool_size)
+                session.mount('https://', adapter)
+                cls._session = session
+        return cls._session
+
+    def geocode(self, address: str) -> Optional[Coordinates]:
+        location = self.lookup(address)
+        return location[0] if location else None
+
+    def lookup(self, address: str) -> Optional[Location]:
+        try:
+            response = self.get_session().get(
+                self.url,
+                params={
+                    'address': address,
+                    'key': self.api_key,
+                    'region': self.region,
+                    'components': self.components,
+                },
+                timeout=10
+            )
+            response.raise_for_status()
+            data = response.json()
+        except (requests.RequestException, ValueError) as e:
+            raise GeocodingError(str(e))
+
+        status = data.get('status')
+        if status == 'ZERO_RESULTS':
+            return None
+        if status != 'OK' or not data.get('results'):
+            raise GeocodingError(f'Geocoding failed with status {status}')
+
+        try:
+            result = data['results'][0]
+            location = result['geometry']['location']
+            return (location['lat'], location['lng']), result.get('formatted_address', '')
+        except (KeyError, IndexError) as e:
+            raise GeocodingError(f'Unexpected geocoding response: {e}')
+
+
+class StubGeocodingProvider:
+    """
+    Offline provider returning stable coordinates derived from the address,
+    for tests and development without an API key
+    """
+    name = 'stub'
+    available = True
+
+    # Spread results over roughly the Perth metro area
+    origin = (-31.95, 115.86)
+    span = 0.5
+
+    def geocode(self, address: str) -> Optional[Coordinates]:
+        if not address:
+            return None
+        digest = hashlib.sha256(address.encode('utf-8')).digest()
+        lat_offset = int.from_bytes(digest[:4], 'big') / 0xFFFFFFFF - 0.5
+        lon_offset = int.from_bytes(digest[4:8], 'big') / 0xFFFFFFFF - 0.5
+        return (
+            round(self.origin[0] + lat_offset * self.span, 8),
+            round(self.origin[1] + lon_offset * self.span, 8),
+        )
+
+    def lookup(self, address: str) -> Optional[Location]:
+        coordinates = self.geocode(address)
+        return (coordinates, address) if coordinates else None
+
+
+PROVIDERS = {
+    GoogleGeocodingProvider.name: GoogleGeocodingProvider,
+    StubGeocodingProvider.name: StubGeocodingProvider,
+}
+
+
+class GeocodingService:
+    """
+    Service for cached address geocoding
+    """
+
+    @staticmethod
+    def normalise_address(address: str) -> str:
+        """Casefold, drop punctuation and collapse whitespace"""
+        if not address:
+            return ''
+        return ' '.join(re.sub(r'[^\w\s]', ' ', address.casefold()).split())
+
+    @staticmethod
+    def address_key(normalised: str) -> str:
+        return hashlib.sha256(normalised.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def get_provider(name=None):
+        name = name or getattr(settings, 'GEOCODING_PROVIDER', 'google')
+        try:
+            return PROVIDERS[name]()
+        except KeyError:
+            raise ValueError(f'Unknown geocoding provider: {name}')
+
+    @classmethod
+    def cached_results(cls, addresses: Iterable[str]) -> Dict[str, Optional[Coordinates]]:
+        """
+        Unexpired cache entries for the given addresses in one query.
+        Addresses cached as not found map to None; misses are left out.
+        """
+        from core.models import GeocodeCache
+
+        keys = {}
+        for address in addresses:
+            normalised = cls.normalise_address(address)
+            if normalised:
+                keys.setdefault(cls.address_key(normalised), []).append(address)
+
+        results = {}
+        entries = GeocodeCache.objects.filter(
+            address_key__in=list(keys),
+            expires_at__gt=timezone.now()
+        )
+        for entry in entries:
+            for address in keys[entry.address_key]:
+                results[address] = entry.coordinates
+        return results
+
+    @classmethod
+    def store_results(cls, results: Dict[str, Optional[Coordinates]], provider_name: str,
+                      formatted_addresses: Optional[Dict[str, str]] = None):
+        """Upsert provider results (None meaning not found) into the cache"""
+        from core.models import GeocodeCache
+
+        now = timezone.now()
+        ttl = timedelta(days=getattr(settings, 'GEOCODE_CACHE_TTL_DAYS', 180))
+        negative_ttl = timedelta(days=getattr(settings, 'GEOCODE_NEGATIVE_CACHE_TTL_DAYS', 7))
+
+        formatted_addresses = formatted_addresses or {}
+        entries = {}
+        for address, coordinates in results.items():
+            normalised = cls.normalise_address(address)
+            if not normalised:
+                continue
+            key = cls.address_key(normalised)
+            entries[key] = GeocodeCache(
+                address_key=key,
+                address=normalised,
+                formatted_address=formatted_addresses.get(address, '')[:255],
+                latitude=Decimal(str(round(coordinates[0], 8))) if coordinates else None,
+                longitude=Decimal(str(round(coordinates[1], 8))) if coordinates else None,
+                status='ok' if coordinates else 'not_found',
+                provider=provider_name,
+                fetched_at=now,
+                expires_at=now + (ttl if coordinates else negative_ttl),
+            )
+
+        GeocodeCache.objects.bulk_create(
+            list(entries.values()),
+            update_conflicts=True,
+            unique_fields=['address_key'],
+            update_fields=['address', 'formatted_address', 'latitude', 'longitude', 'status', 'provider', 'fetched_at', 'expires_at'],
+        )
+
+    @classmethod
+    def geocode(cls, address: str, provider=None) -> Optional[Coordinates]:
+        """
+        Geocode a single address, using the cache when possible
+
+        Returns:
+            Tuple of (latitude, longitude) or None if geocoding fails
+        """
+        return cls.geocode_many([address], provider=provider, max_workers=1).get(address)
+
+    @classmethod
+    def locate(cls, address: str, provider=None):
+        """
+        Geocode a single address and return its cache entry, which also
+        carries the provider's formatted address
+
+        Returns:
+            GeocodeCache entry (status 'not_found' when the provider has no
+            match), or None for a blank address or a failed provider request
+        """
+        from core.models import GeocodeCache
+
+        normalised = cls.normalise_address(address)
+        if not normalised:
+            return None
+        cls.geocode(address, provider=provider)
+        return GeocodeCache.objects.filter(
+            address_key=cls.address_key(normalised),
+            expires_at__gt=timezone.now()
+        ).first()
+
+    @classmethod
+    def geocode_many(cls, addresses: Iterable[str], provider=None, max_workers=4,
+                     refresh=False) -> Dict[str, Optional[Coordinates]]:
+        """
+        Geocode many addresses, fetching only cache misses from the provider
+
+        Args:
+            addresses: Addresses to geocode; blanks are ignored
+            provider: Provider instance (defaults to GEOCODING_PROVIDER)
+            max_workers: Maximum concurrent provider requests
+            refresh: Ignore cached entries and fetch everything again
+
+        Returns:
+            Dictionary of address -> (latitude, longitude) or None
+        """
+        provider = provider or cls.get_provider()
+
+        # One request per distinct normalised address
+        pending = {}
+        for address in addresses:
+            normalised = cls.normalise_address(address)
+            if normalised:
+                pending.setdefault(normalised, []).append(address)
+
+        results = {}
+        if not refresh:
+            cached = cls.cached_results(group[0] for group in pending.values())
+            for normalised, group in list(pending.items()):
+                if group[0] in cached:
+                    for address in group:
+                        results[address] = cached[group[0]]
+                    del pending[normalised]
+
+        if not pending or not getattr(provider, 'available', True):
+            return results
+
+        def fetch(address):
+            try:
+                return address, provider.lookup(address), True
+            except GeocodingError as e:
+                logger.warning(f"Geocoding failed for '{address}': {str(e)}")
+                return address, None, False
+
+        lookups = [group[0] for group in pending.values()]
+        fetched = {}
+        formatted_addresses = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(lookups)))) as executor:
+            for address, location, ok in executor.map(fetch, lookups):
+                coordinates = location[0] if location else None
+                # Failed requests are returned as None but never cached
+                if ok:
+                    fetched[address] = coordinates
+                    if location:
+                        formatted_addresses[address] = location[1]
+                for original in pending[cls.normalise_address(address)]:
+                    results[original] = coordinates
+
+        # Cache writes stay on this thread; workers only talk to the provider
+        if fetched:
+            cls.store_results(fetched, provider.name, formatted_addresses)
+
+        return results
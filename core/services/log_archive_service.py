@@ -0,0 +1,240 @@
+"""
+Log Archive Service for EduPulse
+Moves old log rows into gzipped, date-partitioned JSONL files on the private
+storage backend and re-hydrates archived periods on demand
+"""
+import gzip
+from datetime import datetime, time, timedelta
+from typing import Dict, Iterator, List
+
+from django.apps import apps
+from django.conf import settings
+from django.core import serializers
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveJSONEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder that keeps full microsecond precision on datetimes"""
+
+    def default(self, o):
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+class LogArchiveService:
+    """
+    Service for archiving and re-hydrating append-only log tables
+    """
+
+    # dataset -> (model label, partition timestamp field)
+    DATASETS = {
+        'email_log': ('core.EmailLog', 'created_at'),
+        'sms_log': ('core.SMSLog', 'created_at'),
+        'woocommerce_sync_log': ('core.WooCommerceSyncLog', 'created_at'),
+        'student_activity': ('students.StudentActivity', 'created_at'),
+    }
+    DEFAULT_AFTER_DAYS = 180
+    DELETE_BATCH_SIZE = 500
+
+    @classmethod
+    def get_model(cls, dataset):
+        if dataset not in cls.DATASETS:
+            raise ValueError(f'Unknown log dataset: {dataset}')
+        return apps.get_model(cls.DATASETS[dataset][0])
+
+    @staticmethod
+    def storage():
+        """Archives hold contact details and message bodies, so never public"""
+        return storages['private']
+
+    @staticmethod
+    def archive_path(dataset, day) -> str:
+        return f"{settings.LOG_ARCHIVE_DIR}/{dataset}/{day:%Y}/{day:%m}/{day.isoformat()}.jsonl.gz"
+
+    @staticmethod
+    def day_bounds(day):
+        """Aware [start, end) datetimes covering a local date"""
+        tz = timezone.get_current_timezone()
+        start = timezone.make_aware(datetime.combine(day, time.min), tz)
+        return start, timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min), tz)
+
+    @classmethod
+    def cutoff_date(cls, dataset, older_than_days=None):
+        """First local date that stays in the live table"""
+        if older_than_days is None:
+            older_than_days = getattr(settings, 'LOG_ARCHIVE_AFTER_DAYS', {}).get(dataset, cls.DEFAULT_AFTER_DAYS)
+        return timezone.localdate() - timedelta(days=older_than_days)
+
+    @classmethod
+    def pending_days(cls, dataset, cutoff) -> List:
+        """Local dates before the cutoff that still have live rows"""
+        model = cls.get_model(dataset)
+        field = cls.DATASETS[dataset][1]
+        return list(
+            model.objects.filter(**{f'{field}__lt': cls.day_bounds(cutoff)[0]})
+            .annotate(day=TruncDate(field))
+            .values_list('day', flat=True)
+            .distinct()
+            .order_by('day')
+        )
+
+    @classmethod
+    def read_lines(cls, path) -> List[str]:
+        with cls.storage().open(path, 'rb') as archive:
+            return gzip.decompress(archive.read()).decode('utf-8').splitlines()
+
+    @classmethod
+    def archive_day(cls, dataset, day) -> int:
+        """
+        Archive one local day of a dataset and delete the archived rows
+
+        Re-archiving a day (for example after a re-hydrate) merges into the
+        existing file, so the file always holds every row archived for it.
+
+        Returns:
+            Number of rows moved out of the live table
+        """
+        from core.models import LogArchive
+
+        model = cls.get_model(dataset)
+        field = cls.DATASETS[dataset][1]
+        start, end = cls.day_bounds(day)
+        rows = model.objects.filter(**{f'{field}__gte': start, f'{field}__lt': end}).order_by('pk')
+
+        ids = list(rows.values_list('pk', flat=True))
+        if not ids:
+            return 0
+
+        lines = serializers.serialize('jsonl', rows.iterator(chunk_size=1000), cls=ArchiveJSONEncoder).splitlines()
+        storage = cls.storage()
+        entry = LogArchive.objects.filter(dataset=dataset, date=day).first()
+        archived_ids = set(ids)
+        if entry and storage.exists(entry.path):
+            for obj in serializers.deserialize('jsonl', cls.read_lines(entry.path), ignorenonexistent=True):
+                if obj.object.pk not in archived_ids:
+                    archived_ids.add(obj.object.pk)
+                    lines.append(serializers.serialize('jsonl', [obj.object], cls=ArchiveJSONEncoder).strip())
+
+        content = gzip.compress(('\n'.join(lines) + '\n').encode('utf-8'))
+        path = cls.archive_path(dataset, day)
+        if storage.exists(path):
+            storage.delete(path)
+        path = storage.save(path, ContentFile(content))
+
+        with transaction.atomic():
+            LogArchive.objects.update_or_create(
+                dataset=dataset,
+                date=day,
+                defaults={
+                    'path': path,
+                    'row_count': len(archived_ids),
+                    'size_bytes': len(content),
+                    'min_id': min(archived_ids),
+                    'max_id': max(archived_ids),
+                    'restored_at': None,
+                }
+            )
+            for index in range(0, len(ids), cls.DELETE_BATCH_SIZE):
+                model.objects.filter(pk__in=ids[index:index + cls.DELETE_BATCH_SIZE]).delete()
+
+        return len(ids)
+
+    @classmethod
+    def archive(cls, dataset, older_than_days=None, dry_run=False) -> Dict[str, int]:
+        """
+        Archive every day of a dataset older than its horizon
+
+        Returns:
+            {'days': int, 'rows': int}
+        """
+        days = cls.pending_days(dataset, cls.cutoff_date(dataset, older_than_days))
+        if dry_run:
+            model = cls.get_model(dataset)
+            field = cls.DATASETS[dataset][1]
+            rows = 0
+            if days:
+                rows = model.objects.filter(
+                    **{f'{field}__lt': cls.day_bounds(days[-1])[1]}
+                ).count()
+            return {'days': len(days), 'rows': rows}
+
+        rows = 0
+        for day in days:
+            rows += cls.archive_day(dataset, day)
+        if rows:
+            logger.info(f"Archived {rows} {dataset} rows across {len(days)} day(s)")
+        return {'days': len(days), 'rows': rows}
+
+    @classmethod
+    def iter_archived(cls, dataset, start_date, end_date) -> Iterator:
+        """Unsaved model instances from archive files, oldest day first"""
+        from core.models import LogArchive
+
+        storage = cls.storage()
+        for entry in LogArchive.objects.filter(
+            dataset=dataset, date__gte=start_date, date__lte=end_date
+        ).order_by('date'):
+            if not storage.exists(entry.path):
+                logger.warning(f"Archive file missing for {dataset} {entry.date}: {entry.path}")
+                continue
+            for obj in serializers.deserialize('jsonl', cls.read_lines(entry.path), ignorenonexistent=True):
+                yield obj.object
+
+    @classmethod
+    def rehydrate(cls, dataset, start_date, end_date) -> Dict[str, int]:
+        """
+        Copy archived rows for a period back into the live table
+
+        Rows already present are left alone. Links to deleted records are
+        cleared where the field allows it; rows whose required parent has
+        gone are skipped.
+
+        Returns:
+            {'restored': int, 'skipped': int}
+        """
+        from core.models import LogArchive
+
+        model = cls.get_model(dataset)
+        instances = list(cls.iter_archived(dataset, start_date, end_date))
+        live_ids = set(
+            model.objects.filter(pk__in=[instance.pk for instance in instances]).values_list('pk', flat=True)
+        )
+        instances = [instance for instance in instances if instance.pk not in live_ids]
+
+        skipped = set()
+        for field in model._meta.concrete_fields:
+            if not field.many_to_one:
+                continue
+            wanted = {getattr(instance, field.attname) for instance in instances} - {None}
+            present = set(
+                field.related_model._base_manager.filter(pk__in=wanted).values_list('pk', flat=True)
+            )
+            for instance in instances:
+                if getattr(instance, field.attname) in wanted - present:
+                    if field.null:
+                        setattr(instance, field.attname, None)
+                    else:
+                        skipped.add(instance.pk)
+
+        restored = 0
+        with transaction.atomic():
+            for instance in instances:
+                if instance.pk in skipped:
+                    continue
+                # raw save keeps auto_now/auto_now_add values and tells signals to stay out
+                model.save_base(instance, raw=True)
+                restored += 1
+            LogArchive.objects.filter(
+                dataset=dataset, date__gte=start_date, date__lte=end_date
+            ).update(restored_at=timezone.now())
+
+        return {'restored': restored, 'skipped': len(skipped)}
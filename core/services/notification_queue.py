@@ -4,7 +4,7 @@ Provides graceful fallback to synchronous sending when Redis/queue
 is unavailable so user actions are not blocked.
 """
 import logging
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 import django_rq
 from core.services.notification_delivery import (
     send_email_notification,
@@ -126,6 +126,20 @@ def enqueue_enrollment_confirmation_email(enrollment_id: int) -> Dict:
         return {'queued': False, 'sent': sent, 'error': str(exc)}
 
 
+def enqueue_enrollment_confirmation_emails(enrollment_ids: List[int]) -> Dict:
+    """Queue one job sending confirmation emails for a batch of enrollments; fall back to synchronous send."""
+    try:
+        queue = _get_queue()
+        job = queue.enqueue(
+            'core.tasks.send_enrollment_confirmation_emails_task', enrollment_ids=list(enrollment_ids)
+        )
+        return {'queued': True, 'job_id': job.id}
+    except Exception as exc:
+        logger.warning("Queueing enrollment confirmation emails failed, sending synchronously: %s", exc)
+        sent = sum(1 for enrollment_id in enrollment_ids if _send_confirmation_email_sync(enrollment_id))
+        return {'queued': False, 'sent': sent, 'error': str(exc)}
+
+
 def _send_confirmation_email_sync(enrollment_id: int) -> bool:
     from enrollment.models import Enrollment
     from core.services.notification_service import NotificationService
@@ -0,0 +1,253 @@
+"""
+QR Rendering Service for EduPulse
+Renders QR images in a process pool, caches them by payload hash and builds
+printable multi-code sheets (PDF or SVG) per facility and week
+
+Images and sheets hold working attendance URLs, so they live on the private
+storage and are only handed out through staff views
+"""
+import hashlib
+import io
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import timedelta
+from typing import Dict, List, Sequence
+from xml.sax.saxutils import escape
+
+import qrcode
+from django.core.files.base import ContentFile
+from django.core.files.storage import storages
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+def _build_qr(data: str) -> qrcode.QRCode:
+    qr = qrcode.QRCode(
+        version=1,
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=10,
+        border=4,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+    return qr
+
+
+def render_png(data: str) -> bytes:
+    """Render one QR code as PNG bytes (module level so worker processes can run it)"""
+    img = _build_qr(data).make_image(fill_color="black", back_color="white")
+    buffer = io.BytesIO()
+    img.save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+class QRRenderService:
+    """
+    Service for rendering and caching QR code images and sheets
+    """
+
+    IMAGE_CACHE_DIR = 'qr_cache'
+    SHEET_DIR = 'qr_sheets'
+    # Below this many uncached images a pool costs more than it saves
+    PARALLEL_THRESHOLD = 8
+
+    # Sheet layout (mm on A4 portrait)
+    COLUMNS = 2
+    ROWS = 3
+    QR_SIZE = 70
+
+    @staticmethod
+    def storage():
+        return storages['private']
+
+    @staticmethod
+    def payload_hash(data: str) -> str:
+        return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+    @classmethod
+    def image_path(cls, data: str) -> str:
+        digest = cls.payload_hash(data)
+        return f"{cls.IMAGE_CACHE_DIR}/{digest[:2]}/{digest}.png"
+
+    @classmethod
+    def render_many(cls, payloads: Sequence[str], workers=None) -> Dict[str, bytes]:
+        """
+        PNG bytes for each payload, rendering only those not already cached
+
+        Args:
+            payloads: QR contents (usually attendance URLs)
+            workers: Worker processes for uncached images (default: CPU count)
+        """
+        storage = cls.storage()
+        images = {}
+        missing = []
+        for data in dict.fromkeys(payloads):
+            path = cls.image_path(data)
+            if storage.exists(path):
+                with storage.open(path, 'rb') as cached:
+                    images[data] = cached.read()
+            else:
+                missing.append(data)
+
+        if not missing:
+            return images
+
+        workers = workers or os.cpu_count() or 1
+        if workers > 1 and len(missing) >= cls.PARALLEL_THRESHOLD:
+            with ProcessPoolExecutor(max_workers=min(workers, len(missing))) as executor:
+                rendered = list(executor.map(render_png, missing, chunksize=4))
+        else:
+            rendered = [render_png(data) for data in missing]
+
+        for data, png in zip(missing, rendered):
+            storage.save(cls.image_path(data), ContentFile(png))
+            images[data] = png
+
+        return images
+
+    @classmethod
+    def render_one(cls, data: str) -> bytes:
+        return cls.render_many([data], workers=1)[data]
+
+    @classmethod
+    def sheet_dir(cls, facility) -> str:
+        return f"{cls.SHEET_DIR}/facility_{facility.id}"
+
+    @classmethod
+    def sheet_path(cls, facility, week_start, entries: List[Dict], fmt='pdf') -> str:
+        """Path keyed on the sheet's content, so any class change gives a new file"""
+        digest = cls.payload_hash('\n'.join(
+            f"{entry['title']}|{entry['attendance_url']}" for entry in entries
+        ))
+        return f"{cls.sheet_dir(facility)}/{week_start.isoformat()}-{digest[:16]}.{fmt}"
+
+    @staticmethod
+    def _validity_label(entry) -> str:
+        valid_from = timezone.localtime(entry['valid_from'])
+        expires_at = timezone.localtime(entry['expires_at'])
+        return f"Valid {valid_from.strftime('%d/%m %H:%M')} - {expires_at.strftime('%d/%m %H:%M')}"
+
+    @classmethod
+    def build_pdf_sheet(cls, facility, entries: List[Dict], images: Dict[str, bytes]) -> bytes:
+        """Lay QR codes out on A4 pages, six per page, each with its title"""
+        from fpdf import FPDF
+
+        pdf = FPDF(orientation='P', unit='mm', format='A4')
+        pdf.set_auto_page_break(auto=False)
+        cell_width = (pdf.w - 20) / cls.COLUMNS
+        cell_height = (pdf.h - 30) / cls.ROWS
+        per_page = cls.COLUMNS * cls.ROWS
+
+        for index, entry in enumerate(entries):
+            slot = index % per_page
+            if slot == 0:
+                pdf.add_page()
+                pdf.set_font("Helvetica", "B", 14)
+                pdf.cell(0, 10, cls._latin1(f"{facility.name} - Attendance QR Codes"), ln=True)
+
+            x = 10 + (slot % cls.COLUMNS) * cell_width
+            y = 20 + (slot // cls.COLUMNS) * cell_height
+            pdf.image(io.BytesIO(images[entry['attendance_url']]),
+                      x=x + (cell_width - cls.QR_SIZE) / 2, y=y, w=cls.QR_SIZE, h=cls.QR_SIZE)
+            pdf.set_xy(x, y + cls.QR_SIZE + 1)
+            pdf.set_font("Helvetica", "B", 10)
+            pdf.cell(cell_width, 5, cls._latin1(entry['title']), align='C')
+            pdf.set_xy(x, y + cls.QR_SIZE + 6)
+            pdf.set_font("Helvetica", size=8)
+            pdf.cell(cell_width, 4, cls._validity_label(entry), align='C')
+
+        return bytes(pdf.output(dest="S"))
+
+    @classmethod
+    def build_svg_sheet(cls, facility, entries: List[Dict]) -> str:
+        """Vector sheet drawn straight from the QR module matrices"""
+        cell_width, cell_height, header = 105, 95, 15
+        rows = max(1, -(-len(entries) // cls.COLUMNS))
+        width = cell_width * cls.COLUMNS
+        height = header + cell_height * rows
+
+        parts = [
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}mm" height="{height}mm" '
+            f'viewBox="0 0 {width} {height}">',
+            f'<rect width="{width}" height="{height}" fill="#fff"/>',
+            f'<text x="5" y="10" font-family="Helvetica" font-size="6" font-weight="bold">'
+            f'{escape(facility.name)} - Attendance QR Codes</text>',
+        ]
+        for index, entry in enumerate(entries):
+            matrix = _build_qr(entry['attendance_url']).get_matrix()
+            module = cls.QR_SIZE / len(matrix)
+            x = (index % cls.COLUMNS) * cell_width + (cell_width - cls.QR_SIZE) / 2
+            y = header + (index // cls.COLUMNS) * cell_height
+            path = ''.join(
+                f'M{col},{row}h1v1h-1z'
+                for row, line in enumerate(matrix)
+                for col, dark in enumerate(line) if dark
+            )
+            parts.append(
+                f'<path transform="translate({x:.2f},{y:.2f}) scale({module:.4f})" d="{path}" fill="#000"/>'
+            )
+            centre = (index % cls.COLUMNS) * cell_width + cell_width / 2
+            parts.append(
+                f'<text x="{centre:.2f}" y="{y + cls.QR_SIZE + 5:.2f}" text-anchor="middle" '
+                f'font-family="Helvetica" font-size="4" font-weight="bold">{escape(entry["title"])}</text>'
+            )
+            parts.append(
+                f'<text x="{centre:.2f}" y="{y + cls.QR_SIZE + 10:.2f}" text-anchor="middle" '
+                f'font-family="Helvetica" font-size="3">{cls._validity_label(entry)}</text>'
+            )
+        parts.append('</svg>')
+        return ''.join(parts)
+
+    @classmethod
+    def render_facility_sheet(cls, facility, week_start, fmt='pdf', workers=None, force=False) -> str:
+        """
+        Render (or reuse) the printable sheet for a facility's week
+
+        The sheet is reused only while its entries are unchanged; otherwise a
+        new file is rendered and older renders of the week are removed.
+
+        Returns:
+            Path of the sheet on the private storage
+        """
+        from core.services.qr_service import QRCodeService
+
+        if fmt not in ('pdf', 'svg'):
+            raise ValueError(f'Unsupported sheet format: {fmt}')
+
+        storage = cls.storage()
+        entries = QRCodeService.facility_qr_entries(
+            facility, week_start, week_start + timedelta(days=6)
+        )
+        path = cls.sheet_path(facility, week_start, entries, fmt)
+        if not force and storage.exists(path):
+            return path
+
+        if fmt == 'pdf':
+            images = cls.render_many([entry['attendance_url'] for entry in entries], workers=workers)
+            content = cls.build_pdf_sheet(facility, entries, images)
+        else:
+            content = cls.build_svg_sheet(facility, entries).encode('utf-8')
+
+        if storage.exists(path):
+            storage.delete(path)
+        path = storage.save(path, ContentFile(content))
+        cls._remove_stale_sheets(storage, facility, week_start, fmt, keep=path)
+        return path
+
+    @classmethod
+    def _remove_stale_sheets(cls, storage, facility, week_start, fmt, keep):
+        try:
+            _, files = storage.listdir(cls.sheet_dir(facility))
+        except FileNotFoundError:
+            return
+        for name in files:
+            path = f"{cls.sheet_dir(facility)}/{name}"
+            if name.startswith(week_start.isoformat()) and name.endswith(f'.{fmt}') and path != keep:
+                storage.delete(path)
+
+    @staticmethod
+    def _latin1(text: str) -> str:
+        # Core PDF fonts only cover latin-1
+        return text.encode('latin-1', 'replace').decode('latin-1')
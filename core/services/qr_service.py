@@ -6,11 +6,12 @@ import qrcode
 import qrcode.image.svg
 import base64
 import io
-import json
 import hashlib
 import secrets
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta, timezone as dt_timezone
 from django.conf import settings
+from django.core import signing
+from django.utils.crypto import salted_hmac
 from django.utils import timezone
 from django.urls import reverse
 from django.contrib.sites.models import Site
@@ -25,6 +26,11 @@ class QRCodeService:
     Service for generating and validating QR codes for teacher attendance
     """
     
+    SIGNING_SALT = 'core.qr_attendance'
+    TOKEN_ID_BYTES = 9
+    CLASS_QR_LEAD_MINUTES = 60
+    CLASS_QR_GRACE_MINUTES = 60
+    
     @staticmethod
     def generate_attendance_qr_code(facility, class_instance=None, expires_minutes=60):
         """
@@ -39,13 +45,17 @@ class QRCodeService:
             Dictionary with QR code data and image
         """
         try:
-            # Create secure token for this QR code
-            token = secrets.token_urlsafe(32)
-            
             # Calculate expiration time
             expires_at = timezone.now() + timedelta(minutes=expires_minutes)
             
-            # Create QR code data
+            # Signed, self-verifying payload; nothing is stored server side
+            token = secrets.token_urlsafe(QRCodeService.TOKEN_ID_BYTES)
+            encoded_data = QRCodeService.sign_qr_payload(
+                facility_id=facility.id,
+                class_id=class_instance.id if class_instance else None,
+                expires_at=expires_at,
+                token=token
+            )
             qr_data = {
                 'facility_id': facility.id,
                 'facility_name': facility.name,
@@ -55,36 +65,12 @@ class QRCodeService:
                 'generated_at': timezone.now().isoformat()
             }
             
-            # Get current site domain
-            site = Site.objects.get_current()
+            # Create attendance URL with the signed data
+            attendance_url = QRCodeService.build_attendance_url(encoded_data)
             
-            # Create attendance URL with encoded data
-            encoded_data = base64.urlsafe_b64encode(
-                json.dumps(qr_data).encode('utf-8')
-            ).decode('utf-8')
-            
-            attendance_url = f"https://{site.domain}{reverse('teacher_qr_attendance')}?data={encoded_data}"
-            
-            # Generate QR code
-            qr = qrcode.QRCode(
-                version=1,
-                error_correction=qrcode.constants.ERROR_CORRECT_L,
-                box_size=10,
-                border=4,
-            )
-            qr.add_data(attendance_url)
-            qr.make(fit=True)
-            
-            # Create QR code image
-            img = qr.make_image(fill_color="black", back_color="white")
-            
-            # Convert to base64 for easy embedding
-            buffer = io.BytesIO()
-            img.save(buffer, format='PNG')
-            img_base64 = base64.b64encode(buffer.getvalue()).decode('utf-8')
-            
-            # Store QR code data in cache/database for validation
-            QRCodeService._store_qr_token(token, qr_data)
+            # One-off token, so render directly rather than through the image cache
+            from core.services.qr_render_service import render_png
+            img_base64 = base64.b64encode(render_png(attendance_url)).decode('utf-8')
             
             return {
                 'success': True,
@@ -104,39 +90,74 @@ class QRCodeService:
                 'error': str(e)
             }
     
+    @staticmethod
+    def sign_qr_payload(facility_id, class_id, expires_at, token, valid_from=None, shared=False):
+        """
+        Build the compact signed string carried in the QR code URL
+        
+        The payload holds only the facility, optional class, expiry (epoch
+        seconds) and a short token id used for replay protection. Pre-generated
+        codes also carry the start of their window and a shared flag.
+        """
+        payload = {
+            'f': facility_id,
+            'c': class_id,
+            'e': int(expires_at.timestamp()),
+            't': token
+        }
+        if valid_from is not None:
+            payload['n'] = int(valid_from.timestamp())
+        if shared:
+            payload['s'] = 1
+        # Plain Signer (no timestamp) so the same payload always signs the same,
+        # which lets rendered images be cached by content
+        return signing.Signer(salt=QRCodeService.SIGNING_SALT).sign_object(payload, compress=True)
+    
     @staticmethod
     def validate_qr_code(data_string):
         """
         Validate QR code data and return facility information
         
+        The signature and expiry are checked without any cache or database
+        access; the replay set is only consulted by consume_qr_token.
+        
         Args:
-            data_string: Base64 encoded QR code data
+            data_string: Signed QR code data
             
         Returns:
             Dictionary with validation results and facility data
         """
         try:
-            # Decode the QR code data
-            decoded_data = base64.urlsafe_b64decode(data_string.encode('utf-8'))
-            qr_data = json.loads(decoded_data.decode('utf-8'))
+            try:
+                payload = signing.Signer(salt=QRCodeService.SIGNING_SALT).unsign_object(data_string)
+            except signing.BadSignature:
+                return {
+                    'valid': False,
+                    'error': 'Invalid or expired QR code token'
+                }
             
             # Check if QR code has expired
-            expires_at = datetime.fromisoformat(qr_data['expires_at'].replace('Z', '+00:00'))
+            expires_at = datetime.fromtimestamp(payload['e'], tz=dt_timezone.utc)
             if timezone.now() > expires_at:
                 return {
                     'valid': False,
                     'error': 'QR code has expired',
                     'expired': True
                 }
-            
-            # Validate token
-            token = qr_data.get('token')
-            if not QRCodeService._validate_qr_token(token, qr_data):
+            if 'n' in payload and timezone.now() < datetime.fromtimestamp(payload['n'], tz=dt_timezone.utc):
                 return {
                     'valid': False,
-                    'error': 'Invalid or expired QR code token'
+                    'error': 'QR code is not valid yet'
                 }
             
+            token = payload['t']
+            qr_data = {
+                'facility_id': payload['f'],
+                'class_id': payload.get('c'),
+                'token': token,
+                'expires_at': expires_at.isoformat()
+            }
+            
             # Get facility
             from facilities.models import Facility
             try:
@@ -162,7 +183,9 @@ class QRCodeService:
                 'facility': facility,
                 'class_instance': class_instance,
                 'qr_data': qr_data,
-                'token': token
+                'token': token,
+                'expires_at': expires_at,
+                'shared': bool(payload.get('s'))
             }
             
         except Exception as e:
@@ -173,55 +196,116 @@ class QRCodeService:
             }
     
     @staticmethod
-    def generate_facility_qr_codes(facility, days_ahead=7):
+    def build_attendance_url(encoded_data, site_domain=None):
+        """Full attendance URL for signed QR data"""
+        domain = site_domain or Site.objects.get_current().domain
+        return f"https://{domain}{reverse('teacher_qr_attendance')}?data={encoded_data}"
+    
+    @staticmethod
+    def sheet_token(facility_id, class_id, expires_at):
+        """Deterministic token id for pre-generated codes, so re-rendering is a cache hit"""
+        value = f"{facility_id}:{class_id}:{int(expires_at.timestamp())}"
+        return salted_hmac(QRCodeService.SIGNING_SALT, value).hexdigest()[:12]
+    
+    @staticmethod
+    def facility_qr_entries(facility, start_date, end_date, general_dates=None):
+        """
+        Payloads for a facility's general codes and each class between two dates
+        
+        Codes that leave the server keep short windows: a general code is valid
+        for one local day (one per date in general_dates, default every date in
+        the range), a class code from CLASS_QR_LEAD_MINUTES before the class to
+        CLASS_QR_GRACE_MINUTES after it. They are marked shared, so check-ins
+        need a verified location. Identical inputs give identical URLs, so
+        images and sheets can be cached.
+        
+        Returns:
+            List of dicts with type, title, attendance_url, valid_from,
+            expires_at and class_instance
+        """
+        from academics.models import Class
+        
+        domain = Site.objects.get_current().domain
+        
+        def entry(entry_type, title, valid_from, expires_at, class_instance=None):
+            class_id = class_instance.id if class_instance else None
+            encoded_data = QRCodeService.sign_qr_payload(
+                facility_id=facility.id,
+                class_id=class_id,
+                expires_at=expires_at,
+                token=QRCodeService.sheet_token(facility.id, class_id, expires_at),
+                valid_from=valid_from,
+                shared=True
+            )
+            return {
+                'type': entry_type,
+                'title': title,
+                'attendance_url': QRCodeService.build_attendance_url(encoded_data, domain),
+                'valid_from': valid_from,
+                'expires_at': expires_at,
+                'facility': facility,
+                'class_instance': class_instance
+            }
+        
+        if general_dates is None:
+            general_dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+        entries = []
+        for day in general_dates:
+            day_start = timezone.make_aware(datetime.combine(day, time.min))
+            day_end = timezone.make_aware(datetime.combine(day + timedelta(days=1), time.min))
+            entries.append(entry('general', f"General Check-in - {facility.name} - {day.strftime('%a %d/%m')}",
+                                 day_start, day_end))
+        
+        classes = Class.objects.filter(
+            facility=facility,
+            date__gte=start_date,
+            date__lte=end_date,
+            is_active=True
+        ).select_related('course').order_by('date', 'start_time')
+        
+        for class_instance in classes:
+            starts_at = class_instance.get_class_datetime()
+            valid_from = starts_at - timedelta(minutes=QRCodeService.CLASS_QR_LEAD_MINUTES)
+            expires_at = starts_at + timedelta(
+                minutes=class_instance.duration_minutes + QRCodeService.CLASS_QR_GRACE_MINUTES
+            )
+            title = f"{class_instance.course.name} - {class_instance.date.strftime('%m/%d')} {class_instance.start_time.strftime('%H:%M')}"
+            entries.append(entry('class_specific', title, valid_from, expires_at, class_instance))
+        
+        return entries
+    
+    @staticmethod
+    def generate_facility_qr_codes(facility, days_ahead=7, workers=None):
         """
         Generate QR codes for a facility for upcoming classes
         
+        Images are rendered through QRRenderService, so repeat visits reuse
+        cached PNGs and only new classes are rendered (in parallel).
+        
         Args:
             facility: Facility object
             days_ahead: Number of days ahead to generate QR codes for
+            workers: Worker processes for rendering uncached images
             
         Returns:
             List of QR code data for upcoming classes
         """
-        from academics.models import Class
-        from datetime import date
+        from core.services.qr_render_service import QRRenderService
         
         try:
-            # Get classes for this facility in the next week
-            start_date = timezone.now().date()
+            start_date = timezone.localdate()
             end_date = start_date + timedelta(days=days_ahead)
             
-            classes = Class.objects.filter(
-                facility=facility,
-                date__gte=start_date,
-                date__lte=end_date,
-                is_active=True
-            ).order_by('date', 'start_time')
-            
-            qr_codes = []
-            
-            # Generate general facility QR code
-            general_qr = QRCodeService.generate_attendance_qr_code(
-                facility=facility,
-                expires_minutes=24*60  # 24 hours
+            # Only today's general code is shown on screen; printed sheets carry one per day
+            qr_codes = QRCodeService.facility_qr_entries(facility, start_date, end_date, general_dates=[start_date])
+            images = QRRenderService.render_many(
+                [qr_code['attendance_url'] for qr_code in qr_codes],
+                workers=workers
             )
-            if general_qr['success']:
-                general_qr['type'] = 'general'
-                general_qr['title'] = f"General Check-in - {facility.name}"
-                qr_codes.append(general_qr)
             
-            # Generate specific QR codes for each class
-            for class_instance in classes:
-                class_qr = QRCodeService.generate_attendance_qr_code(
-                    facility=facility,
-                    class_instance=class_instance,
-                    expires_minutes=4*60  # 4 hours
-                )
-                if class_qr['success']:
-                    class_qr['type'] = 'class_specific'
-                    class_qr['title'] = f"{class_instance.course.name} - {class_instance.date.strftime('%m/%d')} {class_instance.start_time.strftime('%H:%M')}"
-                    qr_codes.append(class_qr)
+            for qr_code in qr_codes:
+                qr_code['success'] = True
+                qr_code['qr_code_image'] = base64.b64encode(images[qr_code['attendance_url']]).decode('utf-8')
             
             return {
                 'success': True,
@@ -238,48 +322,33 @@ class QRCodeService:
             }
     
     @staticmethod
-    def _store_qr_token(token, qr_data):
+    def consume_qr_token(token, expires_at, scope=None):
         """
-        Store QR code token for validation (using Django cache)
+        Mark a QR token as used after a successful check-in
+        
+        Returns False if the token was already used within the same scope.
+        One-off codes use no scope and are single use; shared codes are
+        scoped to teacher and clock type so one printed sheet serves every
+        teacher. Entries only live until the token would have expired
+        anyway, so the set stays small.
         """
         from django.core.cache import cache
         
-        # Store for the duration of QR code validity plus buffer
-        expires_at = datetime.fromisoformat(qr_data['expires_at'].replace('Z', '+00:00'))
         timeout = int((expires_at - timezone.now()).total_seconds()) + 300  # 5 min buffer
-        
-        cache_key = f"qr_token_{token}"
-        cache.set(cache_key, qr_data, timeout=max(timeout, 60))  # Minimum 1 minute
-        
+        return cache.add(QRCodeService._used_token_key(token, scope), True, timeout=max(timeout, 60))
+    
     @staticmethod
-    def _validate_qr_token(token, qr_data):
+    def release_qr_token(token, scope=None):
         """
-        Validate QR code token against stored data
+        Allow a consumed token to be used again (e.g. when saving attendance failed)
         """
         from django.core.cache import cache
         
-        cache_key = f"qr_token_{token}"
-        cached_data = cache.get(cache_key)
-        
-        if not cached_data:
-            return False
-        
-        # Verify key data matches
-        return (
-            cached_data.get('facility_id') == qr_data.get('facility_id') and
-            cached_data.get('generated_at') == qr_data.get('generated_at') and
-            cached_data.get('token') == qr_data.get('token')
-        )
+        cache.delete(QRCodeService._used_token_key(token, scope))
     
     @staticmethod
-    def invalidate_qr_token(token):
-        """
-        Invalidate a QR code token (useful after successful check-in)
-        """
-        from django.core.cache import cache
-        
-        cache_key = f"qr_token_{token}"
-        cache.delete(cache_key)
+    def _used_token_key(token, scope=None):
+        return f"qr_used_{token}_{scope}" if scope else f"qr_used_{token}"
     
     @staticmethod
     def generate_svg_qr_code(attendance_url):
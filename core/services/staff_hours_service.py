@@ -0,0 +1,234 @@
+"""
+Staff Daily Hours Service for EduPulse
+Maintains the StaffDailyHours rollup and serves period summaries from it
+"""
+import calendar
+from datetime import date, timedelta
+from decimal import Decimal
+from typing import Dict, Iterable, Tuple
+
+from django.db import transaction
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class StaffDailyHoursService:
+    """
+    Service for computing, refreshing and summarising daily staff hours
+    """
+
+    # Days recomputed per rebuild transaction
+    REBUILD_CHUNK_DAYS = 31
+    # Days either side of a window read for pairing, and either side of a
+    # changed clock record refreshed; sessions longer than this are not paired
+    PAIRING_PAD_DAYS = 1
+    UPDATE_FIELDS = [
+        'total_hours', 'sessions', 'completed_sessions',
+        'has_unmatched_clock_in', 'has_unmatched_clock_out', 'class_count',
+        'updated_at',
+    ]
+
+    @classmethod
+    def compute_days(cls, start_date, end_date, staff_ids=None) -> Dict[Tuple[int, date], Dict]:
+        """
+        Daily totals for each staff member with activity between two dates
+
+        Pairing runs over PAIRING_PAD_DAYS extra days either side so sessions
+        crossing midnight are matched the same way regardless of the window.
+
+        Returns:
+            Dict of (staff id, date) -> rollup field values
+        """
+        from core.models import TeacherAttendance
+        from core.services.staff_timesheet_service import StaffTimesheetService
+
+        pad = timedelta(days=cls.PAIRING_PAD_DAYS)
+        rows = StaffTimesheetService.get_session_rows(
+            start_date - pad, end_date + pad, staff_ids=staff_ids
+        )
+
+        days = {}
+        for row in rows:
+            if not start_date <= row.date <= end_date:
+                continue
+            day = days.setdefault((row.teacher_id, row.date), {
+                'total_hours': 0.0,
+                'sessions': 0,
+                'completed_sessions': 0,
+                'has_unmatched_clock_in': False,
+                'has_unmatched_clock_out': False,
+                'class_count': 0,
+            })
+            day['sessions'] += 1
+            if row.duration_hours is not None:
+                day['total_hours'] += row.duration_hours
+                day['completed_sessions'] += 1
+            elif row.clock_in_id is not None:
+                day['has_unmatched_clock_in'] = True
+            else:
+                day['has_unmatched_clock_out'] = True
+
+        links = TeacherAttendance.classes.through.objects.filter(
+            teacherattendance__timestamp__date__gte=start_date,
+            teacherattendance__timestamp__date__lte=end_date,
+        )
+        if staff_ids is not None:
+            links = links.filter(teacherattendance__teacher_id__in=list(staff_ids))
+        class_counts = links.annotate(
+            day=TruncDate('teacherattendance__timestamp')
+        ).values('teacherattendance__teacher_id', 'day').annotate(
+            classes=Count('class_id', distinct=True)
+        ).order_by()
+        for entry in class_counts:
+            day = days.get((entry['teacherattendance__teacher_id'], entry['day']))
+            if day is not None:
+                day['class_count'] = entry['classes']
+
+        for day in days.values():
+            day['total_hours'] = Decimal(str(round(day['total_hours'], 4)))
+        return days
+
+    @classmethod
+    def refresh_days(cls, staff_id, dates: Iterable[date]):
+        """
+        Recompute the rollup rows for one staff member on the given dates
+
+        Dates without any clock records lose their row.
+        """
+        from core.models import StaffDailyHours
+
+        dates = set(dates)
+        if not dates:
+            return
+
+        days = cls.compute_days(min(dates), max(dates), staff_ids=[staff_id])
+        rollups = [
+            StaffDailyHours(staff_id=staff_id, date=day, **days[(staff_id, day)])
+            for day in sorted(dates)
+            if (staff_id, day) in days
+        ]
+
+        with transaction.atomic():
+            StaffDailyHours.objects.filter(staff_id=staff_id, date__in=dates).exclude(
+                date__in=[rollup.date for rollup in rollups]
+            ).delete()
+            if rollups:
+                StaffDailyHours.objects.bulk_create(
+                    rollups,
+                    update_conflicts=True,
+                    unique_fields=['staff', 'date'],
+                    update_fields=cls.UPDATE_FIELDS,
+                )
+
+    @classmethod
+    def refresh_for_record(cls, staff_id, timestamp):
+        """Refresh the days a clock record at this time can affect"""
+        if staff_id is None or timestamp is None:
+            return
+        local_date = timezone.localdate(timestamp)
+        # A clock out may close a session that started the day before, and a
+        # clock in may claim (or release) a clock out on the day after
+        cls.refresh_days(staff_id, [
+            local_date + timedelta(days=offset)
+            for offset in range(-cls.PAIRING_PAD_DAYS, cls.PAIRING_PAD_DAYS + 1)
+        ])
+
+    @classmethod
+    def rebuild(cls, start_date=None, end_date=None, staff_ids=None) -> int:
+        """
+        Recompute the rollup from raw clock records
+
+        Args:
+            start_date: First date to rebuild (default: earliest clock record)
+            end_date: Last date to rebuild (default: latest clock record)
+            staff_ids: Optional iterable of staff ids to restrict to
+
+        Returns:
+            Number of rollup rows written
+        """
+        from core.models import StaffDailyHours, TeacherAttendance
+
+        if start_date is None or end_date is None:
+            records = TeacherAttendance.objects.all()
+            if staff_ids is not None:
+                records = records.filter(teacher_id__in=list(staff_ids))
+            first = records.order_by('timestamp').values_list('timestamp', flat=True).first()
+            last = records.order_by('-timestamp').values_list('timestamp', flat=True).first()
+            if first is None:
+                return 0
+            start_date = start_date or timezone.localdate(first)
+            end_date = end_date or timezone.localdate(last)
+
+        written = 0
+        chunk_start = start_date
+        while chunk_start <= end_date:
+            chunk_end = min(chunk_start + timedelta(days=cls.REBUILD_CHUNK_DAYS - 1), end_date)
+            days = cls.compute_days(chunk_start, chunk_end, staff_ids=staff_ids)
+
+            with transaction.atomic():
+                existing = StaffDailyHours.objects.filter(date__gte=chunk_start, date__lte=chunk_end)
+                if staff_ids is not None:
+                    existing = existing.filter(staff_id__in=list(staff_ids))
+                existing.delete()
+                StaffDailyHours.objects.bulk_create([
+                    StaffDailyHours(staff_id=staff_id, date=day, **values)
+                    for (staff_id, day), values in days.items()
+                ], batch_size=500)
+
+            written += len(days)
+            chunk_start = chunk_end + timedelta(days=1)
+
+        logger.info(f"Rebuilt {written} staff daily hours rows for {start_date} to {end_date}")
+        return written
+
+    @staticmethod
+    def summarise(start_date, end_date, staff_ids=None) -> Dict[int, Dict]:
+        """
+        Per-staff totals for a period in one aggregate query over the rollup
+
+        Returns:
+            Dict of staff id -> {'total_hours', 'sessions', 'completed_sessions',
+            'working_days', 'class_count', 'unmatched_days'}
+        """
+        from core.models import StaffDailyHours
+
+        queryset = StaffDailyHours.objects.filter(date__gte=start_date, date__lte=end_date)
+        if staff_ids is not None:
+            queryset = queryset.filter(staff_id__in=list(staff_ids))
+
+        totals = queryset.values('staff_id').annotate(
+            hours=Sum('total_hours'),
+            session_count=Sum('sessions'),
+            completed=Sum('completed_sessions'),
+            working_days=Count('id', filter=Q(completed_sessions__gt=0)),
+            classes=Sum('class_count'),
+            unmatched_days=Count('id', filter=Q(has_unmatched_clock_in=True) | Q(has_unmatched_clock_out=True)),
+        ).order_by()
+
+        return {
+            row['staff_id']: {
+                'total_hours': row['hours'] or Decimal('0'),
+                'sessions': row['session_count'] or 0,
+                'completed_sessions': row['completed'] or 0,
+                'working_days': row['working_days'],
+                'class_count': row['classes'] or 0,
+                'unmatched_days': row['unmatched_days'],
+            }
+            for row in totals
+        }
+
+    @staticmethod
+    def month_bounds(year: int, month: int) -> Tuple[date, date]:
+        return date(year, month, 1), date(year, month, calendar.monthrange(year, month)[1])
+
+    @staticmethod
+    def quarter_bounds(year: int, quarter: int) -> Tuple[date, date]:
+        if quarter not in (1, 2, 3, 4):
+            raise ValueError(f'Invalid quarter: {quarter}')
+        first_month = (quarter - 1) * 3 + 1
+        last_month = first_month + 2
+        return date(year, first_month, 1), date(year, last_month, calendar.monthrange(year, last_month)[1])
@@ -2,6 +2,7 @@
 Staff Timesheet Panel Service for EduPulse
 Handles timesheet data processing for staff detail pages
 """
+from collections import defaultdict, namedtuple
 from django.utils import timezone
 from django.db.models import Q
 from datetime import datetime, timedelta, time
@@ -10,6 +11,14 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# One work session (or unmatched clock record) produced by get_session_rows.
+# Unmatched rows have clock_in_id or clock_out_id set to None and no duration.
+SessionRow = namedtuple('SessionRow', [
+    'teacher_id', 'date', 'facility_id',
+    'clock_in_id', 'clock_in_at', 'clock_out_id', 'clock_out_at',
+    'duration_hours',
+])
+
 
 class StaffTimesheetService:
     """
@@ -30,29 +39,14 @@ class StaffTimesheetService:
             Dict containing paired records, summary statistics, and raw data
         """
         try:
-            from core.models import TeacherAttendance
-            
             # Set default date range if not provided
             if not end_date:
                 end_date = timezone.localdate()
             if not start_date:
                 start_date = end_date - timedelta(days=30)
             
-            # Get TeacherAttendance records (primary source)
-            teacher_attendance = TeacherAttendance.objects.filter(
-                teacher=staff,
-                timestamp__date__gte=start_date,
-                timestamp__date__lte=end_date
-            ).select_related('facility').prefetch_related('classes__course').order_by('timestamp')
-            
-            # Process and pair the records
-            paired_records = StaffTimesheetService._pair_attendance_records(
-                teacher_attendance
-            )
-            if not paired_records and teacher_attendance.exists():
-                paired_records = StaffTimesheetService._build_unmatched_from_records(
-                    list(teacher_attendance)
-                )
+            rows = StaffTimesheetService.get_session_rows(start_date, end_date, staff_ids=[staff.id])
+            paired_records, records = StaffTimesheetService.build_paired_records(rows)
             
             # Calculate summary statistics
             summary = StaffTimesheetService._calculate_summary(paired_records)
@@ -60,7 +54,7 @@ class StaffTimesheetService:
             return {
                 'paired_records': paired_records,
                 'summary': summary,
-                'raw_teacher_attendance': list(teacher_attendance),
+                'raw_teacher_attendance': sorted(records.values(), key=lambda record: (record.timestamp, record.id)),
                 'raw_clock_records': [],
                 'date_range': {
                     'start_date': start_date,
@@ -79,6 +73,138 @@ class StaffTimesheetService:
                 'error': str(e)
             }
     
+    @staticmethod
+    def get_session_rows(start_date, end_date, staff_ids=None):
+        """
+        Pair clock in/out records for every staff member in one query
+        
+        Records are read once ordered by (teacher, timestamp) and paired per
+        teacher with the same rules as _pair_teacher_attendance: each clock_out
+        closes the most recent open clock_in at the same facility, even when
+        records for other facilities sit in between. Anything left over is
+        reported unmatched. Rows come back ordered by teacher, then session start.
+        
+        Args:
+            start_date: First local date to include
+            end_date: Last local date to include
+            staff_ids: Optional iterable of staff ids to restrict to
+            
+        Returns:
+            List of SessionRow tuples
+        """
+        from core.models import TeacherAttendance
+        
+        queryset = TeacherAttendance.objects.filter(
+            timestamp__date__gte=start_date,
+            timestamp__date__lte=end_date
+        )
+        if staff_ids is not None:
+            queryset = queryset.filter(teacher_id__in=list(staff_ids))
+        
+        records = queryset.order_by('teacher_id', 'timestamp', 'id').values_list(
+            'teacher_id', 'id', 'clock_type', 'timestamp', 'facility_id'
+        )
+        
+        rows = []
+        open_clock_ins = []
+        current_teacher_id = None
+        
+        def close_teacher():
+            for teacher_id, record_id, timestamp, facility_id in open_clock_ins:
+                rows.append(SessionRow(
+                    teacher_id, timezone.localdate(timestamp), facility_id,
+                    record_id, timestamp, None, None, None
+                ))
+            open_clock_ins.clear()
+        
+        for teacher_id, record_id, clock_type, timestamp, facility_id in records:
+            if teacher_id != current_teacher_id:
+                close_teacher()
+                current_teacher_id = teacher_id
+            
+            if clock_type == 'clock_in':
+                open_clock_ins.append((teacher_id, record_id, timestamp, facility_id))
+                continue
+            
+            match_index = None
+            for index in range(len(open_clock_ins) - 1, -1, -1):
+                if open_clock_ins[index][3] == facility_id and open_clock_ins[index][2] <= timestamp:
+                    match_index = index
+                    break
+            
+            if match_index is None:
+                rows.append(SessionRow(
+                    teacher_id, timezone.localdate(timestamp), facility_id,
+                    None, None, record_id, timestamp, None
+                ))
+                continue
+            
+            _, clock_in_id, clock_in_at, _ = open_clock_ins.pop(match_index)
+            rows.append(SessionRow(
+                teacher_id, timezone.localdate(clock_in_at), facility_id,
+                clock_in_id, clock_in_at, record_id, timestamp,
+                (timestamp - clock_in_at).total_seconds() / 3600
+            ))
+        close_teacher()
+        
+        rows.sort(key=lambda row: (
+            row.teacher_id,
+            row.clock_in_at or row.clock_out_at,
+            row.clock_in_id or row.clock_out_id,
+        ))
+        return rows
+    
+    @staticmethod
+    def build_paired_records(rows):
+        """
+        Expand session rows into the paired record dicts used by templates and exports
+        
+        Loads every referenced TeacherAttendance in one query (plus prefetches).
+        
+        Returns:
+            Tuple of (paired_records, records_by_id)
+        """
+        from core.models import TeacherAttendance
+        
+        record_ids = [
+            record_id
+            for row in rows
+            for record_id in (row.clock_in_id, row.clock_out_id)
+            if record_id is not None
+        ]
+        records = TeacherAttendance.objects.select_related(
+            'facility', 'created_by', 'updated_by'
+        ).prefetch_related('classes__course').in_bulk(record_ids)
+        
+        paired_records = []
+        for row in rows:
+            clock_in = records.get(row.clock_in_id)
+            clock_out = records.get(row.clock_out_id)
+            if clock_in and clock_out:
+                paired_records.append(StaffTimesheetService._build_pair(clock_in, clock_out))
+            elif clock_in:
+                paired_records.append(StaffTimesheetService._build_unmatched_clock_in(clock_in))
+            elif clock_out:
+                paired_records.append(StaffTimesheetService._build_unmatched_clock_out(clock_out))
+        
+        return paired_records, records
+    
+    @staticmethod
+    def get_paired_records_by_staff(staff_ids, start_date, end_date):
+        """
+        Paired records for many staff members from a single pairing query
+        
+        Returns:
+            Dict of staff id -> list of paired record dicts
+        """
+        rows = StaffTimesheetService.get_session_rows(start_date, end_date, staff_ids=staff_ids)
+        paired_records, _ = StaffTimesheetService.build_paired_records(rows)
+        
+        by_staff = defaultdict(list)
+        for record in paired_records:
+            by_staff[record['primary_record'].teacher_id].append(record)
+        return by_staff
+    
     @staticmethod
     def _pair_attendance_records(teacher_attendance):
         """
@@ -301,6 +427,7 @@ class StaffTimesheetService:
         try:
             from django.utils import timezone
             from datetime import timedelta
+            from core.services.staff_hours_service import StaffDailyHoursService
             
             # Set default date range if not provided
             if not end_date:
@@ -313,40 +440,37 @@ class StaffTimesheetService:
             overall_total_sessions = 0
             staff_with_activity_count = 0
             
+            staff_members = list(staff_queryset)
+            summaries = StaffDailyHoursService.summarise(
+                start_date, end_date, staff_ids=[staff.id for staff in staff_members]
+            )
+            
             # Process each staff member
-            for staff in staff_queryset:
-                # Get individual timesheet data
-                timesheet_data = StaffTimesheetService.get_staff_timesheet_data(
-                    staff, start_date, end_date
-                )
+            for staff in staff_members:
+                summary = summaries.get(staff.id)
                 
-                # Calculate staff summary
-                paired_records = timesheet_data.get('paired_records', [])
-                raw_records = timesheet_data.get('raw_teacher_attendance', [])
-                if not paired_records and raw_records:
-                    paired_records = StaffTimesheetService._build_unmatched_from_records(raw_records)
-                total_hours = sum((record.get('duration_hours') or 0) for record in paired_records)
-                sessions = len(paired_records) if paired_records else len(raw_records)
-                working_days = len(set(
-                    record['date'] for record in paired_records
-                    if (record.get('duration_hours') or 0) > 0
-                ))
+                # Only include staff with activity
+                if not summary:
+                    continue
+                
+                total_hours = float(summary['total_hours'])
+                sessions = summary['sessions']
+                working_days = summary['working_days']
                 average_hours_per_day = total_hours / working_days if working_days > 0 else 0
                 
-                # Only include staff with activity
-                if sessions > 0:
-                    staff_summaries.append({
-                        'staff': staff,
-                        'total_hours': round(total_hours, 2),
-                        'working_days': working_days,
-                        'sessions': sessions,
-                        'average_hours_per_day': round(average_hours_per_day, 2),
-                        'detailed_records': paired_records  # Optional for detailed view
-                    })
-                    
-                    overall_total_hours += total_hours
-                    overall_total_sessions += sessions
-                    staff_with_activity_count += 1
+                staff_summaries.append({
+                    'staff': staff,
+                    'total_hours': round(total_hours, 2),
+                    'working_days': working_days,
+                    'sessions': sessions,
+                    'average_hours_per_day': round(average_hours_per_day, 2),
+                    'unmatched_days': summary['unmatched_days'],
+                    'class_count': summary['class_count']
+                })
+                
+                overall_total_hours += total_hours
+                overall_total_sessions += sessions
+                staff_with_activity_count += 1
             
             # Calculate overall summary
             average_hours_per_staff = (
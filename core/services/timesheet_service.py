@@ -147,12 +147,14 @@ class TimesheetExportService:
                     .order_by('first_name', 'last_name')
                 )
 
+            # One pairing query for everyone in the export
+            records_by_staff = StaffTimesheetService.get_paired_records_by_staff(
+                [staff_member.id for staff_member in staff_queryset], start_date, end_date
+            )
+
             staff_timesheets = []
             for staff_member in staff_queryset:
-                timesheet_data = StaffTimesheetService.get_staff_timesheet_data(
-                    staff_member, start_date, end_date
-                )
-                paired_records = timesheet_data.get('paired_records', [])
+                paired_records = records_by_staff.get(staff_member.id, [])
                 if paired_records or teacher:
                     staff_timesheets.append({
                         'staff': staff_member,
@@ -377,84 +379,98 @@ class TimesheetExportService:
         """
         Generate monthly summary report for all teachers
         """
+        from core.services.staff_hours_service import StaffDailyHoursService
+        
+        start_date, end_date = StaffDailyHoursService.month_bounds(year, month)
+        return TimesheetExportService._generate_period_summary(
+            start_date, end_date,
+            title=f"Monthly Summary {year}-{month:02d}",
+            period_label=start_date.strftime("%B %Y"),
+            heading='Monthly Staff Summary',
+            filename=f"monthly_summary_{year}_{month:02d}.xlsx"
+        )
+    
+    @staticmethod
+    def generate_quarterly_summary(year, quarter):
+        """
+        Generate quarterly summary report for all teachers
+        """
+        from core.services.staff_hours_service import StaffDailyHoursService
+        
+        start_date, end_date = StaffDailyHoursService.quarter_bounds(year, quarter)
+        return TimesheetExportService._generate_period_summary(
+            start_date, end_date,
+            title=f"Quarterly Summary {year}-Q{quarter}",
+            period_label=f"Q{quarter} {year} ({start_date.strftime('%B')} - {end_date.strftime('%B')})",
+            heading='Quarterly Staff Summary',
+            filename=f"quarterly_summary_{year}_q{quarter}.xlsx"
+        )
+    
+    @staticmethod
+    def _generate_period_summary(start_date, end_date, title, period_label, heading, filename):
+        """
+        Build the staff summary workbook for a period from the daily hours rollup
+        """
         try:
             from accounts.models import Staff
-            from core.services.staff_timesheet_service import StaffTimesheetService
-            from datetime import date
-            import calendar
-            
-            # Get first and last day of month
-            start_date = date(year, month, 1)
-            last_day = calendar.monthrange(year, month)[1]
-            end_date = date(year, month, last_day)
+            from core.services.staff_hours_service import StaffDailyHoursService
             
             # Create workbook
             wb = openpyxl.Workbook()
             ws = wb.active
-            ws.title = f"Monthly Summary {year}-{month:02d}"
+            ws.title = title
             
             # Process data
             teacher_data = {}
-            staff_queryset = Staff.objects.filter(
+            staff_members = list(Staff.objects.filter(
                 is_active_staff=True,
                 is_active=True
-            ).order_by('first_name', 'last_name')
-
-            for staff_member in staff_queryset:
-                timesheet_data = StaffTimesheetService.get_staff_timesheet_data(
-                    staff_member, start_date, end_date
-                )
-                paired_records = timesheet_data.get('paired_records', [])
-                if not paired_records:
+            ).order_by('first_name', 'last_name'))
+            
+            summaries = StaffDailyHoursService.summarise(
+                start_date, end_date, staff_ids=[staff_member.id for staff_member in staff_members]
+            )
+            
+            for staff_member in staff_members:
+                summary = summaries.get(staff_member.id)
+                if not summary:
                     continue
-
-                total_hours = sum(
-                    Decimal(str(record['duration_hours']))
-                    for record in paired_records
-                    if record.get('duration_hours') is not None
-                )
-                days_worked = {
-                    record['date']
-                    for record in paired_records
-                    if record.get('duration_hours') is not None
-                }
-
+                
                 teacher_data[staff_member.id] = {
                     'teacher': staff_member,
-                    'total_hours': total_hours,
-                    'days_worked': days_worked,
-                    'total_sessions': len(paired_records)
+                    'total_hours': summary['total_hours'],
+                    'days_worked': summary['working_days'],
+                    'total_sessions': summary['sessions']
                 }
             
             # Generate worksheet
             TimesheetExportService._generate_monthly_summary_worksheet(
-                ws, teacher_data, start_date, end_date
+                ws, teacher_data, start_date, end_date, period_label=period_label, heading=heading
             )
             
             # Prepare response
             response = HttpResponse(
                 content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
             )
-            
-            filename = f"monthly_summary_{year}_{month:02d}.xlsx"
             response['Content-Disposition'] = f'attachment; filename="{filename}"'
             
             wb.save(response)
             return response
             
         except Exception as e:
-            logger.error(f"Error generating monthly summary: {str(e)}")
+            logger.error(f"Error generating staff summary for {start_date} to {end_date}: {str(e)}")
             raise e
     
     @staticmethod
-    def _generate_monthly_summary_worksheet(ws, teacher_data, start_date, end_date):
+    def _generate_monthly_summary_worksheet(ws, teacher_data, start_date, end_date,
+                                            period_label=None, heading='Monthly Staff Summary'):
         """
-        Generate monthly summary worksheet
+        Generate monthly (or quarterly) summary worksheet
         """
         # Header
-        ws['A1'] = f'Perth Art School - Monthly Staff Summary'
+        ws['A1'] = f'Perth Art School - {heading}'
         ws['A1'].font = Font(bold=True, size=14)
-        ws['A2'] = f'Period: {start_date.strftime("%B %Y")}'
+        ws['A2'] = f'Period: {period_label or start_date.strftime("%B %Y")}'
         ws['A3'] = f'Generated: {timezone.now().strftime("%d/%m/%Y %H:%M")}'
         
         # Column headers
@@ -474,7 +490,7 @@ class TimesheetExportService:
         for teacher_info in teacher_data.values():
             teacher = teacher_info['teacher']
             total_hours = teacher_info['total_hours']
-            days_worked = len(teacher_info['days_worked'])
+            days_worked = teacher_info['days_worked']
             avg_hours = float(total_hours / days_worked) if days_worked > 0 else 0
             total_sessions = teacher_info['total_sessions']
             
@@ -0,0 +1,73 @@
+"""
+Django signals keeping summary tables (StaffDailyHours, DeliveryDailyStats)
+in step with the records they summarise
+"""
+from django.db.models.signals import m2m_changed, post_delete, post_save
+from django.dispatch import receiver
+from accounts.models import Staff
+from .models import EmailLog, SMSLog, TeacherAttendance
+from .services.delivery_stats_service import DeliveryStatsService
+from .services.staff_hours_service import StaffDailyHoursService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=TeacherAttendance)
+def refresh_daily_hours_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    StaffDailyHoursService.refresh_for_record(instance.teacher_id, instance.timestamp)
+
+    # An edited record may have moved from another staff member or day
+    if not created and instance.has_changed('teacher', 'timestamp'):
+        previous_teacher_id = instance.previous('teacher')
+        previous_timestamp = instance.previous('timestamp')
+        if previous_teacher_id and previous_timestamp:
+            StaffDailyHoursService.refresh_for_record(previous_teacher_id, previous_timestamp)
+
+
+@receiver(post_delete, sender=TeacherAttendance)
+def refresh_daily_hours_on_delete(sender, instance, origin=None, **kwargs):
+    # Deleting the staff member cascades to their rollup rows as well
+    if isinstance(origin, Staff) or getattr(origin, 'model', None) is Staff:
+        return
+    StaffDailyHoursService.refresh_for_record(instance.teacher_id, instance.timestamp)
+
+
+@receiver(m2m_changed, sender=TeacherAttendance.classes.through)
+def refresh_daily_hours_on_classes_change(sender, instance, action, reverse, pk_set, **kwargs):
+    """Keep class counts current when classes are linked after the record is saved"""
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+
+    if not reverse:
+        StaffDailyHoursService.refresh_for_record(instance.teacher_id, instance.timestamp)
+        return
+
+    if pk_set:
+        for teacher_id, timestamp in TeacherAttendance.objects.filter(pk__in=pk_set).values_list(
+            'teacher_id', 'timestamp'
+        ):
+            StaffDailyHoursService.refresh_for_record(teacher_id, timestamp)
+
+
+@receiver(post_save, sender=EmailLog)
+def count_email_delivery(sender, instance, created, raw=False, **kwargs):
+    if not created or raw:
+        return
+    # Counters are best effort; never fail the send that wrote the log
+    try:
+        DeliveryStatsService.record('email', instance.email_type, instance.status, instance.created_at)
+    except Exception as e:
+        logger.error(f"Failed to update email delivery stats: {str(e)}")
+
+
+@receiver(post_save, sender=SMSLog)
+def count_sms_delivery(sender, instance, created, raw=False, **kwargs):
+    if not created or raw:
+        return
+    try:
+        DeliveryStatsService.record('sms', instance.sms_type, instance.status, instance.created_at)
+    except Exception as e:
+        logger.error(f"Failed to update SMS delivery stats: {str(e)}")
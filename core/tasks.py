@@ -142,6 +142,20 @@ def send_enrollment_confirmation_email_task(enrollment_id: int):
     return True
 
 
+def send_enrollment_confirmation_emails_task(enrollment_ids):
+    """Background job: send confirmation emails for a batch of enrollments (e.g. a bulk transfer)."""
+    from enrollment.models import Enrollment
+
+    enrollments = list(Enrollment.objects.filter(pk__in=enrollment_ids).select_related('student', 'course'))
+    failed = [
+        enrollment.pk for enrollment in enrollments
+        if not NotificationService.send_enrollment_confirmation(enrollment)
+    ]
+    if failed:
+        logger.error("Confirmation email failed for enrollments %s", failed)
+    return {'sent': len(enrollments) - len(failed), 'failed': failed}
+
+
 def send_enrollment_welcome_email_task(enrollment_id: int):
     """Background job: send welcome/confirmation email for confirmed enrollments."""
     from enrollment.models import Enrollment
@@ -0,0 +1,85 @@
+from datetime import time, timedelta
+from decimal import Decimal
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase
+from django.utils import timezone
+
+from academics.models import Class, Course
+from enrollment.models import Enrollment
+from students.models import Student
+
+
+class FieldTrackerMixinTest(TestCase):
+    def setUp(self):
+        self.course = Course.objects.create(
+            name='Tracked Course', price=Decimal('100.00'), status='published',
+            start_date=timezone.localdate() + timedelta(days=7), start_time=time(10), repeat_pattern='once',
+        )
+        self.other_course = Course.objects.create(
+            name='Other Course', price=Decimal('100.00'), status='published',
+            start_date=timezone.localdate() + timedelta(days=7), start_time=time(12), repeat_pattern='once',
+        )
+        self.student = Student.objects.create(first_name='Tracked', last_name='Student')
+        self.enrollment = Enrollment.objects.create(student=self.student, course=self.course, status='pending')
+
+    def test_previous_values_come_from_load_not_queries(self):
+        enrollment = Enrollment.objects.get(pk=self.enrollment.pk)
+        enrollment.status = 'confirmed'
+        enrollment.course = self.other_course
+
+        with self.assertNumQueries(0):
+            self.assertEqual(enrollment.previous('status'), 'pending')
+            self.assertEqual(enrollment.previous('course'), self.course.pk)
+            self.assertTrue(enrollment.has_changed('status'))
+            self.assertFalse(enrollment.has_changed('active_from', 'active_until'))
+            self.assertEqual(enrollment.changed_fields(), {
+                'status': ('pending', 'confirmed'),
+                'course': (self.course.pk, self.other_course.pk),
+            })
+
+        enrollment.save()
+        self.assertFalse(enrollment.has_changed())
+        self.assertEqual(enrollment.previous('status'), 'confirmed')
+
+    def test_unchanged_save_skips_the_pre_save_lookup(self):
+        enrollment = Enrollment.objects.get(pk=self.enrollment.pk)
+        enrollment.form_data = {'note': 'paid'}
+
+        # Just the UPDATE: no status lookup, no roster invalidation
+        with self.assertNumQueries(1):
+            enrollment.save()
+
+    def test_partial_saves_and_deferred_loads(self):
+        enrollment = Enrollment.objects.get(pk=self.enrollment.pk)
+        enrollment.status = 'cancelled'
+        enrollment.active_until = timezone.now()
+        enrollment.save(update_fields=['status'])
+
+        self.assertFalse(enrollment.has_changed('status'))
+        self.assertTrue(enrollment.has_changed('active_until'))
+
+        deferred = Enrollment.objects.only('id').get(pk=self.enrollment.pk)
+        with self.assertNumQueries(1):
+            self.assertEqual(deferred.previous('status'), 'cancelled')
+            self.assertIsNone(deferred.previous('active_until'))
+
+        with self.assertRaises(ValueError):
+            deferred.previous('form_data')
+
+    def test_new_instances_report_every_field_changed(self):
+        class_instance = Class(course=self.course, date=timezone.localdate(), start_time=time(10))
+        self.assertTrue(class_instance.has_changed('date'))
+        self.assertIsNone(class_instance.previous('date'))
+
+        class_instance.save()
+        class_instance = Class.objects.get(pk=class_instance.pk)
+        class_instance.start_time = time(11)
+        self.assertEqual(list(class_instance.changed_fields()), ['start_time'])
+
+    def test_course_clean_uses_loaded_status(self):
+        course = Course.objects.get(pk=self.course.pk)
+        course.status = 'draft'
+
+        with self.assertNumQueries(1), self.assertRaises(ValidationError):
+            course.clean()  # only the enrolment existence check
@@ -0,0 +1,29 @@
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase
+
+
+class SQLiteProfileTest(TestCase):
+    def test_pragmas_applied_on_connect(self):
+        if connection.vendor != 'sqlite':
+            self.skipTest('SQLite profile only')
+
+        with connection.cursor() as cursor:
+            cursor.execute('PRAGMA synchronous')
+            self.assertEqual(cursor.fetchone()[0], 1)  # NORMAL
+            cursor.execute('PRAGMA busy_timeout')
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_BUSY_TIMEOUT_MS)
+            cursor.execute('PRAGMA cache_size')
+            self.assertEqual(cursor.fetchone()[0], settings.SQLITE_PRAGMAS['cache_size'])
+        self.assertEqual(connection.transaction_mode, 'IMMEDIATE')
+
+    def test_benchmark_tuned_profile_has_no_lock_errors(self):
+        out = StringIO()
+
+        call_command('benchmark_db_concurrency', '--workers', '3', '--transactions', '30',
+                     '--profile', 'tuned', stdout=out)
+
+        self.assertIn('tuned: 90 committed, 0 locked, counter=90', out.getvalue())
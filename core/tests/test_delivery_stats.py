@@ -0,0 +1,78 @@
+from datetime import timedelta
+from io import StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from core.models import DeliveryDailyStats, EmailLog, SMSLog
+from core.services.delivery_stats_service import DeliveryStatsService
+
+
+def create_email_log(status='sent', email_type='general', **kwargs):
+    return EmailLog.objects.create(
+        recipient_email='student@example.com',
+        recipient_type='student',
+        subject='Subject',
+        content='Body',
+        email_type=email_type,
+        status=status,
+        **kwargs
+    )
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class DeliveryStatsTests(TestCase):
+    def setUp(self):
+        self.admin = get_user_model().objects.create_user(username='admin', password='pass123', role='admin')
+
+    def test_logs_increment_daily_counters(self):
+        create_email_log()
+        create_email_log()
+        create_email_log(status='failed')
+        create_email_log(email_type='welcome')
+        SMSLog.objects.create(recipient_phone='0400000000', recipient_type='student',
+                              content='Hi', sms_type='general', status='failed')
+
+        general = DeliveryDailyStats.objects.get(channel='email', message_type='general', date=timezone.localdate())
+        self.assertEqual((general.sent_count, general.failed_count), (2, 1))
+        self.assertEqual(DeliveryStatsService.totals('email'), {'sent': 3, 'failed': 1, 'total': 4})
+        self.assertEqual(DeliveryStatsService.totals('sms')['failed'], 1)
+
+        with self.assertNumQueries(2):
+            stats = DeliveryStatsService.dashboard_stats('email')
+        self.assertEqual(stats, {'total_sent': 3, 'total_failed': 1, 'recent_count': 4})
+
+    def test_rebuild_recounts_from_logs(self):
+        old = create_email_log()
+        EmailLog.objects.filter(pk=old.pk).update(created_at=timezone.now() - timedelta(days=40))
+        create_email_log(status='failed')
+        DeliveryDailyStats.objects.all().delete()
+
+        out = StringIO()
+        call_command('rebuild_delivery_stats', stdout=out)
+
+        self.assertIn('Rebuilt 2 delivery stats row(s)', out.getvalue())
+        self.assertEqual(DeliveryStatsService.totals('email'), {'sent': 1, 'failed': 1, 'total': 2})
+        self.assertEqual(DeliveryStatsService.dashboard_stats('email')['recent_count'], 1)
+
+    def test_log_browser_pages_through_full_history(self):
+        logs = [create_email_log(status='failed' if index % 3 == 0 else 'sent') for index in range(120)]
+        self.client.force_login(self.admin)
+        url = reverse('core:email_logs')
+
+        seen, params = [], {'status': 'sent'}
+        while True:
+            response = self.client.get(url, params)
+            page = response.context['page_obj']
+            seen.extend(log.pk for log in page.object_list)
+            if not page.has_next:
+                break
+            params = {'status': 'sent', 'after': page.next_cursor}
+
+        expected = [log.pk for log in reversed(logs) if log.status == 'sent']
+        self.assertEqual(seen, expected)
+        self.assertEqual(response.context['delivery_totals']['failed'], 40)
+        self.assertContains(response, 'before=')
@@ -0,0 +1,108 @@
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import GeocodeCache
+from core.services.geocoding_service import GeocodingError, GeocodingService, StubGeocodingProvider
+from facilities.models import Facility
+
+
+class CountingProvider(StubGeocodingProvider):
+    name = 'counting'
+
+    def __init__(self, missing=(), failing=()):
+        self.calls = []
+        self.missing = set(missing)
+        self.failing = set(failing)
+
+    def geocode(self, address):
+        self.calls.append(address)
+        if address in self.failing:
+            raise GeocodingError('timeout')
+        if address in self.missing:
+            return None
+        return super().geocode(address)
+
+
+class GeocodingServiceTest(TestCase):
+    def test_normalised_addresses_share_one_cache_entry(self):
+        provider = CountingProvider()
+
+        first = GeocodingService.geocode('1 King St, Perth WA', provider=provider)
+        second = GeocodingService.geocode('1  king st perth wa', provider=provider)
+
+        self.assertEqual(first, second)
+        self.assertEqual(len(provider.calls), 1)
+        self.assertEqual(GeocodeCache.objects.get().address, '1 king st perth wa')
+
+    def test_batch_fetches_only_misses_and_skips_failures(self):
+        provider = CountingProvider(missing={'Nowhere'}, failing={'Flaky Rd'})
+        GeocodingService.geocode('1 King St', provider=provider)
+        provider.calls.clear()
+
+        results = GeocodingService.geocode_many(
+            ['1 King St', '2 Queen St', '2 QUEEN ST.', 'Nowhere', 'Flaky Rd', ''],
+            provider=provider,
+        )
+
+        self.assertEqual(sorted(provider.calls), ['2 Queen St', 'Flaky Rd', 'Nowhere'])
+        self.assertEqual(results['2 Queen St'], results['2 QUEEN ST.'])
+        self.assertIsNone(results['Nowhere'])
+        self.assertIsNone(results['Flaky Rd'])
+        self.assertEqual(
+            dict(GeocodeCache.objects.values_list('address', 'status')),
+            {'1 king st': 'ok', '2 queen st': 'ok', 'nowhere': 'not_found'},
+        )
+
+    def test_expired_entries_are_refetched(self):
+        provider = CountingProvider()
+        GeocodingService.geocode('1 King St', provider=provider)
+        GeocodeCache.objects.update(expires_at=timezone.now() - timedelta(seconds=1))
+
+        GeocodingService.geocode('1 King St', provider=provider)
+
+        self.assertEqual(len(provider.calls), 2)
+        self.assertEqual(GeocodeCache.objects.count(), 1)
+        self.assertFalse(GeocodeCache.objects.get().is_expired)
+
+    @override_settings(GEOCODING_PROVIDER='stub')
+    def test_geocode_uses_configured_provider(self):
+        self.assertEqual(GeocodingService.geocode('1 King St'), StubGeocodingProvider().geocode('1 King St'))
+        self.assertTrue(GeocodeCache.objects.filter(provider='stub').exists())
+
+    def test_locate_returns_cached_entry_with_formatted_address(self):
+        provider = CountingProvider(missing={'Nowhere'}, failing={'Flaky Rd'})
+
+        entry = GeocodingService.locate('1 King St, Perth', provider=provider)
+        again = GeocodingService.locate('1 king st perth', provider=provider)
+
+        self.assertEqual(entry.formatted_address, '1 King St, Perth')
+        self.assertEqual(entry.coordinates, provider.geocode('1 King St, Perth'))
+        self.assertEqual(again.pk, entry.pk)
+        self.assertEqual(GeocodingService.locate('Nowhere', provider=provider).status, 'not_found')
+        self.assertIsNone(GeocodingService.locate('Flaky Rd', provider=provider))
+        self.assertEqual(provider.calls.count('1 King St, Perth'), 2)
+
+
+class GeocodeAddressesCommandTest(TestCase):
+    def test_fills_missing_facility_coordinates(self):
+        missing = Facility.objects.create(name='New Studio', address='5 Hay St, Perth')
+        located = Facility.objects.create(
+            name='Old Studio', address='6 Murray St, Perth',
+            latitude=Decimal('-31.9'), longitude=Decimal('115.8'),
+        )
+
+        out = StringIO()
+        call_command('geocode_addresses', provider='stub', stdout=out)
+
+        missing.refresh_from_db()
+        located.refresh_from_db()
+        expected = StubGeocodingProvider().geocode('5 Hay St, Perth')
+        self.assertAlmostEqual(float(missing.latitude), expected[0], places=6)
+        self.assertAlmostEqual(float(missing.longitude), expected[1], places=6)
+        self.assertEqual(located.latitude, Decimal('-31.9'))
+        self.assertIn('Updated 1 facility(ies)', out.getvalue())
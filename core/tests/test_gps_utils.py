@@ -0,0 +1,67 @@
+from decimal import Decimal
+
+from django.test import TestCase
+
+from core.utils.gps_utils import (
+    FacilityLocationIndex, find_nearest_facility, haversine_distance, invalidate_facility_index
+)
+from facilities.models import Facility
+
+
+class FacilityLocationIndexTest(TestCase):
+    def setUp(self):
+        invalidate_facility_index()
+        self.city = Facility.objects.create(
+            name='City Studio', address='1 King William St',
+            latitude=Decimal('-34.92850000'), longitude=Decimal('138.60070000'),
+            attendance_radius=100,
+        )
+        self.hills = Facility.objects.create(
+            name='Hills Studio', address='2 Mount Barker Rd',
+            latitude=Decimal('-35.06700000'), longitude=Decimal('138.86100000'),
+            attendance_radius=50,
+        )
+        Facility.objects.create(
+            name='Closed Studio', address='3 Closed Rd',
+            latitude=Decimal('-34.92860000'), longitude=Decimal('138.60080000'),
+            is_active=False,
+        )
+
+    def brute_force_nearest(self, lat, lon):
+        facilities = Facility.objects.filter(is_active=True, latitude__isnull=False)
+        return min(
+            facilities,
+            key=lambda facility: haversine_distance(lat, lon, facility.latitude, facility.longitude)
+        )
+
+    def test_nearest_within_range_without_queries(self):
+        find_nearest_facility(-34.9285, 138.6007)
+
+        with self.assertNumQueries(0):
+            result = find_nearest_facility(-34.9287, 138.6009)
+
+        self.assertEqual(result['facility'], self.city)
+        self.assertTrue(result['within_range'])
+        self.assertAlmostEqual(
+            result['distance'], haversine_distance(-34.9287, 138.6009, -34.9285, 138.6007), places=6
+        )
+
+    def test_far_point_falls_back_to_global_nearest(self):
+        for lat, lon in [(-35.0, 138.7), (-34.5, 139.5), (-33.8688, 151.2093), (51.5, -0.12)]:
+            result = find_nearest_facility(lat, lon)
+            self.assertEqual(result['facility'], self.brute_force_nearest(lat, lon))
+            self.assertFalse(result['within_range'])
+
+    def test_facility_save_invalidates_index(self):
+        find_nearest_facility(-35.067, 138.861)
+
+        self.hills.is_active = False
+        self.hills.save()
+
+        self.assertEqual(find_nearest_facility(-35.067, 138.861)['facility'], self.city)
+
+        Facility.objects.all().delete()
+        self.assertIsNone(find_nearest_facility(-35.067, 138.861))
+
+    def test_empty_index(self):
+        self.assertIsNone(FacilityLocationIndex([]).nearest(0, 0))
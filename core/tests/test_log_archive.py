@@ -0,0 +1,155 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+
+from core.models import DeliveryDailyStats, EmailLog, LogArchive
+from core.services.delivery_stats_service import DeliveryStatsService
+from core.services.log_archive_service import LogArchiveService
+from students.models import Student, StudentActivity
+
+
+class LogArchiveServiceTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        private_root = tempfile.mkdtemp()
+        for directory in (self.media_root, private_root):
+            self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            LOG_ARCHIVE_DIR='log_archive',
+            STORAGES={
+                **settings.STORAGES,
+                'private': {
+                    'BACKEND': 'django.core.files.storage.FileSystemStorage',
+                    'OPTIONS': {'location': private_root},
+                },
+            },
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+
+        self.old = timezone.now() - timedelta(days=400)
+        self.old_day = timezone.localdate(self.old)
+
+    def _email(self, created_at, subject='Subject', status='sent'):
+        log = EmailLog.objects.create(
+            recipient_email='student@example.com', recipient_type='student',
+            subject=subject, content='Body', email_type='general', status=status,
+        )
+        EmailLog.objects.filter(pk=log.pk).update(created_at=created_at)
+        return log
+
+    def test_archive_moves_old_days_to_files(self):
+        old_logs = [self._email(self.old + timedelta(minutes=index), subject=f'Old {index}') for index in range(3)]
+        self._email(self.old - timedelta(days=3))
+        recent = self._email(timezone.now())
+
+        result = LogArchiveService.archive('email_log', older_than_days=180)
+
+        self.assertEqual(result, {'days': 2, 'rows': 4})
+        self.assertEqual(list(EmailLog.objects.values_list('pk', flat=True)), [recent.pk])
+
+        entry = LogArchive.objects.get(dataset='email_log', date=self.old_day)
+        self.assertEqual(entry.row_count, 3)
+        self.assertEqual((entry.min_id, entry.max_id), (old_logs[0].pk, old_logs[-1].pk))
+        self.assertTrue(LogArchiveService.storage().exists(entry.path))
+        self.assertEqual(os.listdir(self.media_root), [])
+        self.assertTrue(entry.path.endswith(f'{self.old_day.isoformat()}.jsonl.gz'))
+        self.assertEqual(
+            sorted(log.subject for log in LogArchiveService.iter_archived('email_log', self.old_day, self.old_day)),
+            ['Old 0', 'Old 1', 'Old 2'],
+        )
+        self.assertTrue(LogArchive.objects.filter(dataset='email_log', date=self.old_day - timedelta(days=3)).exists())
+
+        # Nothing left to do on a second pass
+        self.assertEqual(LogArchiveService.archive('email_log', older_than_days=180)['rows'], 0)
+
+    def test_rehydrate_restores_rows_and_keeps_stats(self):
+        original = self._email(self.old, subject='Restore me', status='failed')
+        created_at = EmailLog.objects.get(pk=original.pk).created_at
+        stats_before = DeliveryStatsService.totals('email')
+        LogArchiveService.archive('email_log', older_than_days=180)
+
+        result = LogArchiveService.rehydrate('email_log', self.old_day, self.old_day)
+
+        self.assertEqual(result, {'restored': 1, 'skipped': 0})
+        restored = EmailLog.objects.get(pk=original.pk)
+        self.assertEqual(restored.subject, 'Restore me')
+        self.assertEqual(restored.created_at, created_at)
+        self.assertEqual(DeliveryStatsService.totals('email'), stats_before)
+        self.assertIsNotNone(LogArchive.objects.get(dataset='email_log').restored_at)
+
+        # Restoring again is a no-op
+        self.assertEqual(LogArchiveService.rehydrate('email_log', self.old_day, self.old_day)['restored'], 0)
+
+    def test_rearchive_merges_into_existing_file(self):
+        first = self._email(self.old, subject='First')
+        LogArchiveService.archive('email_log', older_than_days=180)
+        LogArchiveService.rehydrate('email_log', self.old_day, self.old_day)
+        second = self._email(self.old + timedelta(minutes=5), subject='Second')
+
+        LogArchiveService.archive('email_log', older_than_days=180)
+
+        entry = LogArchive.objects.get(dataset='email_log', date=self.old_day)
+        self.assertEqual(entry.row_count, 2)
+        self.assertIsNone(entry.restored_at)
+        self.assertEqual(
+            sorted(log.pk for log in LogArchiveService.iter_archived('email_log', self.old_day, self.old_day)),
+            sorted([first.pk, second.pk]),
+        )
+        self.assertFalse(EmailLog.objects.exists())
+
+    def test_rehydrate_skips_rows_whose_student_was_deleted(self):
+        kept = Student.objects.create(first_name='Kept', last_name='Student')
+        gone = Student.objects.create(first_name='Gone', last_name='Student')
+        for student in (kept, gone):
+            activity = StudentActivity.objects.create(student=student, activity_type='other', title='Old note')
+            StudentActivity.objects.filter(pk=activity.pk).update(created_at=self.old)
+
+        LogArchiveService.archive('student_activity', older_than_days=365)
+        gone.delete()
+
+        result = LogArchiveService.rehydrate('student_activity', self.old_day, self.old_day)
+
+        self.assertEqual(result, {'restored': 1, 'skipped': 1})
+        self.assertEqual(list(StudentActivity.objects.values_list('student_id', flat=True)), [kept.pk])
+
+    def test_command_dry_run_and_rehydrate(self):
+        self._email(self.old)
+        out = StringIO()
+
+        call_command('archive_logs', '--dataset', 'email_log', '--dry-run', stdout=out)
+        self.assertIn('email_log: Would archive 1 row(s) across 1 day(s)', out.getvalue())
+        self.assertEqual(EmailLog.objects.count(), 1)
+
+        call_command('archive_logs', stdout=out)
+        self.assertIn('email_log: Archived 1 row(s)', out.getvalue())
+        self.assertFalse(EmailLog.objects.exists())
+
+        call_command('archive_logs', '--dataset', 'email_log', '--rehydrate',
+                     '--start', self.old_day.isoformat(), stdout=out)
+        self.assertIn('email_log: restored 1 row(s), skipped 0', out.getvalue())
+        self.assertEqual(EmailLog.objects.count(), 1)
+        self.assertEqual(DeliveryDailyStats.objects.count(), 1)
+
+    def test_rebuild_keeps_counts_for_archived_days(self):
+        self._email(self.old)
+        self._email(self.old, status='failed')
+        self._email(timezone.now())
+        DeliveryStatsService.rebuild('email')
+        LogArchiveService.archive('email_log', older_than_days=180)
+
+        # The archived day's logs are gone; its counters must survive a full rebuild
+        DeliveryStatsService.rebuild('email')
+
+        self.assertEqual(DeliveryStatsService.totals('email'), {'sent': 2, 'failed': 1, 'total': 3})
+        self.assertEqual(
+            DeliveryStatsService.totals('email', start_date=self.old_day, end_date=self.old_day)['total'], 2
+        )
@@ -0,0 +1,175 @@
+import os
+import shutil
+import tempfile
+from datetime import timedelta
+from decimal import Decimal
+from io import StringIO
+from unittest.mock import patch
+
+from django.contrib.auth import get_user_model
+from django.conf import settings
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from academics.models import Class, Course
+from core.services.qr_render_service import QRRenderService, render_png
+from core.services.qr_service import QRCodeService
+from facilities.models import Facility
+
+
+class QRRenderServiceTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        private_root = tempfile.mkdtemp()
+        for directory in (self.media_root, private_root):
+            self.addCleanup(shutil.rmtree, directory, ignore_errors=True)
+        settings_override = override_settings(
+            MEDIA_ROOT=self.media_root,
+            SECURE_SSL_REDIRECT=False,
+            STORAGES={
+                **settings.STORAGES,
+                'private': {
+                    'BACKEND': 'django.core.files.storage.FileSystemStorage',
+                    'OPTIONS': {'location': private_root},
+                },
+            },
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        self.storage = QRRenderService.storage()
+
+        self.facility = Facility.objects.create(
+            name='Test Studio', address='1 Test St',
+            latitude=Decimal('0.0'), longitude=Decimal('0.0'),
+        )
+        today = timezone.localdate()
+        self.course = Course.objects.create(
+            name='Sheet Course',
+            short_description='For QR sheet testing',
+            price=Decimal('100.00'),
+            course_type='group',
+            category='term_courses',
+            status='published',
+            repeat_pattern='once',
+            start_date=today,
+            start_time=timezone.localtime().time().replace(second=0, microsecond=0),
+            duration_minutes=60,
+            vacancy=10,
+            facility=self.facility,
+        )
+        self.class_instance = Class.objects.create(
+            course=self.course,
+            date=today + timedelta(days=3),
+            start_time=self.course.start_time,
+            duration_minutes=60,
+            facility=self.facility,
+            is_active=True,
+        )
+
+    def test_render_many_caches_by_payload(self):
+        payloads = [f'https://example.com/qr/?data={index}' for index in range(3)]
+
+        first = QRRenderService.render_many(payloads, workers=1)
+        with patch('core.services.qr_render_service.render_png') as mock_render:
+            second = QRRenderService.render_many(payloads, workers=1)
+
+        mock_render.assert_not_called()
+        self.assertEqual(first, second)
+        self.assertTrue(self.storage.exists(QRRenderService.image_path(payloads[0])))
+        self.assertEqual(os.listdir(self.media_root), [])
+
+    def test_process_pool_matches_serial_rendering(self):
+        payloads = [f'https://example.com/qr/?data=pool-{index}' for index in range(QRRenderService.PARALLEL_THRESHOLD)]
+
+        images = QRRenderService.render_many(payloads, workers=2)
+
+        self.assertEqual([images[payload] for payload in payloads], [render_png(payload) for payload in payloads])
+
+    def test_facility_entries_are_deterministic_and_valid(self):
+        start = timezone.localdate()
+        entries = QRCodeService.facility_qr_entries(self.facility, start, start + timedelta(days=6))
+        again = QRCodeService.facility_qr_entries(self.facility, start, start + timedelta(days=6))
+
+        self.assertEqual([e['attendance_url'] for e in entries], [e['attendance_url'] for e in again])
+        self.assertEqual(len([e for e in entries if e['type'] == 'general']), 7)
+        class_entry = next(e for e in entries if e['class_instance'] == self.class_instance)
+        starts_at = self.class_instance.get_class_datetime()
+        self.assertEqual(class_entry['valid_from'], starts_at - timedelta(minutes=QRCodeService.CLASS_QR_LEAD_MINUTES))
+        self.assertEqual(
+            class_entry['expires_at'],
+            starts_at + timedelta(minutes=60 + QRCodeService.CLASS_QR_GRACE_MINUTES),
+        )
+
+        # Codes only work inside their own window
+        result = QRCodeService.validate_qr_code(class_entry['attendance_url'].split('?data=', 1)[1])
+        self.assertFalse(result['valid'])
+        today_entry = entries[0]
+        self.assertEqual(today_entry['expires_at'] - today_entry['valid_from'], timedelta(days=1))
+        result = QRCodeService.validate_qr_code(today_entry['attendance_url'].split('?data=', 1)[1])
+        self.assertTrue(result['valid'])
+        self.assertTrue(result['shared'])
+
+    def test_generate_facility_qr_codes_reuses_rendered_images(self):
+        first = QRCodeService.generate_facility_qr_codes(self.facility, workers=1)
+        with patch('core.services.qr_render_service.render_png') as mock_render:
+            second = QRCodeService.generate_facility_qr_codes(self.facility, workers=1)
+
+        mock_render.assert_not_called()
+        self.assertTrue(second['success'])
+        self.assertEqual(
+            [code['qr_code_image'] for code in first['qr_codes']],
+            [code['qr_code_image'] for code in second['qr_codes']],
+        )
+
+    def test_weekly_sheets_and_command(self):
+        week_start = timezone.localdate() - timedelta(days=timezone.localdate().weekday())
+
+        pdf_path = QRRenderService.render_facility_sheet(self.facility, week_start, fmt='pdf', workers=1)
+        svg_path = QRRenderService.render_facility_sheet(self.facility, week_start, fmt='svg')
+
+        with self.storage.open(pdf_path, 'rb') as sheet:
+            self.assertTrue(sheet.read().startswith(b'%PDF'))
+        with self.storage.open(svg_path, 'rb') as sheet:
+            self.assertIn(b'Test Studio - Attendance QR Codes', sheet.read())
+        self.assertEqual(os.listdir(self.media_root), [])
+
+        out = StringIO()
+        call_command('render_qr_sheets', weeks=2, format='both', workers=1, stdout=out)
+        self.assertIn('Rendered 4 sheet(s)', out.getvalue())
+        _, files = self.storage.listdir(QRRenderService.sheet_dir(self.facility))
+        next_week = (week_start + timedelta(weeks=1)).isoformat()
+        self.assertEqual(len([name for name in files if name.startswith(next_week)]), 2)
+
+    def test_sheet_is_rerendered_when_classes_change(self):
+        week_start = timezone.localdate() - timedelta(days=timezone.localdate().weekday())
+        first = QRRenderService.render_facility_sheet(self.facility, week_start, fmt='svg')
+        self.assertEqual(QRRenderService.render_facility_sheet(self.facility, week_start, fmt='svg'), first)
+
+        Class.objects.create(
+            course=self.course,
+            date=week_start + timedelta(days=6),
+            start_time=self.course.start_time,
+            duration_minutes=60,
+            facility=self.facility,
+            is_active=True,
+        )
+        second = QRRenderService.render_facility_sheet(self.facility, week_start, fmt='svg')
+
+        self.assertNotEqual(second, first)
+        self.assertFalse(self.storage.exists(first))
+        self.assertTrue(self.storage.exists(second))
+
+    def test_sheet_download_view(self):
+        admin = get_user_model().objects.create_user(username='admin', password='pass123', role='admin')
+        self.client.force_login(admin)
+
+        response = self.client.get(
+            reverse('core:facility_qr_sheet', args=[self.facility.id]), {'format': 'pdf'}
+        )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertTrue(b''.join(response.streaming_content).startswith(b'%PDF'))
+        self.assertEqual(response['Cache-Control'], 'private, no-store')
@@ -0,0 +1,164 @@
+from datetime import date, datetime, time, timedelta
+from decimal import Decimal
+from io import BytesIO, StringIO
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from openpyxl import load_workbook
+
+from academics.models import Class, Course
+from core.models import StaffDailyHours, TeacherAttendance
+from core.services.staff_hours_service import StaffDailyHoursService
+from core.services.staff_timesheet_service import StaffTimesheetService
+from facilities.models import Facility
+
+
+class StaffDailyHoursTests(TestCase):
+    def setUp(self):
+        self.User = get_user_model()
+        self.teacher = self.User.objects.create_user(
+            username='rollup-teacher',
+            password='Teacher123!',
+            first_name='Rollup',
+            last_name='Teacher',
+            role='teacher',
+            is_active=True,
+            is_active_staff=True,
+        )
+        self.facility = Facility.objects.create(name='Rollup Studio', address='1 Rollup Road')
+        self.day = date(2026, 5, 12)
+
+    def _at(self, hour, minute=0, day=None):
+        return timezone.make_aware(
+            datetime.combine(day or self.day, time(hour, minute)), timezone.get_current_timezone()
+        )
+
+    def _clock(self, clock_type, timestamp, teacher=None):
+        return TeacherAttendance.objects.create(
+            teacher=teacher or self.teacher,
+            clock_type=clock_type,
+            facility=self.facility,
+            timestamp=timestamp,
+            source='manual',
+        )
+
+    def _rollup(self, day=None):
+        return StaffDailyHours.objects.get(staff=self.teacher, date=day or self.day)
+
+    def test_rollup_follows_creates_edits_and_deletes(self):
+        clock_in = self._clock('clock_in', self._at(9))
+
+        rollup = self._rollup()
+        self.assertEqual(rollup.sessions, 1)
+        self.assertTrue(rollup.has_unmatched_clock_in)
+
+        clock_out = self._clock('clock_out', self._at(11, 30))
+        rollup = self._rollup()
+        self.assertEqual(rollup.total_hours, Decimal('2.5'))
+        self.assertEqual((rollup.sessions, rollup.completed_sessions), (1, 1))
+        self.assertFalse(rollup.has_unmatched_clock)
+
+        # Moving the session to another day empties the old one
+        next_day = self.day + timedelta(days=3)
+        clock_in.timestamp = self._at(9, day=next_day)
+        clock_in.save()
+        clock_out.timestamp = self._at(10, day=next_day)
+        clock_out.save()
+        self.assertFalse(StaffDailyHours.objects.filter(staff=self.teacher, date=self.day).exists())
+        self.assertEqual(self._rollup(next_day).total_hours, Decimal('1'))
+
+        clock_out.delete()
+        self.assertTrue(self._rollup(next_day).has_unmatched_clock_in)
+        clock_in.delete()
+        self.assertFalse(StaffDailyHours.objects.exists())
+
+    def test_session_over_midnight_counts_on_start_day(self):
+        self._clock('clock_in', self._at(23))
+        self._clock('clock_out', self._at(1, day=self.day + timedelta(days=1)))
+
+        self.assertEqual(self._rollup().total_hours, Decimal('2'))
+        self.assertFalse(StaffDailyHours.objects.filter(date=self.day + timedelta(days=1)).exists())
+
+    def test_late_clock_in_claims_next_day_clock_out(self):
+        next_day = self.day + timedelta(days=1)
+        self._clock('clock_out', self._at(1, day=next_day))
+        self.assertTrue(self._rollup(next_day).has_unmatched_clock_out)
+
+        # The clock in pairs with the next day's clock out, which must lose its unmatched row
+        self._clock('clock_in', self._at(23))
+        self.assertEqual(self._rollup().total_hours, Decimal('2'))
+        self.assertFalse(StaffDailyHours.objects.filter(date=next_day).exists())
+
+        refreshed = list(StaffDailyHours.objects.values_list('date', 'total_hours', 'sessions'))
+        StaffDailyHoursService.rebuild()
+        self.assertEqual(list(StaffDailyHours.objects.values_list('date', 'total_hours', 'sessions')), refreshed)
+
+    def test_class_links_update_class_count(self):
+        course = Course.objects.create(
+            name='Rollup Course', price=Decimal('10.00'), status='published',
+            start_date=self.day, start_time=time(9), duration_minutes=60, facility=self.facility,
+        )
+        classes = [
+            Class.objects.create(course=course, date=self.day, start_time=time(hour), facility=self.facility)
+            for hour in (9, 10)
+        ]
+        record = self._clock('clock_in', self._at(9))
+        record.classes.set(classes)
+
+        self.assertEqual(self._rollup().class_count, 2)
+
+    def test_summaries_and_rebuild_match_raw_pairing(self):
+        other = self.User.objects.create_user(
+            username='rollup-other', password='Teacher123!', role='teacher',
+            is_active=True, is_active_staff=True,
+        )
+        for offset in range(3):
+            day = self.day + timedelta(days=offset)
+            self._clock('clock_in', self._at(9, day=day))
+            self._clock('clock_out', self._at(12, day=day))
+        self._clock('clock_out', self._at(15), teacher=other)
+
+        with self.assertNumQueries(1):
+            summaries = StaffDailyHoursService.summarise(*StaffDailyHoursService.quarter_bounds(2026, 2))
+
+        self.assertEqual(summaries[self.teacher.id]['total_hours'], Decimal('9'))
+        self.assertEqual(summaries[self.teacher.id]['working_days'], 3)
+        self.assertEqual(summaries[other.id]['working_days'], 0)
+        self.assertEqual(summaries[other.id]['unmatched_days'], 1)
+
+        raw_hours = sum(
+            row.duration_hours or 0
+            for row in StaffTimesheetService.get_session_rows(self.day, self.day + timedelta(days=2))
+        )
+        self.assertAlmostEqual(float(summaries[self.teacher.id]['total_hours']), raw_hours)
+
+        # Queryset updates skip signals; the rebuild command catches up
+        TeacherAttendance.objects.filter(teacher=self.teacher, clock_type='clock_out').update(
+            timestamp=timezone.now() - timedelta(days=3650)
+        )
+        out = StringIO()
+        call_command('rebuild_staff_daily_hours', start='2026-05-01', end='2026-05-31', stdout=out)
+
+        self.assertIn('Rebuilt 4 staff daily hours row(s)', out.getvalue())
+        self.assertEqual(
+            StaffDailyHoursService.summarise(self.day, self.day + timedelta(days=2))[self.teacher.id]['total_hours'],
+            Decimal('0'),
+        )
+
+    @override_settings(SECURE_SSL_REDIRECT=False)
+    def test_monthly_and_quarterly_exports_read_rollup(self):
+        admin = self.User.objects.create_user(username='rollup-admin', password='Admin123!', role='admin')
+        self._clock('clock_in', self._at(9))
+        self._clock('clock_out', self._at(13))
+        self.client.force_login(admin)
+
+        for url in (reverse('monthly_timesheet', args=[2026, 5]), reverse('quarterly_timesheet', args=[2026, 2])):
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            sheet = load_workbook(BytesIO(response.content)).active
+            self.assertEqual(sheet['A6'].value, 'Rollup Teacher')
+            self.assertEqual(sheet['B6'].value, 4.0)
+            self.assertEqual(sheet['C6'].value, 1)
@@ -86,3 +86,103 @@ class StaffTimesheetServiceTests(TestCase):
         self.assertTrue(record['is_complete'])
         self.assertEqual(record['date'], day_one)
         self.assertAlmostEqual(record['duration_hours'], 1.0, places=2)
+
+    def _create_at(self, clock_type, timestamp, teacher=None, facility=None):
+        return TeacherAttendance.objects.create(
+            teacher=teacher or self.teacher,
+            clock_type=clock_type,
+            facility=facility or self.facility,
+            timestamp=timestamp,
+            ip_address='127.0.0.1',
+            user_agent='tests'
+        )
+
+    def test_session_rows_pair_all_staff_in_one_query(self):
+        other = self.User.objects.create_user(
+            username='other-timesheet', password='Teacher123!', role='teacher', is_active=True
+        )
+        other_facility = Facility.objects.create(name='Other Studio', address='Other Road')
+        tz = timezone.get_current_timezone()
+        day = timezone.localdate() - timedelta(days=1)
+        at = lambda hour: timezone.make_aware(datetime.combine(day, time(hour)), tz)
+
+        first_in = self._create_at('clock_in', at(9))
+        first_out = self._create_at('clock_out', at(11))
+        stray_out = self._create_at('clock_out', at(12))
+        open_in = self._create_at('clock_in', at(13))
+        self._create_at('clock_in', at(10), teacher=other)
+        self._create_at('clock_out', at(12), teacher=other, facility=other_facility)
+
+        with self.assertNumQueries(1):
+            rows = StaffTimesheetService.get_session_rows(day, day)
+
+        mine = [row for row in rows if row.teacher_id == self.teacher.id]
+        self.assertEqual(
+            [(row.clock_in_id, row.clock_out_id) for row in mine],
+            [(first_in.id, first_out.id), (None, stray_out.id), (open_in.id, None)],
+        )
+        self.assertAlmostEqual(mine[0].duration_hours, 2.0)
+        # Different facilities never pair
+        theirs = [row for row in rows if row.teacher_id == other.id]
+        self.assertEqual([row.duration_hours for row in theirs], [None, None])
+
+        overview = StaffTimesheetService.get_all_staff_timesheet_data(
+            self.User.objects.filter(id__in=[self.teacher.id, other.id]).order_by('id'),
+            start_date=day,
+            end_date=day
+        )
+        self.assertEqual(overview['overall_summary']['total_sessions'], 5)
+        self.assertEqual(overview['overall_summary']['total_hours'], 2.0)
+        self.assertEqual(overview['staff_summaries'][0]['working_days'], 1)
+
+        detail = StaffTimesheetService.get_staff_timesheet_data(self.teacher, day, day)
+        self.assertEqual(
+            [record.get('anomaly') for record in detail['paired_records']],
+            [None, 'clock_out_without_clock_in', 'clock_in_without_clock_out'],
+        )
+        self.assertEqual(detail['summary']['completed_sessions'], 1)
+
+    def test_session_rows_pair_across_interleaved_facilities(self):
+        other_facility = Facility.objects.create(name='Second Studio', address='Second Road')
+        tz = timezone.get_current_timezone()
+        day = timezone.localdate() - timedelta(days=1)
+        at = lambda hour: timezone.make_aware(datetime.combine(day, time(hour)), tz)
+
+        day_in = self._create_at('clock_in', at(9))
+        stray_out = self._create_at('clock_out', at(12), facility=other_facility)
+        day_out = self._create_at('clock_out', at(17))
+
+        rows = StaffTimesheetService.get_session_rows(day, day)
+
+        self.assertEqual(
+            [(row.clock_in_id, row.clock_out_id) for row in rows],
+            [(day_in.id, day_out.id), (None, stray_out.id)],
+        )
+        self.assertAlmostEqual(rows[0].duration_hours, 8.0)
+
+    def test_session_rows_match_legacy_pairing_for_nested_sessions(self):
+        other_facility = Facility.objects.create(name='Second Studio', address='Second Road')
+        tz = timezone.get_current_timezone()
+        day = timezone.localdate() - timedelta(days=1)
+        at = lambda hour: timezone.make_aware(datetime.combine(day, time(hour)), tz)
+
+        self._create_at('clock_in', at(8))
+        self._create_at('clock_in', at(10), facility=other_facility)
+        self._create_at('clock_in', at(11))
+        self._create_at('clock_out', at(12), facility=other_facility)
+        self._create_at('clock_out', at(14))
+        self._create_at('clock_out', at(16))
+
+        rows = StaffTimesheetService.get_session_rows(day, day)
+        legacy = StaffTimesheetService._pair_attendance_records(
+            TeacherAttendance.objects.filter(teacher=self.teacher).order_by('timestamp', 'id')
+        )
+
+        self.assertEqual(
+            [(row.clock_in_id, row.clock_out_id) for row in rows],
+            [
+                (pair['clock_in'] and pair['clock_in'].id, pair['clock_out'] and pair['clock_out'].id)
+                for pair in legacy
+            ],
+        )
+        self.assertEqual(sorted(row.duration_hours for row in rows), [2.0, 3.0, 8.0])
@@ -1,4 +1,3 @@
-import base64
 import json
 from datetime import timedelta
 from django.test import TestCase, Client, override_settings
@@ -102,24 +101,18 @@ class TeacherClockTests(TestCase):
             content_type='application/json'
         )
 
-    def _build_qr_data(self, class_instance=None):
-        issued_at = timezone.now()
-        qr_data = {
-            'facility_id': self.facility.id,
-            'facility_name': self.facility.name,
-            'class_id': class_instance.id if class_instance else None,
-            'token': f'test-token-{uuid4().hex}',
-            'expires_at': (issued_at + timedelta(minutes=60)).isoformat(),
-            'generated_at': issued_at.isoformat(),
-        }
-        QRCodeService._store_qr_token(qr_data['token'], qr_data)
-        return base64.urlsafe_b64encode(
-            json.dumps(qr_data).encode('utf-8')
-        ).decode('utf-8')
+    def _build_qr_data(self, class_instance=None, expires_at=None):
+        return QRCodeService.sign_qr_payload(
+            facility_id=self.facility.id,
+            class_id=class_instance.id if class_instance else None,
+            expires_at=expires_at or timezone.now() + timedelta(minutes=60),
+            token=uuid4().hex[:12],
+        )
 
-    def _submit_qr(self, clock_type, *, include_gps=True, classes=None, class_instance=None, client=None):
+    def _submit_qr(self, clock_type, *, include_gps=True, classes=None, class_instance=None, client=None,
+                   qr_data=None):
         payload = {
-            'qr_data': self._build_qr_data(class_instance=class_instance),
+            'qr_data': qr_data or self._build_qr_data(class_instance=class_instance),
             'clock_type': clock_type,
         }
 
@@ -203,6 +196,70 @@ class TeacherClockTests(TestCase):
         self.assertEqual(second.status_code, 400)
         self.assertIn('already', second.json().get('message', '').lower())
 
+    def test_qr_code_is_single_use(self):
+        qr_data = self._build_qr_data()
+        self.assertEqual(self._submit_qr('clock_in', qr_data=qr_data).status_code, 200)
+
+        response = self._submit_qr('clock_out', qr_data=qr_data)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('already been used', response.json().get('message', ''))
+        self.assertEqual(TeacherAttendance.objects.filter(teacher=self.teacher).count(), 1)
+
+    def test_shared_qr_code_needs_location_and_is_single_use_per_clock_action(self):
+        qr_data = QRCodeService.sign_qr_payload(
+            facility_id=self.facility.id,
+            class_id=None,
+            expires_at=timezone.now() + timedelta(minutes=60),
+            token=uuid4().hex[:12],
+            valid_from=timezone.now() - timedelta(minutes=5),
+            shared=True,
+        )
+
+        no_gps = self._submit_qr('clock_in', qr_data=qr_data, include_gps=False)
+        self.assertEqual(no_gps.status_code, 400)
+        self.assertIn('Location is required', no_gps.json().get('message', ''))
+
+        self.assertEqual(self._submit_qr('clock_in', qr_data=qr_data).status_code, 200)
+        self.assertEqual(self._submit_qr('clock_out', qr_data=qr_data).status_code, 200)
+        response = self._submit_qr('clock_in', qr_data=qr_data)
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn('already been used', response.json().get('message', ''))
+        self.assertEqual(TeacherAttendance.objects.filter(teacher=self.teacher).count(), 2)
+
+    def test_shared_qr_code_is_rejected_before_its_window(self):
+        qr_data = QRCodeService.sign_qr_payload(
+            facility_id=self.facility.id,
+            class_id=None,
+            expires_at=timezone.now() + timedelta(days=1, minutes=60),
+            token=uuid4().hex[:12],
+            valid_from=timezone.now() + timedelta(days=1),
+            shared=True,
+        )
+
+        result = QRCodeService.validate_qr_code(qr_data)
+
+        self.assertFalse(result['valid'])
+        self.assertIn('not valid yet', result['error'])
+
+    def test_qr_validation_is_stateless_and_rejects_tampering(self):
+        qr_data = self._build_qr_data(class_instance=self.class_instance)
+
+        with self.assertNumQueries(2):  # facility and class lookups only
+            result = QRCodeService.validate_qr_code(qr_data)
+        self.assertTrue(result['valid'])
+        self.assertEqual(result['facility'], self.facility)
+        self.assertEqual(result['class_instance'], self.class_instance)
+
+        self.assertFalse(QRCodeService.validate_qr_code(qr_data[:-2] + 'xx')['valid'])
+
+        expired = QRCodeService.validate_qr_code(
+            self._build_qr_data(expires_at=timezone.now() - timedelta(minutes=1))
+        )
+        self.assertFalse(expired['valid'])
+        self.assertTrue(expired.get('expired'))
+
     def test_qr_invalid_clock_type_rejected(self):
         response = self._submit_qr('break_start')
 
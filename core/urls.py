@@ -11,6 +11,7 @@ urlpatterns = [
     # QR Code Management
     path('qr-codes/', views.QRCodeManagementView.as_view(), name='qr_code_management'),
     path('qr-codes/facility/<int:facility_id>/', views.GenerateFacilityQRCodesView.as_view(), name='generate_facility_qr_codes'),
+    path('qr-codes/facility/<int:facility_id>/sheet/', views.FacilityQRSheetView.as_view(), name='facility_qr_sheet'),
     
     # TinyMCE Image Upload
     path('tinymce/upload/', views.tinymce_upload_image, name='tinymce_upload'),
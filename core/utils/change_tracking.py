@@ -0,0 +1,107 @@
+"""
+Field change tracking for models.
+
+Signals and views often need a field's previous value ("was this enrolment
+already confirmed?"). Re-reading the row in ``pre_save`` costs a query on
+every save. ``FieldTrackerMixin`` instead snapshots the tracked fields when an
+instance is loaded from the database, and refreshes the snapshot after each
+save, so ``previous()`` and ``has_changed()`` are free in the common case.
+"""
+from typing import Any, Dict, Tuple
+
+
+class FieldTrackerMixin:
+    """
+    Remember the loaded values of ``tracked_fields`` on a model instance.
+
+    List field names (``'course'`` or ``'course_id'`` both work for foreign
+    keys, which are compared by id). Tracked fields should hold immutable
+    values; mutating a JSON value in place is not detected.
+
+    Instances that were not loaded from the database (or loaded with the
+    field deferred) fall back to one query the first time a previous value is
+    needed. New, unsaved instances report ``None`` for every previous value
+    and every field as changed.
+    """
+
+    tracked_fields: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        instance._snapshot_tracked_fields()
+        return instance
+
+    @classmethod
+    def _tracked_attnames(cls) -> Dict[str, str]:
+        """Map every accepted name (field name and attname) to the attname"""
+        names = cls.__dict__.get('_tracked_attname_map')
+        if names is None:
+            names = {}
+            for name in cls.tracked_fields:
+                field = cls._meta.get_field(name)
+                names[field.name] = field.attname
+                names[field.attname] = field.attname
+            cls._tracked_attname_map = names
+        return names
+
+    def _snapshot_tracked_fields(self, names=None):
+        """Record current values as the baseline, for all loaded fields or just ``names``"""
+        tracked = self._tracked_attnames()
+        if names is None:
+            loaded = self.__dict__
+            self._tracked_initial = {
+                attname: loaded[attname] for attname in set(tracked.values()) if attname in loaded
+            }
+            return
+        initial = self.__dict__.setdefault('_tracked_initial', {})
+        for name in names:
+            if name in tracked:
+                initial[tracked[name]] = getattr(self, tracked[name])
+
+    def _resolve_tracked(self, field) -> str:
+        try:
+            return self._tracked_attnames()[field]
+        except KeyError:
+            raise ValueError(f'{type(self).__name__}.{field} is not a tracked field')
+
+    def previous(self, field) -> Any:
+        """Value the field had when the instance was loaded or last saved"""
+        attname = self._resolve_tracked(field)
+        initial = self.__dict__.setdefault('_tracked_initial', {})
+        if attname not in initial:
+            if self.pk is None:
+                return None
+            missing = [name for name in set(self._tracked_attnames().values()) if name not in initial]
+            row = type(self)._base_manager.filter(pk=self.pk).values(*missing).first()
+            if row is None:
+                return None
+            initial.update(row)
+        return initial[attname]
+
+    def has_changed(self, *fields) -> bool:
+        """True if any of the given tracked fields (default: all) differs from its previous value"""
+        if self.pk is None:
+            return True
+        for field in fields or self.tracked_fields:
+            attname = self._resolve_tracked(field)
+            if getattr(self, attname) != self.previous(attname):
+                return True
+        return False
+
+    def changed_fields(self) -> Dict[str, Tuple[Any, Any]]:
+        """{field name: (previous, current)} for every tracked field that changed"""
+        return {
+            name: (self.previous(name), getattr(self, self._resolve_tracked(name)))
+            for name in self.tracked_fields
+            if self.has_changed(name)
+        }
+
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # With update_fields only the written fields are known to match the database
+        self._snapshot_tracked_fields(kwargs.get('update_fields'))
+
+    def refresh_from_db(self, using=None, fields=None, **kwargs):
+        super().refresh_from_db(using=using, fields=fields, **kwargs)
+        self._snapshot_tracked_fields(fields)
@@ -2,13 +2,23 @@
 GPS utility functions for teacher attendance system
 """
 import math
-import requests
+import time
 from decimal import Decimal
 from django.conf import settings
 from facilities.models import Facility
 from typing import Optional, Tuple, List, Dict
 
 
+# Earth's radius in meters
+EARTH_RADIUS = 6371000
+
+# Metres per degree of latitude (and of longitude at the equator)
+METERS_PER_DEGREE = math.pi * EARTH_RADIUS / 180
+
+# Grid cell size in degrees (~1.1km of latitude)
+FACILITY_GRID_CELL_DEGREES = 0.01
+
+
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
     Calculate the great circle distance between two points 
@@ -34,13 +44,135 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
          math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(dlon / 2) ** 2)
     c = 2 * math.asin(math.sqrt(a))
     
-    # Earth's radius in meters
-    earth_radius = 6371000
-    distance = earth_radius * c
+    distance = EARTH_RADIUS * c
     
     return distance
 
 
+class FacilityLocationIndex:
+    """
+    In-memory grid index over active facility coordinates.
+
+    Facilities are bucketed into fixed-size lat/lon cells with their
+    coordinates pre-converted to radians, so a lookup only computes distances
+    for facilities in the cells overlapping the bounding box of the largest
+    attendance radius around the teacher.
+    """
+
+    def __init__(self, facilities, cell_degrees: float = FACILITY_GRID_CELL_DEGREES):
+        self.cell_degrees = cell_degrees
+        # (facility, lat_rad, lon_rad, cos_lat)
+        self.entries: List[Tuple[Facility, float, float, float]] = []
+        self.cells: Dict[Tuple[int, int], List[int]] = {}
+        self.max_radius = 0
+
+        for facility in facilities:
+            lat = float(facility.latitude)
+            lon = float(facility.longitude)
+            lat_rad = math.radians(lat)
+            self.cells.setdefault(self._cell(lat, lon), []).append(len(self.entries))
+            self.entries.append((facility, lat_rad, math.radians(lon), math.cos(lat_rad)))
+            self.max_radius = max(self.max_radius, facility.attendance_radius)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _cell(self, lat: float, lon: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.cell_degrees), math.floor(lon / self.cell_degrees))
+
+    def _candidates(self, lat: float, lon: float, radius: float) -> List[int]:
+        """Entry positions in the grid cells overlapping the radius bounding box"""
+        lat_delta = radius / METERS_PER_DEGREE
+        cos_lat = math.cos(math.radians(lat))
+        # Near the poles the box would span every longitude
+        if cos_lat < 0.01:
+            return list(range(len(self.entries)))
+        lon_delta = lat_delta / cos_lat
+
+        min_lat, min_lon = self._cell(lat - lat_delta, lon - lon_delta)
+        max_lat, max_lon = self._cell(lat + lat_delta, lon + lon_delta)
+        if (max_lat - min_lat + 1) * (max_lon - min_lon + 1) > len(self.cells):
+            return list(range(len(self.entries)))
+
+        positions = []
+        for cell_lat in range(min_lat, max_lat + 1):
+            for cell_lon in range(min_lon, max_lon + 1):
+                positions.extend(self.cells.get((cell_lat, cell_lon), ()))
+        return positions
+
+    def _nearest(self, positions, lat: float, lon: float) -> Tuple[Optional[int], float]:
+        lat_rad = math.radians(lat)
+        lon_rad = math.radians(lon)
+        cos_lat = math.cos(lat_rad)
+        best_position, best_a = None, float('inf')
+
+        # Compare on the haversine term directly; it is monotonic in distance
+        for position in positions:
+            _, facility_lat, facility_lon, facility_cos = self.entries[position]
+            a = (math.sin((facility_lat - lat_rad) / 2) ** 2 +
+                 cos_lat * facility_cos * math.sin((facility_lon - lon_rad) / 2) ** 2)
+            if a < best_a:
+                best_position, best_a = position, a
+
+        if best_position is None:
+            return None, float('inf')
+        return best_position, EARTH_RADIUS * 2 * math.asin(math.sqrt(min(best_a, 1.0)))
+
+    def nearest(self, lat: float, lon: float) -> Optional[Dict]:
+        """Nearest facility to the point, with its distance and range check"""
+        if not self.entries:
+            return None
+
+        lat = float(lat)
+        lon = float(lon)
+        position, distance = self._nearest(self._candidates(lat, lon, self.max_radius), lat, lon)
+
+        # Anything outside the bounding box is further than max_radius, so only
+        # fall back to scanning every facility when nothing was that close
+        if position is None or distance > self.max_radius:
+            position, distance = self._nearest(range(len(self.entries)), lat, lon)
+
+        facility = self.entries[position][0]
+        return {
+            'facility': facility,
+            'distance': distance,
+            'within_range': distance <= facility.attendance_radius
+        }
+
+
+_facility_index: Optional[FacilityLocationIndex] = None
+_facility_index_built_at = 0.0
+
+
+def get_facility_index() -> FacilityLocationIndex:
+    """
+    Return the process-wide facility index, building it on first use.
+
+    Facility saves and deletes reset it (see facilities.signals); the TTL
+    covers other worker processes and queryset updates that skip signals.
+    """
+    global _facility_index, _facility_index_built_at
+
+    ttl = getattr(settings, 'FACILITY_INDEX_TTL', 300)
+    now = time.monotonic()
+    if _facility_index is None or now - _facility_index_built_at > ttl:
+        _facility_index = FacilityLocationIndex(
+            Facility.objects.filter(
+                is_active=True,
+                latitude__isnull=False,
+                longitude__isnull=False
+            )
+        )
+        _facility_index_built_at = now
+    return _facility_index
+
+
+def invalidate_facility_index():
+    """Drop the cached facility index so the next lookup rebuilds it"""
+    global _facility_index
+    _facility_index = None
+
+
 def find_nearest_facility(teacher_lat: float, teacher_lon: float) -> Optional[Dict]:
     """
     Find the nearest facility to the teacher's current location.
@@ -52,36 +184,7 @@ def find_nearest_facility(teacher_lat: float, teacher_lon: float) -> Optional[Di
     Returns:
         Dictionary with facility info and distance, or None if no suitable facility found
     """
-    facilities = Facility.objects.filter(
-        is_active=True,
-        latitude__isnull=False,
-        longitude__isnull=False
-    )
-    
-    if not facilities.exists():
-        return None
-    
-    nearest_facility = None
-    min_distance = float('inf')
-    
-    for facility in facilities:
-        distance = haversine_distance(
-            teacher_lat, teacher_lon,
-            float(facility.latitude), float(facility.longitude)
-        )
-        
-        if distance < min_distance:
-            min_distance = distance
-            nearest_facility = facility
-    
-    if nearest_facility:
-        return {
-            'facility': nearest_facility,
-            'distance': min_distance,
-            'within_range': min_distance <= nearest_facility.attendance_radius
-        }
-    
-    return None
+    return get_facility_index().nearest(teacher_lat, teacher_lon)
 
 
 def verify_teacher_location(teacher_lat: float, teacher_lon: float) -> Dict:
@@ -145,41 +248,6 @@ def get_today_classes_for_teacher_at_facility(teacher, facility, date=None):
     ).select_related('course').order_by('start_time')
 
 
-def geocode_address(address: str) -> Optional[Tuple[float, float]]:
-    """
-    Convert address to GPS coordinates using Google Geocoding API.
-    
-    Args:
-        address: Street address to geocode
-        
-    Returns:
-        Tuple of (latitude, longitude) or None if geocoding fails
-    """
-    api_key = getattr(settings, 'GOOGLE_MAPS_API_KEY', None)
-    if not api_key:
-        return None
-    
-    url = 'https://maps.googleapis.com/maps/api/geocode/json'
-    params = {
-        'address': address,
-        'key': api_key
-    }
-    
-    try:
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        data = response.json()
-        
-        if data['status'] == 'OK' and data['results']:
-            location = data['results'][0]['geometry']['location']
-            return (location['lat'], location['lng'])
-    
-    except (requests.RequestException, KeyError, IndexError):
-        pass
-    
-    return None
-
-
 def get_client_ip(request) -> str:
     """
     Extract client IP address from request.
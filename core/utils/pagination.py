@@ -0,0 +1,213 @@
+"""
+Keyset (seek) pagination helpers.
+
+Offset pagination has to count and skip every preceding row, so deep pages get
+slower as tables grow. Keyset pagination instead remembers the sort key of the
+last row shown and asks the database for rows strictly after it, which stays
+constant time as long as an index covers ``(field, id)``.
+"""
+import base64
+import json
+from typing import Any, List, Optional
+
+from django.db import models
+from django.db.models import Q
+from django.utils.dateparse import parse_date, parse_datetime
+
+
+def encode_cursor(value: Any, pk: int) -> str:
+    """Encode a ``(value, pk)`` sort key into an opaque URL-safe token."""
+    if hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    raw = json.dumps([value, pk], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_cursor(token: Optional[str], model_field=None) -> Optional[tuple]:
+    """
+    Decode a cursor token back into a ``(value, pk)`` tuple.
+
+    Returns None for missing or malformed tokens so callers can fall back to
+    the first page instead of raising on tampered query strings.
+    """
+    if not token:
+        return None
+
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        value, pk = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        pk = int(pk)
+    except (ValueError, TypeError, json.JSONDecodeError):
+        return None
+
+    if isinstance(model_field, models.DateTimeField):
+        value = parse_datetime(value) if isinstance(value, str) else None
+    elif isinstance(model_field, models.DateField):
+        value = parse_date(value) if isinstance(value, str) else None
+
+    if value is None:
+        return None
+    return value, pk
+
+
+class KeysetPage:
+    """A single page of keyset-paginated results."""
+
+    def __init__(self, object_list: List, *, has_next: bool, has_previous: bool,
+                 next_cursor: Optional[str], previous_cursor: Optional[str]):
+        self.object_list = object_list
+        self.has_next = has_next
+        self.has_previous = has_previous
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def has_other_pages(self):
+        return self.has_next or self.has_previous
+
+
+def paginate_keyset(queryset, *, field: str = 'created_at', after: Optional[str] = None,
+                    before: Optional[str] = None, per_page: int = 20) -> KeysetPage:
+    """
+    Return one page of ``queryset`` ordered newest-first by ``(field, id)``.
+
+    ``after`` continues towards older rows; ``before`` walks back towards newer
+    rows. Only one of them is honoured (``after`` wins) and invalid tokens are
+    treated as the first page.
+    """
+    model_field = queryset.model._meta.get_field(field)
+    after_key = decode_cursor(after, model_field)
+    before_key = None if after_key else decode_cursor(before, model_field)
+
+    if before_key:
+        value, pk = before_key
+        rows = list(
+            queryset.filter(Q(**{f'{field}__gt': value}) | Q(**{field: value, 'pk__gt': pk}))
+            .order_by(field, 'pk')[:per_page + 1]
+        )
+        has_previous = len(rows) > per_page
+        rows = list(reversed(rows[:per_page]))
+        has_next = True
+    else:
+        if after_key:
+            value, pk = after_key
+            queryset = queryset.filter(Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk}))
+        rows = list(queryset.order_by(f'-{field}', '-pk')[:per_page + 1])
+        has_next = len(rows) > per_page
+        rows = rows[:per_page]
+        has_previous = after_key is not None
+
+    next_cursor = previous_cursor = None
+    if rows:
+        if has_next:
+            next_cursor = encode_cursor(getattr(rows[-1], field), rows[-1].pk)
+        if has_previous:
+            previous_cursor = encode_cursor(getattr(rows[0], field), rows[0].pk)
+
+    return KeysetPage(
+        rows,
+        has_next=has_next,
+        has_previous=has_previous,
+        next_cursor=next_cursor,
+        previous_cursor=previous_cursor,
+    )
+
+
+def encode_stream_cursor(value: Any, kind: str, pk: int) -> str:
+    """Encode a ``(value, kind, pk)`` sort key for a merged stream."""
+    if hasattr(value, 'isoformat'):
+        value = value.isoformat()
+    raw = json.dumps([value, kind, pk], separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_stream_cursor(token: Optional[str], sources) -> Optional[tuple]:
+    """
+    Decode a merged stream cursor into ``(value, source index, pk)``.
+
+    Like ``decode_cursor`` this returns None for anything malformed, including
+    cursors naming a source that is not part of ``sources``.
+    """
+    if not token:
+        return None
+
+    try:
+        padded = token + '=' * (-len(token) % 4)
+        value, kind, pk = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        pk = int(pk)
+    except (ValueError, TypeError, json.JSONDecodeError):
+        return None
+
+    for index, (source_kind, queryset, field) in enumerate(sources):
+        if source_kind == kind:
+            model_field = queryset.model._meta.get_field(field)
+            break
+    else:
+        return None
+
+    if isinstance(model_field, models.DateTimeField):
+        value = parse_datetime(value) if isinstance(value, str) else None
+    elif isinstance(model_field, models.DateField):
+        value = parse_date(value) if isinstance(value, str) else None
+
+    if value is None:
+        return None
+    return value, index, pk
+
+
+def _row_attr(row, name):
+    if isinstance(row, dict):
+        return row['id'] if name == 'pk' and 'pk' not in row else row[name]
+    return getattr(row, name)
+
+
+def paginate_merged_keyset(sources, *, after: Optional[str] = None, per_page: int = 20) -> KeysetPage:
+    """
+    Return one page of several querysets merged newest-first into one stream.
+
+    ``sources`` is a list of ``(kind, queryset, field)``; rows are ordered by
+    ``field`` descending, then by position in ``sources``, then by id. Each
+    source is asked for at most ``per_page + 1`` rows past the cursor, so a
+    page costs one index seek per source however deep the stream goes.
+    ``values()`` querysets are supported as long as they include ``id``.
+
+    The page's ``object_list`` holds ``(kind, row)`` tuples. Only forward
+    (``after``) paging is supported.
+    """
+    cursor = decode_stream_cursor(after, sources)
+
+    candidates = []
+    for index, (kind, queryset, field) in enumerate(sources):
+        if cursor:
+            value, cursor_index, pk = cursor
+            if index > cursor_index:
+                queryset = queryset.filter(**{f'{field}__lte': value})
+            elif index == cursor_index:
+                queryset = queryset.filter(Q(**{f'{field}__lt': value}) | Q(**{field: value, 'pk__lt': pk}))
+            else:
+                queryset = queryset.filter(**{f'{field}__lt': value})
+
+        for row in queryset.order_by(f'-{field}', '-pk')[:per_page + 1]:
+            candidates.append(((_row_attr(row, field), -index, _row_attr(row, 'pk')), kind, row))
+
+    candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+    has_next = len(candidates) > per_page
+    candidates = candidates[:per_page]
+
+    next_cursor = None
+    if has_next and candidates:
+        (value, _, pk), kind, _ = candidates[-1]
+        next_cursor = encode_stream_cursor(value, kind, pk)
+
+    return KeysetPage(
+        [(kind, row) for _, kind, row in candidates],
+        has_next=has_next,
+        has_previous=cursor is not None,
+        next_cursor=next_cursor,
+        previous_cursor=None,
+    )
@@ -26,6 +26,8 @@ from enrollment.models import Enrollment, Attendance
 from .models import EmailSettings, SMSSettings, EmailLog, SMSLog, NotificationQuota, TeacherAttendance, OrganisationSettings
 from .forms import EmailSettingsForm, TestEmailForm, SMSSettingsForm, TestSMSForm, NotificationForm, BulkNotificationForm
 from .services.notification_queue import enqueue_email_notification, enqueue_sms_notification
+from .services.delivery_stats_service import DeliveryStatsService
+from .utils.pagination import paginate_keyset
 from .utils.gps_utils import (
     verify_teacher_location, 
     get_today_classes_for_teacher_at_facility,
@@ -35,6 +37,8 @@ from .utils.gps_utils import (
 
 logger = logging.getLogger(__name__)
 
+LOG_PAGE_SIZE = 50
+
 
 class DashboardView(LoginRequiredMixin, TemplateView):
     """Dashboard view"""
@@ -348,14 +352,8 @@ def email_settings_view(request):
     # Get recent email logs for statistics
     recent_logs = EmailLog.objects.all().order_by('-sent_at')[:10]
     
-    # Get statistics
-    stats = {
-        'total_sent': EmailLog.objects.filter(status='sent').count(),
-        'total_failed': EmailLog.objects.filter(status='failed').count(),
-        'recent_count': EmailLog.objects.filter(
-            sent_at__gte=timezone.now() - timedelta(days=7)
-        ).count()
-    }
+    # Get statistics from the daily delivery counters
+    stats = DeliveryStatsService.dashboard_stats('email')
     
     context = {
         'form': form,
@@ -458,7 +456,14 @@ def email_logs_view(request):
     if recipient_type_filter:
         logs = logs.filter(recipient_type=recipient_type_filter)
     
-    logs = logs.order_by('-sent_at')[:100]  # Limit to recent 100 entries
+    # Seek on (created_at, id) so the full history pages at constant cost
+    page = paginate_keyset(
+        logs,
+        field='created_at',
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+        per_page=LOG_PAGE_SIZE,
+    )
     
     # Get filter choices for dropdown
     filter_choices = {
@@ -467,8 +472,15 @@ def email_logs_view(request):
         'recipient_types': ['staff', 'student', 'guardian', 'unknown']
     }
     
+    filter_params = request.GET.copy()
+    filter_params.pop('after', None)
+    filter_params.pop('before', None)
+    
     context = {
-        'logs': logs,
+        'logs': page.object_list,
+        'page_obj': page,
+        'filter_querystring': filter_params.urlencode(),
+        'delivery_totals': DeliveryStatsService.totals('email', message_type=email_type_filter or None),
         'filter_choices': filter_choices,
         'current_filters': {
             'status': status_filter,
@@ -512,14 +524,8 @@ def sms_settings_view(request):
     # Get recent SMS logs for statistics
     recent_logs = SMSLog.objects.all().order_by('-sent_at')[:10]
     
-    # Get statistics
-    stats = {
-        'total_sent': SMSLog.objects.filter(status='sent').count(),
-        'total_failed': SMSLog.objects.filter(status='failed').count(),
-        'recent_count': SMSLog.objects.filter(
-            sent_at__gte=timezone.now() - timedelta(days=7)
-        ).count()
-    }
+    # Get statistics from the daily delivery counters
+    stats = DeliveryStatsService.dashboard_stats('sms')
     
     context = {
         'form': form,
@@ -622,7 +628,14 @@ def sms_logs_view(request):
     if recipient_type_filter:
         logs = logs.filter(recipient_type=recipient_type_filter)
     
-    logs = logs.order_by('-sent_at')[:100]  # Limit to recent 100 entries
+    # Seek on (created_at, id) so the full history pages at constant cost
+    page = paginate_keyset(
+        logs,
+        field='created_at',
+        after=request.GET.get('after'),
+        before=request.GET.get('before'),
+        per_page=LOG_PAGE_SIZE,
+    )
     
     # Get filter choices for dropdown
     filter_choices = {
@@ -631,8 +644,15 @@ def sms_logs_view(request):
         'recipient_types': ['staff', 'student', 'guardian', 'unknown']
     }
     
+    filter_params = request.GET.copy()
+    filter_params.pop('after', None)
+    filter_params.pop('before', None)
+    
     context = {
-        'logs': logs,
+        'logs': page.object_list,
+        'page_obj': page,
+        'filter_querystring': filter_params.urlencode(),
+        'delivery_totals': DeliveryStatsService.totals('sms', message_type=sms_type_filter or None),
         'filter_choices': filter_choices,
         'current_filters': {
             'status': status_filter,
@@ -828,6 +848,9 @@ def get_notification_quotas(request):
     
     email_quota = NotificationQuota.get_current_quota('email')
     sms_quota = NotificationQuota.get_current_quota('sms')
+    month_start = timezone.localdate().replace(day=1)
+    email_delivery = DeliveryStatsService.totals('email', start_date=month_start)
+    sms_delivery = DeliveryStatsService.totals('sms', start_date=month_start)
     
     return JsonResponse({
         'success': True,
@@ -836,13 +859,17 @@ def get_notification_quotas(request):
                 'used': email_quota.used_count,
                 'limit': email_quota.monthly_limit,
                 'remaining': email_quota.remaining_quota,
-                'percentage': email_quota.usage_percentage
+                'percentage': email_quota.usage_percentage,
+                'sent_this_month': email_delivery['sent'],
+                'failed_this_month': email_delivery['failed']
             },
             'sms': {
                 'used': sms_quota.used_count,
                 'limit': sms_quota.monthly_limit,
                 'remaining': sms_quota.remaining_quota,
-                'percentage': sms_quota.usage_percentage
+                'percentage': sms_quota.usage_percentage,
+                'sent_this_month': sms_delivery['sent'],
+                'failed_this_month': sms_delivery['failed']
             }
         }
     })
@@ -1228,6 +1255,24 @@ class TeacherQRAttendanceView(LoginRequiredMixin, TeacherOrAdminRequiredMixin, V
                     'message': 'Invalid GPS coordinates'
                 }, status=400)
         
+        # Shared (printed) codes can be photographed, so they only work on site
+        if validation_result.get('shared') and not location_verified:
+            return JsonResponse({
+                'success': False,
+                'message': 'Location is required for this QR code. Please allow location access and try again.'
+            }, status=400)
+        
+        # Single-use check only happens once everything else has passed; shared
+        # codes are single use per teacher and clock action
+        replay_scope = f"{request.user.id}_{clock_type}" if validation_result.get('shared') else None
+        if not QRCodeService.consume_qr_token(
+            validation_result['token'], validation_result['expires_at'], scope=replay_scope
+        ):
+            return JsonResponse({
+                'success': False,
+                'message': 'This QR code has already been used'
+            }, status=400)
+        
         # Create attendance record
         try:
             allowed_classes = Class.objects.filter(
@@ -1261,9 +1306,6 @@ class TeacherQRAttendanceView(LoginRequiredMixin, TeacherOrAdminRequiredMixin, V
             if allowed_classes.exists():
                 attendance.classes.set(allowed_classes.distinct())
             
-            # Invalidate the QR token to prevent reuse
-            QRCodeService.invalidate_qr_token(validation_result['token'])
-            
             return JsonResponse({
                 'success': True,
                 'message': f'Successfully clocked {clock_type.replace("_", " ")} at {facility.name}',
@@ -1272,6 +1314,7 @@ class TeacherQRAttendanceView(LoginRequiredMixin, TeacherOrAdminRequiredMixin, V
             })
             
         except Exception as e:
+            QRCodeService.release_qr_token(validation_result['token'], scope=replay_scope)
             return JsonResponse({
                 'success': False,
                 'message': f'Error recording attendance: {str(e)}'
@@ -1345,6 +1388,40 @@ class GenerateFacilityQRCodesView(LoginRequiredMixin, AdminRequiredMixin, View):
             })
 
 
+class FacilityQRSheetView(LoginRequiredMixin, AdminRequiredMixin, View):
+    """
+    Download the printable QR sheet (PDF or SVG) for a facility's week
+    """
+    
+    def get(self, request, facility_id):
+        from django.http import FileResponse, Http404
+        from core.services.qr_render_service import QRRenderService
+        
+        facility = get_object_or_404(Facility, id=facility_id, is_active=True)
+        
+        sheet_format = request.GET.get('format', 'pdf')
+        if sheet_format not in ('pdf', 'svg'):
+            raise Http404('Unsupported sheet format')
+        
+        try:
+            week_of = date.fromisoformat(request.GET['week']) if request.GET.get('week') else timezone.localdate()
+        except ValueError:
+            raise Http404('Invalid week')
+        week_start = week_of - timedelta(days=week_of.weekday())
+        
+        # Normally pre-rendered overnight by render_qr_sheets
+        path = QRRenderService.render_facility_sheet(facility, week_start, fmt=sheet_format)
+        
+        content_type = 'application/pdf' if sheet_format == 'pdf' else 'image/svg+xml'
+        response = FileResponse(
+            QRRenderService.storage().open(path, 'rb'),
+            content_type=content_type,
+            filename=f"qr-sheet-{facility.id}-{week_start.isoformat()}.{sheet_format}"
+        )
+        response['Cache-Control'] = 'private, no-store'
+        return response
+
+
 # Timesheet Export Views
 
 class TimesheetExportView(LoginRequiredMixin, TeacherOrAdminRequiredMixin, TemplateView):
@@ -1461,6 +1538,23 @@ class MonthlyTimesheetView(LoginRequiredMixin, AdminRequiredMixin, View):
             return redirect('timesheet_export')
 
 
+class QuarterlyTimesheetView(LoginRequiredMixin, AdminRequiredMixin, View):
+    """
+    Quarterly timesheet summary export
+    """
+    
+    def get(self, request, year, quarter):
+        """Generate and download quarterly summary"""
+        from core.services import TimesheetExportService
+        
+        try:
+            return TimesheetExportService.generate_quarterly_summary(year, quarter)
+        except Exception as e:
+            logger.error(f"Quarterly timesheet export error: {str(e)}")
+            messages.error(request, f'Quarterly export failed: {str(e)}')
+            return redirect('timesheet_export')
+
+
 # Organisation Settings Views
 
 @login_required
@@ -115,7 +115,7 @@ run_server() {
 
 run_worker() {
   echo "[INFO] Starting Django RQ worker"
-  exec "$VENV_PYTHON" "$MANAGE_PY" rqworker notifications default
+  exec "$VENV_PYTHON" "$MANAGE_PY" rqworker notifications default --with-scheduler
 }
 
 run_all() {
@@ -149,7 +149,7 @@ run_all() {
   "$VENV_PYTHON" "$MANAGE_PY" runserver "${HOST}:${PORT}" &
   server_pid=$!
 
-  "$VENV_PYTHON" "$MANAGE_PY" rqworker notifications default &
+  "$VENV_PYTHON" "$MANAGE_PY" rqworker notifications default --with-scheduler &
   worker_pid=$!
 
   wait -n "$server_pid" "$worker_pid"
@@ -29,6 +29,7 @@ urlpatterns = [
     path('timesheet/', core_views.TimesheetView.as_view(), name='timesheet'),
     path('timesheet/export/', core_views.TimesheetExportView.as_view(), name='timesheet_export'),
     path('timesheet/monthly/<int:year>/<int:month>/', core_views.MonthlyTimesheetView.as_view(), name='monthly_timesheet'),
+    path('timesheet/quarterly/<int:year>/<int:quarter>/', core_views.QuarterlyTimesheetView.as_view(), name='quarterly_timesheet'),
     
     # Core application (Dashboard, Clock, etc.)
     path('core/', include('core.urls')),
@@ -4,7 +4,7 @@ from django.utils import timezone
 from .models import Enrollment, Attendance
 from students.models import Student
 from academics.models import Course, Class
-from .services import AttendanceRosterService, MakeupSessionService
+from .services import AttendanceRosterService, ClassAttendanceService
 
 
 class EnrollmentForm(forms.ModelForm):
@@ -697,13 +697,15 @@ class BulkAttendanceForm(forms.Form):
     
     def __init__(self, *args, **kwargs):
         class_instance = kwargs.pop('class_instance', None)
+        roster_entries = kwargs.pop('roster_entries', None)
         super().__init__(*args, **kwargs)
         self.student_meta = {}
         
         if class_instance:
             self.fields['class_instance'].initial = class_instance
             
-            roster_entries = AttendanceRosterService.get_roster_entries(class_instance)
+            if roster_entries is None:
+                roster_entries = AttendanceRosterService.get_roster_entries(class_instance)
             
             # Get existing attendance records
             existing_attendance = {
@@ -778,41 +780,16 @@ class BulkAttendanceForm(forms.Form):
     def save_attendance(self, class_instance, actor=None):
         """Save attendance records from form data"""
         default_time = self.cleaned_data['default_time']
-        updated_count = 0
-        created_count = 0
-        makeup_synced_count = 0
+        marks = {}
         
         for field_name, status in self.cleaned_data.items():
             if field_name.startswith('student_') and status:
                 student_id = field_name.replace('student_', '')
                 time_field_name = f'time_{student_id}'
                 attendance_time = self.cleaned_data.get(time_field_name) or default_time
-                
-                try:
-                    student = Student.objects.get(id=student_id)
-                    attendance, created = Attendance.objects.update_or_create(
-                        student=student,
-                        class_instance=class_instance,
-                        defaults={
-                            'status': status,
-                            'attendance_time': attendance_time
-                        }
-                    )
-                    if created:
-                        created_count += 1
-                    else:
-                        updated_count += 1
-
-                    makeup_synced_count += MakeupSessionService.sync_status_from_target_attendance(
-                        student=student,
-                        target_class=class_instance,
-                        attendance_status=status,
-                        actor=actor,
-                    )
-                except Student.DoesNotExist:
-                    continue
+                marks[int(student_id)] = (status, attendance_time)
         
-        return created_count, updated_count, makeup_synced_count
+        return ClassAttendanceService.mark_class_attendance(class_instance, marks, actor=actor)
 
 
 class BulkEnrollmentNotificationForm(forms.Form):
@@ -1330,16 +1307,9 @@ class StudentSearchForm(forms.Form):
                 enrollments__status='confirmed'
             )
         
-        # Search across multiple fields
-        from django.db.models import Q
-        search_query = (
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query) |
-            Q(contact_email__icontains=query) |
-            Q(contact_phone__icontains=query)
-        )
-        
-        students = students_qs.filter(search_query).distinct()[:limit]
+        # Ranked lookup against the student search index
+        from students.services import StudentSearchService
+        students = StudentSearchService.search(query, queryset=students_qs, limit=limit)
         
         # Format results
         results = []
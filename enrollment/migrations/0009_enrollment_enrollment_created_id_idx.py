@@ -0,0 +1,19 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0015_course_course_status_name_idx'),
+        ('enrollment', '0008_makeupsession'),
+        ('students', '0012_auto_20250919_0019'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['-created_at', '-id'], name='enrollment_created_id_idx'),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('academics', '0015_course_course_status_name_idx'),
+        ('enrollment', '0009_enrollment_enrollment_created_id_idx'),
+        ('students', '0015_student_match_keys'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='attendance',
+            index=models.Index(fields=['student', '-attendance_time', '-id'], name='attendance_student_time_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='enrollment',
+            index=models.Index(fields=['student', '-created_at', '-id'], name='enrollment_student_time_idx'),
+        ),
+    ]
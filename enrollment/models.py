@@ -4,12 +4,15 @@ from django.conf import settings
 from django.core.exceptions import ValidationError
 from students.models import Student
 from academics.models import Course, Class
+from core.utils.change_tracking import FieldTrackerMixin
 
 
-class Enrollment(models.Model):
+class Enrollment(FieldTrackerMixin, models.Model):
     """
     Enrollment model
     """
+    tracked_fields = ('status', 'course', 'active_from', 'active_until')
+
     STATUS_CHOICES = [
         ('pending', 'Pending'),
         ('confirmed', 'Confirmed'),
@@ -176,6 +179,12 @@ class Enrollment(models.Model):
                 name='unique_student_class_enrollment'
             ),
         ]
+        indexes = [
+            # Keyset pagination for the enrolment list seeks on (created_at, id)
+            models.Index(fields=['-created_at', '-id'], name='enrollment_created_id_idx'),
+            # Student timeline reads a student's enrolments newest first
+            models.Index(fields=['student', '-created_at', '-id'], name='enrollment_student_time_idx'),
+        ]
     
     def __str__(self):
         base_str = f"{self.student} - {self.course}"
@@ -294,6 +303,10 @@ class Attendance(models.Model):
         verbose_name = 'Attendance Record'
         verbose_name_plural = 'Attendance Records'
         unique_together = ['student', 'class_instance']
+        indexes = [
+            # Student timeline reads a student's attendance newest first
+            models.Index(fields=['student', '-attendance_time', '-id'], name='attendance_student_time_idx'),
+        ]
     
     def __str__(self):
         return f"{self.student} - {self.class_instance} ({self.get_status_display()})"
@@ -4,10 +4,13 @@ Service layer for enrollment and attendance automation
 This module provides services for managing automatic attendance creation
 and synchronization between enrollments, classes, and attendance records.
 """
+from datetime import date, time as dt_time, timedelta
 from django.db import transaction
 from django.utils import timezone
 from django.db import models
+from django.core.cache import cache
 from django.core.exceptions import ValidationError
+from django.db.models.functions import Coalesce, TruncDate, TruncTime
 from .models import Enrollment, Attendance, MakeupSession
 from academics.models import Class, Course
 from students.models import Student
@@ -21,57 +24,147 @@ class AttendanceRosterService:
 
     ACTIVE_MAKEUP_STATUSES = ('scheduled', 'completed')
     SYNC_MAKEUP_STATUSES = ('scheduled', 'completed', 'no_show')
+    CACHE_TIMEOUT = 60 * 60
 
     @staticmethod
-    def get_roster_entries(class_instance):
-        roster = {}
+    def _cache_key(class_instance):
+        # Editing the class time or bumping roster_version moves to a fresh key;
+        # created_at guards against SQLite reusing the id of a deleted class
+        return (
+            f'attendance_roster:{class_instance.pk}:{class_instance.created_at.timestamp()}:'
+            f'{class_instance.roster_version}:{class_instance.date.isoformat()}:'
+            f'{class_instance.start_time.isoformat()}'
+        )
 
-        confirmed_enrollments = class_instance.course.enrollments.filter(
-            status='confirmed'
-        ).select_related('student')
+    @staticmethod
+    def _name_key(entry):
+        return entry['student'].first_name.lower(), entry['student'].last_name.lower()
 
-        for enrollment in confirmed_enrollments:
-            if not EnrollmentAttendanceService._is_class_within_window(enrollment, class_instance):
-                continue
+    @staticmethod
+    def _window_enrollments(class_ids):
+        """
+        Confirmed (enrollment, class) pairs whose active window covers the class
 
-            student = enrollment.student
-            entry = roster.setdefault(
-                student.id,
-                {
-                    'student': student,
-                    'from_enrollment': False,
-                    'from_makeup': False,
-                    'makeup_status': None,
-                    'makeup_session_id': None,
-                }
+        The window check compares the enrolment bounds, converted to local
+        date and time in SQL, against each class's date and start time.
+        """
+        class_date = models.F('course__classes__date')
+        class_time = models.F('course__classes__start_time')
+        return Enrollment.objects.annotate(
+            from_date=TruncDate('active_from'),
+            from_time=TruncTime('active_from'),
+            until_date=TruncDate('active_until'),
+            until_time=TruncTime('active_until'),
+        ).filter(
+            models.Q(status='confirmed', course__classes__id__in=class_ids)
+            & (
+                models.Q(active_from__isnull=True)
+                | models.Q(from_date__lt=class_date)
+                | models.Q(from_date=class_date, from_time__lte=class_time)
             )
-            entry['from_enrollment'] = True
-
-        makeup_sessions = MakeupSession.objects.filter(
-            target_class=class_instance,
-            status__in=AttendanceRosterService.ACTIVE_MAKEUP_STATUSES
+            & (
+                models.Q(active_until__isnull=True)
+                | models.Q(until_date__gt=class_date)
+                | models.Q(until_date=class_date, until_time__gt=class_time)
+            )
+        ).annotate(
+            roster_class_id=models.F('course__classes__id')
         ).select_related('student')
 
-        for makeup in makeup_sessions:
-            student = makeup.student
-            entry = roster.setdefault(
-                student.id,
-                {
-                    'student': student,
-                    'from_enrollment': False,
-                    'from_makeup': False,
-                    'makeup_status': None,
-                    'makeup_session_id': None,
-                }
+    @staticmethod
+    def get_rosters(class_instances):
+        """
+        Resolve rosters for many classes at once
+
+        Cached rosters are reused; the rest are resolved with one enrolment
+        query and one makeup query. Cached entries hold ids only, so students
+        are always loaded fresh.
+
+        Args:
+            class_instances: Iterable of Class instances
+
+        Returns:
+            dict: {class_id: [roster entry, ...]} sorted by student name
+        """
+        class_instances = list(class_instances)
+        if not class_instances:
+            return {}
+
+        keys = {class_instance.pk: AttendanceRosterService._cache_key(class_instance)
+                for class_instance in class_instances}
+        cached = cache.get_many(keys.values())
+
+        rosters = {}
+        students = {}
+        missing_ids = []
+        for class_id, key in keys.items():
+            if key in cached:
+                rosters[class_id] = cached[key]
+            else:
+                rosters[class_id] = {}
+                missing_ids.append(class_id)
+
+        def blank_entry(student):
+            return {
+                'student': student,
+                'from_enrollment': False,
+                'from_makeup': False,
+                'makeup_status': None,
+                'makeup_session_id': None,
+            }
+
+        if missing_ids:
+            for enrollment in AttendanceRosterService._window_enrollments(missing_ids):
+                students[enrollment.student_id] = enrollment.student
+                entry = rosters[enrollment.roster_class_id].setdefault(
+                    enrollment.student_id, blank_entry(enrollment.student)
+                )
+                entry['from_enrollment'] = True
+
+            makeup_sessions = MakeupSession.objects.filter(
+                target_class_id__in=missing_ids,
+                status__in=AttendanceRosterService.ACTIVE_MAKEUP_STATUSES
+            ).select_related('student').order_by('-created_at', '-id')
+
+            for makeup in makeup_sessions:
+                students[makeup.student_id] = makeup.student
+                entry = rosters[makeup.target_class_id].setdefault(
+                    makeup.student_id, blank_entry(makeup.student)
+                )
+                entry['from_makeup'] = True
+                entry['makeup_status'] = makeup.status
+                entry['makeup_session_id'] = makeup.id
+
+            to_cache = {}
+            for class_id in missing_ids:
+                rosters[class_id] = sorted(rosters[class_id].values(), key=AttendanceRosterService._name_key)
+                to_cache[keys[class_id]] = [
+                    {**entry, 'student': entry['student'].pk} for entry in rosters[class_id]
+                ]
+            cache.set_many(to_cache, AttendanceRosterService.CACHE_TIMEOUT)
+
+        wanted_ids = {
+            entry['student']
+            for class_id, entries in rosters.items() if class_id not in missing_ids
+            for entry in entries
+        } - set(students)
+        if wanted_ids:
+            students.update(Student.objects.in_bulk(wanted_ids))
+
+        for class_id, entries in rosters.items():
+            if class_id in missing_ids:
+                continue
+            rosters[class_id] = sorted(
+                [{**entry, 'student': students[entry['student']]}
+                 for entry in entries if entry['student'] in students],
+                key=AttendanceRosterService._name_key
             )
-            entry['from_makeup'] = True
-            entry['makeup_status'] = makeup.status
-            entry['makeup_session_id'] = makeup.id
 
-        return sorted(
-            roster.values(),
-            key=lambda item: (item['student'].first_name.lower(), item['student'].last_name.lower())
-        )
+        return rosters
+
+    @staticmethod
+    def get_roster_entries(class_instance):
+        return AttendanceRosterService.get_rosters([class_instance])[class_instance.pk]
 
     @staticmethod
     def get_roster_students(class_instance):
@@ -81,6 +174,18 @@ class AttendanceRosterService:
     def get_roster_student_ids(class_instance):
         return [entry['student'].id for entry in AttendanceRosterService.get_roster_entries(class_instance)]
 
+    @staticmethod
+    def invalidate(*, class_ids=None, course_ids=None):
+        """Move the given classes, or every class of the given courses, to a fresh roster cache key"""
+        filters = models.Q()
+        if class_ids:
+            filters |= models.Q(pk__in=class_ids)
+        if course_ids:
+            filters |= models.Q(course_id__in=course_ids)
+        if not filters:
+            return 0
+        return Class.objects.filter(filters).update(roster_version=models.F('roster_version') + 1)
+
 
 class MakeupSessionService:
     """Create and maintain makeup sessions with attendance side effects."""
@@ -93,6 +198,9 @@ class MakeupSessionService:
         'early_leave': 'completed',
         'absent': 'no_show',
     }
+    CANDIDATE_WINDOW_DAYS = 28
+    CANDIDATE_PAGE_SIZE = 50
+    CANDIDATE_MAX_PAGE_SIZE = 200
 
     @staticmethod
     def format_class_label(class_instance):
@@ -126,52 +234,171 @@ class MakeupSessionService:
         }
 
     @staticmethod
-    def get_candidate_classes(student, current_class, initiated_from='source', actor=None):
+    def _student_class_q(student):
+        """Classes the student is linked to by an active enrolment, an attendance or a makeup"""
+        return (
+            models.Q(models.Exists(Enrollment.objects.filter(
+                student=student,
+                course_id=models.OuterRef('course_id'),
+                status__in=['pending', 'confirmed'],
+            )))
+            | models.Q(models.Exists(Attendance.objects.filter(
+                student=student,
+                class_instance_id=models.OuterRef('pk'),
+            )))
+            | models.Q(models.Exists(MakeupSession.objects.filter(
+                student=student,
+                source_class_id=models.OuterRef('pk'),
+            )))
+            | models.Q(models.Exists(MakeupSession.objects.filter(
+                student=student,
+                target_class_id=models.OuterRef('pk'),
+            )))
+        )
+
+    @staticmethod
+    def _annotate_candidate_rank(queryset, current_class):
+        """
+        Rank target candidates: a compatible level first
+
+        A level is compatible when the course shares the current course's
+        group, or for ungrouped courses its category and course type. The
+        rank only depends on course settings, so it stays put while a user
+        pages through the results; free seats change with every booking and
+        are annotated for display (seats_taken, has_capacity) instead of
+        being ranked on, which would let the keyset cursor skip or repeat
+        classes between pages. Seats taken follow the roster: confirmed
+        enrolments in the course plus scheduled or completed makeups into
+        the class.
+        """
+        def count_of(subquery, group_field):
+            return Coalesce(models.Subquery(
+                subquery.order_by().values(group_field).annotate(total=models.Count('pk')).values('total')
+            ), 0)
+
+        current_course = current_class.course
+        if current_course.group_id:
+            level_q = models.Q(course__group_id=current_course.group_id)
+        else:
+            level_q = models.Q(
+                course__group__isnull=True,
+                course__category=current_course.category,
+                course__course_type=current_course.course_type,
+            )
+
+        queryset = queryset.annotate(
+            seats_taken=count_of(
+                Enrollment.objects.filter(course_id=models.OuterRef('course_id'), status='confirmed'),
+                'course_id',
+            ) + count_of(
+                MakeupSession.objects.filter(
+                    target_class_id=models.OuterRef('pk'),
+                    status__in=AttendanceRosterService.ACTIVE_MAKEUP_STATUSES,
+                ),
+                'target_class_id',
+            ),
+            has_capacity=models.ExpressionWrapper(
+                models.Q(seats_taken__lt=models.F('course__vacancy')), output_field=models.BooleanField()
+            ),
+            level_match=models.ExpressionWrapper(level_q, output_field=models.BooleanField()),
+        )
+        return queryset.annotate(rank=models.Case(
+            models.When(level_match=True, then=0),
+            default=1,
+            output_field=models.IntegerField(),
+        ))
+
+    @staticmethod
+    def _encode_cursor(class_instance):
+        return (
+            f"{class_instance.rank}|{class_instance.date.isoformat()}|"
+            f"{class_instance.start_time.isoformat()}|{class_instance.pk}"
+        )
+
+    @staticmethod
+    def _cursor_q(cursor):
+        """Keyset condition for rows after the cursor in (rank, date, start_time, id) order"""
+        try:
+            rank, class_date, start_time, pk = cursor.split('|')
+            rank, pk = int(rank), int(pk)
+            class_date = date.fromisoformat(class_date)
+            start_time = dt_time.fromisoformat(start_time)
+        except (AttributeError, ValueError):
+            raise ValidationError('Invalid cursor.')
+
+        return (
+            models.Q(rank__gt=rank)
+            | models.Q(rank=rank, date__gt=class_date)
+            | models.Q(rank=rank, date=class_date, start_time__gt=start_time)
+            | models.Q(rank=rank, date=class_date, start_time=start_time, pk__gt=pk)
+        )
+
+    @staticmethod
+    def get_candidate_classes(
+        student,
+        current_class,
+        initiated_from='source',
+        actor=None,
+        *,
+        date_from=None,
+        date_to=None,
+        course_id=None,
+        facility_id=None,
+        weekdays=None,
+        cursor=None,
+        limit=None,
+    ):
+        """
+        One page of classes to pair with ``current_class`` in a makeup
+
+        From a source class the candidates are upcoming target classes in a
+        date window (CANDIDATE_WINDOW_DAYS from today unless given), ranked by
+        level compatibility. Once a window is exhausted, ``next_window`` gives
+        the date range to request next (starting at the next matching class),
+        or None when nothing later matches. From a target class they are the
+        student's own classes, past ones included. Both come from a single
+        query, paged by the ``next_cursor`` of the previous page.
+
+        Args:
+            weekdays: Iterable of weekday numbers, Monday=0
+            cursor: ``next_cursor`` from the previous page
+            limit: Page size, capped at CANDIDATE_MAX_PAGE_SIZE
+        """
         local_now = timezone.localtime()
         now_date = local_now.date()
         now_time = local_now.time()
 
+        queryset = Class.objects.filter(is_active=True).exclude(pk=current_class.pk)
+
         if initiated_from == 'target':
             # Source classes stay student-related and can include past sessions.
-            enrollment_course_ids = set(
-                Enrollment.objects.filter(
-                    student=student,
-                    status__in=['pending', 'confirmed']
-                ).values_list('course_id', flat=True)
-            )
-            attendance_class_ids = set(
-                Attendance.objects.filter(
-                    student=student
-                ).values_list('class_instance_id', flat=True)
-            )
-            makeup_class_ids = set(
-                MakeupSession.objects.filter(
-                    student=student
-                ).values_list('source_class_id', flat=True)
-            )
-            makeup_class_ids.update(
-                MakeupSession.objects.filter(
-                    student=student
-                ).values_list('target_class_id', flat=True)
-            )
-
-            queryset = Class.objects.filter(
-                is_active=True
-            ).filter(
-                models.Q(course_id__in=enrollment_course_ids) |
-                models.Q(id__in=attendance_class_ids) |
-                models.Q(id__in=makeup_class_ids)
-            )
+            queryset = queryset.filter(
+                MakeupSessionService._student_class_q(student)
+            ).annotate(rank=models.Value(0, output_field=models.IntegerField()))
         else:
-            # Target classes are globally available upcoming sessions.
-            queryset = Class.objects.filter(
-                is_active=True
-            ).filter(
+            # Target classes are upcoming sessions across all courses.
+            date_from = max(date_from or now_date, now_date)
+            if date_to is None:
+                date_to = date_from + timedelta(days=MakeupSessionService.CANDIDATE_WINDOW_DAYS)
+            elif date_to < date_from:
+                raise ValidationError('date_to must not be before date_from or today.')
+            queryset = queryset.filter(
                 models.Q(date__gt=now_date) |
                 models.Q(date=now_date, start_time__gte=now_time)
             )
+            queryset = MakeupSessionService._annotate_candidate_rank(queryset, current_class)
 
-        queryset = queryset.select_related('course').distinct().order_by('date', 'start_time', 'course__name')
+        if date_from:
+            queryset = queryset.filter(date__gte=date_from)
+        if course_id:
+            queryset = queryset.filter(course_id=course_id)
+        if facility_id:
+            queryset = queryset.filter(
+                models.Q(facility_id=facility_id) |
+                models.Q(facility__isnull=True, course__facility_id=facility_id)
+            )
+        if weekdays:
+            queryset = queryset.filter(date__iso_week_day__in=[int(day) + 1 for day in weekdays])
 
         if (
             actor is not None
@@ -180,17 +407,44 @@ class MakeupSessionService:
         ):
             queryset = queryset.filter(course__teacher=actor)
 
+        later_classes = queryset
+        if date_to:
+            later_classes = queryset.filter(date__gt=date_to)
+            queryset = queryset.filter(date__lte=date_to)
+
+        if cursor:
+            queryset = queryset.filter(MakeupSessionService._cursor_q(cursor))
+
+        limit = min(limit or MakeupSessionService.CANDIDATE_PAGE_SIZE, MakeupSessionService.CANDIDATE_MAX_PAGE_SIZE)
+        page = list(
+            queryset.select_related('course').order_by('rank', 'date', 'start_time', 'pk')[:limit + 1]
+        )
+        has_more = len(page) > limit
+        page = page[:limit]
+
+        next_window = None
+        if initiated_from != 'target' and not has_more and date_to:
+            next_date = later_classes.order_by('date').values_list('date', flat=True).first()
+            if next_date:
+                next_window = {
+                    'date_from': next_date.isoformat(),
+                    'date_to': (next_date + (date_to - date_from)).isoformat(),
+                }
+
         candidates = []
-        for class_instance in queryset:
-            if class_instance.id == current_class.id:
-                continue
-            candidates.append({
+        for class_instance in page:
+            candidate = {
                 'id': class_instance.id,
                 'course_name': class_instance.course.name,
                 'date': class_instance.date.isoformat(),
                 'start_time': class_instance.start_time.isoformat(),
                 'label': MakeupSessionService.format_class_label(class_instance),
-            })
+            }
+            if initiated_from != 'target':
+                candidate['has_capacity'] = class_instance.has_capacity
+                candidate['level_match'] = class_instance.level_match
+                candidate['seats_left'] = max(class_instance.course.vacancy - class_instance.seats_taken, 0)
+            candidates.append(candidate)
 
         return {
             'initiated_from': initiated_from,
@@ -199,7 +453,14 @@ class MakeupSessionService:
                 'id': current_class.id,
                 'label': MakeupSessionService.format_class_label(current_class),
             },
+            'window': {
+                'date_from': date_from.isoformat() if date_from else None,
+                'date_to': date_to.isoformat() if date_to else None,
+            },
             'candidates': candidates,
+            'has_more': has_more,
+            'next_cursor': MakeupSessionService._encode_cursor(page[-1]) if has_more else None,
+            'next_window': next_window,
         }
 
     @staticmethod
@@ -244,6 +505,13 @@ class MakeupSessionService:
         if new_status == 'cancelled' and not note:
             raise ValidationError('Cancellation reason is required.')
 
+        MakeupSessionService._apply_status(makeup_session, new_status, actor, note)
+        makeup_session.save(update_fields=['status', 'updated_by', 'notes', 'updated_at'])
+        return makeup_session
+
+    @staticmethod
+    def _apply_status(makeup_session, new_status, actor, note):
+        """Set the new status and append the audit note without saving"""
         actor_label = 'System'
         if actor is not None:
             actor_label = actor.get_full_name().strip() or actor.username
@@ -260,32 +528,59 @@ class MakeupSessionService:
             if makeup_session.notes else
             audit_note
         )
-        makeup_session.save(update_fields=['status', 'updated_by', 'notes', 'updated_at'])
-        return makeup_session
 
     @staticmethod
     def sync_status_from_target_attendance(*, student, target_class, attendance_status, actor=None):
-        next_status = MakeupSessionService.ATTENDANCE_STATUS_TO_MAKEUP_STATUS.get(attendance_status)
-        if not next_status:
+        return MakeupSessionService.sync_statuses_from_target_attendance(
+            target_class=target_class,
+            attendance_statuses={student.id: attendance_status},
+            actor=actor,
+        )
+
+    @staticmethod
+    def sync_statuses_from_target_attendance(*, target_class, attendance_statuses, actor=None):
+        """
+        Close scheduled makeups into a class from a batch of attendance marks
+
+        Args:
+            target_class (Class): Class the attendance was taken for
+            attendance_statuses (dict): {student_id: attendance status}
+
+        Returns:
+            int: Number of makeup sessions updated
+        """
+        next_statuses = {
+            student_id: MakeupSessionService.ATTENDANCE_STATUS_TO_MAKEUP_STATUS[status]
+            for student_id, status in attendance_statuses.items()
+            if status in MakeupSessionService.ATTENDANCE_STATUS_TO_MAKEUP_STATUS
+        }
+        if not next_statuses:
             return 0
 
-        scheduled_sessions = MakeupSession.objects.filter(
-            student=student,
+        scheduled_sessions = list(MakeupSession.objects.filter(
+            student_id__in=next_statuses,
             target_class=target_class,
             status='scheduled'
-        )
+        ))
+        if not scheduled_sessions:
+            return 0
 
-        updated_count = 0
+        now = timezone.now()
         for makeup_session in scheduled_sessions:
-            MakeupSessionService.update_session_status(
-                makeup_session=makeup_session,
-                new_status=next_status,
-                actor=actor,
-                note=f'Auto-sync from attendance status: {attendance_status}.',
+            MakeupSessionService._apply_status(
+                makeup_session,
+                next_statuses[makeup_session.student_id],
+                actor,
+                f'Auto-sync from attendance status: {attendance_statuses[makeup_session.student_id]}.',
             )
-            updated_count += 1
+            makeup_session.updated_at = now
 
-        return updated_count
+        MakeupSession.objects.bulk_update(
+            scheduled_sessions, ['status', 'updated_by', 'notes', 'updated_at'], batch_size=200
+        )
+        # bulk_update skips post_save, so refresh the roster cache here
+        AttendanceRosterService.invalidate(class_ids=[target_class.pk])
+        return len(scheduled_sessions)
 
     @staticmethod
     def schedule_session(
@@ -634,6 +929,83 @@ class ClassAttendanceService:
                 'message': error_msg
             }
     
+    @staticmethod
+    def mark_class_attendance(class_instance, marks, actor=None):
+        """
+        Write a batch of attendance marks for one class in a single transaction
+
+        Existing rows and scheduled makeups for the class are loaded once;
+        creates and updates go out as bulk statements. Students deleted since
+        the roster was rendered are skipped.
+
+        Args:
+            class_instance (Class): The class being marked
+            marks (dict): {student_id: (status, attendance_time)}
+            actor: Staff member marking the class, recorded on makeup updates
+
+        Returns:
+            tuple: (created_count, updated_count, makeup_synced_count)
+        """
+        if not marks:
+            return 0, 0, 0
+
+        with transaction.atomic():
+            existing = {
+                attendance.student_id: attendance
+                for attendance in Attendance.objects.filter(
+                    class_instance=class_instance,
+                    student_id__in=marks
+                )
+            }
+
+            new_ids = [student_id for student_id in marks if student_id not in existing]
+            if new_ids:
+                new_ids = set(Student.objects.filter(id__in=new_ids).values_list('id', flat=True))
+
+            now = timezone.now()
+            to_update = []
+            for student_id, attendance in existing.items():
+                attendance.status, attendance.attendance_time = marks[student_id]
+                attendance.updated_at = now
+                to_update.append(attendance)
+
+            to_create = [
+                Attendance(
+                    student_id=student_id,
+                    class_instance=class_instance,
+                    status=status,
+                    attendance_time=attendance_time,
+                )
+                for student_id, (status, attendance_time) in marks.items()
+                if student_id in new_ids
+            ]
+
+            if to_update:
+                Attendance.objects.bulk_update(
+                    to_update, ['status', 'attendance_time', 'updated_at'], batch_size=200
+                )
+            if to_create:
+                # A concurrent save of the same roster turns into an update
+                Attendance.objects.bulk_create(
+                    to_create,
+                    batch_size=200,
+                    update_conflicts=True,
+                    unique_fields=['student', 'class_instance'],
+                    update_fields=['status', 'attendance_time', 'updated_at'],
+                )
+
+            makeup_synced_count = MakeupSessionService.sync_statuses_from_target_attendance(
+                target_class=class_instance,
+                attendance_statuses={
+                    student_id: status
+                    for student_id, (status, _) in marks.items()
+                    if student_id in existing or student_id in new_ids
+                },
+                actor=actor,
+            )
+
+        return len(to_create), len(to_update), makeup_synced_count
+
     @staticmethod
     def sync_class_attendance(class_instance):
         """
@@ -847,3 +1219,222 @@ class AttendanceSyncService:
                 'status': 'error',
                 'message': error_msg
             }
+
+
+class EnrollmentTransferService:
+    """Move a set of enrolments to another course in one transaction"""
+
+    TRANSFERABLE_STATUSES = ('pending', 'confirmed')
+
+    @staticmethod
+    def _classes_from(effective_at, prefix=''):
+        """Q for classes that start on or after effective_at"""
+        local = timezone.localtime(effective_at)
+        return (
+            models.Q(**{f'{prefix}date__gt': local.date()})
+            | models.Q(**{f'{prefix}date': local.date(), f'{prefix}start_time__gte': local.time()})
+        )
+
+    @classmethod
+    def transfer_enrollments(cls, enrollment_ids, target_course, *, effective_at, price_handling='new_price',
+                             force=False, send_confirmation=False, performed_by=None):
+        """
+        Transfer enrolments to target_course, e.g. when merging an under-filled class
+
+        Mirrors the single transfer in EnrollmentTransferView: each source
+        enrolment is closed at effective_at and cancelled, and a confirmed
+        enrolment is created in the target course. Attendance is reconciled
+        with set-based deletes and inserts, capacity is checked once for the
+        whole batch and activity rows are bulk inserted. Confirmation emails,
+        if requested, go out in one queued job after commit.
+
+        Args:
+            enrollment_ids (iterable): Source enrolment ids
+            target_course (Course): Course to move the students into
+            effective_at (datetime): Attendance moves for classes from this time
+            price_handling (str): 'new_price' or 'carry_over'
+            force (bool): Skip the vacancy check
+            send_confirmation (bool): Queue confirmation emails for the new enrolments
+            performed_by: Staff member performing the transfer
+
+        Returns:
+            dict: {'transferred': [{'from', 'to', 'student_id'}, ...],
+                   'skipped': [{'enrollment_id', 'reason'}, ...],
+                   'attendance_removed': int, 'attendance_created': int}
+
+        Raises:
+            ValidationError: If the batch would overfill the target course
+        """
+        from students.models import StudentActivity
+
+        if timezone.is_naive(effective_at):
+            effective_at = timezone.make_aware(effective_at, timezone.get_current_timezone())
+        enrollment_ids = list(dict.fromkeys(enrollment_ids))
+
+        with transaction.atomic():
+            # Serialise transfers into the same course so the capacity check below holds
+            target_course = Course.objects.select_for_update().get(pk=target_course.pk)
+            sources = list(
+                Enrollment.objects.select_for_update(of=('self',))
+                .select_related('course')
+                .filter(pk__in=enrollment_ids)
+                .order_by('pk')
+            )
+            found = {enrollment.pk for enrollment in sources}
+            skipped = [
+                {'enrollment_id': pk, 'reason': 'Enrollment not found'}
+                for pk in enrollment_ids if pk not in found
+            ]
+
+            # Unique per (student, course) across every status
+            taken = set(
+                Enrollment.objects.filter(
+                    course=target_course, student_id__in=[enrollment.student_id for enrollment in sources]
+                ).values_list('student_id', flat=True)
+            )
+            moving = []
+            for enrollment in sources:
+                if enrollment.status not in cls.TRANSFERABLE_STATUSES:
+                    skipped.append({'enrollment_id': enrollment.pk, 'reason': f'Enrollment is {enrollment.status}'})
+                elif enrollment.course_id == target_course.pk:
+                    skipped.append({'enrollment_id': enrollment.pk, 'reason': 'Already in the target course'})
+                elif enrollment.student_id in taken:
+                    skipped.append({
+                        'enrollment_id': enrollment.pk,
+                        'reason': f'Student already has an enrollment in {target_course.name}'
+                    })
+                else:
+                    taken.add(enrollment.student_id)
+                    moving.append(enrollment)
+
+            if not force and moving:
+                confirmed = Enrollment.objects.filter(course=target_course, status='confirmed').count()
+                if confirmed + len(moving) > target_course.vacancy:
+                    raise ValidationError(
+                        f'Target course {target_course.name} has {target_course.vacancy - confirmed} place(s) left '
+                        f'but {len(moving)} student(s) are being transferred.'
+                    )
+
+            effective_iso = effective_at.isoformat()
+            now = timezone.now()
+            new_enrollments = []
+            for enrollment in moving:
+                form_data = dict(enrollment.form_data or {})
+                form_data.update({
+                    'transferred_from': enrollment.pk,
+                    'original_course': enrollment.course.name,
+                    'transfer_effective_at': effective_iso,
+                })
+                new_enrollments.append(Enrollment(
+                    student_id=enrollment.student_id,
+                    course=target_course,
+                    status='confirmed',
+                    registration_status='transferred',
+                    source_channel='staff',
+                    course_fee=enrollment.course_fee if price_handling == 'carry_over' else target_course.price,
+                    registration_fee=0,
+                    registration_fee_paid=True,
+                    is_new_student=False,
+                    active_from=effective_at,
+                    form_data=form_data,
+                ))
+            Enrollment.objects.bulk_create(new_enrollments, batch_size=200)
+
+            for enrollment, new_enrollment in zip(moving, new_enrollments):
+                enrollment.form_data = dict(enrollment.form_data or {})
+                enrollment.form_data.update({
+                    'transferred_to': new_enrollment.pk,
+                    'target_course': target_course.name,
+                    'transfer_effective_at': effective_iso,
+                })
+                enrollment.active_until = effective_at
+                enrollment.status = 'cancelled'
+                enrollment.updated_at = now
+            Enrollment.objects.bulk_update(
+                moving, ['form_data', 'active_until', 'status', 'updated_at'], batch_size=200
+            )
+
+            # Attendance: drop source-course rows from the effective time, add target-course rows
+            source_courses = {}
+            for enrollment in moving:
+                source_courses.setdefault(enrollment.course_id, []).append(enrollment.student_id)
+            removed = 0
+            if source_courses:
+                moved_rows = models.Q()
+                for course_id, student_ids in source_courses.items():
+                    moved_rows |= models.Q(class_instance__course_id=course_id, student_id__in=student_ids)
+                _, deleted = Attendance.objects.filter(moved_rows).filter(
+                    cls._classes_from(effective_at, 'class_instance__')
+                ).delete()
+                removed = deleted.get(Attendance._meta.label, 0)
+
+            target_classes = list(
+                Class.objects.filter(course=target_course, is_active=True).filter(cls._classes_from(effective_at))
+            )
+            # Rows may already exist, e.g. from a makeup booked into the target course
+            existing = set(
+                Attendance.objects.filter(
+                    class_instance__in=target_classes,
+                    student_id__in=[enrollment.student_id for enrollment in new_enrollments],
+                ).values_list('student_id', 'class_instance_id')
+            ) if target_classes and new_enrollments else set()
+            attendance = Attendance.objects.bulk_create(
+                [
+                    Attendance(
+                        student_id=enrollment.student_id,
+                        class_instance=class_instance,
+                        status='unmarked',
+                        attendance_time=class_instance.get_class_datetime(),
+                    )
+                    for enrollment in new_enrollments
+                    for class_instance in target_classes
+                    if (enrollment.student_id, class_instance.pk) not in existing
+                ],
+                batch_size=500,
+            )
+
+            activities = []
+            for enrollment, new_enrollment in zip(moving, new_enrollments):
+                activities.append(StudentActivity(
+                    student_id=enrollment.student_id,
+                    activity_type='enrollment_cancelled',
+                    title=f'Enrollment transferred to {target_course.name}',
+                    description=f'Student transferred to {target_course.name}. Old enrollment cancelled.',
+                    enrollment=enrollment,
+                    course=enrollment.course,
+                    performed_by=performed_by,
+                    metadata={'transfer_target_id': new_enrollment.pk, 'transfer_effective_at': effective_iso},
+                ))
+                activities.append(StudentActivity(
+                    student_id=enrollment.student_id,
+                    activity_type='enrollment_created',
+                    title=f'Enrollment transferred from {enrollment.course.name}',
+                    description=f'Transfer enrollment created from {enrollment.course.name}.',
+                    enrollment=new_enrollment,
+                    course=target_course,
+                    performed_by=performed_by,
+                    metadata={'transfer_source_id': enrollment.pk, 'transfer_effective_at': effective_iso},
+                ))
+            StudentActivity.objects.bulk_create(activities, batch_size=500)
+
+            # bulk writes skip the roster signals
+            AttendanceRosterService.invalidate(course_ids=set(source_courses) | {target_course.pk})
+
+            if send_confirmation and new_enrollments:
+                from core.services.notification_queue import enqueue_enrollment_confirmation_emails
+                new_ids = [enrollment.pk for enrollment in new_enrollments]
+                transaction.on_commit(lambda: enqueue_enrollment_confirmation_emails(new_ids))
+
+        logger.info(
+            f"Transferred {len(moving)} enrollment(s) to {target_course.name}; "
+            f"skipped {len(skipped)}, attendance -{removed} +{len(attendance)}"
+        )
+        return {
+            'transferred': [
+                {'from': enrollment.pk, 'to': new_enrollment.pk, 'student_id': enrollment.student_id}
+                for enrollment, new_enrollment in zip(moving, new_enrollments)
+            ],
+            'skipped': skipped,
+            'attendance_removed': removed,
+            'attendance_created': len(attendance),
+        }
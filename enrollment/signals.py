@@ -5,12 +5,12 @@ This module handles automatic creation of attendance records when:
 1. A student enrollment is confirmed for a course
 2. A new class is created for a course with existing enrollments
 """
-from django.db.models.signals import post_save, pre_save
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from django.db import transaction
-from .models import Enrollment, Attendance
+from .models import Enrollment, Attendance, MakeupSession
 from academics.models import Class
-from .services import EnrollmentAttendanceService, ClassAttendanceService
+from .services import AttendanceRosterService, EnrollmentAttendanceService, ClassAttendanceService
 import logging
 
 logger = logging.getLogger(__name__)
@@ -27,8 +27,8 @@ def create_attendance_for_confirmed_enrollment(sender, instance, created, **kwar
         return
     
     # Check if this is a status change to confirmed (not a new confirmed enrollment)
-    if not created and hasattr(instance, '_original_status'):
-        if instance._original_status != 'confirmed':
+    if not created:
+        if instance.has_changed('status'):
             # This is an enrollment being updated to confirmed status
             result = EnrollmentAttendanceService.auto_create_attendance_for_enrollment(instance)
             logger.info(f"Enrollment confirmation signal: {result['message']}")
@@ -38,17 +38,27 @@ def create_attendance_for_confirmed_enrollment(sender, instance, created, **kwar
         logger.info(f"New confirmed enrollment signal: {result['message']}")
 
 
-@receiver(pre_save, sender=Enrollment)
-def track_enrollment_status_change(sender, instance, **kwargs):
-    """Track the original status before save to detect status changes"""
-    if instance.pk:
-        try:
-            original = Enrollment.objects.get(pk=instance.pk)
-            instance._original_status = original.status
-        except Enrollment.DoesNotExist:
-            instance._original_status = None
-    else:
-        instance._original_status = None
+@receiver(post_save, sender=Enrollment)
+def invalidate_rosters_on_enrollment_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    if not created and not instance.has_changed('status', 'course', 'active_from', 'active_until'):
+        return
+    course_ids = {instance.course_id, instance.previous('course')} - {None}
+    AttendanceRosterService.invalidate(course_ids=course_ids)
+
+
+@receiver(post_delete, sender=Enrollment)
+def invalidate_rosters_on_enrollment_delete(sender, instance, **kwargs):
+    AttendanceRosterService.invalidate(course_ids=[instance.course_id])
+
+
+@receiver(post_save, sender=MakeupSession)
+@receiver(post_delete, sender=MakeupSession)
+def invalidate_rosters_on_makeup_change(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    AttendanceRosterService.invalidate(class_ids=[instance.target_class_id])
 
 
 @receiver(post_save, sender=Class)
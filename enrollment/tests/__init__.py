@@ -1,4 +1,6 @@
 from .test_attendance_automation import *
+from .test_attendance_roster import *
 from .test_attendance_sync_services import *
+from .test_bulk_transfer import *
 from .test_price_adjustment_api import *
 from .test_templates import *
@@ -0,0 +1,112 @@
+from datetime import time, timedelta
+
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+from academics.models import Class, Course
+from enrollment.models import Enrollment, MakeupSession
+from enrollment.services import AttendanceRosterService, EnrollmentAttendanceService
+from students.models import Student
+
+
+class AttendanceRosterBatchTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.addCleanup(cache.clear)
+        today = timezone.localdate()
+        self.course = Course.objects.create(
+            name='Roster Course', price=100, status='published',
+            start_date=today + timedelta(days=1), start_time=time(16), repeat_pattern='once',
+        )
+        self.other_course = Course.objects.create(
+            name='Other Course', price=100, status='published',
+            start_date=today + timedelta(days=1), start_time=time(10), repeat_pattern='once',
+        )
+        self.classes = [
+            Class.objects.create(course=self.course, date=today + timedelta(days=7 * week), start_time=time(16))
+            for week in range(1, 5)
+        ]
+        self.other_class = Class.objects.create(course=self.other_course, date=today + timedelta(days=2),
+                                                start_time=time(10))
+
+        self.always = Student.objects.create(first_name='Always', last_name='Here')
+        self.joiner = Student.objects.create(first_name='Joiner', last_name='Late')
+        self.leaver = Student.objects.create(first_name='Leaver', last_name='Early')
+        self.visitor = Student.objects.create(first_name='Visitor', last_name='Makeup')
+
+        Enrollment.objects.create(student=self.always, course=self.course, status='confirmed')
+        # Joins exactly at the start of the second class, leaves exactly at the start of the third
+        Enrollment.objects.create(student=self.joiner, course=self.course, status='confirmed',
+                                  active_from=self.classes[1].get_class_datetime())
+        Enrollment.objects.create(student=self.leaver, course=self.course, status='confirmed',
+                                  active_until=self.classes[2].get_class_datetime())
+        Enrollment.objects.create(student=self.visitor, course=self.other_course, status='confirmed')
+        Enrollment.objects.create(student=self.visitor, course=self.course, status='pending')
+        MakeupSession.objects.create(
+            student=self.visitor, course=self.other_course, source_class=self.other_class,
+            target_class=self.classes[3], status='scheduled',
+        )
+        for class_instance in self.classes:
+            class_instance.refresh_from_db()
+
+    def _names(self, entries):
+        return [entry['student'].first_name for entry in entries]
+
+    def test_batch_matches_python_window_check(self):
+        with self.assertNumQueries(2):
+            rosters = AttendanceRosterService.get_rosters(self.classes)
+
+        self.assertEqual([self._names(rosters[c.pk]) for c in self.classes], [
+            ['Always', 'Leaver'],
+            ['Always', 'Joiner', 'Leaver'],
+            ['Always', 'Joiner'],
+            ['Always', 'Joiner', 'Visitor'],
+        ])
+        for class_instance in self.classes:
+            expected = {
+                enrollment.student_id
+                for enrollment in self.course.enrollments.filter(status='confirmed')
+                if EnrollmentAttendanceService._is_class_within_window(enrollment, class_instance)
+            }
+            found = {entry['student'].pk for entry in rosters[class_instance.pk] if entry['from_enrollment']}
+            self.assertEqual(found, expected)
+
+        visitor = rosters[self.classes[3].pk][-1]
+        self.assertEqual((visitor['from_makeup'], visitor['from_enrollment'], visitor['makeup_status']),
+                         (True, False, 'scheduled'))
+
+    def test_cached_rosters_only_reload_students(self):
+        AttendanceRosterService.get_rosters(self.classes)
+
+        with self.assertNumQueries(1):
+            rosters = AttendanceRosterService.get_rosters(self.classes)
+        self.assertEqual(self._names(rosters[self.classes[0].pk]), ['Always', 'Leaver'])
+
+        Student.objects.filter(pk=self.always.pk).update(first_name='Alwyn')
+        entries = AttendanceRosterService.get_roster_entries(self.classes[0])
+        self.assertEqual(self._names(entries), ['Alwyn', 'Leaver'])
+
+    def test_enrolment_and_makeup_changes_refresh_cache(self):
+        AttendanceRosterService.get_rosters(self.classes)
+        newcomer = Student.objects.create(first_name='Newcomer', last_name='Student')
+
+        Enrollment.objects.create(student=newcomer, course=self.course, status='confirmed')
+        MakeupSession.objects.filter(student=self.visitor).get().delete()
+
+        classes = Class.objects.filter(pk__in=[c.pk for c in self.classes]).order_by('date')
+        rosters = AttendanceRosterService.get_rosters(classes)
+        self.assertIn('Newcomer', self._names(rosters[self.classes[0].pk]))
+        self.assertNotIn('Visitor', self._names(rosters[self.classes[3].pk]))
+        self.assertEqual(self._names(AttendanceRosterService.get_roster_entries(self.other_class)), ['Visitor'])
+
+    def test_saving_stale_class_keeps_bumped_roster_version(self):
+        stale = Class.objects.get(pk=self.classes[0].pk)
+        AttendanceRosterService.invalidate(class_ids=[stale.pk])
+        current = Class.objects.get(pk=stale.pk).roster_version
+
+        stale.duration_minutes = 90
+        stale.save()
+
+        saved = Class.objects.get(pk=stale.pk)
+        self.assertEqual((saved.roster_version, saved.duration_minutes), (current, 90))
@@ -0,0 +1,147 @@
+import json
+from datetime import time, timedelta
+from decimal import Decimal
+from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from accounts.models import Staff
+from academics.models import Class, Course
+from enrollment.models import Attendance, Enrollment
+from enrollment.services import EnrollmentTransferService
+from students.models import Student, StudentActivity
+
+
+class BulkEnrollmentTransferTests(TestCase):
+    def setUp(self):
+        patcher = patch('academics.signals.WooCommerceSyncService')
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        today = timezone.localdate()
+        self.source = Course.objects.create(
+            name='Small Class', price=Decimal('100.00'), status='published', vacancy=12,
+            start_date=today - timedelta(days=7), end_date=today + timedelta(days=30), start_time=time(16),
+            repeat_pattern='weekly',
+        )
+        self.target = Course.objects.create(
+            name='Merged Class', price=Decimal('120.00'), status='published', vacancy=4,
+            start_date=today - timedelta(days=7), end_date=today + timedelta(days=30), start_time=time(10),
+            repeat_pattern='weekly',
+        )
+        self.source_past = Class.objects.create(course=self.source, date=today - timedelta(days=7), start_time=time(16))
+        self.source_future = [
+            Class.objects.create(course=self.source, date=today + timedelta(days=7 * week), start_time=time(16))
+            for week in (1, 2)
+        ]
+        self.target_past = Class.objects.create(course=self.target, date=today - timedelta(days=7), start_time=time(10))
+        self.target_future = [
+            Class.objects.create(course=self.target, date=today + timedelta(days=7 * week), start_time=time(10))
+            for week in (1, 2)
+        ]
+
+        self.students = [Student.objects.create(first_name=f'Mover{index}', last_name='Student') for index in range(3)]
+        self.enrollments = [
+            Enrollment.objects.create(student=student, course=self.source, status='confirmed',
+                                      course_fee=Decimal('90.00'))
+            for student in self.students
+        ]
+        self.staff = Staff.objects.create_user(username='transfer-admin', password='pass', role='admin', is_staff=True)
+
+    def test_transfer_moves_enrollments_and_attendance(self):
+        with self.assertNumQueries(14):
+            result = EnrollmentTransferService.transfer_enrollments(
+                [enrollment.pk for enrollment in self.enrollments], self.target,
+                effective_at=timezone.now(), price_handling='carry_over', performed_by=self.staff,
+            )
+
+        self.assertEqual(len(result['transferred']), 3)
+        self.assertEqual(result['skipped'], [])
+        self.assertEqual((result['attendance_removed'], result['attendance_created']), (6, 6))
+
+        for enrollment in self.enrollments:
+            enrollment.refresh_from_db()
+            self.assertEqual(enrollment.status, 'cancelled')
+            self.assertIsNotNone(enrollment.active_until)
+        new_enrollments = Enrollment.objects.filter(course=self.target)
+        self.assertEqual(new_enrollments.count(), 3)
+        self.assertEqual(set(new_enrollments.values_list('status', 'course_fee', 'registration_status')),
+                         {('confirmed', Decimal('90.00'), 'transferred')})
+
+        student_ids = [student.pk for student in self.students]
+        # Past source attendance stays, future source attendance moves to the target's future classes
+        self.assertEqual(
+            set(Attendance.objects.filter(student_id__in=student_ids).values_list('class_instance_id', flat=True)),
+            {self.source_past.pk} | {class_instance.pk for class_instance in self.target_future},
+        )
+        self.assertEqual(StudentActivity.objects.filter(performed_by=self.staff).count(), 6)
+
+    def test_capacity_checked_once_for_the_batch(self):
+        Enrollment.objects.create(
+            student=Student.objects.create(first_name='Already', last_name='There'),
+            course=self.target, status='confirmed',
+        )
+        Enrollment.objects.create(
+            student=Student.objects.create(first_name='Second', last_name='There'),
+            course=self.target, status='confirmed',
+        )
+
+        with self.assertRaises(ValidationError):
+            EnrollmentTransferService.transfer_enrollments(
+                [enrollment.pk for enrollment in self.enrollments], self.target, effective_at=timezone.now(),
+            )
+        self.assertFalse(Enrollment.objects.filter(course=self.source, status='cancelled').exists())
+
+        result = EnrollmentTransferService.transfer_enrollments(
+            [enrollment.pk for enrollment in self.enrollments], self.target, effective_at=timezone.now(), force=True,
+        )
+        self.assertEqual(len(result['transferred']), 3)
+
+    def test_capacity_uses_the_locked_course_row(self):
+        # Another request shrank the course after this instance was loaded
+        Course.objects.filter(pk=self.target.pk).update(vacancy=2)
+
+        with self.assertRaises(ValidationError):
+            EnrollmentTransferService.transfer_enrollments(
+                [enrollment.pk for enrollment in self.enrollments], self.target, effective_at=timezone.now(),
+            )
+        self.assertFalse(Enrollment.objects.filter(course=self.target).exists())
+
+    def test_students_already_in_target_are_skipped(self):
+        Enrollment.objects.create(student=self.students[0], course=self.target, status='cancelled')
+
+        result = EnrollmentTransferService.transfer_enrollments(
+            [enrollment.pk for enrollment in self.enrollments], self.target, effective_at=timezone.now(),
+        )
+
+        self.assertEqual([row['enrollment_id'] for row in result['skipped']], [self.enrollments[0].pk])
+        self.assertEqual(len(result['transferred']), 2)
+        self.enrollments[0].refresh_from_db()
+        self.assertEqual(self.enrollments[0].status, 'confirmed')
+
+    @override_settings(SECURE_SSL_REDIRECT=False)
+    def test_endpoint_queues_one_confirmation_job(self):
+        self.client.login(username='transfer-admin', password='pass')
+
+        with patch('django_rq.get_queue') as mock_get_queue:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.post(
+                    reverse('enrollment:bulk_enrollment_transfer_api'),
+                    data=json.dumps({
+                        'enrollment_ids': [enrollment.pk for enrollment in self.enrollments],
+                        'target_course_id': self.target.pk,
+                        'send_confirmation': True,
+                    }),
+                    content_type='application/json',
+                )
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.json()['transferred']), 3)
+        enqueue = mock_get_queue.return_value.enqueue
+        enqueue.assert_called_once()
+        self.assertEqual(enqueue.call_args.args[0], 'core.tasks.send_enrollment_confirmation_emails_task')
+        self.assertEqual(sorted(enqueue.call_args.kwargs['enrollment_ids']),
+                         sorted(Enrollment.objects.filter(course=self.target).values_list('pk', flat=True)))
@@ -2,10 +2,13 @@ from datetime import date, time, timedelta
 
 from django.core.exceptions import ValidationError
 from django.test import TestCase
+from django.urls import reverse
+from django.utils import timezone
 
 from accounts.models import Staff
 from academics.models import Class, Course
-from enrollment.models import Attendance, Enrollment
+from enrollment.forms import BulkAttendanceForm
+from enrollment.models import Attendance, Enrollment, MakeupSession
 from enrollment.services import ClassAttendanceService, MakeupSessionService
 from students.models import Student
 
@@ -296,6 +299,47 @@ class MakeupSessionServiceTests(TestCase):
         makeup.refresh_from_db()
         self.assertEqual(makeup.status, 'no_show')
 
+    def test_bulk_attendance_form_saves_roster_in_one_pass(self):
+        result = MakeupSessionService.schedule_session(
+            student=self.student,
+            source_class=self.source_class,
+            target_class=self.cross_target_class,
+            initiated_from='source',
+            reason_type='student_request',
+            actor=self.admin,
+        )
+        classmates = [
+            Student.objects.create(first_name=f'Class{index}', last_name='Mate') for index in range(5)
+        ]
+        for classmate in classmates:
+            Enrollment.objects.create(
+                student=classmate, course=self.cross_course, status='confirmed', source_channel='staff'
+            )
+        Attendance.objects.filter(class_instance=self.cross_target_class, student__in=classmates[:2]).delete()
+        existing_count = Attendance.objects.filter(class_instance=self.cross_target_class).count()
+
+        data = {
+            'class_instance': self.cross_target_class.pk,
+            'default_time': timezone.localtime().strftime('%Y-%m-%dT%H:%M'),
+            f'student_{self.student.id}': 'present',
+        }
+        data.update({f'student_{classmate.id}': 'absent' for classmate in classmates})
+        form = BulkAttendanceForm(data, class_instance=self.cross_target_class)
+        self.assertTrue(form.is_valid(), form.errors)
+
+        with self.assertNumQueries(9):
+            created, updated, synced = form.save_attendance(self.cross_target_class, actor=self.admin)
+
+        self.assertEqual((created, updated, synced), (6 - existing_count, existing_count, 1))
+        statuses = dict(
+            Attendance.objects.filter(class_instance=self.cross_target_class).values_list('student_id', 'status')
+        )
+        self.assertEqual(statuses[self.student.id], 'present')
+        self.assertEqual({statuses[classmate.id] for classmate in classmates}, {'absent'})
+        makeup = MakeupSession.objects.get(pk=result['makeup_session'].pk)
+        self.assertEqual(makeup.status, 'completed')
+        self.assertIn('Auto-sync from attendance status: present.', makeup.notes)
+
     def test_candidate_classes_include_course_name(self):
         Enrollment.objects.create(
             student=self.student,
@@ -323,3 +367,153 @@ class MakeupSessionServiceTests(TestCase):
         candidate_ids = {item['id'] for item in payload['candidates']}
         self.assertIn(self.global_future_class.id, candidate_ids)
         self.assertNotIn(self.global_past_class.id, candidate_ids)
+
+    def test_source_mode_ranks_compatible_classes_first_and_pages(self):
+        # self.course is full: vacancy 1 and the student's confirmed enrolment
+        private_course = Course.objects.create(
+            name='Private Lesson',
+            price=150,
+            course_type='private',
+            start_date=date.today() + timedelta(days=1),
+            end_date=date.today() + timedelta(days=60),
+            start_time=time(hour=9, minute=0),
+            repeat_pattern='weekly',
+            status='published',
+        )
+        private_class = Class.objects.create(
+            course=private_course,
+            date=date.today() + timedelta(days=2),
+            start_time=time(hour=9, minute=0),
+            is_active=True,
+        )
+        outside_window = Class.objects.create(
+            course=private_course,
+            date=date.today() + timedelta(days=45),
+            start_time=time(hour=9, minute=0),
+            is_active=True,
+        )
+
+        pages = []
+        cursor = None
+        while True:
+            payload = MakeupSessionService.get_candidate_classes(
+                student=self.student,
+                current_class=self.source_class,
+                initiated_from='source',
+                cursor=cursor,
+                limit=2,
+            )
+            pages.append(payload['candidates'])
+            cursor = payload['next_cursor']
+            if not payload['has_more']:
+                break
+
+        self.assertEqual([len(page) for page in pages], [2, 2])
+        self.assertEqual(
+            [item['id'] for page in pages for item in page],
+            [self.global_future_class.id, self.target_class.id, self.cross_target_class.id, private_class.id]
+        )
+        self.assertEqual(pages[0][1]['seats_left'], 0)
+        self.assertFalse(pages[0][1]['has_capacity'])
+        self.assertFalse(pages[1][1]['level_match'])
+        # The last page of the default window points at the next class beyond it
+        self.assertEqual(payload['next_window'], {
+            'date_from': outside_window.date.isoformat(),
+            'date_to': (outside_window.date + timedelta(days=MakeupSessionService.CANDIDATE_WINDOW_DAYS)).isoformat(),
+        })
+        payload = MakeupSessionService.get_candidate_classes(
+            student=self.student,
+            current_class=self.source_class,
+            initiated_from='source',
+            date_from=outside_window.date,
+            date_to=outside_window.date + timedelta(days=MakeupSessionService.CANDIDATE_WINDOW_DAYS),
+        )
+        self.assertEqual([item['id'] for item in payload['candidates']], [outside_window.id])
+        self.assertIsNone(payload['next_window'])
+
+        payload = MakeupSessionService.get_candidate_classes(
+            student=self.student,
+            current_class=self.source_class,
+            initiated_from='source',
+            date_to=date.today() + timedelta(days=60),
+            course_id=private_course.id,
+            weekdays=[outside_window.date.weekday()],
+        )
+        self.assertEqual([item['id'] for item in payload['candidates']], [outside_window.id])
+
+    def test_source_mode_pages_are_stable_when_seats_change(self):
+        first = MakeupSessionService.get_candidate_classes(
+            student=self.student,
+            current_class=self.source_class,
+            initiated_from='source',
+            limit=1,
+        )
+        # A booking between pages fills the class on the first page
+        self.global_target_course.vacancy = 0
+        self.global_target_course.save()
+
+        rest = MakeupSessionService.get_candidate_classes(
+            student=self.student,
+            current_class=self.source_class,
+            initiated_from='source',
+            cursor=first['next_cursor'],
+        )
+
+        self.assertEqual(
+            [item['id'] for item in first['candidates'] + rest['candidates']],
+            [self.global_future_class.id, self.target_class.id, self.cross_target_class.id],
+        )
+
+    def test_target_mode_candidates_come_from_one_query(self):
+        other_course = Course.objects.create(
+            name='Other Course',
+            price=100,
+            start_date=date.today() - timedelta(days=10),
+            end_date=date.today() + timedelta(days=10),
+            start_time=time(hour=12, minute=0),
+            repeat_pattern='weekly',
+            status='published',
+        )
+        attended_class = Class.objects.create(
+            course=other_course,
+            date=date.today() - timedelta(days=10),
+            start_time=time(hour=12, minute=0),
+            is_active=True,
+        )
+        Attendance.objects.create(
+            student=self.student,
+            class_instance=attended_class,
+            status='present',
+            attendance_time=attended_class.get_class_datetime(),
+        )
+
+        with self.assertNumQueries(2):
+            payload = MakeupSessionService.get_candidate_classes(
+                student=self.student,
+                current_class=self.global_future_class,
+                initiated_from='target',
+            )
+
+        self.assertEqual(
+            [item['id'] for item in payload['candidates']],
+            [attended_class.id, self.source_class.id, self.target_class.id]
+        )
+        self.assertFalse(payload['has_more'])
+
+    def test_candidates_endpoint_rejects_bad_cursor(self):
+        self.client.force_login(self.admin)
+        url = reverse('academics:class_makeup_candidates', args=[self.source_class.pk])
+
+        response = self.client.get(url, {'student_id': self.student.pk, 'limit': 1})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.json()['has_more'])
+
+        response = self.client.get(url, {'student_id': self.student.pk, 'cursor': 'nonsense'})
+        self.assertEqual(response.status_code, 400)
+
+        response = self.client.get(url, {
+            'student_id': self.student.pk,
+            'date_from': (date.today() + timedelta(days=10)).isoformat(),
+            'date_to': (date.today() + timedelta(days=5)).isoformat(),
+        })
+        self.assertEqual(response.status_code, 400)
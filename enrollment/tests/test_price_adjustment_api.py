@@ -2,6 +2,7 @@ from django.test import TestCase, Client
 from django.urls import reverse
 from datetime import date, time, timedelta
 from decimal import Decimal
+from django.utils import timezone
 from accounts.models import Staff
 from students.models import Student
 from academics.models import Course, Class
@@ -105,3 +106,128 @@ class PriceAdjustmentAPITests(TestCase):
         self.enrollment.refresh_from_db()
         self.assertEqual(self.enrollment.course_fee, self.course.early_bird_price)
         self.assertTrue(self.enrollment.is_early_bird)
+
+
+class BatchPriceAdjustmentTests(TestCase):
+    def setUp(self):
+        self.admin = Staff.objects.create_user(username='admin3', password='pass', role='admin', is_staff=True, is_superuser=True)
+        self.client = Client()
+        self.client.login(username='admin3', password='pass')
+        # Pricing decisions use timezone.now().date(), which can differ from self.today
+        self.today = timezone.now().date()
+
+        self.course = Course.objects.create(
+            name='Term Course',
+            price=Decimal('150.00'),
+            early_bird_price=Decimal('120.00'),
+            early_bird_deadline=self.today - timedelta(days=1),
+            start_date=self.today + timedelta(days=10),
+            start_time=time(hour=9, minute=0),
+            repeat_pattern='once',
+            status='published'
+        )
+        self.pending = []
+        for index in range(3):
+            student = Student.objects.create(first_name=f'Pending{index}', last_name='Student')
+            self.pending.append(Enrollment.objects.create(
+                student=student, course=self.course, status='pending',
+                course_fee=Decimal('120.00'), is_early_bird=True, original_price=Decimal('150.00')
+            ))
+        # Already at the regular price, and a confirmed enrolment: both left alone
+        Enrollment.objects.create(
+            student=Student.objects.create(first_name='Regular', last_name='Student'),
+            course=self.course, status='pending', course_fee=Decimal('150.00')
+        )
+        self.confirmed = Enrollment.objects.create(
+            student=Student.objects.create(first_name='Confirmed', last_name='Student'),
+            course=self.course, status='confirmed', course_fee=Decimal('120.00'), is_early_bird=True
+        )
+
+    def test_preview_lists_pending_diffs_for_term(self):
+        resp = self.client.get(reverse('enrollment:batch_price_adjustment_api'), {
+            'term_start': (self.today + timedelta(days=1)).isoformat(),
+            'term_end': (self.today + timedelta(days=30)).isoformat(),
+        })
+
+        self.assertEqual(resp.status_code, 200)
+        data = resp.json()
+        self.assertEqual(data['count'], 3)
+        self.assertEqual(Decimal(data['total_difference']), Decimal('-90.00'))
+        self.assertEqual([row['enrollment_id'] for row in data['enrollments']], [e.pk for e in self.pending])
+        self.assertEqual(Decimal(data['enrollments'][0]['suggested_price']), Decimal('150.00'))
+
+    def test_apply_uses_bulk_writes(self):
+        from core.services.early_bird_pricing_service import EarlyBirdPricingService
+        from students.models import StudentActivity
+
+        courses = EarlyBirdPricingService.courses_for_scope(course_id=self.course.pk)
+        # savepoint, select, bulk update, bulk insert, release
+        with self.assertNumQueries(5):
+            result = EarlyBirdPricingService.apply_batch_adjustment(courses, performed_by=self.admin)
+
+        self.assertEqual(result['updated'], 3)
+        self.assertEqual(result['total_difference'], Decimal('-90.00'))
+        for enrollment in self.pending:
+            enrollment.refresh_from_db()
+            self.assertEqual(enrollment.course_fee, Decimal('150.00'))
+            self.assertFalse(enrollment.is_early_bird)
+            self.assertEqual(enrollment.form_data['price_adjustment_type'], 'regular_price_applied')
+        self.confirmed.refresh_from_db()
+        self.assertEqual(self.confirmed.course_fee, Decimal('120.00'))
+        self.assertEqual(StudentActivity.objects.filter(activity_type='price_adjustment').count(), 3)
+
+        # Nothing left to reprice
+        self.assertEqual(EarlyBirdPricingService.apply_batch_adjustment(courses)['updated'], 0)
+
+    def test_apply_endpoint_limits_to_selected_enrollments(self):
+        resp = self.client.post(
+            reverse('enrollment:batch_price_adjustment_api'),
+            data={'course_id': self.course.pk, 'enrollment_ids': [self.pending[0].pk]},
+            content_type='application/json',
+        )
+
+        self.assertEqual(resp.status_code, 200)
+        self.assertEqual(resp.json()['enrollment_ids'], [self.pending[0].pk])
+        self.pending[1].refresh_from_db()
+        self.assertEqual(self.pending[1].course_fee, Decimal('120.00'))
+
+    def test_staff_decisions_are_reported_not_repriced(self):
+        from core.services.early_bird_pricing_service import EarlyBirdPricingService
+        from students.models import StudentActivity
+
+        honoured = Enrollment.objects.create(
+            student=Student.objects.create(first_name='Honoured', last_name='Student'),
+            course=self.course, status='pending', course_fee=Decimal('120.00'), is_early_bird=True,
+            form_data={'price_adjustment_performed': True, 'price_adjustment_type': 'early_bird_price_maintained'},
+        )
+        courses = EarlyBirdPricingService.courses_for_scope(course_id=self.course.pk)
+
+        preview = EarlyBirdPricingService.preview_batch_adjustment(courses)
+        self.assertEqual(preview['count'], 3)
+        self.assertEqual([row['enrollment_id'] for row in preview['staff_decisions']], [honoured.pk])
+        self.assertEqual(preview['staff_decisions'][0]['staff_decision'], 'early_bird_price_maintained')
+
+        resp = self.client.post(
+            reverse('enrollment:batch_price_adjustment_api'),
+            data={'course_id': self.course.pk},
+            content_type='application/json',
+        )
+        data = resp.json()
+        self.assertEqual((data['updated'], data['skipped_staff_decisions']), (3, [honoured.pk]))
+        self.assertIn('1 with an individual staff pricing decision left unchanged', data['message'])
+        honoured.refresh_from_db()
+        self.assertEqual(honoured.course_fee, Decimal('120.00'))
+
+        activity = StudentActivity.objects.filter(enrollment=self.pending[0]).get()
+        self.assertTrue(activity.description.startswith('Batch repricing for'))
+        self.assertEqual(activity.metadata['adjustment_reason'], 'batch_repricing')
+
+        # Selecting the enrolment explicitly overrides the earlier decision
+        result = EarlyBirdPricingService.apply_batch_adjustment(courses, enrollment_ids=[honoured.pk])
+        self.assertEqual(result['enrollment_ids'], [honoured.pk])
+        honoured.refresh_from_db()
+        self.assertEqual(honoured.course_fee, Decimal('150.00'))
+
+    def test_scope_is_required(self):
+        resp = self.client.get(reverse('enrollment:batch_price_adjustment_api'))
+        self.assertEqual(resp.status_code, 400)
@@ -107,16 +107,21 @@ class EnrollmentListFilterTemplateTest(TestCase):
                 status='confirmed',
             )
 
+    def _course_option_names(self, params=None):
+        response = self.client.get(
+            reverse('enrollment:enrollment_filter_options', kwargs={'kind': 'courses'}),
+            params or {},
+        )
+        self.assertEqual(response.status_code, 200)
+        return [option['text'] for option in response.json()['results']]
+
     def test_default_view_shows_published_courses_only(self):
         response = self.client.get(reverse('enrollment:enrollment_list'))
 
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.context['current_course_view'], 'current')
         self.assertEqual(response.context['current_course_status'], '')
-        self.assertEqual(
-            [course.name for course in response.context['courses']],
-            ['Published Course'],
-        )
+        self.assertEqual(self._course_option_names(), ['Published Course'])
         self.assertEqual(
             [enrollment.course.name for enrollment in response.context['enrollments']],
             ['Published Course'],
@@ -136,7 +141,7 @@ class EnrollmentListFilterTemplateTest(TestCase):
         self.assertEqual(response.context['current_course_view'], 'historical')
         self.assertEqual(response.context['current_course_status'], '')
         self.assertCountEqual(
-            [course.name for course in response.context['courses']],
+            self._course_option_names({'course_view': 'historical'}),
             ['Draft Course', 'Expired Course', 'Archived Course'],
         )
         self.assertCountEqual(
@@ -156,7 +161,7 @@ class EnrollmentListFilterTemplateTest(TestCase):
         self.assertEqual(response.context['current_course_view'], 'historical')
         self.assertEqual(response.context['current_course_status'], 'expired')
         self.assertEqual(
-            [course.name for course in response.context['courses']],
+            self._course_option_names({'course_view': 'historical', 'course_status': 'expired'}),
             ['Expired Course'],
         )
         self.assertEqual(
@@ -196,7 +201,7 @@ class EnrollmentListFilterTemplateTest(TestCase):
         self.assertEqual(response.context['current_course_status'], 'all')
         self.assertTrue(response.context['is_legacy_all_course_status'])
         self.assertCountEqual(
-            [course.name for course in response.context['courses']],
+            self._course_option_names({'course_status': 'all'}),
             ['Published Course', 'Draft Course', 'Expired Course', 'Archived Course'],
         )
         self.assertContains(response, 'Showing all course statuses via a legacy compatibility link.')
@@ -220,3 +225,95 @@ class EnrollmentListFilterTemplateTest(TestCase):
             [enrollment.course.name for enrollment in response.context['enrollments']],
             ['Published Course', 'Draft Course', 'Expired Course', 'Archived Course'],
         )
+
+    def test_filter_dropdowns_only_render_current_selection(self):
+        Student.objects.create(first_name='Unrelated', last_name='Person')
+
+        response = self.client.get(reverse('enrollment:enrollment_list'))
+
+        self.assertEqual(list(response.context['students']), [])
+        self.assertEqual(list(response.context['courses']), [])
+        self.assertNotContains(response, 'Unrelated Person')
+
+    def test_student_filter_options_match_name_prefixes(self):
+        Student.objects.create(first_name='Filbert', last_name='Other')
+        Student.objects.create(first_name='Someone', last_name='Else')
+
+        url = reverse('enrollment:enrollment_filter_options', kwargs={'kind': 'students'})
+        response = self.client.get(url, {'q': 'fil'})
+        self.assertCountEqual(
+            [option['text'] for option in response.json()['results']],
+            ['Filter Student', 'Filbert Other'],
+        )
+
+        response = self.client.get(url, {'q': 'fil stu'})
+        self.assertEqual(
+            response.json()['results'],
+            [{'id': self.student.pk, 'text': 'Filter Student'}],
+        )
+
+    def test_course_filter_options_match_name_prefix_case_insensitively(self):
+        self.assertEqual(self._course_option_names({'q': 'PUBL'}), ['Published Course'])
+        self.assertEqual(self._course_option_names({'q': 'course'}), [])
+
+    def test_filter_options_reject_unknown_kind(self):
+        response = self.client.get(
+            reverse('enrollment:enrollment_filter_options', kwargs={'kind': 'staff'})
+        )
+        self.assertEqual(response.status_code, 404)
+
+
+class EnrollmentListKeysetPaginationTest(TestCase):
+    def setUp(self):
+        User = get_user_model()
+        User.objects.create_user(
+            username='admin-pages',
+            email='admin-pages@test.com',
+            password='testpass123',
+            role='admin',
+            is_staff=True,
+        )
+        self.client.login(username='admin-pages', password='testpass123')
+
+        course = Course.objects.create(
+            name='Paged Course',
+            price=100.00,
+            status='published',
+            start_date=timezone.now().date(),
+            start_time=time(10, 0),
+        )
+        created_at = timezone.now()
+        for index in range(25):
+            student = Student.objects.create(first_name=f'Student{index:02d}', last_name='Paged')
+            enrollment = Enrollment.objects.create(student=student, course=course, status='confirmed')
+            # Several rows share a timestamp so the id tie-breaker is exercised
+            Enrollment.objects.filter(pk=enrollment.pk).update(
+                created_at=created_at - timezone.timedelta(minutes=index // 3)
+            )
+        self.expected_ids = list(
+            Enrollment.objects.order_by('-created_at', '-id').values_list('pk', flat=True)
+        )
+
+    def test_pages_walk_forward_and_back_without_gaps(self):
+        url = reverse('enrollment:enrollment_list')
+
+        first = self.client.get(url)
+        first_page = first.context['page_obj']
+        self.assertEqual([e.pk for e in first.context['enrollments']], self.expected_ids[:20])
+        self.assertTrue(first_page.has_next)
+        self.assertFalse(first_page.has_previous)
+
+        second = self.client.get(url, {'after': first_page.next_cursor})
+        second_page = second.context['page_obj']
+        self.assertEqual([e.pk for e in second.context['enrollments']], self.expected_ids[20:])
+        self.assertFalse(second_page.has_next)
+        self.assertTrue(second_page.has_previous)
+
+        back = self.client.get(url, {'before': second_page.previous_cursor})
+        self.assertEqual([e.pk for e in back.context['enrollments']], self.expected_ids[:20])
+
+    def test_invalid_cursor_falls_back_to_first_page(self):
+        response = self.client.get(reverse('enrollment:enrollment_list'), {'after': 'not-a-cursor'})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([e.pk for e in response.context['enrollments']], self.expected_ids[:20])
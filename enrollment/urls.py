@@ -6,6 +6,7 @@ app_name = 'enrollment'
 urlpatterns = [
     # Staff Enrollment Management (require authentication)
     path('enrollments/', views.EnrollmentListView.as_view(), name='enrollment_list'),
+    path('enrollments/filter-options/<str:kind>/', views.EnrollmentFilterOptionsAPIView.as_view(), name='enrollment_filter_options'),
     path('enrollments/export/', views.EnrollmentExportView.as_view(), name='enrollment_export'),
     path('enrollments/create/', views.EnrollmentCreateView.as_view(), name='enrollment_create'),
     path('enrollments/staff/create/', views.StaffEnrollmentCreateView.as_view(), name='staff_enrollment_create'),
@@ -13,6 +14,7 @@ urlpatterns = [
     path('enrollments/<int:pk>/', views.EnrollmentDetailView.as_view(), name='enrollment_detail'),
     path('enrollments/<int:pk>/edit/', views.EnrollmentUpdateView.as_view(), name='enrollment_update'),
     path('enrollments/<int:pk>/transfer/', views.EnrollmentTransferView.as_view(), name='enrollment_transfer'),
+    path('api/enrollments/bulk-transfer/', views.BulkEnrollmentTransferAPIView.as_view(), name='bulk_enrollment_transfer_api'),
     path('enrollments/<int:pk>/delete/', views.EnrollmentDeleteView.as_view(), name='enrollment_delete'),
     path('enrollments/<int:pk>/send-email/', views.SendEnrollmentEmailView.as_view(), name='send_enrollment_email'),
     path('enrollments/<int:pk>/invoice/', views.DownloadEnrollmentInvoiceView.as_view(), name='enrollment_invoice'),
@@ -23,6 +25,7 @@ urlpatterns = [
     # Price Adjustment API for early bird deadline handling
     path('api/check-price-adjustment/<int:enrollment_id>/', views.CheckPriceAdjustmentAPIView.as_view(), name='check_price_adjustment_api'),
     path('api/price-adjustment/<int:enrollment_id>/', views.ApplyPriceAdjustmentAPIView.as_view(), name='apply_price_adjustment_api'),
+    path('api/price-adjustment/batch/', views.BatchPriceAdjustmentAPIView.as_view(), name='batch_price_adjustment_api'),
     
     # Bulk Notification
     path('enrollments/bulk-notification/start/', views.bulk_enrollment_notification_start, name='bulk_notification_start'),
@@ -10,6 +10,7 @@ from django.views.generic import (
 )
 from django.urls import reverse_lazy, reverse
 from django.db.models import Q
+from django.db.models.functions import Lower
 from django.db import transaction
 from django.utils import timezone
 from django.http import JsonResponse, HttpResponse
@@ -28,6 +29,7 @@ from core.services.notification_queue import (
 from .services import EnrollmentAttendanceService
 from .services import AttendanceRosterService
 from core.utils.url_utils import get_public_site_domain
+from core.utils.pagination import paginate_keyset
 
 
 CURRENT_COURSE_VIEW = 'current'
@@ -241,19 +243,45 @@ class EnrollmentListView(LoginRequiredMixin, ListView):
 
         queryset = queryset.filter(course__status__in=resolved_filters['course_statuses'])
 
-        return queryset.order_by('-created_at')
-    
+        return queryset.order_by('-created_at', '-id')
+
+    def paginate_queryset(self, queryset, page_size):
+        """Seek on (created_at, id) so deep pages cost the same as the first one."""
+        page = paginate_keyset(
+            queryset,
+            field='created_at',
+            after=self.request.GET.get('after'),
+            before=self.request.GET.get('before'),
+            per_page=page_size,
+        )
+        return None, page, page.object_list, page.has_other_pages()
+
     def get_context_data(self, **kwargs):
         from core.models import OrganisationSettings
         context = super().get_context_data(**kwargs)
         resolved_filters = self.get_resolved_filters()
 
-        # Add filter options
-        context['students'] = Student.objects.all().order_by('first_name', 'last_name')
-
-        context['courses'] = Course.objects.filter(
-            status__in=resolved_filters['course_statuses']
-        ).order_by('name')
+        # Filter dropdowns are populated by the typeahead endpoint; only the
+        # current selections are rendered so Select2 can show them.
+        student_id = resolved_filters['student_id']
+        context['students'] = (
+            Student.objects.filter(pk=student_id).only('pk', 'first_name', 'last_name')
+            if student_id else Student.objects.none()
+        )
+        course_id = resolved_filters['course_id']
+        context['courses'] = (
+            Course.objects.filter(
+                pk=course_id,
+                status__in=resolved_filters['course_statuses'],
+            ).only('pk', 'name')
+            if course_id else Course.objects.none()
+        )
+        context['student_options_url'] = reverse(
+            'enrollment:enrollment_filter_options', kwargs={'kind': 'students'}
+        )
+        context['course_options_url'] = reverse(
+            'enrollment:enrollment_filter_options', kwargs={'kind': 'courses'}
+        )
         context['historical_course_status_choices'] = [
             (status_code, status_label)
             for status_code, status_label in Course.STATUS_CHOICES
@@ -304,6 +332,61 @@ class EnrollmentListView(LoginRequiredMixin, ListView):
         return context
 
 
+class EnrollmentFilterOptionsAPIView(LoginRequiredMixin, View):
+    """
+    Typeahead source for the enrolment list filter dropdowns.
+
+    Students match on word prefixes of their names through the
+    StudentSearchTerm index; courses match on a prefix of their lower-cased
+    name, answered as a range on the course_status_name_lower_idx index.
+    Results are capped instead of shipping every student/course to the
+    browser. Responses use the Select2 ``{results, pagination}`` shape.
+    """
+
+    RESULT_LIMIT = 20
+
+    def get(self, request, kind):
+        query = request.GET.get('q', '').strip()[:100]
+
+        if kind == 'students':
+            results = self._search_students(query)
+        elif kind == 'courses':
+            course_statuses = resolve_enrollment_course_filters(request)['course_statuses']
+            results = self._search_courses(query, course_statuses)
+        else:
+            return JsonResponse({'error': 'Unknown filter'}, status=404)
+
+        has_more = len(results) > self.RESULT_LIMIT
+        return JsonResponse({
+            'results': results[:self.RESULT_LIMIT],
+            'pagination': {'more': has_more},
+        })
+
+    def _search_students(self, query):
+        from students.services import StudentSearchService
+
+        queryset = Student.objects.only('pk', 'first_name', 'last_name')
+        # Every typed word must prefix a word of the first or the last name
+        queryset = StudentSearchService.filter_queryset(queryset, query, fields=('first_name', 'last_name'))
+
+        students = queryset.order_by('first_name', 'last_name', 'pk')[:self.RESULT_LIMIT + 1]
+        return [
+            {'id': student.pk, 'text': student.get_full_name()}
+            for student in students
+        ]
+
+    def _search_courses(self, query, course_statuses):
+        queryset = Course.objects.filter(status__in=course_statuses).annotate(
+            name_lower=Lower('name')
+        ).only('pk', 'name')
+        if query:
+            prefix = query.lower()
+            queryset = queryset.filter(name_lower__gte=prefix, name_lower__lt=f'{prefix}\uffff')
+
+        courses = queryset.order_by('name_lower', 'pk')[:self.RESULT_LIMIT + 1]
+        return [{'id': course.pk, 'text': course.name} for course in courses]
+
+
 class EnrollmentDetailView(LoginRequiredMixin, DetailView):
     model = Enrollment
     template_name = 'core/enrollments/detail.html'
@@ -777,8 +860,8 @@ class EnrollmentUpdateView(LoginRequiredMixin, UpdateView):
     def form_valid(self, form):
         from core.services.early_bird_pricing_service import EarlyBirdPricingService
 
-        # Get original status before saving
-        original_status = self.object.status
+        # Get original status before saving (the form has already applied the new one)
+        original_status = self.object.previous('status')
 
         # Save the enrollment
         enrollment = form.save()
@@ -1326,7 +1409,7 @@ class AttendanceMarkView(LoginRequiredMixin, View):
         # Add form to context
         if form is None:
             from .forms import BulkAttendanceForm
-            form = BulkAttendanceForm(class_instance=class_instance)
+            form = BulkAttendanceForm(class_instance=class_instance, roster_entries=roster_entries)
         context['form'] = form
         
         # Add student field data for easier template rendering
@@ -1659,6 +1742,89 @@ class ApplyPriceAdjustmentAPIView(LoginRequiredMixin, View):
             }, status=500)
 
 
+class BatchPriceAdjustmentAPIView(LoginRequiredMixin, View):
+    """
+    AJAX API endpoint to preview (GET) and apply (POST) early bird repricing
+    for every pending enrollment of a course or a term
+    """
+
+    @staticmethod
+    def _scope(data):
+        """Course queryset and action date from request parameters"""
+        from django.utils.dateparse import parse_date
+        from core.services.early_bird_pricing_service import EarlyBirdPricingService
+
+        course_id = data.get('course_id')
+        term_start = parse_date(data.get('term_start') or '')
+        term_end = parse_date(data.get('term_end') or '')
+        action_date = parse_date(data.get('action_date') or '')
+        courses = EarlyBirdPricingService.courses_for_scope(
+            course_id=int(course_id) if course_id not in (None, '') else None,
+            term_start=term_start,
+            term_end=term_end,
+        )
+        return courses, action_date
+
+    def get(self, request):
+        """Preview suggested prices"""
+        if not request.user.is_staff:
+            return JsonResponse({'error': 'Access denied'}, status=403)
+
+        try:
+            from core.services.early_bird_pricing_service import EarlyBirdPricingService
+
+            courses, action_date = self._scope(request.GET)
+            return JsonResponse(EarlyBirdPricingService.preview_batch_adjustment(courses, action_date))
+
+        except (TypeError, ValueError) as e:
+            return JsonResponse({'error': str(e)}, status=400)
+
+    def post(self, request):
+        """Apply suggested prices"""
+        if not request.user.is_staff:
+            return JsonResponse({'error': 'Access denied'}, status=403)
+
+        import json
+        try:
+            from core.services.early_bird_pricing_service import EarlyBirdPricingService
+
+            data = json.loads(request.body)
+            courses, action_date = self._scope(data)
+            enrollment_ids = data.get('enrollment_ids')
+            if enrollment_ids is not None:
+                enrollment_ids = [int(pk) for pk in enrollment_ids]
+
+            result = EarlyBirdPricingService.apply_batch_adjustment(
+                courses,
+                performed_by=request.user,
+                enrollment_ids=enrollment_ids,
+                action_date=action_date,
+            )
+            message = f"Price adjusted for {result['updated']} enrollment(s)"
+            if result['skipped_staff_decisions']:
+                message += (
+                    f"; {len(result['skipped_staff_decisions'])} with an individual staff pricing "
+                    f"decision left unchanged"
+                )
+            return JsonResponse({
+                'success': True,
+                'message': message,
+                **result,
+            })
+
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+        except (TypeError, ValueError) as e:
+            return JsonResponse({'error': str(e)}, status=400)
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error applying batch price adjustment: {str(e)}")
+            return JsonResponse({
+                'error': 'An unexpected error occurred while applying price adjustments.'
+            }, status=500)
+
+
 class DownloadEnrollmentInvoiceView(LoginRequiredMixin, View):
     """Generate and download PDF invoice for an enrollment."""
     
@@ -1821,6 +1987,76 @@ class EnrollmentTransferView(LoginRequiredMixin, UserPassesTestMixin, View):
         })
 
 
+class BulkEnrollmentTransferAPIView(LoginRequiredMixin, View):
+    """
+    AJAX API endpoint to transfer several enrollments to one course,
+    e.g. when merging an under-filled class
+    """
+
+    def post(self, request):
+        if not request.user.is_staff:
+            return JsonResponse({'error': 'Access denied'}, status=403)
+
+        import json
+        from django.core.exceptions import ValidationError
+        from django.utils.dateparse import parse_datetime
+        from .services import EnrollmentTransferService
+
+        try:
+            data = json.loads(request.body)
+        except json.JSONDecodeError:
+            return JsonResponse({'error': 'Invalid JSON data'}, status=400)
+
+        try:
+            enrollment_ids = [int(pk) for pk in data.get('enrollment_ids') or []]
+            target_course = Course.objects.filter(pk=int(data.get('target_course_id')), status='published').first()
+        except (TypeError, ValueError):
+            return JsonResponse({'error': 'enrollment_ids and target_course_id must be integers'}, status=400)
+        if not enrollment_ids:
+            return JsonResponse({'error': 'No enrollments selected'}, status=400)
+        if target_course is None:
+            return JsonResponse({'error': 'Target course not found or not published'}, status=404)
+
+        price_handling = data.get('price_handling', 'new_price')
+        if price_handling not in dict(EnrollmentTransferForm.PRICE_HANDLING_CHOICES):
+            return JsonResponse({'error': 'Invalid price handling option'}, status=400)
+
+        effective_at = timezone.now()
+        if data.get('transfer_effective_at'):
+            effective_at = parse_datetime(data['transfer_effective_at'])
+            if effective_at is None:
+                return JsonResponse({'error': 'Invalid transfer_effective_at'}, status=400)
+            if timezone.is_naive(effective_at):
+                effective_at = timezone.make_aware(effective_at)
+
+        try:
+            result = EnrollmentTransferService.transfer_enrollments(
+                enrollment_ids,
+                target_course,
+                effective_at=effective_at,
+                price_handling=price_handling,
+                force=bool(data.get('force_transfer')),
+                send_confirmation=bool(data.get('send_confirmation')),
+                performed_by=request.user,
+            )
+        except ValidationError as e:
+            return JsonResponse({'success': False, 'error': ' '.join(e.messages)}, status=400)
+        except Exception as e:
+            import logging
+            logger = logging.getLogger(__name__)
+            logger.error(f"Error during bulk transfer to course {target_course.pk}: {str(e)}")
+            return JsonResponse({
+                'success': False,
+                'error': 'An unexpected error occurred during the transfer.'
+            }, status=500)
+
+        return JsonResponse({
+            'success': True,
+            'message': f"Transferred {len(result['transferred'])} student(s) to {target_course.name}",
+            **result,
+        })
+
+
 @login_required
 def bulk_enrollment_notification_start(request):
     """Start bulk notification sending for enrollments and return task ID for progress tracking"""
@@ -0,0 +1,14 @@
+"""
+Django signals keeping the in-memory facility location index fresh
+"""
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+from .models import Facility
+
+
+@receiver(post_save, sender=Facility)
+@receiver(post_delete, sender=Facility)
+def invalidate_facility_location_index(sender, instance, **kwargs):
+    """Rebuild the GPS lookup index after any facility change"""
+    from core.utils.gps_utils import invalidate_facility_index
+    invalidate_facility_index()
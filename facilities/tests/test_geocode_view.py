@@ -0,0 +1,58 @@
+import json
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+from core.models import GeocodeCache
+from core.services.geocoding_service import StubGeocodingProvider
+
+
+@override_settings(GEOCODING_PROVIDER='stub')
+class AddressGeocodeViewTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='admin',
+            password='pass123',
+            role='admin',
+        )
+        self.client.force_login(self.user)
+
+    def post(self, address):
+        return self.client.post(
+            reverse('facilities:address_geocode'),
+            data=json.dumps({'address': address}),
+            content_type='application/json',
+        )
+
+    def test_geocodes_through_cache(self):
+        response = self.post('5 Hay St, Perth')
+
+        self.assertEqual(response.status_code, 200)
+        expected = StubGeocodingProvider().geocode('5 Hay St, Perth')
+        self.assertEqual(
+            response.json(),
+            {
+                'success': True,
+                'formatted_address': '5 Hay St, Perth',
+                'latitude': expected[0],
+                'longitude': expected[1],
+            },
+        )
+        entry = GeocodeCache.objects.get()
+        self.assertEqual(entry.formatted_address, '5 Hay St, Perth')
+
+        self.post('5 hay st perth')
+        self.assertEqual(GeocodeCache.objects.count(), 1)
+
+    def test_missing_address_is_rejected(self):
+        response = self.post('  ')
+
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(GeocodeCache.objects.exists())
+
+    @override_settings(GEOCODING_PROVIDER='google', GOOGLE_MAPS_API_KEY=None)
+    def test_unconfigured_provider(self):
+        response = self.post('5 Hay St, Perth')
+
+        self.assertEqual(response.status_code, 500)
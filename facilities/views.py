@@ -8,8 +8,6 @@ from django.conf import settings
 from django.http import JsonResponse
 from django.views.decorators.csrf import csrf_exempt
 from django.utils.decorators import method_decorator
-import os
-import requests
 import json
 
 from .models import Facility, Classroom
@@ -206,9 +204,11 @@ class ClassroomUpdateView(AdminRequiredMixin, UpdateView):
 @method_decorator(csrf_exempt, name='dispatch')
 class AddressGeocodeView(AdminRequiredMixin, View):
     """
-    AJAX endpoint for address geocoding using Google Maps API
+    AJAX endpoint for address geocoding through the cached GeocodingService
     """
     def post(self, request, *args, **kwargs):
+        from core.services.geocoding_service import GeocodingService
+
         try:
             data = json.loads(request.body)
             address = data.get('address', '').strip()
@@ -216,44 +216,27 @@ class AddressGeocodeView(AdminRequiredMixin, View):
             if not address:
                 return JsonResponse({'error': 'Address is required'}, status=400)
             
-            # Get Google Maps API key
-            api_key = os.getenv('GOOGLE_MAPS_API_KEY')
-            if not api_key:
-                return JsonResponse({'error': 'Google Maps API not configured'}, status=500)
-            
-            # Call Google Geocoding API
-            url = 'https://maps.googleapis.com/maps/api/geocode/json'
-            params = {
-                'address': address,
-                'key': api_key,
-                'region': 'au',
-                'components': 'country:AU'
-            }
+            provider = GeocodingService.get_provider()
+            if not provider.available:
+                return JsonResponse({'error': 'Geocoding provider not configured'}, status=500)
             
-            response = requests.get(url, params=params, timeout=10)
-            data = response.json()
+            entry = GeocodingService.locate(address, provider=provider)
             
-            if data['status'] == 'OK' and data['results']:
-                result = data['results'][0]
-                location = result['geometry']['location']
-                
-                return JsonResponse({
-                    'success': True,
-                    'formatted_address': result['formatted_address'],
-                    'latitude': location['lat'],
-                    'longitude': location['lng']
-                })
-            elif data['status'] == 'ZERO_RESULTS':
+            if entry is None:
+                return JsonResponse({'error': 'Geocoding failed. Please try again later.'}, status=503)
+            if entry.coordinates is None:
                 return JsonResponse({'error': 'No results found for this address'}, status=404)
-            elif data['status'] == 'OVER_QUERY_LIMIT':
-                return JsonResponse({'error': 'API quota exceeded. Please try again later.'}, status=429)
-            else:
-                return JsonResponse({'error': f"Geocoding failed: {data['status']}"}, status=400)
+            
+            latitude, longitude = entry.coordinates
+            return JsonResponse({
+                'success': True,
+                'formatted_address': entry.formatted_address or address,
+                'latitude': latitude,
+                'longitude': longitude
+            })
                 
         except json.JSONDecodeError:
             return JsonResponse({'error': 'Invalid JSON data'}, status=400)
-        except requests.RequestException as e:
-            return JsonResponse({'error': f'Network error: {str(e)}'}, status=500)
         except Exception as e:
             return JsonResponse({'error': f'Server error: {str(e)}'}, status=500)
 
@@ -0,0 +1,70 @@
+import csv
+
+from django.core.management.base import BaseCommand
+from students.services import StudentMatchingService
+
+
+class Command(BaseCommand):
+    help = 'Report likely duplicate students using the normalised name/phone/email match keys'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--include-inactive',
+            action='store_true',
+            help='Include inactive students in the report'
+        )
+        parser.add_argument(
+            '--csv',
+            type=str,
+            help='Also write the report to this CSV file'
+        )
+
+    def handle(self, *args, **options):
+        groups = StudentMatchingService.find_duplicate_groups(
+            include_inactive=options['include_inactive']
+        )
+
+        if not groups:
+            self.stdout.write(self.style.SUCCESS('No duplicate students found'))
+            return
+
+        rows = []
+        for group_number, group in enumerate(groups, start=1):
+            match_types = ', '.join(group['match_types'])
+            self.stdout.write(
+                self.style.WARNING(f"Group {group_number}: {group['name_key']} ({match_types})")
+            )
+            for student in group['students']:
+                self.stdout.write(
+                    f"  #{student.pk} {student.get_full_name()} | "
+                    f"DOB: {student.birth_date or '-'} | "
+                    f"{student.contact_email or '-'} | {student.contact_phone or '-'}"
+                    f"{'' if student.is_active else ' | inactive'}"
+                )
+                rows.append([
+                    group_number,
+                    match_types,
+                    student.pk,
+                    student.first_name,
+                    student.last_name,
+                    student.birth_date.isoformat() if student.birth_date else '',
+                    student.contact_email,
+                    student.contact_phone,
+                    student.is_active,
+                ])
+
+        if options.get('csv'):
+            with open(options['csv'], 'w', newline='', encoding='utf-8') as csv_file:
+                writer = csv.writer(csv_file)
+                writer.writerow([
+                    'group', 'match_types', 'student_id', 'first_name', 'last_name',
+                    'birth_date', 'contact_email', 'contact_phone', 'is_active',
+                ])
+                writer.writerows(rows)
+            self.stdout.write(f"CSV written to {options['csv']}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Found {len(groups)} duplicate groups covering {len(rows)} students'
+            )
+        )
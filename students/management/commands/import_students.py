@@ -1,46 +1,85 @@
 import csv
+import json
+import os
 import re
+import time
 from datetime import datetime
 from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
 from django.core.exceptions import ValidationError
 from students.models import Student, StudentActivity
+from students.services import StudentMatchingService, StudentSearchService
 from django.utils import timezone
 
 
 class Command(BaseCommand):
     help = 'Import students from TSV file into the Student model'
 
-    def add_arguments(self, parser):
-        parser.add_argument(
-            '--file',
-            type=str,
-            default='students.tsv',
-            help='Path to the TSV file to import (default: students.tsv)'
-        )
-        parser.add_argument(
-            '--dry-run',
-            action='store_true',
-            help='Preview import without actually saving data'
-        )
-
     def handle(self, *args, **options):
         file_path = options['file']
         dry_run = options['dry_run']
+        self.verbosity = options.get('verbosity', 1)
+        self.chunk_size = max(1, options['chunk_size'])
+        self.progress_path = options.get('progress_file') or f'{file_path}.progress'
 
         if dry_run:
             self.stdout.write(self.style.WARNING('DRY RUN MODE - No data will be saved'))
 
+        try:
+            self.file_fingerprint = self.fingerprint(file_path)
+        except FileNotFoundError:
+            raise CommandError(f'File not found: {file_path}')
+
+        resume_after = 0
+        if options['resume'] and not dry_run:
+            resume_after = self.read_progress()
+            if resume_after:
+                self.stdout.write(f'从第 {resume_after + 1} 行继续导入')
+
         try:
             with open(file_path, 'r', encoding='utf-8') as file:
-                self.import_students(file, dry_run)
+                self.import_students(file, dry_run, resume_after=resume_after)
         except FileNotFoundError:
             raise CommandError(f'File not found: {file_path}')
         except Exception as e:
             raise CommandError(f'Error reading file: {str(e)}')
 
-    def import_students(self, file, dry_run=False):
-        """Import students from TSV file"""
+        # Every chunk is committed, so the checkpoint must not leak into a
+        # later --resume run against a different export
+        if not dry_run:
+            self.clear_progress()
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--file',
+            type=str,
+            default='students.tsv',
+            help='Path to the TSV file to import (default: students.tsv)'
+        )
+        parser.add_argument(
+            '--dry-run',
+            action='store_true',
+            help='Preview import without actually saving data'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=500,
+            help='Rows validated and written per transaction (default: 500)'
+        )
+        parser.add_argument(
+            '--resume',
+            action='store_true',
+            help='Skip rows already committed by a previous interrupted run'
+        )
+        parser.add_argument(
+            '--progress-file',
+            type=str,
+            help='Checkpoint file used by --resume (default: <file>.progress)'
+        )
+
+    def import_students(self, file, dry_run=False, resume_after=0):
+        """Stream the TSV and import it chunk by chunk"""
         reader = csv.reader(file, delimiter='\t')
 
         # Skip header row
@@ -54,70 +93,176 @@ class Command(BaseCommand):
         }
 
         errors = []
+        started = time.perf_counter()
 
+        # Existing students are loaded once; rows queued in this run are added
+        # too so duplicates inside the file are caught as well
+        self.match_index = self.load_match_index()
+
+        chunk = []
         for row_num, row in enumerate(reader, start=2):  # Start from 2 since we skipped header
+            if row_num <= resume_after:
+                continue
             if not row or len(row) < 6:  # Skip empty or incomplete rows
                 continue
 
-            stats['total'] += 1
+            chunk.append((row_num, row))
+            if len(chunk) >= self.chunk_size:
+                self.process_chunk(chunk, stats, errors, dry_run)
+                chunk = []
 
-            try:
-                student_name, dob, guardian_name, phone, address, email = row[:6]
+        if chunk:
+            self.process_chunk(chunk, stats, errors, dry_run)
 
-                # Skip empty names
-                if not student_name.strip():
-                    stats['skipped'] += 1
-                    continue
+        # Print summary
+        self.print_summary(stats, errors, dry_run)
+        self.print_throughput(stats, time.perf_counter() - started)
+
+    def load_match_index(self):
+        """Build the in-memory duplicate index from existing students"""
+        index = set()
+        for name_key, birth_date, email, phone in Student.objects.exclude(
+            match_name_key=''
+        ).values_list('match_name_key', 'birth_date', 'match_email', 'match_phone').iterator():
+            index.update(self.match_keys(name_key, birth_date, email, phone))
+        return index
+
+    @staticmethod
+    def match_keys(name_key, birth_date, email, phone):
+        keys = []
+        if birth_date:
+            keys.append(('dob', name_key, birth_date))
+        if email:
+            keys.append(('email', name_key, email))
+        if phone:
+            keys.append(('phone', name_key, phone))
+        return keys
+
+    def validate_row(self, row_num, row):
+        """Parse and validate one row; returns an unsaved Student or None to skip"""
+        student_name, dob, guardian_name, phone, address, email = row[:6]
+
+        # Skip empty names
+        if not student_name.strip():
+            return None
+
+        # Parse student data
+        parsed_data = self.parse_student_data(
+            student_name, dob, guardian_name, phone, address, email
+        )
+        if not parsed_data:
+            return None
+
+        student = StudentMatchingService.apply_match_keys(Student(**parsed_data))
+        student.full_clean(validate_unique=False, validate_constraints=False)
+        return student
 
-                # Parse student data
-                parsed_data = self.parse_student_data(
-                    student_name, dob, guardian_name, phone, address, email
-                )
+    def process_chunk(self, chunk, stats, errors, dry_run):
+        """Validate a chunk, resolve duplicates in memory and bulk write it"""
+        new_students = []
 
-                if not parsed_data:
+        for row_num, row in chunk:
+            stats['total'] += 1
+
+            try:
+                student = self.validate_row(row_num, row)
+                if student is None:
                     stats['skipped'] += 1
                     continue
 
                 # Check for existing student
-                existing_student = self.find_existing_student(parsed_data)
-                if existing_student:
-                    self.stdout.write(
-                        f"第 {row_num} 行: 学生 {parsed_data['first_name']} {parsed_data['last_name']} 已存在，跳过"
-                    )
+                if self.find_existing_student(student):
+                    if self.verbosity > 1:
+                        self.stdout.write(
+                            f"第 {row_num} 行: 学生 {student.first_name} {student.last_name} 已存在，跳过"
+                        )
                     stats['skipped'] += 1
                     continue
 
-                if not dry_run:
-                    # Create student
-                    with transaction.atomic():
-                        student = Student.objects.create(**parsed_data)
-
-                        # Create activity record
-                        StudentActivity.create_activity(
-                            student=student,
-                            activity_type='other',
-                            title='Student imported from TSV',
-                            description=f'Student data imported from TSV file on {timezone.now().strftime("%Y-%m-%d %H:%M:%S")}'
-                        )
+                self.match_index.update(self.match_keys(
+                    student.match_name_key, student.birth_date, student.match_email, student.match_phone
+                ))
+                new_students.append(student)
 
-                        self.stdout.write(
-                            f"第 {row_num} 行: 成功导入学生 {student.get_full_name()}"
-                        )
-                else:
+                if dry_run and self.verbosity > 1:
                     self.stdout.write(
-                        f"第 {row_num} 行: 将导入学生 {parsed_data['first_name']} {parsed_data['last_name']}"
+                        f"第 {row_num} 行: 将导入学生 {student.first_name} {student.last_name}"
                     )
 
-                stats['success'] += 1
-
+            except ValidationError as e:
+                error_msg = f"第 {row_num} 行错误: {'; '.join(e.messages)}"
+                errors.append(error_msg)
+                stats['errors'] += 1
+                self.stdout.write(self.style.ERROR(error_msg))
             except Exception as e:
                 error_msg = f"第 {row_num} 行错误: {str(e)}"
                 errors.append(error_msg)
                 stats['errors'] += 1
                 self.stdout.write(self.style.ERROR(error_msg))
 
-        # Print summary
-        self.print_summary(stats, errors, dry_run)
+        first_row, last_row = chunk[0][0], chunk[-1][0]
+
+        if not dry_run and new_students:
+            imported_at = timezone.now().strftime("%Y-%m-%d %H:%M:%S")
+            with transaction.atomic():
+                created = Student.objects.bulk_create(new_students)
+                StudentActivity.objects.bulk_create([
+                    StudentActivity(
+                        student=student,
+                        activity_type='other',
+                        title='Student imported from TSV',
+                        description=f'Student data imported from TSV file on {imported_at}'
+                    )
+                    for student in created
+                ])
+                StudentSearchService.index_new_students(created)
+
+        if not dry_run:
+            self.write_progress(last_row)
+
+        stats['success'] += len(new_students)
+        self.stdout.write(
+            f"第 {first_row}-{last_row} 行: {'将导入' if dry_run else '成功导入'} {len(new_students)} 名学生"
+        )
+
+    @staticmethod
+    def fingerprint(file_path):
+        """Size and mtime of the source file, stored with the checkpoint"""
+        stat = os.stat(file_path)
+        return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns}
+
+    def read_progress(self):
+        try:
+            with open(self.progress_path, 'r', encoding='utf-8') as progress_file:
+                progress = json.load(progress_file)
+            last_row = int(progress.get('last_row', 0))
+        except (FileNotFoundError, ValueError, TypeError, AttributeError):
+            return 0
+
+        if progress.get('file') != self.file_fingerprint:
+            self.stdout.write(self.style.WARNING('进度文件与当前导入文件不匹配，忽略断点并从头导入'))
+            return 0
+        return last_row
+
+    def write_progress(self, last_row):
+        with open(self.progress_path, 'w', encoding='utf-8') as progress_file:
+            json.dump({
+                'last_row': last_row,
+                'file': self.file_fingerprint,
+                'updated_at': timezone.now().isoformat(),
+            }, progress_file)
+
+    def clear_progress(self):
+        try:
+            os.remove(self.progress_path)
+        except FileNotFoundError:
+            pass
+
+    def print_throughput(self, stats, elapsed):
+        rate = stats['total'] / elapsed if elapsed else 0
+        self.stdout.write(
+            f"耗时: {elapsed:.2f}s, 吞吐量: {rate:.0f} 行/秒 (每批 {self.chunk_size} 行)"
+        )
 
     def parse_student_data(self, student_name, dob, guardian_name, phone, address, email):
         """Parse and validate student data from TSV row"""
@@ -239,37 +384,16 @@ class Command(BaseCommand):
 
         return clean_email
 
-    def find_existing_student(self, data):
-        """Check if student already exists"""
-        try:
-            # Try to find by exact name and birth date match
-            if data['birth_date']:
-                return Student.objects.filter(
-                    first_name__iexact=data['first_name'],
-                    last_name__iexact=data['last_name'],
-                    birth_date=data['birth_date']
-                ).first()
-
-            # Try to find by exact name and email match
-            if data['contact_email']:
-                return Student.objects.filter(
-                    first_name__iexact=data['first_name'],
-                    last_name__iexact=data['last_name'],
-                    contact_email__iexact=data['contact_email']
-                ).first()
-
-            # Try to find by exact name and phone match
-            if data['contact_phone']:
-                return Student.objects.filter(
-                    first_name__iexact=data['first_name'],
-                    last_name__iexact=data['last_name'],
-                    contact_phone=data['contact_phone']
-                ).first()
-
-        except Exception:
-            pass
-
-        return None
+    def find_existing_student(self, student):
+        """Check the in-memory index for an existing student"""
+        # Same precedence as before: DOB, then email, then phone
+        if student.birth_date:
+            return ('dob', student.match_name_key, student.birth_date) in self.match_index
+        if student.match_email:
+            return ('email', student.match_name_key, student.match_email) in self.match_index
+        if student.match_phone:
+            return ('phone', student.match_name_key, student.match_phone) in self.match_index
+        return False
 
     def print_summary(self, stats, errors, dry_run):
         """Print import summary"""
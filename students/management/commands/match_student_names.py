@@ -1,9 +1,8 @@
 import csv
-import re
-import difflib
+import time
 from django.core.management.base import BaseCommand, CommandError
-from django.db.models import Q
 from students.models import Student
+from students.name_matching import DEFAULT_CANDIDATE_LIMIT, NameMatchIndex, match_names, normalize_name
 
 
 class Command(BaseCommand):
@@ -33,37 +32,62 @@ class Command(BaseCommand):
             default=0.6,
             help='Minimum confidence threshold for fuzzy matching (0.0-1.0, default: 0.6)'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='Number of worker processes used for fuzzy scoring (default: 1)'
+        )
+        parser.add_argument(
+            '--candidates',
+            type=int,
+            default=DEFAULT_CANDIDATE_LIMIT,
+            help=f'Trigram candidates scored per name (default: {DEFAULT_CANDIDATE_LIMIT})'
+        )
 
     def handle(self, *args, **options):
         input_file = options['input']
         output_file = options['output']
         dry_run = options['dry_run']
         threshold = options['threshold']
+        workers = options['workers']
+        candidate_limit = options['candidates']
 
         if dry_run:
             self.stdout.write(self.style.WARNING('DRY RUN MODE - No output file will be created'))
 
         try:
-            # Load all students once for efficiency
-            self.students = list(Student.objects.filter(is_active=True))
-            self.student_names = [(s.get_full_name(), s) for s in self.students]
+            timings = {}
 
-            self.stdout.write(f'加载了 {len(self.students)} 名活跃学生进行匹配')
+            # Load all students once, as plain (id, name) pairs the workers can share
+            started = time.perf_counter()
+            self.student_names = [
+                (student.id, student.get_full_name())
+                for student in Student.objects.filter(is_active=True).only('id', 'first_name', 'last_name')
+            ]
+            timings['load'] = time.perf_counter() - started
+
+            self.stdout.write(f'加载了 {len(self.student_names)} 名活跃学生进行匹配')
+
+            started = time.perf_counter()
+            self.index = NameMatchIndex(self.student_names, candidate_limit)
+            timings['index'] = time.perf_counter() - started
 
             with open(input_file, 'r', encoding='utf-8') as file:
-                results = self.match_names(file, threshold)
+                results = self.match_names(file, threshold, workers, candidate_limit, timings)
 
             if not dry_run:
                 self.write_results(results, output_file)
 
             self.print_summary(results, dry_run)
+            self.print_timings(timings, len(results), workers)
 
         except FileNotFoundError:
             raise CommandError(f'文件未找到: {input_file}')
         except Exception as e:
             raise CommandError(f'处理文件时出错: {str(e)}')
 
-    def match_names(self, file, threshold):
+    def match_names(self, file, threshold, workers=1, candidate_limit=DEFAULT_CANDIDATE_LIMIT, timings=None):
         """Match names from input file with student database"""
         reader = csv.reader(file, delimiter='\t')
 
@@ -77,15 +101,28 @@ class Command(BaseCommand):
             file.seek(0)
             reader = csv.reader(file, delimiter='\t')
 
-        results = []
-
-        for row_num, row in enumerate(reader, start=1):
-            if not row or not row[0].strip():
-                continue
-
-            poster_name = row[0].strip()
-            match_result = self.find_best_match(poster_name, threshold)
+        rows = [
+            (row_num, row[0].strip())
+            for row_num, row in enumerate(reader, start=1)
+            if row and row[0].strip()
+        ]
+
+        started = time.perf_counter()
+        if workers > 1:
+            matches = match_names(
+                [poster_name for _, poster_name in rows],
+                self.student_names,
+                threshold,
+                workers=workers,
+                candidate_limit=candidate_limit,
+            )
+        else:
+            matches = [self.index.find_best_match(poster_name, threshold) for _, poster_name in rows]
+        if timings is not None:
+            timings['match'] = time.perf_counter() - started
 
+        results = []
+        for (row_num, poster_name), match_result in zip(rows, matches):
             results.append({
                 'row_num': row_num,
                 'poster_name': poster_name,
@@ -110,159 +147,11 @@ class Command(BaseCommand):
 
     def find_best_match(self, poster_name, threshold):
         """Find the best matching student name using multiple strategies"""
-
-        # Strategy 1: Exact match
-        exact_match = self.exact_match(poster_name)
-        if exact_match:
-            return exact_match
-
-        # Strategy 2: Normalized match (case insensitive, strip spaces/punctuation)
-        normalized_match = self.normalized_match(poster_name)
-        if normalized_match:
-            return normalized_match
-
-        # Strategy 3: Fuzzy match with confidence scoring
-        fuzzy_match = self.fuzzy_match(poster_name, threshold)
-        if fuzzy_match:
-            return fuzzy_match
-
-        # Strategy 4: Partial match (first name or last name)
-        partial_match = self.partial_match(poster_name, threshold)
-        if partial_match:
-            return partial_match
-
-        # No match found
-        return {
-            'matched_name': '',
-            'student_id': '',
-            'match_type': 'none',
-            'confidence_score': 0.0
-        }
-
-    def exact_match(self, poster_name):
-        """Find exact name match"""
-        for student_name, student in self.student_names:
-            if poster_name == student_name:
-                return {
-                    'matched_name': student_name,
-                    'student_id': student.id,
-                    'match_type': 'exact',
-                    'confidence_score': 1.0
-                }
-        return None
-
-    def normalized_match(self, poster_name):
-        """Find match after normalizing names (case, spaces, punctuation)"""
-        normalized_poster = self.normalize_name(poster_name)
-
-        for student_name, student in self.student_names:
-            normalized_student = self.normalize_name(student_name)
-            if normalized_poster == normalized_student:
-                return {
-                    'matched_name': student_name,
-                    'student_id': student.id,
-                    'match_type': 'normalized',
-                    'confidence_score': 0.95
-                }
-        return None
-
-    def fuzzy_match(self, poster_name, threshold):
-        """Find fuzzy match using string similarity"""
-        best_match = None
-        best_score = 0.0
-
-        normalized_poster = self.normalize_name(poster_name)
-
-        for student_name, student in self.student_names:
-            normalized_student = self.normalize_name(student_name)
-
-            # Calculate similarity using SequenceMatcher
-            similarity = difflib.SequenceMatcher(None, normalized_poster, normalized_student).ratio()
-
-            if similarity > best_score and similarity >= threshold:
-                best_score = similarity
-                best_match = {
-                    'matched_name': student_name,
-                    'student_id': student.id,
-                    'match_type': 'fuzzy',
-                    'confidence_score': similarity
-                }
-
-        return best_match
-
-    def partial_match(self, poster_name, threshold):
-        """Find partial match (first name or last name)"""
-        name_parts = poster_name.strip().split()
-        if not name_parts:
-            return None
-
-        best_match = None
-        best_score = 0.0
-
-        for student_name, student in self.student_names:
-            student_parts = student_name.split()
-
-            # Check if any part of poster name matches any part of student name
-            for poster_part in name_parts:
-                for student_part in student_parts:
-                    if len(poster_part) >= 3 and len(student_part) >= 3:  # Only match meaningful parts
-                        similarity = difflib.SequenceMatcher(
-                            None,
-                            self.normalize_name(poster_part),
-                            self.normalize_name(student_part)
-                        ).ratio()
-
-                        if similarity > best_score and similarity >= threshold:
-                            best_score = similarity
-                            best_match = {
-                                'matched_name': student_name,
-                                'student_id': student.id,
-                                'match_type': 'partial',
-                                'confidence_score': similarity * 0.8  # Reduce confidence for partial matches
-                            }
-
-        return best_match
+        return self.index.find_best_match(poster_name, threshold)
 
     def normalize_name(self, name):
         """Normalize name for comparison (lowercase, remove spaces and punctuation)"""
-        if not name:
-            return ''
-
-        # Convert to lowercase and remove extra spaces
-        normalized = re.sub(r'\s+', ' ', name.lower().strip())
-
-        # Remove common punctuation
-        normalized = re.sub(r'[^\w\s]', '', normalized)
-
-        # Handle common name variations
-        name_variations = {
-            'katherine': 'kate',
-            'katharine': 'kate',
-            'catherine': 'kate',
-            'william': 'bill',
-            'william': 'will',
-            'robert': 'bob',
-            'richard': 'rick',
-            'richard': 'dick',
-            'elizabeth': 'liz',
-            'elizabeth': 'beth',
-            'margaret': 'meg',
-            'margaret': 'maggie',
-            'christopher': 'chris',
-            'michael': 'mike',
-            'michelle': 'mich',
-            'stephanie': 'steph',
-            'rebecca': 'becca',
-            'rebecca': 'becky',
-            'patricia': 'pat',
-            'patricia': 'patty'
-        }
-
-        # Apply name variations
-        for full_name, short_name in name_variations.items():
-            normalized = normalized.replace(full_name, short_name)
-
-        return normalized
+        return normalize_name(name)
 
     def write_results(self, results, output_file):
         """Write matching results to output TSV file"""
@@ -333,4 +222,13 @@ class Command(BaseCommand):
                 self.stdout.write(f"  {match_type}: {count}")
 
         if dry_run and matched > 0:
-            self.stdout.write('\n' + self.style.WARNING('要生成结果文件，请运行命令时不带 --dry-run 参数'))
\ No newline at end of file
+            self.stdout.write('\n' + self.style.WARNING('要生成结果文件，请运行命令时不带 --dry-run 参数'))
+
+    def print_timings(self, timings, total, workers):
+        """Print per-phase timing and throughput"""
+        match_seconds = timings.get('match', 0)
+        rate = total / match_seconds if match_seconds else 0
+        self.stdout.write('\n耗时统计:')
+        self.stdout.write(f"  加载学生: {timings.get('load', 0):.2f}s")
+        self.stdout.write(f"  构建索引: {timings.get('index', 0):.2f}s")
+        self.stdout.write(f"  匹配 ({workers} 进程): {match_seconds:.2f}s ({rate:.0f} 行/秒)")
@@ -0,0 +1,25 @@
+import time
+
+from django.core.management.base import BaseCommand
+from students.services import StudentSearchService
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the student search index (needed after bulk imports that bypass signals)'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='Number of index rows written per batch (default: 1000)'
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        indexed = StudentSearchService.rebuild_index(batch_size=options['batch_size'])
+        elapsed = time.perf_counter() - started
+
+        self.stdout.write(
+            self.style.SUCCESS(f'Indexed {indexed} students in {elapsed:.2f}s')
+        )
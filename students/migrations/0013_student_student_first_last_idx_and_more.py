@@ -0,0 +1,22 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('enrollment', '0009_enrollment_enrollment_created_id_idx'),
+        ('students', '0012_auto_20250919_0019'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['first_name', 'last_name'], name='student_first_last_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['last_name', 'first_name'], name='student_last_first_idx'),
+        ),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.5 on 2026-10-18 21:59
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_search_terms(apps, schema_editor):
+    from students.services import StudentSearchService
+
+    Student = apps.get_model('students', 'Student')
+    StudentSearchTerm = apps.get_model('students', 'StudentSearchTerm')
+
+    pending = []
+    for student in Student.objects.all().iterator(chunk_size=1000):
+        pending.extend(
+            StudentSearchTerm(student_id=student.pk, term=term, field=field)
+            for term, field in StudentSearchService.build_terms(student)
+        )
+        if len(pending) >= 1000:
+            StudentSearchTerm.objects.bulk_create(pending)
+            pending = []
+    if pending:
+        StudentSearchTerm.objects.bulk_create(pending)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0013_student_student_first_last_idx_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StudentSearchTerm',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=100, verbose_name='Search Term')),
+                ('field', models.CharField(choices=[('first_name', 'First Name'), ('last_name', 'Last Name'), ('guardian_name', 'Guardian Name'), ('contact_email', 'Contact Email'), ('contact_phone', 'Contact Phone')], max_length=20, verbose_name='Source Field')),
+                ('student', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='search_terms', to='students.student', verbose_name='Student')),
+            ],
+            options={
+                'verbose_name': 'Student Search Term',
+                'verbose_name_plural': 'Student Search Terms',
+                'indexes': [models.Index(fields=['term', 'student'], name='student_search_term_idx')],
+            },
+        ),
+        migrations.RunPython(populate_search_terms, migrations.RunPython.noop),
+    ]
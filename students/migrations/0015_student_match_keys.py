@@ -0,0 +1,48 @@
+# Generated by Django 5.2.5 on 2026-10-18 22:01
+
+from django.db import migrations, models
+
+
+def populate_match_keys(apps, schema_editor):
+    from students.services import StudentMatchingService
+
+    Student = apps.get_model('students', 'Student')
+    batch = []
+    for student in Student.objects.all().iterator(chunk_size=1000):
+        batch.append(StudentMatchingService.apply_match_keys(student))
+        if len(batch) >= 1000:
+            Student.objects.bulk_update(batch, ['match_name_key', 'match_phone', 'match_email'])
+            batch = []
+    if batch:
+        Student.objects.bulk_update(batch, ['match_name_key', 'match_phone', 'match_email'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('enrollment', '0009_enrollment_enrollment_created_id_idx'),
+        ('students', '0014_studentsearchterm'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='student',
+            name='match_email',
+            field=models.CharField(blank=True, editable=False, max_length=254, verbose_name='Email Match Key'),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='match_name_key',
+            field=models.CharField(blank=True, editable=False, help_text='Case-folded, accent-stripped "first | last" used for duplicate matching', max_length=101, verbose_name='Name Match Key'),
+        ),
+        migrations.AddField(
+            model_name='student',
+            name='match_phone',
+            field=models.CharField(blank=True, editable=False, max_length=20, verbose_name='Phone Match Key'),
+        ),
+        migrations.AddIndex(
+            model_name='student',
+            index=models.Index(fields=['match_name_key', 'is_active'], name='student_match_name_idx'),
+        ),
+        migrations.RunPython(populate_match_keys, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.5 on 2026-10-19 00:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('students', '0015_student_match_keys'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='student',
+            name='student_last_first_idx',
+        ),
+    ]
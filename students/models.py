@@ -332,6 +332,27 @@ class Student(models.Model):
         default=True,
         verbose_name='Active Status'
     )
+
+    # Normalised duplicate-detection keys (maintained in save)
+    match_name_key = models.CharField(
+        max_length=101,
+        blank=True,
+        editable=False,
+        verbose_name='Name Match Key',
+        help_text='Case-folded, accent-stripped "first | last" used for duplicate matching'
+    )
+    match_phone = models.CharField(
+        max_length=20,
+        blank=True,
+        editable=False,
+        verbose_name='Phone Match Key'
+    )
+    match_email = models.CharField(
+        max_length=254,
+        blank=True,
+        editable=False,
+        verbose_name='Email Match Key'
+    )
     
     created_at = models.DateTimeField(
         auto_now_add=True,
@@ -342,12 +363,32 @@ class Student(models.Model):
         verbose_name='Updated At'
     )
     
+    MATCH_KEY_SOURCE_FIELDS = {'first_name', 'last_name', 'contact_phone', 'contact_email'}
+
     class Meta:
         verbose_name = 'Student'
         verbose_name_plural = 'Students'
+        indexes = [
+            # Name-ordered typeahead pages
+            models.Index(fields=['first_name', 'last_name'], name='student_first_last_idx'),
+            # Duplicate detection: one lookup returns every candidate for a name
+            models.Index(fields=['match_name_key', 'is_active'], name='student_match_name_idx'),
+        ]
     
     def __str__(self):
         return f"{self.first_name} {self.last_name}"
+
+    def save(self, *args, **kwargs):
+        """Refresh the normalised match keys before writing"""
+        from .services import StudentMatchingService
+
+        StudentMatchingService.apply_match_keys(self)
+
+        update_fields = kwargs.get('update_fields')
+        if update_fields is not None and self.MATCH_KEY_SOURCE_FIELDS.intersection(update_fields):
+            kwargs['update_fields'] = set(update_fields) | {'match_name_key', 'match_phone', 'match_email'}
+
+        super().save(*args, **kwargs)
     
     def get_contact_email(self):
         """Get primary contact email (student or guardian based on age)"""
@@ -536,3 +577,46 @@ class StudentActivity(models.Model):
             description=description or '',
             **kwargs
         )
+
+
+class StudentSearchTerm(models.Model):
+    """
+    Normalised word index backing student search.
+
+    One row per case-folded, accent-stripped word of a searchable student
+    field. Rows are maintained by signals on Student, so lookups become an
+    indexed prefix range scan instead of LIKE scans over several columns.
+    """
+    FIELD_CHOICES = [
+        ('first_name', 'First Name'),
+        ('last_name', 'Last Name'),
+        ('guardian_name', 'Guardian Name'),
+        ('contact_email', 'Contact Email'),
+        ('contact_phone', 'Contact Phone'),
+    ]
+
+    student = models.ForeignKey(
+        Student,
+        on_delete=models.CASCADE,
+        related_name='search_terms',
+        verbose_name='Student'
+    )
+    term = models.CharField(
+        max_length=100,
+        verbose_name='Search Term'
+    )
+    field = models.CharField(
+        max_length=20,
+        choices=FIELD_CHOICES,
+        verbose_name='Source Field'
+    )
+
+    class Meta:
+        verbose_name = 'Student Search Term'
+        verbose_name_plural = 'Student Search Terms'
+        indexes = [
+            models.Index(fields=['term', 'student'], name='student_search_term_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.term} ({self.field})"
@@ -0,0 +1,236 @@
+"""
+Candidate-indexed fuzzy name matching for the match_student_names command.
+
+The old matcher compared every input name with every student (and every name
+part with every name part) through difflib. Here students are loaded once into
+an in-memory index:
+
+* exact and normalised names are plain dict lookups;
+* full names and individual name parts are indexed by character trigrams, so
+  each input name is only scored against the few students that share the most
+  trigrams with it.
+
+The module deliberately has no Django imports so the index can be rebuilt
+inside worker processes.
+"""
+import difflib
+import os
+import re
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+DEFAULT_CANDIDATE_LIMIT = 50
+
+NAME_VARIATIONS = {
+    'katherine': 'kate',
+    'katharine': 'kate',
+    'catherine': 'kate',
+    'william': 'will',
+    'robert': 'bob',
+    'richard': 'dick',
+    'elizabeth': 'beth',
+    'margaret': 'maggie',
+    'christopher': 'chris',
+    'michael': 'mike',
+    'michelle': 'mich',
+    'stephanie': 'steph',
+    'rebecca': 'becky',
+    'patricia': 'patty',
+}
+
+
+def normalize_name(name: str) -> str:
+    """Normalize name for comparison (lowercase, remove spaces and punctuation)"""
+    if not name:
+        return ''
+
+    # Convert to lowercase and remove extra spaces
+    normalized = re.sub(r'\s+', ' ', name.lower().strip())
+
+    # Remove common punctuation
+    normalized = re.sub(r'[^\w\s]', '', normalized)
+
+    # Apply name variations
+    for full_name, short_name in NAME_VARIATIONS.items():
+        normalized = normalized.replace(full_name, short_name)
+
+    return normalized
+
+
+def trigrams(text: str) -> set:
+    padded = f'  {text} '
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+def _no_match() -> Dict:
+    return {
+        'matched_name': '',
+        'student_id': '',
+        'match_type': 'none',
+        'confidence_score': 0.0
+    }
+
+
+class NameMatchIndex:
+    """In-memory exact/normalised/trigram index over ``(student_id, full_name)`` pairs."""
+
+    def __init__(self, students: Iterable[Tuple[int, str]],
+                 candidate_limit: int = DEFAULT_CANDIDATE_LIMIT):
+        self.candidate_limit = candidate_limit
+        self.entries: List[Tuple[int, str, str]] = []
+        self.exact: Dict[str, int] = {}
+        self.normalized: Dict[str, int] = {}
+        self.name_grams: Dict[str, List[int]] = defaultdict(list)
+        # Distinct normalised name parts -> first entry carrying them
+        self.parts: List[str] = []
+        self.part_owner: List[int] = []
+        self.part_grams: Dict[str, List[int]] = defaultdict(list)
+
+        part_positions: Dict[str, int] = {}
+
+        for student_id, full_name in students:
+            position = len(self.entries)
+            normalized = normalize_name(full_name)
+            self.entries.append((student_id, full_name, normalized))
+            # First student wins ties, matching the original list scan order
+            self.exact.setdefault(full_name, position)
+            self.normalized.setdefault(normalized, position)
+
+            grams = trigrams(normalized)
+            for gram in grams:
+                self.name_grams[gram].append(position)
+
+            for raw_part in full_name.split():
+                if len(raw_part) < 3:
+                    continue
+                part = normalize_name(raw_part)
+                if part in part_positions:
+                    continue
+                part_positions[part] = len(self.parts)
+                self.parts.append(part)
+                self.part_owner.append(position)
+                for gram in trigrams(part):
+                    self.part_grams[gram].append(part_positions[part])
+
+    def __len__(self):
+        return len(self.entries)
+
+    def _result(self, position: int, match_type: str, score: float) -> Dict:
+        student_id, full_name, _ = self.entries[position]
+        return {
+            'matched_name': full_name,
+            'student_id': student_id,
+            'match_type': match_type,
+            'confidence_score': score
+        }
+
+    def _top_candidates(self, grams: set, postings: Dict[str, List[int]]) -> List[int]:
+        counts = Counter()
+        for gram in grams:
+            posting = postings.get(gram)
+            if posting:
+                counts.update(posting)
+        top = counts.most_common(self.candidate_limit)
+        return sorted(position for position, _ in top)
+
+    def fuzzy_match(self, poster_name: str, threshold: float) -> Optional[Dict]:
+        normalized_poster = normalize_name(poster_name)
+        best_position, best_score = None, 0.0
+
+        matcher = difflib.SequenceMatcher(None, a=normalized_poster)
+        for position in self._top_candidates(trigrams(normalized_poster), self.name_grams):
+            matcher.set_seq2(self.entries[position][2])
+            # Cheap upper bounds first, as difflib recommends
+            if matcher.real_quick_ratio() < max(threshold, best_score):
+                continue
+            if matcher.quick_ratio() < max(threshold, best_score):
+                continue
+            similarity = matcher.ratio()
+            if similarity > best_score and similarity >= threshold:
+                best_position, best_score = position, similarity
+
+        if best_position is None:
+            return None
+        return self._result(best_position, 'fuzzy', best_score)
+
+    def partial_match(self, poster_name: str, threshold: float) -> Optional[Dict]:
+        best_owner, best_score = None, 0.0
+
+        for raw_part in poster_name.strip().split():
+            if len(raw_part) < 3:
+                continue
+            poster_part = normalize_name(raw_part)
+            matcher = difflib.SequenceMatcher(None, a=poster_part)
+            for part_position in self._top_candidates(trigrams(poster_part), self.part_grams):
+                matcher.set_seq2(self.parts[part_position])
+                similarity = matcher.ratio()
+                owner = self.part_owner[part_position]
+                if similarity >= threshold and (
+                    similarity > best_score
+                    or (similarity == best_score and best_owner is not None and owner < best_owner)
+                ):
+                    best_owner, best_score = owner, similarity
+
+        if best_owner is None:
+            return None
+        # Reduce confidence for partial matches
+        return self._result(best_owner, 'partial', best_score * 0.8)
+
+    def find_best_match(self, poster_name: str, threshold: float) -> Dict:
+        """Exact -> normalised -> fuzzy -> partial, as the original command did."""
+        position = self.exact.get(poster_name)
+        if position is not None:
+            return self._result(position, 'exact', 1.0)
+
+        position = self.normalized.get(normalize_name(poster_name))
+        if position is not None:
+            return self._result(position, 'normalized', 0.95)
+
+        return (
+            self.fuzzy_match(poster_name, threshold)
+            or self.partial_match(poster_name, threshold)
+            or _no_match()
+        )
+
+
+_worker_index: Optional[NameMatchIndex] = None
+
+
+def _init_worker(students: Sequence[Tuple[int, str]], candidate_limit: int):
+    global _worker_index
+    _worker_index = NameMatchIndex(students, candidate_limit)
+
+
+def _match_chunk(args) -> List[Dict]:
+    names, threshold = args
+    return [_worker_index.find_best_match(name, threshold) for name in names]
+
+
+def match_names(names: Sequence[str], students: Sequence[Tuple[int, str]], threshold: float,
+                workers: int = 1, candidate_limit: int = DEFAULT_CANDIDATE_LIMIT,
+                chunk_size: int = 200) -> List[Dict]:
+    """
+    Match every name against ``students``, preserving input order.
+
+    With ``workers > 1`` the index is built once per worker process and the
+    names are scored in chunks across the pool.
+    """
+    if workers <= 1 or len(names) <= chunk_size:
+        index = NameMatchIndex(students, candidate_limit)
+        return [index.find_best_match(name, threshold) for name in names]
+
+    workers = min(workers, os.cpu_count() or 1)
+    chunks = [
+        (list(names[start:start + chunk_size]), threshold)
+        for start in range(0, len(names), chunk_size)
+    ]
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_worker,
+        initargs=(list(students), candidate_limit),
+    ) as executor:
+        results = []
+        for chunk_results in executor.map(_match_chunk, chunks):
+            results.extend(chunk_results)
+    return results
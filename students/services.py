@@ -1,69 +1,355 @@
-from django.db.models import Q
+import re
+import unicodedata
+
+from django.db import transaction
+from django.db.models import Case, Count, F, IntegerField, Max, Q, Value, When
 from datetime import date
-from .models import Student, StudentActivity
+from django.utils.dateparse import parse_date
+from .models import Student, StudentActivity, StudentSearchTerm
+
+
+def normalise_search_text(value):
+    """Case-fold and strip accents so 'Zoë' and 'ZOE' compare equal."""
+    if not value:
+        return ''
+    decomposed = unicodedata.normalize('NFKD', str(value).casefold())
+    return ''.join(char for char in decomposed if not unicodedata.combining(char))
+
+
+def tokenise_search_text(value):
+    """Split normalised text into alphanumeric words."""
+    return re.findall(r'[^\W_]+', normalise_search_text(value))
+
+
+def build_name_key(first_name, last_name):
+    """Blocking key for duplicate detection: normalised 'first | last'."""
+    words = tokenise_search_text(first_name) + ['|'] + tokenise_search_text(last_name)
+    if words[0] == '|' or words[-1] == '|':
+        return ''
+    return ' '.join(words)[:101]
+
+
+def normalise_phone(value):
+    """Digits only, with +61 numbers folded to the local 0 prefix."""
+    digits = re.sub(r'\D', '', value or '')
+    if digits.startswith('61') and len(digits) == 11:
+        digits = f'0{digits[2:]}'
+    return digits[:20]
+
+
+def normalise_email(value):
+    return (value or '').strip().lower()[:254]
+
+
+class StudentSearchService:
+    """
+    Ranked student search over the StudentSearchTerm word index.
+
+    Every query word must prefix at least one indexed word of the student.
+    Prefix matches are answered with a ``term >= word AND term < word + U+FFFF``
+    range so the (term, student) index is used on every backend; matching and
+    ranking happen in a single grouped query.
+    """
+
+    MAX_QUERY_TERMS = 5
+
+    # Name hits rank above guardian/contact hits; exact words double the weight
+    FIELD_WEIGHTS = {
+        'first_name': 4,
+        'last_name': 4,
+        'guardian_name': 2,
+        'contact_email': 2,
+        'contact_phone': 2,
+    }
+
+    @staticmethod
+    def build_terms(student):
+        """Return the set of (term, field) pairs that should index a student."""
+        terms = set()
+        for field in ('first_name', 'last_name', 'guardian_name', 'contact_email'):
+            for word in tokenise_search_text(getattr(student, field, '')):
+                terms.add((word[:100], field))
+
+        phone_digits = re.sub(r'\D', '', student.contact_phone or '')
+        if phone_digits:
+            terms.add((phone_digits, 'contact_phone'))
+
+        return terms
+
+    @classmethod
+    def index_student(cls, student):
+        """Bring a single student's index rows in line with its current fields."""
+        desired = cls.build_terms(student)
+        existing = {
+            (term, field): pk
+            for pk, term, field in StudentSearchTerm.objects.filter(
+                student=student
+            ).values_list('pk', 'term', 'field')
+        }
+
+        stale_ids = [pk for key, pk in existing.items() if key not in desired]
+        missing = [key for key in desired if key not in existing]
+
+        if stale_ids:
+            StudentSearchTerm.objects.filter(pk__in=stale_ids).delete()
+        if missing:
+            StudentSearchTerm.objects.bulk_create([
+                StudentSearchTerm(student=student, term=term, field=field)
+                for term, field in missing
+            ])
+
+    @classmethod
+    def index_new_students(cls, students, batch_size=1000):
+        """Index students written with bulk_create, which skips post_save."""
+        StudentSearchTerm.objects.bulk_create(
+            [
+                StudentSearchTerm(student_id=student.pk, term=term, field=field)
+                for student in students
+                for term, field in cls.build_terms(student)
+            ],
+            batch_size=batch_size,
+        )
+
+    @classmethod
+    def rebuild_index(cls, batch_size=1000):
+        """Rebuild the whole index. Returns the number of students indexed."""
+        fields = ('pk', 'first_name', 'last_name', 'guardian_name', 'contact_email', 'contact_phone')
+        indexed = 0
+
+        with transaction.atomic():
+            StudentSearchTerm.objects.all().delete()
+            pending = []
+            for student in Student.objects.only(*fields).order_by('pk').iterator(chunk_size=batch_size):
+                pending.extend(
+                    StudentSearchTerm(student_id=student.pk, term=term, field=field)
+                    for term, field in cls.build_terms(student)
+                )
+                indexed += 1
+                if len(pending) >= batch_size:
+                    StudentSearchTerm.objects.bulk_create(pending, batch_size=batch_size)
+                    pending = []
+            if pending:
+                StudentSearchTerm.objects.bulk_create(pending, batch_size=batch_size)
+
+        return indexed
+
+    @classmethod
+    def parse_query(cls, query):
+        """Turn raw user input into normalised query words."""
+        query = (query or '').strip()
+        digits = re.sub(r'[\s\-()+]', '', query)
+        # Phone numbers are indexed as one digit string, so "0412 345" must
+        # stay a single prefix rather than two unrelated words
+        if digits.isdigit():
+            return [digits]
+        return tokenise_search_text(query)[:cls.MAX_QUERY_TERMS]
+
+    @classmethod
+    def _ranked_matches(cls, words, student_queryset=None, fields=None):
+        """Grouped (student_id, score) query requiring every word to match."""
+        fields = tuple(fields or cls.FIELD_WEIGHTS)
+        prefix_filter = Q()
+        annotations = {}
+        for index, word in enumerate(words):
+            is_prefix = Q(term__gte=word, term__lt=f'{word}\uffff')
+            prefix_filter |= is_prefix
+
+            whens = []
+            for field in fields:
+                weight = cls.FIELD_WEIGHTS[field]
+                whens.append(When(Q(term=word, field=field), then=Value(weight * 2)))
+                whens.append(When(is_prefix & Q(field=field), then=Value(weight)))
+            annotations[f'match_{index}'] = Max(
+                Case(*whens, default=Value(0), output_field=IntegerField())
+            )
+
+        matches = StudentSearchTerm.objects.filter(prefix_filter)
+        if fields != tuple(cls.FIELD_WEIGHTS):
+            matches = matches.filter(field__in=fields)
+        if student_queryset is not None:
+            matches = matches.filter(student_id__in=student_queryset.values('pk'))
+
+        score = sum((F(name) for name in annotations), Value(0))
+        return (
+            matches.values('student_id')
+            .annotate(**annotations)
+            .filter(**{f'{name}__gt': 0 for name in annotations})
+            .annotate(score=score)
+        )
+
+    @classmethod
+    def filter_queryset(cls, queryset, query, fields=None):
+        """
+        Restrict ``queryset`` to students matching ``query`` (order untouched)
+
+        ``fields`` limits matching to some indexed fields, e.g. names only.
+        """
+        words = cls.parse_query(query)
+        if not words:
+            return queryset
+        matching_ids = cls._ranked_matches(words, fields=fields).values('student_id')
+        return queryset.filter(pk__in=matching_ids)
+
+    @classmethod
+    def search(cls, query, queryset=None, limit=10):
+        """Return up to ``limit`` students from ``queryset`` ordered by relevance."""
+        words = cls.parse_query(query)
+        if not words:
+            return []
+
+        queryset = Student.objects.all() if queryset is None else queryset
+        ranked = list(
+            cls._ranked_matches(words, queryset)
+            .order_by('-score', 'student_id')
+            .values_list('student_id', flat=True)[:limit]
+        )
+        students = {student.pk: student for student in queryset.filter(pk__in=ranked)}
+        return [students[pk] for pk in ranked if pk in students]
 
 
 class StudentMatchingService:
     """Service for matching and creating students from enrollment data"""
-    
+
+    # Evidence that a same-name candidate is the same person, strongest first
+    MATCH_PRIORITY = ('name_dob', 'name_phone', 'name_email')
+    MATCH_KEY_ATTRS = (
+        ('name_dob', 'birth_date'),
+        ('name_phone', 'match_phone'),
+        ('name_email', 'match_email'),
+    )
+
     @staticmethod
-    def find_existing_student(form_data):
+    def apply_match_keys(student):
+        """Populate the normalised match key fields on an unsaved student."""
+        student.match_name_key = build_name_key(student.first_name, student.last_name)
+        student.match_phone = normalise_phone(student.contact_phone)
+        student.match_email = normalise_email(student.contact_email)
+        return student
+
+    @classmethod
+    def _classify_candidate(cls, candidate, birth_date, phone, email):
+        """Return the strongest match type a same-name candidate satisfies."""
+        if birth_date and candidate.birth_date == birth_date:
+            return 'name_dob'
+        if phone and candidate.match_phone == phone:
+            return 'name_phone'
+        if email and candidate.match_email == email:
+            return 'name_email'
+        return None
+
+    @classmethod
+    def find_existing_student(cls, form_data):
         """
         Intelligently match existing student based on form data
         Matching strategies (in priority order):
         1. Full name + DOB (exact match)
         2. Full name + Phone number
         3. Full name + Email
+        All active students sharing the normalised name key are fetched in
+        one indexed lookup and ranked in Python.
         Returns: (student_instance, match_type)
         """
         first_name = form_data.get('first_name', '').strip()
         last_name = form_data.get('last_name', '').strip()
         date_of_birth = form_data.get('date_of_birth')
-        phone = form_data.get('phone', '').strip()
-        email = form_data.get('email', '').strip()
-        
+        if isinstance(date_of_birth, str):
+            date_of_birth = parse_date(date_of_birth)
+        phone = normalise_phone(form_data.get('phone') or '')
+        email = normalise_email(form_data.get('email') or '')
+
         if not first_name or not last_name:
             return None, 'none'
-        
-        # Strategy 1: Full name + DOB (exact match - highest priority)
-        if date_of_birth:
-            exact_match = Student.objects.filter(
-                first_name__iexact=first_name,
-                last_name__iexact=last_name,
-                birth_date=date_of_birth,
-                is_active=True
-            ).first()
-            
-            if exact_match:
-                return exact_match, 'name_dob'
-        
-        # Strategy 2: Full name + Phone number
-        if phone:
-            phone_match = Student.objects.filter(
-                first_name__iexact=first_name,
-                last_name__iexact=last_name,
-                contact_phone=phone,
-                is_active=True
-            ).first()
-            
-            if phone_match:
-                return phone_match, 'name_phone'
-        
-        # Strategy 3: Full name + Email
-        if email:
-            email_match = Student.objects.filter(
-                first_name__iexact=first_name,
-                last_name__iexact=last_name,
-                contact_email__iexact=email,
-                is_active=True
-            ).first()
-            
-            if email_match:
-                return email_match, 'name_email'
-        
+
+        name_key = build_name_key(first_name, last_name)
+        if not name_key or not (date_of_birth or phone or email):
+            return None, 'none'
+
+        candidates = Student.objects.filter(
+            match_name_key=name_key,
+            is_active=True
+        ).order_by('pk')
+
+        best_match, best_rank = None, len(cls.MATCH_PRIORITY)
+        for candidate in candidates:
+            match_type = cls._classify_candidate(candidate, date_of_birth, phone, email)
+            if match_type is None:
+                continue
+            rank = cls.MATCH_PRIORITY.index(match_type)
+            if rank < best_rank:
+                best_match, best_rank = candidate, rank
+
+        if best_match:
+            return best_match, cls.MATCH_PRIORITY[best_rank]
+
         # No matches found
         return None, 'none'
-    
+
+    @classmethod
+    def find_duplicate_groups(cls, include_inactive=False):
+        """
+        Batch duplicate report built on the same blocking keys.
+
+        Students are first blocked by match_name_key (a single grouped scan of
+        the index), then linked within each block when they share a birth date,
+        phone or email. Returns a list of dicts with ``name_key``,
+        ``match_types`` and ``students``.
+        """
+        students = Student.objects.exclude(match_name_key='')
+        if not include_inactive:
+            students = students.filter(is_active=True)
+
+        duplicate_keys = (
+            students.values('match_name_key')
+            .annotate(total=Count('pk'))
+            .filter(total__gt=1)
+            .values_list('match_name_key', flat=True)
+        )
+
+        blocks = {}
+        for student in students.filter(match_name_key__in=duplicate_keys).order_by('match_name_key', 'pk'):
+            blocks.setdefault(student.match_name_key, []).append(student)
+
+        groups = []
+        for name_key, members in blocks.items():
+            # Union-find over members linked by any shared identifying value
+            parent = list(range(len(members)))
+
+            def find(index):
+                while parent[index] != index:
+                    parent[index] = parent[parent[index]]
+                    index = parent[index]
+                return index
+
+            links = {}
+            for index, student in enumerate(members):
+                for match_type, attr in cls.MATCH_KEY_ATTRS:
+                    value = getattr(student, attr)
+                    if not value:
+                        continue
+                    other = links.setdefault((match_type, value), index)
+                    if other != index:
+                        parent[find(index)] = find(other)
+
+            clusters = {}
+            for index, student in enumerate(members):
+                clusters.setdefault(find(index), []).append(student)
+
+            for cluster in clusters.values():
+                if len(cluster) < 2:
+                    continue
+                match_types = []
+                for match_type, attr in cls.MATCH_KEY_ATTRS:
+                    values = [getattr(student, attr) for student in cluster if getattr(student, attr)]
+                    if len(values) != len(set(values)):
+                        match_types.append(match_type)
+                groups.append({
+                    'name_key': name_key,
+                    'match_types': match_types,
+                    'students': cluster,
+                })
+
+        return groups
+
     @staticmethod
     def create_or_update_student(form_data, enrollment):
         """
@@ -287,4 +573,107 @@ class EnrollmentFeeCalculator:
             # Fail silently to avoid blocking enrollment creation
             pass
 
-        return fees
\ No newline at end of file
+        return fees
+
+class StudentTimelineService:
+    """
+    Newest-first stream of a student's activities, attendance and enrolments.
+
+    Each source is read through its own ``(student, time)`` index and only the
+    columns the timeline renders are selected, so a page costs three small
+    seeks however long the student has been with us.
+    """
+
+    PAGE_SIZE = 20
+    MAX_PAGE_SIZE = 100
+
+    ATTENDANCE_COLORS = {
+        'present': 'success',
+        'late': 'warning',
+        'early_leave': 'warning',
+        'absent': 'danger',
+        'unmarked': 'secondary',
+    }
+    ENROLLMENT_COLORS = {
+        'confirmed': 'success',
+        'pending': 'warning',
+        'cancelled': 'secondary',
+    }
+
+    @staticmethod
+    def sources(student_id):
+        from enrollment.models import Attendance, Enrollment
+
+        return [
+            ('activity', StudentActivity.objects.filter(student_id=student_id).values(
+                'id', 'created_at', 'activity_type', 'title', 'description', 'course__name'
+            ), 'created_at'),
+            ('attendance', Attendance.objects.filter(student_id=student_id).values(
+                'id', 'attendance_time', 'status', 'class_instance__date', 'class_instance__course__name'
+            ), 'attendance_time'),
+            ('enrollment', Enrollment.objects.filter(student_id=student_id).values(
+                'id', 'created_at', 'status', 'source_channel', 'course__name'
+            ), 'created_at'),
+        ]
+
+    @classmethod
+    def get_page(cls, student_id, after=None, per_page=None):
+        """
+        One page of timeline entries
+
+        Returns:
+            KeysetPage whose object_list holds JSON-ready entry dicts
+        """
+        from core.utils.pagination import paginate_merged_keyset
+
+        per_page = max(1, min(per_page or cls.PAGE_SIZE, cls.MAX_PAGE_SIZE))
+        page = paginate_merged_keyset(cls.sources(student_id), after=after, per_page=per_page)
+        page.object_list = [cls.serialise(kind, row) for kind, row in page.object_list]
+        return page
+
+    @classmethod
+    def serialise(cls, kind, row):
+        from django.urls import reverse
+        from enrollment.models import Attendance, Enrollment
+
+        if kind == 'activity':
+            activity = StudentActivity(activity_type=row['activity_type'])
+            return {
+                'kind': kind,
+                'id': row['id'],
+                'timestamp': row['created_at'].isoformat(),
+                'title': row['title'],
+                'description': row['description'],
+                'course': row['course__name'],
+                'status': activity.get_activity_type_display(),
+                'icon': activity.get_activity_icon(),
+                'color': activity.get_activity_color(),
+                'url': None,
+            }
+
+        if kind == 'attendance':
+            return {
+                'kind': kind,
+                'id': row['id'],
+                'timestamp': row['attendance_time'].isoformat(),
+                'title': f"Attendance: {row['class_instance__course__name']}",
+                'description': f"Class on {row['class_instance__date'].strftime('%d/%m/%Y')}",
+                'course': row['class_instance__course__name'],
+                'status': dict(Attendance.STATUS_CHOICES).get(row['status'], row['status']),
+                'icon': 'fa-check-square',
+                'color': cls.ATTENDANCE_COLORS.get(row['status'], 'secondary'),
+                'url': None,
+            }
+
+        return {
+            'kind': kind,
+            'id': row['id'],
+            'timestamp': row['created_at'].isoformat(),
+            'title': f"Enrolment: {row['course__name']}",
+            'description': f"Via {dict(Enrollment.SOURCE_CHOICES).get(row['source_channel'], row['source_channel'])}",
+            'course': row['course__name'],
+            'status': dict(Enrollment.STATUS_CHOICES).get(row['status'], row['status']),
+            'icon': 'fa-user-plus',
+            'color': cls.ENROLLMENT_COLORS.get(row['status'], 'secondary'),
+            'url': reverse('enrollment:enrollment_detail', args=[row['id']]),
+        }
@@ -0,0 +1,22 @@
+"""
+Django signals keeping the student search index in sync
+"""
+from django.db.models.signals import post_save
+from django.dispatch import receiver
+from .models import Student
+from .services import StudentSearchService
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@receiver(post_save, sender=Student)
+def update_student_search_terms(sender, instance, raw=False, **kwargs):
+    """Re-index a student's searchable fields after every save"""
+    if raw:
+        return
+
+    try:
+        StudentSearchService.index_student(instance)
+    except Exception as e:
+        logger.error(f"Failed to update search index for student {instance.pk}: {str(e)}")
@@ -0,0 +1,99 @@
+import json
+import os
+import tempfile
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from students.models import Student, StudentActivity, StudentSearchTerm
+
+
+HEADER = 'student_name\tdob\tguardian_name\tphone\taddress\temail\n'
+
+
+class ImportStudentsCommandTest(TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp_dir.cleanup)
+        self.path = os.path.join(self.tmp_dir.name, 'students.tsv')
+
+    def write_rows(self, rows):
+        with open(self.path, 'w', encoding='utf-8') as file:
+            file.write(HEADER)
+            for row in rows:
+                file.write('\t'.join(row) + '\n')
+
+    def run_import(self, **options):
+        out = StringIO()
+        call_command('import_students', file=self.path, stdout=out, **options)
+        return out.getvalue()
+
+    def test_bulk_import_skips_existing_and_in_file_duplicates(self):
+        Student.objects.create(
+            first_name='Olivia', last_name='Smith', birth_date=date(2015, 3, 1), is_active=False
+        )
+        self.write_rows([
+            ('Olivia Smith', '01/03/2015', 'Anna', '0412345678', '', ''),
+            ('Jack Nguyen', '', 'Tom', '+61 412 000 111', '1 Main St', ''),
+            ('jack nguyen', '', 'Tom', '0412 000 111', '', ''),
+            ('Mia Walker', '', '', '', '', 'MIA@Example.com'),
+            ('Single', '', '', '', '', ''),
+        ])
+
+        output = self.run_import(chunk_size=2)
+
+        self.assertEqual(
+            sorted(Student.objects.values_list('first_name', flat=True)),
+            ['Jack', 'Mia', 'Olivia'],
+        )
+        jack = Student.objects.get(first_name='Jack')
+        self.assertEqual(jack.contact_phone, '0412 000 111')
+        self.assertEqual(jack.match_name_key, 'jack | nguyen')
+        self.assertTrue(StudentActivity.objects.filter(student=jack, title='Student imported from TSV').exists())
+        self.assertTrue(StudentSearchTerm.objects.filter(student=jack, term='nguyen').exists())
+        self.assertIn('成功: 2', output)
+        self.assertIn('跳过: 3', output)
+        self.assertIn('行/秒', output)
+
+    def test_dry_run_writes_nothing(self):
+        self.write_rows([('Jack Nguyen', '02/04/2016', '', '', '', '')])
+
+        self.run_import(dry_run=True)
+
+        self.assertFalse(Student.objects.exists())
+        self.assertFalse(os.path.exists(f'{self.path}.progress'))
+
+    def write_progress(self, last_row, **file_overrides):
+        stat = os.stat(self.path)
+        fingerprint = {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, **file_overrides}
+        with open(f'{self.path}.progress', 'w', encoding='utf-8') as progress_file:
+            json.dump({'last_row': last_row, 'file': fingerprint}, progress_file)
+
+    def test_resume_skips_committed_rows(self):
+        self.write_rows([
+            ('Jack Nguyen', '02/04/2016', '', '', '', ''),
+            ('Mia Walker', '03/05/2017', '', '', '', ''),
+        ])
+        self.write_progress(2)
+
+        self.run_import(resume=True)
+
+        self.assertEqual(list(Student.objects.values_list('first_name', flat=True)), ['Mia'])
+        self.assertFalse(os.path.exists(f'{self.path}.progress'))
+
+    def test_resume_ignores_checkpoint_from_another_file(self):
+        self.write_rows([
+            ('Jack Nguyen', '02/04/2016', '', '', '', ''),
+            ('Mia Walker', '03/05/2017', '', '', '', ''),
+        ])
+        self.write_progress(2, size=1)
+
+        output = self.run_import(resume=True)
+
+        self.assertIn('忽略断点', output)
+        self.assertEqual(
+            sorted(Student.objects.values_list('first_name', flat=True)), ['Jack', 'Mia']
+        )
+        self.assertFalse(os.path.exists(f'{self.path}.progress'))
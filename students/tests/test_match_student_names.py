@@ -0,0 +1,68 @@
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import SimpleTestCase, TestCase
+
+from students.models import Student
+from students.name_matching import NameMatchIndex, match_names
+
+
+class NameMatchIndexTest(SimpleTestCase):
+    def setUp(self):
+        self.students = [
+            (1, 'Olivia Smith'),
+            (2, 'Jack Nguyen'),
+            (3, 'Katherine Walker'),
+            (4, 'Olivia Smith'),
+        ]
+        self.index = NameMatchIndex(self.students)
+
+    def test_strategies_in_priority_order(self):
+        self.assertEqual(self.index.find_best_match('Olivia Smith', 0.6)['student_id'], 1)
+
+        normalized = self.index.find_best_match('kate walker!', 0.6)
+        self.assertEqual((normalized['student_id'], normalized['match_type']), (3, 'normalized'))
+
+        fuzzy = self.index.find_best_match('Jak Ngyuen', 0.6)
+        self.assertEqual((fuzzy['student_id'], fuzzy['match_type']), (2, 'fuzzy'))
+
+        partial = self.index.find_best_match('Nguyen', 0.8)
+        self.assertEqual((partial['student_id'], partial['match_type']), (2, 'partial'))
+        self.assertAlmostEqual(partial['confidence_score'], 0.8)
+
+        self.assertEqual(self.index.find_best_match('Xq', 0.6)['match_type'], 'none')
+
+    def test_process_pool_matches_serial_results(self):
+        names = ['Olivia Smth', 'Jack Nguyen', 'Walker', 'Nobody Here'] * 10
+
+        serial = match_names(names, self.students, 0.6)
+        parallel = match_names(names, self.students, 0.6, workers=2, chunk_size=8)
+
+        self.assertEqual(parallel, serial)
+
+
+class MatchStudentNamesCommandTest(TestCase):
+    def setUp(self):
+        self.student = Student.objects.create(first_name='Harper', last_name='Lewis')
+        Student.objects.create(first_name='Harper', last_name='Inactive', is_active=False)
+
+    def test_command_writes_results_and_timings(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            input_path = os.path.join(tmp_dir, 'names.tsv')
+            output_path = os.path.join(tmp_dir, 'results.tsv')
+            with open(input_path, 'w', encoding='utf-8') as handle:
+                handle.write('name\nHarper Lewis\nHarpr Lewis\nUnknown Person\n')
+
+            out = StringIO()
+            call_command('match_student_names', input=input_path, output=output_path, stdout=out)
+
+            with open(output_path, encoding='utf-8') as handle:
+                lines = handle.read().splitlines()
+
+        self.assertEqual(len(lines), 4)
+        self.assertTrue(lines[1].startswith(f'Harper Lewis\tHarper Lewis\t{self.student.pk}\texact'))
+        self.assertIn('\tfuzzy\t', lines[2])
+        self.assertIn('\tnone\t', lines[3])
+        self.assertIn('行/秒', out.getvalue())
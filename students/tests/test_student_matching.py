@@ -0,0 +1,98 @@
+from datetime import date
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from students.models import Student
+from students.services import StudentMatchingService
+
+
+class StudentMatchKeyTest(TestCase):
+    def test_match_keys_are_normalised_on_save(self):
+        student = Student.objects.create(
+            first_name='  Zoë ',
+            last_name="O'Brien",
+            contact_phone='+61 412 345 678',
+            contact_email=' Zoe@Example.COM ',
+        )
+
+        self.assertEqual(student.match_name_key, 'zoe | o brien')
+        self.assertEqual(student.match_phone, '0412345678')
+        self.assertEqual(student.match_email, 'zoe@example.com')
+
+    def test_update_fields_save_refreshes_keys(self):
+        student = Student.objects.create(first_name='Amy', last_name='Lee')
+        student.last_name = 'Chen'
+        student.save(update_fields=['last_name'])
+
+        student.refresh_from_db()
+        self.assertEqual(student.match_name_key, 'amy | chen')
+
+
+class FindExistingStudentTest(TestCase):
+    def setUp(self):
+        self.by_email = Student.objects.create(
+            first_name='Sam', last_name='Taylor', contact_email='sam@example.com'
+        )
+        self.by_dob = Student.objects.create(
+            first_name='Sam', last_name='Taylor', birth_date=date(2012, 5, 1)
+        )
+        Student.objects.create(
+            first_name='Sam', last_name='Taylor', birth_date=date(2012, 5, 1), is_active=False
+        )
+
+    def test_strongest_match_wins_in_one_query(self):
+        with self.assertNumQueries(1):
+            student, match_type = StudentMatchingService.find_existing_student({
+                'first_name': 'SAM',
+                'last_name': 'taylor',
+                'date_of_birth': date(2012, 5, 1),
+                'email': 'sam@example.com',
+            })
+
+        self.assertEqual((student, match_type), (self.by_dob, 'name_dob'))
+
+    def test_email_match_is_case_insensitive(self):
+        student, match_type = StudentMatchingService.find_existing_student({
+            'first_name': 'Sam',
+            'last_name': 'Taylor',
+            'email': 'SAM@example.com',
+        })
+
+        self.assertEqual((student, match_type), (self.by_email, 'name_email'))
+
+    def test_name_alone_is_not_enough(self):
+        self.assertEqual(
+            StudentMatchingService.find_existing_student({'first_name': 'Sam', 'last_name': 'Taylor'}),
+            (None, 'none'),
+        )
+
+
+class DuplicateStudentReportTest(TestCase):
+    def setUp(self):
+        self.first = Student.objects.create(
+            first_name='Ava', last_name='Brown', contact_phone='0412 000 111'
+        )
+        self.second = Student.objects.create(
+            first_name='AVA', last_name='Brown', contact_phone='0412000111',
+            contact_email='ava@example.com',
+        )
+        self.third = Student.objects.create(
+            first_name='Ava', last_name='Brown', contact_email='AVA@example.com'
+        )
+        # Same name but nothing shared: not a duplicate
+        Student.objects.create(first_name='Ava', last_name='Brown', birth_date=date(2001, 1, 1))
+
+    def test_groups_link_transitively_by_shared_keys(self):
+        groups = StudentMatchingService.find_duplicate_groups()
+
+        self.assertEqual(len(groups), 1)
+        self.assertEqual(groups[0]['students'], [self.first, self.second, self.third])
+        self.assertEqual(groups[0]['match_types'], ['name_phone', 'name_email'])
+
+    def test_command_reports_groups(self):
+        out = StringIO()
+        call_command('find_duplicate_students', stdout=out)
+
+        self.assertIn('Found 1 duplicate groups covering 3 students', out.getvalue())
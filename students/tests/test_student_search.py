@@ -0,0 +1,100 @@
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+from django.urls import reverse
+
+from students.models import Student, StudentSearchTerm
+from students.services import StudentSearchService
+
+
+class StudentSearchServiceTest(TestCase):
+    def setUp(self):
+        self.zoe = Student.objects.create(
+            first_name='Zoë',
+            last_name='Martin',
+            contact_email='zoe.martin@example.com',
+            contact_phone='0412 345 678',
+        )
+        self.martina = Student.objects.create(
+            first_name='Martina',
+            last_name='Lee',
+            guardian_name='Oliver Lee',
+        )
+        self.inactive = Student.objects.create(
+            first_name='Martin',
+            last_name='Hidden',
+            is_active=False,
+        )
+
+    def test_index_is_maintained_on_save(self):
+        self.assertTrue(
+            StudentSearchTerm.objects.filter(student=self.zoe, term='zoe', field='first_name').exists()
+        )
+
+        self.zoe.last_name = 'Nguyen'
+        self.zoe.save()
+
+        terms = set(StudentSearchTerm.objects.filter(student=self.zoe).values_list('term', 'field'))
+        self.assertIn(('nguyen', 'last_name'), terms)
+        self.assertNotIn(('martin', 'last_name'), terms)
+
+    def test_search_is_accent_and_case_insensitive(self):
+        self.assertEqual(StudentSearchService.search('ZOE'), [self.zoe])
+
+    def test_all_words_must_match(self):
+        self.assertEqual(StudentSearchService.search('mart lee'), [self.martina])
+
+    def test_name_matches_rank_above_contact_matches(self):
+        results = StudentSearchService.search('martin', queryset=Student.objects.filter(is_active=True))
+
+        # Exact last-name hit beats a first-name prefix hit; inactive is filtered out
+        self.assertEqual(results, [self.zoe, self.martina])
+
+    def test_guardian_email_and_phone_are_searchable(self):
+        self.assertEqual(StudentSearchService.search('oliver'), [self.martina])
+        self.assertEqual(StudentSearchService.search('zoe.martin@example'), [self.zoe])
+        self.assertEqual(StudentSearchService.search('0412 345'), [self.zoe])
+
+    def test_rebuild_index_restores_rows_for_bulk_writes(self):
+        Student.objects.filter(pk=self.martina.pk).update(first_name='Priya')
+
+        self.assertEqual(StudentSearchService.search('priya'), [])
+        StudentSearchService.rebuild_index()
+        self.assertEqual(StudentSearchService.search('priya'), [self.martina])
+
+
+class StudentSearchEndpointsTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(
+            username='search-admin',
+            password='pass123',
+            role='admin',
+            is_staff=True,
+        )
+        self.client.login(username='search-admin', password='pass123')
+        self.student = Student.objects.create(
+            first_name='Harriet',
+            last_name='Quinn',
+            contact_email='hq@example.com',
+        )
+        Student.objects.create(first_name='Other', last_name='Person')
+
+    def test_student_list_search_uses_index(self):
+        response = self.client.get(reverse('students:student_list'), {'search': 'harr'})
+
+        self.assertEqual(list(response.context['students']), [self.student])
+
+    def test_students_search_endpoint(self):
+        response = self.client.get(reverse('students:student_search'), {'q': 'quinn'})
+
+        self.assertEqual(
+            [student['id'] for student in response.json()['students']],
+            [self.student.pk],
+        )
+
+    def test_enrollment_student_search_api(self):
+        response = self.client.get(reverse('enrollment:student_search_api'), {'query': 'hq'})
+
+        self.assertEqual(
+            [student['id'] for student in response.json()['results']],
+            [self.student.pk],
+        )
@@ -0,0 +1,101 @@
+from datetime import time, timedelta
+from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+
+from academics.models import Class, Course
+from enrollment.models import Attendance, Enrollment
+from students.models import Student, StudentActivity
+from students.services import StudentTimelineService
+
+
+@override_settings(SECURE_SSL_REDIRECT=False)
+class StudentTimelineTest(TestCase):
+    def setUp(self):
+        self.user = get_user_model().objects.create_user(username='admin', password='pass123', role='admin')
+        self.student = Student.objects.create(first_name='Long', last_name='Tenure')
+        self.other = Student.objects.create(first_name='Other', last_name='Student')
+        self.start = timezone.now() - timedelta(days=30)
+
+        course = Course.objects.create(
+            name='Timeline Course', price=Decimal('100.00'), status='published',
+            start_date=timezone.localdate(), start_time=time(10), duration_minutes=60,
+        )
+        enrollment = Enrollment.objects.create(student=self.student, course=course)
+        Enrollment.objects.filter(pk=enrollment.pk).update(created_at=self.start)
+
+        for index in range(3):
+            class_instance = Class.objects.create(
+                course=course, date=timezone.localdate() + timedelta(days=index), start_time=time(10 + index),
+            )
+            Attendance.objects.create(
+                student=self.student, class_instance=class_instance, status='present',
+                attendance_time=self.start + timedelta(days=index + 1),
+            )
+
+        for index in range(5):
+            activity = StudentActivity.objects.create(
+                student=self.student, activity_type='notes_added', title=f'Note {index}',
+            )
+            # Two activities share a timestamp with an attendance row to exercise tie-breaking
+            StudentActivity.objects.filter(pk=activity.pk).update(
+                created_at=self.start + timedelta(days=min(index, 2) + 1)
+            )
+        StudentActivity.objects.create(student=self.other, activity_type='other', title='Not mine')
+
+    def _walk(self, per_page):
+        entries, cursor = [], None
+        while True:
+            page = StudentTimelineService.get_page(self.student.pk, after=cursor, per_page=per_page)
+            entries.extend(page.object_list)
+            if not page.has_next:
+                return entries
+            cursor = page.next_cursor
+
+    def test_pages_form_one_ordered_stream(self):
+        full = StudentTimelineService.get_page(self.student.pk, per_page=100).object_list
+        kinds = {entry['kind'] for entry in full}
+
+        self.assertEqual(kinds, {'activity', 'attendance', 'enrollment'})
+        self.assertEqual(len(full), StudentActivity.objects.filter(student=self.student).count() + 3 + 1)
+        self.assertEqual(full, sorted(full, key=lambda entry: entry['timestamp'], reverse=True))
+        self.assertEqual(full[-1]['kind'], 'enrollment')
+
+        for per_page in (1, 2, 3, 4):
+            self.assertEqual(self._walk(per_page), full)
+
+    def test_each_page_is_one_query_per_source(self):
+        first = StudentTimelineService.get_page(self.student.pk, per_page=3)
+
+        with self.assertNumQueries(3):
+            StudentTimelineService.get_page(self.student.pk, after=first.next_cursor, per_page=3)
+
+    def test_api_returns_json_pages(self):
+        self.client.force_login(self.user)
+        url = reverse('students:student_timeline', args=[self.student.pk])
+
+        response = self.client.get(url, {'limit': 2})
+        data = response.json()
+        self.assertEqual(len(data['items']), 2)
+        self.assertTrue(data['has_next'])
+
+        response = self.client.get(url, {'limit': 100, 'after': data['next_cursor']})
+        self.assertEqual(len(response.json()['items']), len(self._walk(100)) - 2)
+
+        # Tampered cursors fall back to the first page
+        response = self.client.get(url, {'limit': 2, 'after': 'not-a-cursor'})
+        self.assertEqual(response.json()['items'], data['items'])
+
+        self.assertEqual(self.client.get(reverse('students:student_timeline', args=[999999])).status_code, 404)
+
+    def test_detail_page_counts_enrolments_without_loading_them(self):
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('students:student_detail', args=[self.student.pk]))
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context['enrollment_count'], 1)
+        self.assertContains(response, reverse('students:student_timeline', args=[self.student.pk]))
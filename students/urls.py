@@ -9,6 +9,7 @@ urlpatterns = [
     path('add/', views.StudentCreateView.as_view(), name='student_add'),
     path('<int:pk>/', views.StudentDetailView.as_view(), name='student_detail'),
     path('<int:pk>/edit/', views.StudentUpdateView.as_view(), name='student_edit'),
+    path('<int:pk>/timeline/', views.StudentTimelineView.as_view(), name='student_timeline'),
 
     # Search
     path('search/', views.StudentSearchView.as_view(), name='student_search'),
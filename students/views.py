@@ -6,7 +6,6 @@ from django.contrib import messages
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, View
 from django.urls import reverse_lazy
 from django.conf import settings
-from django.db.models import Q
 from django.http import JsonResponse
 from django.utils import timezone
 from django.utils.text import get_valid_filename
@@ -19,6 +18,7 @@ from uuid import uuid4
 
 from .models import Student, StudentTag, StudentLevel
 from .forms import StudentForm, BulkNotificationForm
+from .services import StudentSearchService
 from core.models import EmailSettings, SMSSettings, EmailLog, SMSLog, NotificationQuota
 from core.services.notification_service import NotificationService
 
@@ -145,12 +145,7 @@ class StudentListView(LoginRequiredMixin, ListView):
             queryset = queryset.filter(is_active=True)
 
         if search:
-            queryset = queryset.filter(
-                Q(first_name__icontains=search) |
-                Q(last_name__icontains=search) |
-                Q(contact_email__icontains=search) |
-                Q(guardian_name__icontains=search)
-            )
+            queryset = StudentSearchService.filter_queryset(queryset, search)
 
         # Multi-tag filtering with OR logic (students having ANY of the selected tags)
         if tag_filters:
@@ -221,23 +216,53 @@ class StudentDetailView(LoginRequiredMixin, DetailView):
     template_name = 'core/students/detail.html'
     context_object_name = 'student'
     
+    RECENT_ENROLLMENTS = 10
+    
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         # Add enrollments and attendance information - with try/except to avoid errors
+        # Older history loads on demand through StudentTimelineView
         try:
             from enrollment.models import Enrollment, Attendance
-            context['enrollments'] = Enrollment.objects.filter(
-                student=self.object
-            ).select_related('course').all()
+            enrollments = Enrollment.objects.filter(student=self.object)
+            context['enrollment_count'] = enrollments.count()
+            context['enrollments'] = enrollments.select_related('course').only(
+                'id', 'status', 'created_at', 'course__name', 'course__price'
+            ).order_by('-created_at', '-id')[:self.RECENT_ENROLLMENTS]
             context['attendances'] = Attendance.objects.filter(
                 student=self.object
-            ).select_related('class_instance__course').order_by('-attendance_time')[:10]
+            ).select_related('class_instance__course').only(
+                'id', 'status', 'attendance_time', 'class_instance__course__name'
+            ).order_by('-attendance_time', '-id')[:10]
         except ImportError:
+            context['enrollment_count'] = 0
             context['enrollments'] = []
             context['attendances'] = []
         return context
 
 
+class StudentTimelineView(LoginRequiredMixin, View):
+    """JSON feed of a student's activities, attendance and enrolments, newest first"""
+    
+    def get(self, request, pk):
+        from .services import StudentTimelineService
+        
+        if not Student.objects.filter(pk=pk).exists():
+            return JsonResponse({'error': 'Student not found'}, status=404)
+        
+        try:
+            per_page = int(request.GET.get('limit', StudentTimelineService.PAGE_SIZE))
+        except (TypeError, ValueError):
+            per_page = StudentTimelineService.PAGE_SIZE
+        
+        page = StudentTimelineService.get_page(pk, after=request.GET.get('after'), per_page=per_page)
+        return JsonResponse({
+            'items': page.object_list,
+            'has_next': page.has_next,
+            'next_cursor': page.next_cursor,
+        })
+
+
 class StudentUpdateView(LoginRequiredMixin, UpdateView):
     model = Student
     form_class = StudentForm
@@ -831,13 +856,12 @@ class StudentSearchView(LoginRequiredMixin, View):
         if len(query) < 2:
             return JsonResponse({'students': []})
         
-        # Search students
-        students = Student.objects.filter(
-            Q(first_name__icontains=query) |
-            Q(last_name__icontains=query) |
-            Q(contact_email__icontains=query),
-            is_active=True
-        ).order_by('last_name', 'first_name')[:10]
+        # Search students, best matches first
+        students = StudentSearchService.search(
+            query,
+            queryset=Student.objects.filter(is_active=True),
+            limit=10,
+        )
         
         # Format results
         results = []